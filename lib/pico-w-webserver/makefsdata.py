@@ -1,106 +1,155 @@
 #!/usr/bin/python3
 
-# This script is by @rspeir on GitHub: 
+# This script is by @rspeir on GitHub:
 # https://github.com/krzmaz/pico-w-webserver-example/pull/1/files/4b3e78351dd236f213da9bebbb20df690d470476#diff-e675c4a367e382db6f9ba61833a58c62029d8c71c3156a9f238b612b69de279d
 # Renamed output to avoid linking incorrect file
+#
+# Rewritten for pikoPD: whole buffers are formatted at once, text assets can be
+# pre-gzipped (served with Content-Encoding: gzip) and the output is only
+# rewritten when an asset or an option changed.
 
 import os
-import binascii
-
-#Create file to write output into
-output = open('htmldata.c', 'w') 
-
-#Traverse directory, generate list of files
-files = list()
-os.chdir('./html_files')
-for(dirpath, dirnames, filenames) in os.walk('.'):
-    files += [os.path.join(dirpath, file) for file in filenames]
-
-filenames = list()
-varnames  = list()
-
-#Generate appropriate HTTP headers
-for file in files:
-
-    if '404' in file:
+import sys
+import gzip
+import hashlib
+import argparse
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BYTES_PER_LINE = 16
+CHUNK_SIZE = BYTES_PER_LINE * 4096
+STAMP_PREFIX = "/* makefsdata stamp: "
+
+MIME_TYPES = {
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".shtml": "text/html",
+    ".jpg": "image/jpeg",
+    ".gif": "image/gif",
+    ".png": "image/png",
+    ".ico": "image/x-icon",
+    ".class": "application/octet-stream",
+    ".js": "text/javascript",
+    ".css": "text/css",
+    ".svg": "image/svg+xml",
+    ".json": "application/json",
+}
+
+# Worth compressing. Never .shtml/.shtm/.ssi/.xml/.json: lwIP scans those for SSI tags
+GZIP_TYPES = {".html", ".htm", ".js", ".css", ".svg", ".txt"}
+
+
+def http_header(name, gzipped):
+    if '404' in name:
         header = "HTTP/1.0 404 File not found\r\n"
     else:
         header = "HTTP/1.0 200 OK\r\n"
-
     header += "Server: lwIP/pre-0.6 (http://www.sics.se/~adam/lwip/)\r\n"
-
-    if '.html' in file:
-        header += "Content-type: text/html\r\n"
-    elif '.shtml' in file:
-        header += "Content-type: text/html\r\n"
-    elif '.jpg' in file:
-        header += "Content-type: image/jpeg\r\n"
-    elif '.gif' in file:
-        header += "Content-type: image/gif\r\n"
-    elif '.png' in file:
-        header += "Content-type: image/png\r\n"
-    elif '.class' in file:
-       header += "Content-type: application/octet-stream\r\n"
-    elif '.js' in file:
-       header += "Content-type: text/javascript\r\n"
-    elif '.css' in file:
-       header += "Content-type: text/css\r\n"
-    elif '.svg' in file:
-       header += "Content-type: image/svg+xml\r\n"
-    else:
-        header += "Content-type: text/plain\r\n"
-
-    header += "\r\n"
-
-    fvar = file[1:]                 #remove leading dot in filename
-    fvar = fvar.replace('/', '_')   #replace *nix path separator with underscore
-    fvar = fvar.replace('\\', '_')  #replace DOS path separator with underscore
-    fvar = fvar.replace('.', '_')   #replace file extension dot with underscore
-
-    output.write("static const unsigned char data{}[] = {{\n".format(fvar))
-    output.write("\t/* {} */\n\t".format(file))
-
-    #first set of hex data encodes the filename
-    b = bytes(file[1:].replace('\\', '/'), 'utf-8')     #change DOS path separator to forward slash     
-    for byte in binascii.hexlify(b, b' ', 1).split():
-        output.write("0x{}, ".format(byte.decode()))
-    output.write("0,\n\t")
-
-    #second set of hex data is the HTTP header/mime type we generated above
-    b = bytes(header, 'utf-8')
-    count = 0
-    for byte in binascii.hexlify(b, b' ', 1).split():
-        output.write("0x{}, ".format(byte.decode()))
-        count = count + 1
-        if(count == 10):
-            output.write("\n\t")
-            count = 0
-    output.write("\n\t")
-
-    #finally, dump raw hex data from files
-    with open(file, 'rb') as f:
-        count = 0
-        while(byte := f.read(1)):
-            byte = binascii.hexlify(byte)
-            output.write("0x{}, ".format(byte.decode()))
-            count = count + 1
-            if(count == 10):
-                output.write("\n\t")
-                count = 0
-        output.write("};\n\n")
-
-    filenames.append(file[1:])
-    varnames.append(fvar)
-
-for i in range(len(filenames)):
-    prevfile = "NULL"
-    if(i > 0):
-        prevfile = "file" + varnames[i-1]
-
-    output.write("const struct fsdata_file file{0}[] = {{{{ {1}, data{2}, ".format(varnames[i], prevfile, varnames[i]))
-    output.write("data{} + {}, ".format(varnames[i], len(filenames[i]) + 1))
-    output.write("sizeof(data{}) - {}, ".format(varnames[i], len(filenames[i]) + 1))
-    output.write("FS_FILE_FLAGS_HEADER_INCLUDED | FS_FILE_FLAGS_HEADER_PERSISTENT}};\n")
-
-output.write("\n#define FS_ROOT file{}\n".format(varnames[-1])) 
-output.write("#define FS_NUMFILES {}\n".format(len(filenames)))
\ No newline at end of file
+    header += "Content-type: {}\r\n".format(MIME_TYPES.get(os.path.splitext(name)[1], "text/plain"))
+    if gzipped:
+        header += "Content-Encoding: gzip\r\n"
+    return header + "\r\n"
+
+
+def hex_lines(chunks):
+    """Yield one formatted C array row per BYTES_PER_LINE bytes."""
+    for chunk in chunks:
+        for i in range(0, len(chunk), BYTES_PER_LINE):
+            yield "\t" + "".join("0x%02x, " % b for b in chunk[i:i + BYTES_PER_LINE]) + "\n"
+
+
+def file_chunks(path):
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def collect_files(html_dir):
+    files = []
+    for dirpath, dirnames, filenames in os.walk(html_dir):
+        dirnames.sort()
+        for file in sorted(filenames):
+            path = os.path.join(dirpath, file)
+            files.append((path, "/" + os.path.relpath(path, html_dir).replace('\\', '/')))
+    return files
+
+
+def stamp(files, use_gzip):
+    h = hashlib.sha256(b"gzip" if use_gzip else b"raw")
+    for path, name in files:
+        h.update(name.encode())
+        with open(path, 'rb') as f:
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+
+def write_fsdata(files, output_path, use_gzip, digest):
+    varnames = []
+    saved = 0
+    with open(output_path, 'w') as output:
+        output.write("{}{} */\n\n".format(STAMP_PREFIX, digest))
+
+        for path, name in files:
+            fvar = name.replace('/', '_').replace('.', '_')
+            ext = os.path.splitext(name)[1]
+
+            # text assets are small enough to compress in memory; keep gzip only if it helps
+            body = None
+            if use_gzip and ext in GZIP_TYPES:
+                with open(path, 'rb') as f:
+                    raw = f.read()
+                packed = gzip.compress(raw, compresslevel=9, mtime=0)
+                if len(packed) < len(raw):
+                    body = packed
+                    saved += len(raw) - len(packed)
+
+            name_bytes = name.encode('utf-8') + b"\0"
+            header_bytes = http_header(name, body is not None).encode('utf-8')
+
+            output.write("static const unsigned char data{}[] = {{\n".format(fvar))
+            output.write("\t/* .{} */\n".format(name))
+            output.writelines(hex_lines([name_bytes]))
+            output.writelines(hex_lines([header_bytes]))
+            output.writelines(hex_lines([body] if body is not None else file_chunks(path)))
+            output.write("};\n\n")
+            varnames.append((fvar, len(name_bytes)))
+
+        prevfile = "NULL"
+        for fvar, name_len in varnames:
+            output.write("const struct fsdata_file file{0}[] = {{{{ {1}, data{0}, ".format(fvar, prevfile))
+            output.write("data{} + {}, ".format(fvar, name_len))
+            output.write("sizeof(data{}) - {}, ".format(fvar, name_len))
+            output.write("FS_FILE_FLAGS_HEADER_INCLUDED | FS_FILE_FLAGS_HEADER_PERSISTENT}};\n")
+            prevfile = "file" + fvar
+
+        output.write("\n#define FS_ROOT file{}\n".format(varnames[-1][0]))
+        output.write("#define FS_NUMFILES {}\n".format(len(varnames)))
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Embed web assets into an lwIP fsdata C file")
+    parser.add_argument("-i", "--input", default=os.path.join(SCRIPT_DIR, "html_files"), help="Asset folder")
+    parser.add_argument("-o", "--output", default=os.path.join(SCRIPT_DIR, "htmldata.c"), help="Generated C file")
+    parser.add_argument("-z", "--gzip", action="store_true", help="Pre-gzip text assets (not SSI files)")
+    parser.add_argument("-f", "--force", action="store_true", help="Regenerate even if no asset changed")
+    args = parser.parse_args()
+
+    files = collect_files(args.input)
+    if not files:
+        print("makefsdata: no files in {}".format(args.input))
+        sys.exit(1)
+
+    current = stamp(files, args.gzip)
+    if not args.force and os.path.exists(args.output):
+        with open(args.output) as f:
+            if f.readline().strip() == "{}{} */".format(STAMP_PREFIX, current):
+                print("makefsdata: {} is up to date".format(args.output))
+                return
+
+    saved = write_fsdata(files, args.output, args.gzip, current)
+    print("makefsdata: wrote {} ({} files{})".format(
+        args.output, len(files), ", gzip saved {} bytes".format(saved) if args.gzip else ""))
+
+
+if __name__ == "__main__":
+    main()
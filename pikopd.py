@@ -1,9 +1,114 @@
 #!/usr/bin/env python3
-import os, json, shutil, subprocess, jinja2, argparse, time, glob, sys
+import os, json, shutil, subprocess, jinja2, argparse, time, glob, sys, hashlib, re, contextlib, wave, array, threading, struct, random, math, traceback, ast
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+CACHE_VERSION = 1
+
+# board.json "voice_steal" -> VOICE_STEAL in src/PicoVoices.h
+VOICE_STEAL_POLICIES = {"oldest": 0, "quietest": 1, "lowest": 2, "highest": 3}
+
+# board.json "masterfx" buffer sizes; the defaults match the sizes src/masterfx falls back to at 48 kHz
+MASTERFX_DEFAULTS = {"delay_max_ms": 300, "reverb_predelay_ms": 100, "reverb_size": 1.0}
+
+
+def masterfx_defines(settings):
+    """Compile definitions that size the MasterFX buffers, from board.json "masterfx" and the sample rate."""
+    fx = {**MASTERFX_DEFAULTS, **settings.get("masterfx", {})}
+    rate = settings.get("sample_rate", 48000)
+
+    if not 0 < fx["delay_max_ms"] <= 2000:
+        print(f"\033[91m❌ masterfx delay_max_ms {fx['delay_max_ms']} out of range, use 1..2000\033[0m")
+        sys.exit(1)
+    # the right channel reads 1.07x further back; DelayLine wraps with a mask
+    delay_samples = 1 << (math.ceil(fx["delay_max_ms"] * rate / 1000 * 1.07) + 2 - 1).bit_length()
+
+    predelay_samples = max(1, round(fx["reverb_predelay_ms"] * rate / 1000))
+    if predelay_samples > 65535:
+        print(f"\033[91m❌ masterfx reverb_predelay_ms {fx['reverb_predelay_ms']} too long, at most {65535 * 1000 // rate} ms at {rate} Hz\033[0m")
+        sys.exit(1)
+
+    if not 0.25 <= fx["reverb_size"] <= 2.0:
+        print(f"\033[91m❌ masterfx reverb_size {fx['reverb_size']} out of range, use 0.25..2.0\033[0m")
+        sys.exit(1)
+
+    return {"DELAY_MAX_SAMPLES": delay_samples,
+            "REVERB_PREDELAY_SAMPLES": predelay_samples,
+            "REVERB_SIZE_PERCENT": round(fx["reverb_size"] * 100)}
+
+
+class BuildCancelled(Exception):
+    """Raised inside a --watch build when a newer edit replaces it."""
+
+
+def pico_name_hash(name, seed):
+    """Seeded FNV-1a with a final mix; must match pico_name_hash() in src/PicoHash.h."""
+    h = (2166136261 ^ seed) & 0xFFFFFFFF
+    for b in name.encode():
+        h = ((h ^ b) * 16777619) & 0xFFFFFFFF
+    h ^= h >> 15
+    h = (h * 0x2C1B3C6D) & 0xFFFFFFFF
+    h ^= h >> 12
+    return h
+
+
+def route_slot(h, d):
+    """Displaced slot hash; must match route_slot() in src/PicoHash.h."""
+    h = (h ^ ((d * 0x9E3779B1) & 0xFFFFFFFF)) & 0xFFFFFFFF
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    return h
+
+
+def place_buckets(buckets, size):
+    """Find a displacement per bucket so every name lands in its own slot; None if one doesn't fit."""
+    slots = [None] * size
+    disp = [0] * len(buckets)
+    for b in sorted(range(len(buckets)), key=lambda i: -len(buckets[i])):
+        if not buckets[b]:
+            break
+        for d in range(1 << 16):
+            idx = [route_slot(h, d) & (size - 1) for h, _ in buckets[b]]
+            if len(set(idx)) == len(idx) and all(slots[i] is None for i in idx):
+                break
+        else:
+            return None
+        disp[b] = d
+        for i, (_, (name, value)) in zip(idx, buckets[b]):
+            slots[i] = {"name": name, "value": value}
+    return slots, disp
+
+
+def perfect_hash_table(entries):
+    """Place (name, value) pairs into a collision-free power-of-two table (hash and displace).
+
+    Names are split into buckets by their base hash; each bucket gets a 16-bit
+    displacement that moves all of its names into free slots. Lookup is one
+    string hash, two table reads and one strcmp. Returns {"seed", "mask",
+    "disp", "disp_mask", "slots"}, slots being {"name", "value"} or None.
+    """
+    size = 1
+    while size < len(entries):
+        size *= 2
+
+    while True:
+        n_buckets = max(1, size // 2)
+        for seed in range(256):
+            hashes = [pico_name_hash(name, seed) for name, _ in entries]
+            if len(set(hashes)) != len(hashes):
+                continue
+            buckets = [[] for _ in range(n_buckets)]
+            for h, entry in zip(hashes, entries):
+                buckets[(h >> 16) & (n_buckets - 1)].append((h, entry))
+            placed = place_buckets(buckets, size)
+            if placed:
+                slots, disp = placed
+                return {"seed": seed, "mask": size - 1, "disp": disp, "disp_mask": n_buckets - 1, "slots": slots}
+        size *= 2
 
 
 class PicoUF2Generator:
-    def __init__(self, pd_path, project_root, src_dir=None, verbose=False):
+    def __init__(self, pd_path, project_root, src_dir=None, verbose=False, hvcc_dir=None):
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.pd_path = os.path.abspath(pd_path)
         self.project_root = os.path.abspath(project_root)
@@ -15,12 +120,27 @@ class PicoUF2Generator:
             self.src_dir = os.path.abspath(src_dir)
         self.c_dir = os.path.join(self.project_root, "src")
         self.patch_name = os.path.splitext(os.path.basename(self.pd_path))[0]
-        self.hvcc_dir = os.path.join(self.project_root, "hvcc")
+        self.hvcc_dir = os.path.abspath(hvcc_dir) if hvcc_dir else os.path.join(self.project_root, "hvcc")
         self.build_dir = os.path.join(self.project_root, "build")
         self.ir_json = os.path.join(self.hvcc_dir, f"{self.patch_name}.heavy.ir.json")
         self.manifest_out = os.path.join(self.hvcc_dir, f"{self.patch_name}_manifest.json")
-        self.hv_lib_path = os.path.abspath(os.path.join(self.project_root, "../lib", "heavylib"))
-        
+        self.lib_dir = os.path.join(self.script_dir, "lib")
+        self.hv_lib_path = os.path.join(self.lib_dir, "heavylib")
+        self.cache_file = os.path.join(self.project_root, ".pikopd_cache.json")
+        self.cache = {}
+        self.use_cache = True
+        self.jobs = os.cpu_count() or 4
+        self.quiet = False
+        self.ignore_budget = False
+        self.sample_banks = []
+        self.sample_bytes = 0
+        self.jinja_env = None
+        self.cancel = None  # threading.Event set by PicoWatcher to abort the build
+        self.inflash_tables = 0  # hvcc tables samples_inflash moved to flash
+        self.settings = None  # board config of the build in run_stages
+        self.proc = None
+        self.timings = {}
+
     def print_logo(self):
         logo = r"""
            _  _           _____  _____  
@@ -30,11 +150,11 @@ class PicoUF2Generator:
     | .__/|_||_|\_\ \___/|_|    |_____/ 
     |_|   [hvcc]  RP2040|RP2350  v0.0.1 
         """
-        if not self.verbose:
+        if not self.verbose and not self.quiet:
             print(f"\033[36m{logo}\033[0m")
 
     def print_progress(self, percent, task, error=False):
-        if self.verbose:
+        if self.verbose or self.quiet:
             return
         bar_length = 20
         filled = int(round(bar_length * percent))
@@ -47,18 +167,67 @@ class PicoUF2Generator:
         )
         sys.stdout.flush()
 
+    @contextlib.contextmanager
+    def timed(self, stage):
+        """Add the wall time of a pipeline stage to self.timings for the build report."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[stage] = self.timings.get(stage, 0.0) + time.perf_counter() - start
+
+    def write_build_report(self, settings, board_config=None, status="ok"):
+        """Stage times and firmware footprint -> build_report.json, one line appended to build_history.jsonl."""
+        firmware = None
+        if status == "ok":
+            chip = PicoBudgetEstimator(self.ir_json, self.src_dir, settings).chip()
+            firmware = PicoFirmwareReport(self.build_dir, chip).analyze()
+
+        report = {
+            "patch": self.patch_name,
+            "board": os.path.splitext(os.path.basename(board_config or "board.json"))[0],
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "status": status,
+            "stages": {stage: round(t, 3) for stage, t in self.timings.items()},
+            "total": round(sum(self.timings.values()), 3),
+            "firmware": firmware,
+        }
+
+        os.makedirs(self.project_root, exist_ok=True)
+        with open(os.path.join(self.project_root, "build_report.json"), "w") as f:
+            json.dump(report, f, indent=2)
+        with open(os.path.join(self.project_root, "build_history.jsonl"), "a") as f:
+            f.write(json.dumps(report, sort_keys=True) + "\n")
+        return report
+
+    def check_cancelled(self):
+        if self.cancel is not None and self.cancel.is_set():
+            raise BuildCancelled()
+
     def run_cmd(self, cmd, cwd=None, step_name="Command"):
+        self.check_cancelled()
         if self.verbose:
             print(f"\n--- [ {step_name.upper()} ] ---")
-            res = subprocess.run(cmd, cwd=cwd)
-            if res.returncode != 0:
-                sys.exit(1)
-            return res
+            self.proc = subprocess.Popen(cmd, cwd=cwd)
         else:
-            res = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
-            if res.returncode != 0:
-                self.handle_error(step_name, res)
-            return res
+            self.proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        # Popen rather than run, so PicoWatcher can terminate a build that a newer edit replaced
+        stdout, stderr = self.proc.communicate()
+        res = subprocess.CompletedProcess(cmd, self.proc.returncode, stdout, stderr)
+        self.proc = None
+        self.check_cancelled()
+
+        if res.returncode != 0:
+            if self.verbose:
+                sys.exit(1)
+            self.handle_error(step_name, res)
+        return res
+
+    def terminate(self):
+        """Stop the running hvcc/cmake/make command, from another thread."""
+        proc = self.proc
+        if proc is not None and proc.poll() is None:
+            proc.terminate()
 
     def handle_error(self, step_name, result):
         print(f"\n\n\033[91m❌ ERROR during {step_name}:\033[0m")
@@ -149,6 +318,80 @@ class PicoUF2Generator:
 
         return manifest
 
+    def load_cache(self):
+        self.cache = {}
+        if not self.use_cache or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.cache = data.get("stages", {})
+
+    def save_cache(self):
+        if not self.use_cache:
+            return
+        os.makedirs(self.project_root, exist_ok=True)
+        with open(self.cache_file, "w") as f:
+            json.dump({"version": CACHE_VERSION, "stages": self.cache}, f, indent=2, sort_keys=True)
+
+    def is_cached(self, stage, key):
+        return self.use_cache and self.cache.get(stage) == key
+
+    def mark_cached(self, stage, key):
+        self.cache[stage] = key
+        self.save_cache()
+
+    def hash_inputs(self, files=(), values=()):
+        """Content hash over a list of files and plain values, used as a stage cache key."""
+        h = hashlib.sha256()
+        for path in files:
+            h.update(os.path.relpath(path, self.script_dir).encode())
+            with open(path, "rb") as f:
+                h.update(hashlib.sha256(f.read()).digest())
+        for value in values:
+            h.update(json.dumps(value, sort_keys=True).encode())
+        return h.hexdigest()
+
+    def collect_pd_dependencies(self, pd_path=None):
+        """Return the patch plus every local or heavylib abstraction it pulls in."""
+        pending = [os.path.abspath(pd_path or self.pd_path)]
+        found = []
+        while pending:
+            path = pending.pop()
+            if path in found or not os.path.exists(path):
+                continue
+            found.append(path)
+            with open(path, errors="ignore") as f:
+                records = re.split(r"(?<!\\);\s*\n", f.read())
+            for record in records:
+                tokens = record.split()
+                if len(tokens) < 5 or tokens[:2] != ["#X", "obj"]:
+                    continue
+                name = tokens[4].replace("\\", "")
+                for base in (os.path.dirname(path), self.hv_lib_path):
+                    if "$" in name:
+                        # dynamic abstraction such as hv.osc/$1: depend on the whole folder
+                        folder = os.path.join(base, os.path.dirname(name))
+                        if os.path.dirname(name) and os.path.isdir(folder):
+                            pending.extend(glob.glob(os.path.join(folder, "*.pd")))
+                    elif os.path.exists(os.path.join(base, name + ".pd")):
+                        pending.append(os.path.abspath(os.path.join(base, name + ".pd")))
+                        break
+        return sorted(found)
+
+    def write_if_changed(self, path, text):
+        """Write text to path only when it differs, so make does not see a new mtime."""
+        if os.path.exists(path):
+            with open(path) as f:
+                if f.read() == text:
+                    return False
+        with open(path, "w") as f:
+            f.write(text)
+        return True
+
     def flatten_hvcc_output(self):
         """Move hvcc outputs into a single directory."""
         for sub in ["c", "ir", "hv"]:
@@ -161,6 +404,18 @@ class PicoUF2Generator:
                     src = os.path.join(root, f)
                     dst = os.path.join(self.hvcc_dir, f)
 
+                    # patch before comparing, the file on disk is already patched
+                    if f == f"Heavy_{self.patch_name}.cpp":
+                        with open(src) as fh:
+                            self.write_if_changed(dst, self.samples_inflash(fh.read()))
+                        continue
+
+                    # keep the old file (and its mtime) when hvcc produced identical content
+                    if os.path.exists(dst) and os.path.getsize(src) == os.path.getsize(dst):
+                        with open(src, "rb") as a, open(dst, "rb") as b:
+                            if a.read() == b.read():
+                                continue
+
                     # overwrite if newer
                     if not os.path.exists(dst) or (
                         os.path.getmtime(src) > os.path.getmtime(dst)
@@ -169,81 +424,86 @@ class PicoUF2Generator:
 
             shutil.rmtree(subdir, ignore_errors=True)
 
-    def samples_inflash(self):
-        """Finds generated Heavy tables and adds 'static const' to move them to Flash."""
-        # Find the main generated C++ file (usually Heavy_patchname.cpp)
-        cpp_file = os.path.join(self.hvcc_dir, f"Heavy_{self.patch_name}.cpp")
-        
-        if not os.path.exists(cpp_file):
-            if self.verbose: print(f"Warning: {cpp_file} not found for patching.")
-            return
-
-        with open(cpp_file, 'r') as f:
-            lines = f.readlines()
+    def samples_inflash(self, text):
+        """Declare Heavy tables with initial data 'static const' in Heavy_<patch>.cpp so they stay in flash.
 
-        patched = False
-        with open(cpp_file, 'w') as f:
-            for line in lines:
-                # Target the hTable definitions
-                if line.startswith("float hTable") and "[" in line:
-                    f.write("static const " + line)
-                    patched = True
-                else:
-                    f.write(line)
-        
-        if patched and self.verbose:
-            print(f"  -> Patched {cpp_file}: Tables moved to Flash memory.")
+        Tables with saved contents do not go through PicoSampleAssets: they keep
+        hvcc's float data (4 bytes per value) and this textual patch. When the
+        patch matches nothing, check_inflash() warns after hvcc.
+        """
+        # float hTable_x[N] = {...}, whatever qualifiers and spacing hvcc emits
+        text, self.inflash_tables = re.subn(
+            r"^[ \t]*(?:(?:static|const)\s+)*float\s+(hTable_\w+)\s*\[",
+            r"static const float \1[", text, flags=re.M
+        )
+        if self.inflash_tables and self.verbose:
+            print(f"  -> Patched Heavy_{self.patch_name}.cpp: {self.inflash_tables} tables moved to Flash memory.")
+        return text
 
-    def run_all(self, flash=False, board_config=None, serial=False, skip_hvcc=False, midi_host=None):
-        self.print_logo()
-        start_time = time.time()
-        print(f"\033[1mBuilding: {self.patch_name}\033[0m")
+    def check_inflash(self):
+        """Warn when the patch has tables with saved contents but samples_inflash found no declaration."""
+        if self.inflash_tables or not os.path.exists(self.ir_json):
+            return
+        with open(self.ir_json) as f:
+            saved = [obj.get("args", {}).get("name") for obj in json.load(f).get("objects", {}).values()
+                     if obj.get("type") == "__table" and obj.get("args", {}).get("values")]
+        if saved:
+            print(f"\n\033[33m⚠️  Tables with saved contents stay in RAM: no float hTable_ declaration found in "
+                  f"Heavy_{self.patch_name}.cpp for {', '.join(saved)} (hvcc output format changed?)\033[0m")
 
-        if not os.path.exists(self.hv_lib_path):
-            print(f"❌ Heavy library path not found: {self.hv_lib_path}")
-            sys.exit(1)
+    def hvcc_outputs_exist(self):
+        return os.path.exists(self.ir_json) and os.path.exists(
+            os.path.join(self.hvcc_dir, f"Heavy_{self.patch_name}.cpp")
+        )
 
-        # 1. Heavy Compiler Step
-        if not skip_hvcc:
-            self.print_progress(0.1, "Heavy Compiler")
-            hvcc_cmd = [
-                "hvcc", self.pd_path,
-                "-o", self.hvcc_dir,
-                "-n", self.patch_name,
-                "-g", "c",
-                "-p", self.hv_lib_path,
-            ]
-            self.run_cmd(hvcc_cmd, step_name="HVCC")
-            self.flatten_hvcc_output()
-            self.samples_inflash()
-        else:
+    def run_hvcc(self, skip_hvcc=False):
+        """Heavy compiler step, skipped when the patch and its abstractions are unchanged."""
+        if skip_hvcc:
             print("\033[33m⚠️  Skipping HVCC file regeneration (--skip-hvcc enabled)\033[0m")
+            return False
 
-        # 2. Load Configuration
-        self.print_progress(0.3, "Setup")
+        hvcc_cmd = [
+            "hvcc", self.pd_path,
+            "-o", self.hvcc_dir,
+            "-n", self.patch_name,
+            "-g", "c",
+            "-p", self.hv_lib_path,
+        ]
+        key = self.hash_inputs(self.collect_pd_dependencies(), [hvcc_cmd])
+        if self.is_cached("hvcc", key) and self.hvcc_outputs_exist():
+            self.print_progress(0.1, "Heavy Compiler (cached)")
+            if self.verbose:
+                print("  -> HVCC inputs unchanged, reusing generated C files")
+            return False
+
+        self.print_progress(0.1, "Heavy Compiler")
+        self.run_cmd(hvcc_cmd, step_name="HVCC")
+        self.inflash_tables = 0
+        self.flatten_hvcc_output()
+        self.check_inflash()
+        self.mark_cached("hvcc", key)
+        return True
+
+    def load_settings(self, board_config=None):
         settings = {"pico_board": "pico2", "midi_mode": "usb"} # Default base settings
 
         config_filename = board_config if board_config else "board.json"
         config_path = os.path.join(self.script_dir, config_filename)
-        
+
         if not os.path.exists(config_path):
             print(f"\033[91m❌ Configuration file not found: {config_filename}\033[0m")
             sys.exit(1)
 
         with open(config_path) as f:
             settings.update(json.load(f))
-            
-        print(f"\033[32m  -> Using config: {config_filename}\033[0m")
 
-        # 1. Prepare
+        print(f"\033[32m  -> Using config: {config_filename}\033[0m")
+        return settings
 
-        midi_mode = midi_host if midi_host else settings.get("midi_mode")
+    def sync_sources(self, settings):
+        """Copy src/ into the project, skipping files whose size and mtime already match."""
         web_enabled = settings.get("web", {}).get("enabled", False)
         display_enabled = settings.get("display", {}).get("enabled", False)
-        sensors = settings.get("sensors", {})
-        distance_enabled = len(sensors.get("hc-sr04", [])) > 0
-        mpr121_enabled = len(settings.get("sensors", {}).get("mpr121", [])) > 0
-        masterfx = settings.get("masterfx", {})
 
         # Determine which folder to ignore based on web status
 
@@ -256,12 +516,17 @@ class PicoUF2Generator:
         if not display_enabled:
             ignore_list.append("screen")
 
-        # 2. Sync files
         os.makedirs(self.c_dir, exist_ok=True)
 
+        # htmldata.c is generated from web/html_files in the project, see build_web_assets()
+        generated = []
+        if os.path.isdir(os.path.join(self.src_dir, "web", "html_files")):
+            generated.append(os.path.join("web", "htmldata.c"))
+
+        copied = 0
         for root, dirs, files in os.walk(self.src_dir):
             rel_dir = os.path.relpath(root, self.src_dir)
-            
+
             # Check if the current folder is in our ignore list
             if any(rel_dir == f or rel_dir.startswith(f + os.sep) for f in ignore_list):
                 dirs[:] = []  # Tell os.walk not to look inside these folders
@@ -270,22 +535,150 @@ class PicoUF2Generator:
             for f in files:
                 src_file = os.path.join(root, f)
                 rel_path = os.path.relpath(src_file, self.src_dir)
+                if rel_path in generated:
+                    continue
                 dest_file = os.path.join(self.project_root, f) if f == "CMakeLists.txt" else os.path.join(self.c_dir, rel_path)
-                
+
+                # copy2 preserves mtime, so an unchanged pair is detected from stat alone
+                src_stat = os.stat(src_file)
+                if os.path.exists(dest_file):
+                    dest_stat = os.stat(dest_file)
+                    if (dest_stat.st_size == src_stat.st_size
+                            and dest_stat.st_mtime_ns == src_stat.st_mtime_ns):
+                        continue
+
                 os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-                if not os.path.exists(dest_file) or open(src_file, "rb").read() != open(dest_file, "rb").read():
-                    shutil.copy2(src_file, dest_file)
+                shutil.copy2(src_file, dest_file)
+                copied += 1
+
+        if self.verbose:
+            print(f"  -> Synced sources: {copied} file(s) updated")
+
+        if web_enabled:
+            self.build_web_assets()
+
+    def build_web_assets(self):
+        """Regenerate htmldata.c from web/html_files; makefsdata skips the write when no asset changed."""
+        html_dir = os.path.join(self.c_dir, "web", "html_files")
+        if not os.path.isdir(html_dir):
+            return
+        makefsdata = os.path.join(self.lib_dir, "pico-w-webserver", "makefsdata.py")
+        self.run_cmd(
+            [sys.executable, makefsdata, "-i", html_dir, "-o", os.path.join(self.c_dir, "web", "htmldata.c"), "--gzip"],
+            step_name="Web assets",
+        )
+
+    def build_params(self, settings, manifest):
+        """Receivers fed by continuous controls; each gets a last-write-wins slot on the audio core."""
+        receives = {r["name"]: r["hash"] for r in manifest.get("receives", [])}
+        inputs = settings.get("inputs", {})
+        sensors = inputs.get("sensors", {})
+
+        names = [k["name"] for k in inputs.get("adc_pins", [])]
+        for j in inputs.get("joystick", []):
+            names += [j["name"] + "_x", j["name"] + "_y"]
+        names += [c["name"] for c in sensors.get("cny70", [])]
+        names += [d["name"] for d in sensors.get("hc-sr04", [])]
+        if settings.get("web", {}).get("enabled", False):
+            names += [r for r in receives if r.startswith(("web", "osc"))]
+
+        params = []
+        for name in names:
+            if name in receives and name not in params:
+                params.append(name)
+        return [{"name": name, "hash": receives[name]} for name in params]
+
+    def build_routes(self, manifest, params):
+        """Perfect-hash tables for the web, OSC and print name lookups in main.cpp.
+
+        Web and OSC names resolve to their parameter slot, prints to their index.
+        web_params and web_values are the /params.cgi indices: web receivers with
+        their slot and web sends, both in manifest order.
+        """
+        slots = {p["name"]: i for i, p in enumerate(params)}
+        receives = [r["name"] for r in manifest.get("receives", []) if r["name"] in slots]
+        return {
+            "web": perfect_hash_table([(r, slots[r]) for r in receives if r.startswith("web")]),
+            "osc": perfect_hash_table([("/" + r, slots[r]) for r in receives if r.startswith("osc")]),
+            "print": perfect_hash_table([(p["name"], i) for i, p in enumerate(manifest.get("prints", []))]),
+            "web_params": [{"name": r, "slot": slots[r]} for r in receives if r.startswith("web")],
+            "web_values": [s["name"] for s in manifest.get("sends", []) if s["name"].startswith("web")],
+        }
+
+    def build_samples(self, settings, manifest):
+        """Encode board.json "samples" into src/samples_data.cpp, skipped when nothing changed."""
+        out_path = os.path.join(self.c_dir, "samples_data.cpp")
+        self.sample_banks, self.sample_bytes = [], 0
+        if not settings.get("samples"):
+            if os.path.exists(out_path):
+                os.remove(out_path)
+            return
+
+        assets = PicoSampleAssets(settings, manifest, self.ir_json,
+                                  [os.path.dirname(self.pd_path), self.script_dir])
+        banks = assets.banks()
+        files = [f for bank in banks for f in bank["files"]]
+        key = self.hash_inputs(files, [settings["samples"], settings.get("sample_rate", 48000), banks,
+                                        PicoSampleAssets.ADPCM_BLOCK_FRAMES])
+        cached = self.cache.get("samples") if isinstance(self.cache.get("samples"), dict) else {}
+        if self.use_cache and cached.get("key") == key and os.path.exists(out_path):
+            self.print_progress(0.55, "Sample banks (cached)")
+            self.sample_bytes = cached.get("bytes", 0)
+        else:
+            self.print_progress(0.55, "Sample banks")
+            self.sample_bytes, raw_bytes = assets.write(out_path)
+            if self.verbose:
+                print(f"\n  -> {len(files)} samples: {self.sample_bytes / 1024:.1f} KB in flash "
+                      f"({raw_bytes / 1024:.1f} KB as float)")
+            self.mark_cached("samples", {"key": key, "bytes": self.sample_bytes})
+
+        sends = {s["name"]: s["hash"] for s in manifest.get("sends", [])}
+        self.sample_banks = [{"table": b["table"], "send": sends.get(b["table"] + "_sample")} for b in banks]
+
+    def render_main(self, settings, manifest):
+        """Render main.cpp, leaving the file untouched when the output did not change."""
+        # kept for the life of the generator; the loader reloads main.cpp when it changes
+        if self.jinja_env is None:
+            self.jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader(self.templates))
+        params = self.build_params(settings, manifest)
+        new_main = self.jinja_env.get_template("main.cpp").render(
+            name=self.patch_name, hv_manifest=manifest, board=settings,
+            params=params, routes=self.build_routes(manifest, params), samples=self.sample_banks
+        )
+        changed = self.write_if_changed(os.path.join(self.c_dir, "main.cpp"), new_main)
+        if self.verbose and not changed:
+            print("  -> main.cpp unchanged")
+        return changed
+
+    def check_budget(self, settings):
+        """Estimate RAM/flash and DSP load from the IR and stop before CMake if the patch clearly won't fit."""
+        if not os.path.exists(self.ir_json):
+            return None
+        self.print_progress(0.6, "Budget estimate")
+        report = PicoBudgetEstimator(self.ir_json, self.src_dir, settings, self.sample_bytes).estimate()
+        with open(os.path.join(self.hvcc_dir, f"{self.patch_name}_budget.json"), "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+        problems = PicoBudgetEstimator.problems(report)
+        if self.verbose or problems:
+            sys.stdout.write("\n")
+            PicoBudgetEstimator.print_report(report)
+        if problems:
+            for problem in problems:
+                print(f"\033[91m❌ {problem}\033[0m")
+            if not self.ignore_budget:
+                print("\033[33m   Use --ignore-budget to build anyway.\033[0m")
+                sys.exit(1)
+        return report
+
+    def build_cmake_cmd(self, settings, midi_host=None):
+        midi_mode = midi_host if midi_host else settings.get("midi_mode")
+        display_enabled = settings.get("display", {}).get("enabled", False)
+        sensors = settings.get("sensors", {})
+        distance_enabled = len(sensors.get("hc-sr04", [])) > 0
+        mpr121_enabled = len(settings.get("sensors", {}).get("mpr121", [])) > 0
+        masterfx = settings.get("masterfx", {})
 
-        # 4. Generate main.cpp Template
-        self.print_progress(0.5, "Updating C++ & Manifest")
-        manifest = self.collect_and_save_manifest()
-        env = jinja2.Environment(loader=jinja2.FileSystemLoader(self.templates))
-        new_main = env.get_template("main.cpp").render(name=self.patch_name, hv_manifest=manifest, board=settings)
-        
-        with open(os.path.join(self.c_dir, "main.cpp"), "w") as f:
-            f.write(new_main)
-
-        # 5. CMake Configuration
         sdk = os.environ.get("PICO_SDK_PATH")
         board = settings.get("pico_board", "pico")
         sdk_target = "pico_w" if board == "pico_w" else ("pico" if board == "zero" else board)
@@ -295,14 +688,13 @@ class PicoUF2Generator:
         else:
             toolchain_file = os.path.join(sdk, "cmake/preload/toolchains/pico_arm_cortex_m0plus_gcc.cmake")
 
-        os.makedirs(self.build_dir, exist_ok=True)
-        self.print_progress(0.7, "Configuring CMake")
-
         cmake_cmd = [
             "cmake", "-G", "Unix Makefiles",
             f"-DPICO_SDK_PATH={sdk}",
             f"-DPICO_BOARD={sdk_target}",
             f"-DCMAKE_TOOLCHAIN_FILE={toolchain_file}",
+            f"-DHVCC_DIR={self.hvcc_dir}",
+            f"-DPIKOPD_LIB_DIR={self.lib_dir}",
             self.project_root,
         ]
 
@@ -311,18 +703,18 @@ class PicoUF2Generator:
         if web_cfg.get("enabled"):
             mode = web_cfg.get("active_mode", 0)
             creds = web_cfg.get("ap" if mode == 0 else "sta", {})
-            osc = web_cfg.get("osc", {})
-            
+
             cmake_cmd.extend([
                 "-DWEB=1",
                 f"-DACTIVE_MODE={mode}",
                 f'-DWIFI_SSID="{creds.get("ssid", "")}"',
                 f'-DWIFI_PASSWORD="{creds.get("password", "")}"',
                 f'-DMDNS_NAME="{web_cfg.get("mdns_name", "pikopd")}"',
-                f"-DOSC_ENABLED={1 if osc.get('enabled', True) else 0}",
+                f"-DOSC_ENABLED={1 if web_cfg.get('osc_enabled', True) else 0}",
                 f'-DOSC_PORT={web_cfg.get("osc_port", 8000)}',
-                "-DMIDI_HOST_ENABLED=0",  
-                "-DMIDI_UART_ENABLED=1"   
+                f'-DOSC_INTERVAL_MS={int(web_cfg.get("osc_interval_ms", 20))}',
+                "-DMIDI_HOST_ENABLED=0",
+                "-DMIDI_UART_ENABLED=1"
             ])
             print("\033[32m  -> Web Enabled: MIDI Host disabled, UART MIDI enabled\033[0m")
         else:
@@ -340,6 +732,10 @@ class PicoUF2Generator:
         # Console & Extra Flags
         cmake_cmd.append(f"-DENABLE_DEBUG={'1' if settings.get('console') else '0'}")
 
+        cmake_cmd.append(f"-DTELEMETRY_BINARY={1 if settings.get('console') and settings.get('telemetry') else 0}")
+
+        cmake_cmd.append(f"-DAUDIO_PROFILE={1 if settings.get('profile') else 0}")
+
         cmake_cmd.append(f"-DDISPLAY_ENABLED={1 if display_enabled else 0}")
 
         cmake_cmd.append(f"-DDISTANCE_SENSOR_ENABLED={1 if distance_enabled else 0}")
@@ -351,37 +747,1567 @@ class PicoUF2Generator:
         cmake_cmd.append(f"-DUSE_REVERB={1 if masterfx.get('reverb', False) else 0}")
 
         cmake_cmd.append(f"-DUSE_LIMITER={1 if masterfx.get('limiter', False) else 0}")
+        cmake_cmd += [f"-D{name}={value}" for name, value in masterfx_defines(settings).items()]
 
         if board == "zero": cmake_cmd.append("-DPICO_ZERO_BOARD=1")
         cmake_cmd.append(f"-DMAX_VOICES={settings.get('voice_count', 1)}")
 
+        steal = settings.get("voice_steal", "oldest")
+        if steal not in VOICE_STEAL_POLICIES:
+            print(f"\033[91m❌ Unknown voice_steal '{steal}', use one of: {', '.join(VOICE_STEAL_POLICIES)}\033[0m")
+            sys.exit(1)
+        cmake_cmd.append(f"-DVOICE_STEAL={VOICE_STEAL_POLICIES[steal]}")
+        cmake_cmd.append(f"-DVOICE_RETRIGGER={1 if settings.get('voice_retrigger', True) else 0}")
+
+        if settings.get("dual_core"):
+            voices = settings.get("voice_count", 1)
+            if voices > 1:
+                print(f"\033[32m  -> Dual core: {voices} voices, [r NOTE1] .. [r NOTE{(voices + 1) // 2}] on each core\033[0m")
+            else:
+                print("\033[33m  -> dual_core needs voice_count 2 or more, running on one core\033[0m")
+
+        if settings.get("sample_accurate"):
+            block_ms = settings.get("buffer_size", 64) * 1000 / settings.get("sample_rate", 48000)
+            print(f"\033[32m  -> Sample-accurate events: MIDI and controls play {block_ms:.1f} ms (one block) later, without jitter\033[0m")
+
+        return cmake_cmd
+
+    def configure_cmake(self, settings, midi_host=None):
+        """Run CMake configure unless the flags, CMakeLists and source list are unchanged."""
+        cmake_cmd = self.build_cmake_cmd(settings, midi_host)
+        os.makedirs(self.build_dir, exist_ok=True)
+
+        # CMakeLists globs the hvcc and project sources, so a new or removed file needs a reconfigure
+        hvcc_sources = sorted(
+            os.path.basename(f) for f in glob.glob(os.path.join(self.hvcc_dir, "*.c*"))
+        )
+        project_sources = sorted(os.path.basename(f) for f in glob.glob(os.path.join(self.c_dir, "*.cpp")))
+        key = self.hash_inputs(
+            [os.path.join(self.project_root, "CMakeLists.txt")], [cmake_cmd, hvcc_sources, project_sources]
+        )
+        if self.is_cached("cmake", key) and os.path.exists(os.path.join(self.build_dir, "CMakeCache.txt")):
+            self.print_progress(0.7, "Configuring CMake (cached)")
+            return False
+
+        self.print_progress(0.7, "Configuring CMake")
         self.run_cmd(cmake_cmd, cwd=self.build_dir, step_name="CMake")
+        self.mark_cached("cmake", key)
+        return True
 
-        # 6. Compilation & Flash
+    def compile(self):
         self.print_progress(0.85, "Compiling")
-        self.run_cmd(["make", "-j10"], cwd=self.build_dir, step_name="Make")
+        self.run_cmd(["make", f"-j{self.jobs}"], cwd=self.build_dir, step_name="Make")
+
+    def find_uf2(self):
+        found = glob.glob(os.path.join(self.build_dir, "*.uf2"))
+        return found[0] if found else None
+
+    def flash_uf2(self):
+        if self.check_pico_bootsel():
+            self.print_progress(0.95, "Flashing")
+            uf2 = self.find_uf2()
+            self.run_cmd(["picotool", "load", "-f", "-x", uf2], step_name="Flash")
+            return True
+        print("\033[91m❌ STOP: Pico not in BOOTSEL mode.\033[0m")
+        sys.exit(1)
+
+    def run_stages(self, board_config=None, midi_host=None, manifest=None, skip_hvcc=False):
+        """hvcc, sync, samples, render, budget, cmake and make, each timed into self.timings.
+
+        Passing a manifest skips hvcc (batch builds run it once per patch). A build
+        stops between stages when self.cancel is set, and progress goes through
+        print_progress, silent when quiet. self.settings is set as soon as the board
+        config is loaded, so a caller can still report a build that failed later.
+        Returns the settings.
+        """
+        self.settings = None
+        if manifest is None:
+            # 1. Heavy Compiler Step
+            with self.timed("hvcc"):
+                self.run_hvcc(skip_hvcc)
+            self.check_cancelled()
+
+        # 2. Load Configuration and sync files
+        self.print_progress(0.3, "Setup")
+        with self.timed("sync"):
+            self.settings = self.load_settings(board_config)
+            self.sync_sources(self.settings)
+        self.check_cancelled()
+
+        # 3. Generate main.cpp Template
+        self.print_progress(0.5, "Updating C++ & Manifest")
+        with self.timed("samples"):
+            if manifest is None:
+                manifest = self.collect_and_save_manifest()
+            self.build_samples(self.settings, manifest)
+        with self.timed("render"):
+            self.render_main(self.settings, manifest)
+        with self.timed("budget"):
+            self.check_budget(self.settings)
+        self.check_cancelled()
+
+        # 4. CMake Configuration
+        with self.timed("cmake"):
+            self.configure_cmake(self.settings, midi_host)
+
+        # 5. Compilation
+        with self.timed("make"):
+            self.compile()
+        return self.settings
+
+    def run_all(self, flash=False, board_config=None, serial=False, skip_hvcc=False, midi_host=None):
+        self.print_logo()
+        start_time = time.time()
+        print(f"\033[1mBuilding: {self.patch_name}\033[0m")
+
+        if not os.path.exists(self.hv_lib_path):
+            print(f"❌ Heavy library path not found: {self.hv_lib_path}")
+            sys.exit(1)
+
+        self.load_cache()
+        self.timings = {}
+        settings = self.run_stages(board_config, midi_host, skip_hvcc=skip_hvcc)
 
         flash_success = False
         if flash:
-            if self.check_pico_bootsel():
-                self.print_progress(0.95, "Flashing")
-                uf2 = glob.glob(os.path.join(self.build_dir, "*.uf2"))[0]
-                self.run_cmd(["picotool", "load", "-f", "-x", uf2], step_name="Flash")
-                flash_success = True
-            else:
-                print("\033[91m❌ STOP: Pico not in BOOTSEL mode.\033[0m")
-                sys.exit(1)
+            with self.timed("flash"):
+                flash_success = self.flash_uf2()
 
         duration = time.time() - start_time
         self.print_progress(1.0, f"Finished in {duration:.1f}s")
         sys.stdout.write("\n")
+        PicoFirmwareReport.print_report(self.write_build_report(settings, board_config))
         if serial and flash_success: self.open_serial()
 
+class PicoSampleAssets:
+    """WAV sample banks from board.json "samples", stored in flash as int16 or IMA-ADPCM.
+
+    Each bank feeds one exposed Heavy table. The encoded data is written to
+    src/samples_data.cpp and decoded into the table by src/PicoSamples.h.
+    """
+
+    FORMATS = {"int16": "SAMPLE_INT16", "adpcm": "SAMPLE_ADPCM"}
+
+    # Must match src/PicoSamples.h
+    ADPCM_BLOCK_FRAMES = 256
+    ADPCM_STEPS = [
+        7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+        50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230,
+        253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963,
+        1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327,
+        3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487,
+        12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767,
+    ]
+    ADPCM_INDEX = [-1, -1, -1, -1, 2, 4, 6, 8, -1, -1, -1, -1, 2, 4, 6, 8]
+
+    def __init__(self, settings, manifest, ir_json, search_dirs):
+        self.settings = settings
+        self.manifest = manifest
+        self.ir_json = ir_json
+        self.search_dirs = search_dirs
+        self.sample_rate = settings.get("sample_rate", 48000)
+
+    def fail(self, message):
+        print(f"\n\033[91m❌ samples: {message}\033[0m")
+        sys.exit(1)
+
+    def find_file(self, name):
+        for base in self.search_dirs:
+            path = os.path.join(base, name)
+            if os.path.exists(path):
+                return os.path.abspath(path)
+        self.fail(f"{name} not found next to the patch or in {self.search_dirs[-1]}")
+
+    def banks(self):
+        """Validate board.json "samples" against the patch tables."""
+        tables = {}
+        if os.path.exists(self.ir_json):
+            with open(self.ir_json) as f:
+                for obj in json.load(f).get("objects", {}).values():
+                    if obj.get("type") == "__table":
+                        args = obj.get("args", {})
+                        tables[args.get("name")] = args
+        hashes = {t["name"]: t["hash"] for t in self.manifest.get("tables", [])}
+
+        banks = []
+        for entry in self.settings.get("samples", []):
+            table = entry.get("table")
+            files = entry.get("files") or ([entry["file"]] if entry.get("file") else [])
+            fmt = entry.get("format", "int16")
+            if table not in tables:
+                self.fail(f"table '{table}' is not in the patch, add [table {table} <size> @hv_table]")
+            if tables[table].get("values"):
+                self.fail(f"table '{table}' has saved contents, turn off 'save contents' so it lives in RAM")
+            if fmt not in self.FORMATS:
+                self.fail(f"unknown format '{fmt}' for '{table}', use one of: {', '.join(self.FORMATS)}")
+            if not files:
+                self.fail(f"no files for table '{table}'")
+            banks.append({
+                "table": table,
+                "hash": hashes.get(table, "0"),
+                "size": int(tables[table].get("size", 0)),
+                "format": fmt,
+                "files": [self.find_file(name) for name in files],
+            })
+        return banks
+
+    def read_wav(self, path):
+        """Mono int16 frames at the board sample rate."""
+        try:
+            with wave.open(path, "rb") as w:
+                channels, width, rate = w.getnchannels(), w.getsampwidth(), w.getframerate()
+                raw = w.readframes(w.getnframes())
+        except (wave.Error, EOFError) as e:
+            self.fail(f"{os.path.basename(path)}: {e} (only PCM WAV is supported)")
+
+        if width == 1:
+            pcm = [(b - 128) << 8 for b in raw]
+        elif width == 2:
+            pcm = array.array("h", raw)
+            if sys.byteorder == "big":
+                pcm.byteswap()
+        elif width in (3, 4):
+            pcm = [int.from_bytes(raw[i + width - 2:i + width], "little", signed=True)
+                   for i in range(0, len(raw), width)]
+        else:
+            self.fail(f"{os.path.basename(path)}: unsupported sample width {width * 8} bit")
+
+        if channels > 1:
+            pcm = [sum(pcm[i:i + channels]) // channels for i in range(0, len(pcm), channels)]
+
+        if rate != self.sample_rate and len(pcm) > 1:
+            # linear resampling is enough for drum hits and one-shots
+            ratio = rate / self.sample_rate
+            frames = int(len(pcm) / ratio)
+            out = []
+            for i in range(frames):
+                pos = i * ratio
+                j = int(pos)
+                frac = pos - j
+                nxt = pcm[j + 1] if j + 1 < len(pcm) else pcm[j]
+                out.append(int(round(pcm[j] + (nxt - pcm[j]) * frac)))
+            pcm = out
+        return list(pcm)
+
+    @staticmethod
+    def encode_int16(pcm):
+        data = array.array("h", pcm)
+        if sys.byteorder == "big":
+            data.byteswap()
+        return data.tobytes()
+
+    @classmethod
+    def encode_adpcm(cls, pcm):
+        """IMA-ADPCM in blocks of ADPCM_BLOCK_FRAMES, each starting with the decoder state."""
+        out = bytearray()
+        pred, index = 0, 0
+        for start in range(0, len(pcm), cls.ADPCM_BLOCK_FRAMES):
+            out += pred.to_bytes(2, "little", signed=True) + bytes([index, 0])
+            block = pcm[start:start + cls.ADPCM_BLOCK_FRAMES]
+            block += [0] * (cls.ADPCM_BLOCK_FRAMES - len(block))
+            nibbles = []
+            for sample in block:
+                step = cls.ADPCM_STEPS[index]
+                diff = sample - pred
+                code = 0
+                if diff < 0:
+                    code, diff = 8, -diff
+                if diff >= step:
+                    code |= 4
+                    diff -= step
+                if diff >= step >> 1:
+                    code |= 2
+                    diff -= step >> 1
+                if diff >= step >> 2:
+                    code |= 1
+
+                # track the decoder exactly, so the next block header matches its state
+                delta = step >> 3
+                if code & 4: delta += step
+                if code & 2: delta += step >> 1
+                if code & 1: delta += step >> 2
+                pred = max(-32768, min(32767, pred - delta if code & 8 else pred + delta))
+                index = max(0, min(88, index + cls.ADPCM_INDEX[code]))
+                nibbles.append(code)
+            out += bytes(nibbles[i] | (nibbles[i + 1] << 4) for i in range(0, len(nibbles), 2))
+        return bytes(out)
+
+    def write(self, path):
+        """Write samples_data.cpp; returns (flash bytes, bytes the same frames take as float)."""
+        banks = self.banks()
+        lines = ["// Generated by pikopd.py from board.json \"samples\", do not edit.", "",
+                 '#include "PicoSamples.h"', ""]
+        flash_bytes = raw_bytes = 0
+        bank_lines = []
+
+        for b, bank in enumerate(banks):
+            assets = []
+            for i, wav in enumerate(bank["files"]):
+                pcm = self.read_wav(wav)
+                if bank["size"] and len(pcm) > bank["size"]:
+                    print(f"\n\033[33m⚠️  {os.path.basename(wav)}: {len(pcm)} frames, "
+                          f"table '{bank['table']}' holds {bank['size']}; the end is cut\033[0m")
+                    pcm = pcm[:bank["size"]]
+                data = self.encode_adpcm(pcm) if bank["format"] == "adpcm" else self.encode_int16(pcm)
+                flash_bytes += len(data)
+                raw_bytes += len(pcm) * 4
+
+                var = f"sample_{b}_{i}"
+                lines.append(f"// {os.path.basename(wav)}: {len(pcm)} frames, {bank['format']}")
+                lines.append(f"alignas(4) static const uint8_t {var}[{len(data)}] = {{")
+                for row in range(0, len(data), 16):
+                    lines.append("    " + "".join(f"0x{v:02x}, " for v in data[row:row + 16]).rstrip())
+                lines.append("};")
+                lines.append("")
+                assets.append(f"    {{ {var}, {len(pcm)}, {self.FORMATS[bank['format']]} }}")
+
+            lines.append(f"static const SampleAsset bank_{b}[] = {{")
+            lines.append(",\n".join(assets))
+            lines.append("};")
+            lines.append("")
+            bank_lines.append(f"    {{ \"{bank['table']}\", {bank['hash']}U, bank_{b}, {len(assets)} }}")
+
+        lines.append("const SampleBank sample_banks[] = {")
+        lines.append(",\n".join(bank_lines))
+        lines.append("};")
+        lines.append(f"const int NUM_SAMPLE_BANKS = {len(banks)};")
+        lines.append("")
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("\n".join(lines))
+        return flash_bytes, raw_bytes
+
+
+class PicoBudgetEstimator:
+    """Static RAM/flash and DSP-load estimate from the Heavy IR, checked before CMake runs.
+
+    The numbers are deliberately coarse: the goal is to catch a patch that clearly
+    will not fit or will overrun the audio deadline, not to predict the linker map.
+    """
+
+    CHIPS = {
+        # ram/flash in bytes, cycles per float op (RP2040 has no FPU, float math runs in the ROM library)
+        "rp2040": {"ram": 264 * 1024, "flash": 2 * 1024 * 1024, "float_cycles": 40.0},
+        "rp2350": {"ram": 520 * 1024, "flash": 4 * 1024 * 1024, "float_cycles": 1.5},
+    }
+
+    # Float ops per sample for Heavy signal objects; unknown ~f objects count as 2
+    SIGNAL_OPS = {
+        "__add~f": 1, "__sub~f": 1, "__mul~f": 1, "__min~f": 1, "__max~f": 1, "__abs~f": 1,
+        "__neg~f": 1, "__lt~f": 1, "__lte~f": 1, "__gt~f": 1, "__gte~f": 1, "__eq~f": 1, "__neq~f": 1,
+        "__floor~f": 2, "__ceil~f": 2, "__fma~f": 2, "__fms~f": 2, "__div~f": 8, "__sqrt~f": 8,
+        "__rsqrt~f": 8, "__pow~f": 30, "__cos~f": 12, "__sin~f": 12, "__tan~f": 20, "__atan~f": 20,
+        "__atan2~f": 25, "__exp~f": 20, "__log~f": 20, "__log2~f": 20, "__tanh~f": 20,
+        "__phasor~f": 3, "__phasor_k~f": 2, "__line~f": 3, "__rpole~f": 2, "__cpole~f": 6,
+        "__biquad~f": 10, "__biquad_k~f": 9, "__samphold~f": 1, "__sample~f": 1, "__del1~f": 1,
+        "__tabread~f": 4, "__tabreadu~f": 2, "__tabwrite~f": 2, "__tabhead~f": 1,
+        "__noise~f": 3, "__env~f": 3,
+    }
+    SIGNAL_OBJECT_BYTES = 16   # typical per-object state struct
+    SIGNAL_OBJECT_CYCLES = 4   # loads/stores around each object per sample
+
+    # MasterFX per stereo sample: (float ops, integer cycles); reverb combs are int16 fixed point
+    MASTERFX_OPS = {"delay": (20, 20), "reverb": (12, 160), "limiter": (6, 4)}
+    OUTPUT_OPS = (4, 6)             # clamp + float -> int16/PWM conversion
+    BLOCK_OVERHEAD_CYCLES = 2000    # callback, buffer handoff, Heavy message scheduling
+    DUAL_CORE_MIX_OPS = 2           # core 1 adds core 0's stereo sample
+    VOICE_CORE_QUEUE_BYTES = 128 * 24  # forwarded events, VOICE_CORE_QUEUE_SIZE x ControlEvent
+    TELEMETRY_RECORD_BYTES = 12     # TelemetryRecord in PicoTelemetry.h
+
+    HEAVY_POOL_BYTES = (10 + 2) * 1024  # Heavy_<patch>(sample_rate) default message pool + input queue
+    FIRMWARE_RAM = {"base": 24 * 1024, "web": 80 * 1024}  # SDK, stacks, TinyUSB, MIDI rings / cyw43 + lwIP
+    FIRMWARE_FLASH = {"base": 160 * 1024, "web": 350 * 1024}
+
+    C_TYPES = {"float": 4, "int32_t": 4, "uint32_t": 4, "int16_t": 2, "uint16_t": 2, "int8_t": 1, "uint8_t": 1}
+
+    def __init__(self, ir_json, src_dir, settings, sample_bytes=0):
+        self.ir_json = ir_json
+        self.src_dir = src_dir
+        self.settings = settings
+        self.sample_bytes = sample_bytes
+
+    def chip(self):
+        return "rp2350" if str(self.settings.get("pico_board", "pico")).startswith("pico2") else "rp2040"
+
+    def header_constants(self, text):
+        consts = {}
+        for name, value in re.findall(r"#define\s+(\w+)\s+(\d+)\b", text):
+            consts[name] = int(value)
+        for name, value in re.findall(r"constexpr\s+[\w:]+\s+(\w+)\s*=\s*(\d+)\s*;", text):
+            consts[name] = int(value)
+        return consts
+
+    def eval_dim(self, expr, consts):
+        """Integer value of an array dimension such as `1116 * REVERB_SIZE_PERCENT / 100`, None when unknown."""
+        expr = re.sub(r"\b[A-Za-z_]\w*\b", lambda m: str(consts.get(m.group(0), m.group(0))), expr)
+        try:
+            return self.eval_int_ast(ast.parse(expr.strip(), mode="eval").body)
+        except (SyntaxError, ValueError, ZeroDivisionError, RecursionError):
+            return None
+
+    @classmethod
+    def eval_int_ast(cls, node):
+        """C integer arithmetic on numbers only; raises ValueError for anything else."""
+        if isinstance(node, ast.Constant) and type(node.value) is int:
+            return node.value
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            value = cls.eval_int_ast(node.operand)
+            return -value if isinstance(node.op, ast.USub) else value
+        if isinstance(node, ast.BinOp):
+            a, b = cls.eval_int_ast(node.left), cls.eval_int_ast(node.right)
+            if isinstance(node.op, ast.Add):
+                return a + b
+            if isinstance(node.op, ast.Sub):
+                return a - b
+            if isinstance(node.op, ast.Mult):
+                return a * b
+            if isinstance(node.op, (ast.Div, ast.Mod)):
+                quotient = abs(a) // abs(b) * (1 if (a < 0) == (b < 0) else -1)  # C truncates toward zero
+                return quotient if isinstance(node.op, ast.Div) else a - b * quotient
+        raise ValueError(ast.dump(node))
+
+    def read_header(self, filename):
+        path = os.path.join(self.src_dir, filename)
+        if not os.path.exists(path):
+            return ""
+        with open(path) as f:
+            return f.read()
+
+    def header_array_bytes(self, filename, defines=None):
+        """Sum the fixed-size arrays and DelayLine members declared in a src/ header.
+
+        `defines` overrides the header's #ifndef defaults, as the build's -D flags do."""
+        text = self.read_header(filename)
+        if not text:
+            return 0
+        consts = {**self.header_constants(text), **(defines or {})}
+
+        total = 0
+        types = "|".join(self.C_TYPES)
+        for ctype, decl in re.findall(rf"^\s*(?:static\s+)?({types})\s+([^;=]*)", text, re.M):
+            for dims in re.findall(r"\w+((?:\[[^\]]+\])+)", decl):
+                count = 1
+                for dim in re.findall(r"\[([^\]]+)\]", dims):
+                    value = self.eval_dim(dim, consts)
+                    if value is None:
+                        count = 0
+                        break
+                    count *= value
+                total += count * self.C_TYPES[ctype]
+        for ctype, size in re.findall(rf"DelayLine<({types}),\s*(\w+)>", text):
+            value = self.eval_dim(size, consts)
+            total += (value or 0) * self.C_TYPES[ctype]
+        return total
+
+    def estimate(self):
+        chip = self.chip()
+        limits = self.CHIPS[chip]
+        sample_rate = self.settings.get("sample_rate", 48000)
+        buffer_size = self.settings.get("buffer_size", 64)
+        core_hz = self.settings.get("core_freq", 125000) * 1000
+        masterfx = self.settings.get("masterfx", {})
+        web = self.settings.get("web", {}).get("enabled", False)
+        dual = bool(self.settings.get("dual_core")) and self.settings.get("voice_count", 1) > 1
+
+        with open(self.ir_json) as f:
+            ir = json.load(f)
+
+        ram = {"firmware": self.FIRMWARE_RAM["base"] + (self.FIRMWARE_RAM["web"] if web else 0),
+               "heavy pools": self.HEAVY_POOL_BYTES,
+               "audio buffers": self.header_array_bytes("PicoAudio.h") + 3 * buffer_size * 4}
+        flash = {"firmware": self.FIRMWARE_FLASH["base"] + (self.FIRMWARE_FLASH["web"] if web else 0)}
+
+        table_ram = table_flash = 0
+        signal_objects = 0
+        float_ops = 0
+        for obj in ir.get("objects", {}).values():
+            t = obj.get("type", "")
+            args = obj.get("args", {})
+            if t == "__table":
+                size = int(args.get("size", 0) or len(args.get("values", [])))
+                # tables with initial data are moved to flash by samples_inflash()
+                if args.get("values"):
+                    table_flash += size * 4
+                else:
+                    table_ram += size * 4
+            elif t.endswith("~f") or t.endswith("~i"):
+                signal_objects += 1
+                float_ops += self.SIGNAL_OPS.get(t, 2)
+
+        temp_buffers = ir.get("signal", {}).get("numTemporaryBuffers", {})
+        temp_count = sum(temp_buffers.values()) if isinstance(temp_buffers, dict) else int(temp_buffers or 0)
+
+        ram["heavy tables"] = table_ram
+        ram["heavy signal state"] = signal_objects * self.SIGNAL_OBJECT_BYTES + temp_count * 4
+        if dual:
+            # a second instance of the patch for core 0, plus its block buffer and event ring
+            ram["heavy pools"] *= 2
+            ram["heavy tables"] *= 2
+            ram["heavy signal state"] *= 2
+            ram["dual core"] = self.header_array_bytes("PicoDualCore.h") + self.VOICE_CORE_QUEUE_BYTES
+        if self.settings.get("console"):
+            ram["telemetry"] = self.header_constants(self.read_header("PicoTelemetry.h")).get(
+                "TELEMETRY_RING_SIZE", 0) * self.TELEMETRY_RECORD_BYTES
+        flash["heavy tables"] = table_flash
+        flash["sample banks"] = self.sample_bytes
+        flash["heavy code"] = signal_objects * 200
+
+        # both cores run the whole patch; core 1 also adds core 0's block and runs MasterFX
+        heavy_ops, heavy_cycles = float_ops, self.SIGNAL_OBJECT_CYCLES * signal_objects
+
+        int_cycles = self.SIGNAL_OBJECT_CYCLES * signal_objects + self.OUTPUT_OPS[1]
+        float_ops += self.OUTPUT_OPS[0]
+        fx_defines = masterfx_defines(self.settings)
+        fx_bytes = {"delay": self.header_array_bytes(os.path.join("masterfx", "masterfx.h"), fx_defines),
+                    "reverb": self.header_array_bytes(os.path.join("masterfx", "freeverb.h"), fx_defines),
+                    "limiter": 0}
+        for fx, (f_ops, i_cycles) in self.MASTERFX_OPS.items():
+            if masterfx.get(fx, False):
+                ram[f"masterfx {fx}"] = fx_bytes[fx]
+                float_ops += f_ops
+                int_cycles += i_cycles
+
+        if dual:
+            float_ops += self.DUAL_CORE_MIX_OPS
+
+        cycles_per_sample = float_ops * limits["float_cycles"] + int_cycles
+        block_cycles = cycles_per_sample * buffer_size + self.BLOCK_OVERHEAD_CYCLES
+        deadline_cycles = core_hz * buffer_size / sample_rate
+
+        report = {
+            "chip": chip,
+            "core_hz": core_hz,
+            "sample_rate": sample_rate,
+            "buffer_size": buffer_size,
+            "signal_objects": signal_objects,
+            "ram": ram,
+            "ram_total": sum(ram.values()),
+            "ram_limit": limits["ram"],
+            "flash": flash,
+            "flash_total": sum(flash.values()),
+            "flash_limit": limits["flash"],
+            "cycles_per_block": int(block_cycles),
+            "deadline_cycles": int(deadline_cycles),
+            "dsp_load": block_cycles / deadline_cycles,
+        }
+        if dual:
+            core0_cycles = (heavy_ops * limits["float_cycles"] + heavy_cycles) * buffer_size + self.BLOCK_OVERHEAD_CYCLES
+            report["voices_per_core"] = (self.settings.get("voice_count", 1) + 1) // 2
+            report["core0_load"] = core0_cycles / deadline_cycles
+        return report
+
+    @staticmethod
+    def problems(report):
+        found = []
+        if report["ram_total"] > report["ram_limit"]:
+            found.append(f"RAM {report['ram_total'] / 1024:.0f} KB exceeds {report['ram_limit'] // 1024} KB")
+        if report["flash_total"] > report["flash_limit"]:
+            found.append(f"flash {report['flash_total'] / 1024:.0f} KB exceeds {report['flash_limit'] // 1024} KB")
+        if report["dsp_load"] > 1.0:
+            found.append(f"DSP load {report['dsp_load'] * 100:.0f}% overruns the audio deadline")
+        if report.get("core0_load", 0.0) > 1.0:
+            found.append(f"core 0 DSP load {report['core0_load'] * 100:.0f}% overruns the audio deadline")
+        return found
+
+    @staticmethod
+    def print_report(report):
+        def line(label, used, limit):
+            pct = used / limit
+            color = "\033[91m" if pct > 1.0 else ("\033[33m" if pct > 0.8 else "\033[32m")
+            print(f"  {label:<10} {color}{used / 1024:>8.1f} KB / {limit // 1024} KB ({pct * 100:.0f}%)\033[0m")
+
+        print(f"\n\033[1mBudget estimate: {report['chip']} @ {report['core_hz'] // 1000000} MHz, "
+              f"{report['sample_rate']} Hz, block {report['buffer_size']}\033[0m")
+        for name, size in report["ram"].items():
+            if size:
+                print(f"  \033[2m{name:<20} {size / 1024:>8.1f} KB\033[0m")
+        line("RAM", report["ram_total"], report["ram_limit"])
+        line("Flash", report["flash_total"], report["flash_limit"])
+        load = report["dsp_load"]
+        color = "\033[91m" if load > 1.0 else ("\033[33m" if load > 0.75 else "\033[32m")
+        print(f"  {'DSP':<10} {color}{load * 100:>8.0f} %  ({report['cycles_per_block']} of "
+              f"{report['deadline_cycles']} cycles per block, {report['signal_objects']} signal objects)\033[0m")
+        if "core0_load" in report:
+            load = report["core0_load"]
+            color = "\033[91m" if load > 1.0 else ("\033[33m" if load > 0.75 else "\033[32m")
+            print(f"  {'DSP core 0':<10} {color}{load * 100:>8.0f} %  "
+                  f"({report['voices_per_core']} voices per core)\033[0m")
+
+
+class PicoFirmwareReport:
+    """Measured flash/SRAM footprint of the linked firmware, split by component.
+
+    Totals come from the ELF section headers; the split comes from the GNU ld map
+    (pikopd.elf.map), which lists every input section with the object it came from.
+    Heavy allocates its message pool and non-const tables on the heap when the
+    patch starts, so those are not in the ELF: the budget estimate covers them.
+    """
+
+    FLASH = (0x10000000, 0x20000000)
+    RAM = (0x20000000, 0x30000000)
+    SHF_ALLOC = 0x2
+    SHT_NOBITS = 8
+
+    COMPONENTS = ["heavy code", "heavy tables", "sample banks", "masterfx", "web/lwip",
+                  "tinyusb", "pico sdk", "libc/libgcc", "pikopd", "other"]
+
+    # Object path fragments, checked in order after the section name rules
+    PATHS = [
+        ("web/lwip", ("lwip", "cyw43", "httpd", "htmldata", "fsdata", "/web/", "pico_cyw43", "pico_lwip")),
+        ("tinyusb", ("tinyusb", "/tusb")),
+        ("libc/libgcc", ("libc.a", "libc_nano", "libm.a", "libgcc", "libstdc++", "libsupc++", "libnosys")),
+        ("pico sdk", ("pico-sdk", "pico_sdk", "/rp2_common/", "/common/", "/rp2040/", "/rp2350/", "pico-extras")),
+    ]
+
+    def __init__(self, build_dir, chip="rp2040"):
+        self.build_dir = build_dir
+        self.chip = chip
+
+    def find(self, pattern):
+        files = glob.glob(os.path.join(self.build_dir, pattern))
+        return max(files, key=os.path.getmtime) if files else None
+
+    def elf_sections(self, path):
+        """[(name, type, flags, addr, size)] from the section header table of an ELF32/ELF64 file."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != b"\x7fELF":
+            return []
+        is64 = data[4] == 2
+        end = "<" if data[5] == 1 else ">"
+        if is64:
+            shoff, = struct.unpack_from(end + "Q", data, 0x28)
+            shentsize, shnum, shstrndx = struct.unpack_from(end + "HHH", data, 0x3A)
+            fmt = end + "IIQQQQ"
+        else:
+            shoff, = struct.unpack_from(end + "I", data, 0x20)
+            shentsize, shnum, shstrndx = struct.unpack_from(end + "HHH", data, 0x2E)
+            fmt = end + "IIIIII"
+
+        headers = [struct.unpack_from(fmt, data, shoff + i * shentsize) for i in range(shnum)]
+        strtab = headers[shstrndx][4] if shstrndx < shnum else 0
+        sections = []
+        for name, kind, flags, addr, _, size in headers:
+            name = data[strtab + name:data.index(b"\0", strtab + name)].decode(errors="replace")
+            sections.append((name, kind, flags, addr, size))
+        return sections
+
+    def in_region(self, addr, region):
+        return region[0] <= addr < region[1]
+
+    def elf_totals(self, path):
+        flash = ram = 0
+        for name, kind, flags, addr, size in self.elf_sections(path):
+            if not flags & self.SHF_ALLOC or not size:
+                continue
+            if self.in_region(addr, self.FLASH):
+                flash += size
+            elif self.in_region(addr, self.RAM):
+                ram += size
+                if kind != self.SHT_NOBITS:
+                    flash += size  # initialised data is copied out of flash at boot
+        return flash, ram
+
+    def parse_map(self, path):
+        """[(section, address, size, object, loaded_from_flash)] for every input section in a GNU ld map."""
+        with open(path, errors="replace") as f:
+            lines = f.read().splitlines()
+        if "Linker script and memory map" in lines:
+            lines = lines[lines.index("Linker script and memory map") + 1:]
+
+        # ld wraps long section names onto their own line; join them back
+        joined = []
+        for line in lines:
+            if joined and re.match(r"^\s+0x[0-9a-fA-F]+\s+0x[0-9a-fA-F]+", line) and re.match(r"^ ?\S+$", joined[-1]):
+                joined[-1] += line
+            else:
+                joined.append(line)
+
+        entries = []
+        loaded = False
+        for line in joined:
+            out = re.match(r"^(\S+)\s+0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)(\s+load address)?", line)
+            if out:
+                loaded = bool(out.group(4))
+                continue
+            m = re.match(r"^ (\S+)\s+0x([0-9a-fA-F]+)\s+0x([0-9a-fA-F]+)\s+(\S.*)$", line)
+            if not m or m.group(1) == "*fill*":
+                continue
+            size = int(m.group(3), 16)
+            if size:
+                entries.append((m.group(1), int(m.group(2), 16), size, m.group(4).strip(), loaded))
+        return entries
+
+    def component(self, section, obj):
+        base = os.path.basename(obj.split("(")[0])
+        member = obj[obj.find("(") + 1:-1] if obj.endswith(")") else base
+        if "hTable_" in section or "hTable_" in member:
+            return "heavy tables"
+        if "samples_data" in obj:
+            return "sample banks"
+        if "MasterFX" in section or "masterFX" in section:
+            return "masterfx"
+        if member.startswith(("Hv", "Heavy_")) or "/hvcc/" in obj:
+            return "heavy code"
+        for name, fragments in self.PATHS:
+            if any(fragment in obj for fragment in fragments):
+                return name
+        if "CMakeFiles/pikopd" in obj:
+            return "pikopd"
+        return "other"
+
+    def analyze(self):
+        elf = self.find("*.elf")
+        if not elf:
+            return None
+        flash, ram = self.elf_totals(elf)
+        limits = PicoBudgetEstimator.CHIPS[self.chip]
+        report = {
+            "elf": os.path.basename(elf),
+            "chip": self.chip,
+            "flash": flash,
+            "ram": ram,
+            "flash_limit": limits["flash"],
+            "ram_limit": limits["ram"],
+            "components": None,
+        }
+
+        map_file = self.find("*.elf.map") or self.find("*.map")
+        if not map_file:
+            return report
+
+        components = {name: {"flash": 0, "ram": 0} for name in self.COMPONENTS}
+        for section, addr, size, obj, loaded in self.parse_map(map_file):
+            name = self.component(section, obj)
+            if self.in_region(addr, self.FLASH):
+                components[name]["flash"] += size
+            elif self.in_region(addr, self.RAM):
+                components[name]["ram"] += size
+                if loaded:
+                    components[name]["flash"] += size
+
+        # fill, alignment and linker generated sections
+        for key, total in (("flash", flash), ("ram", ram)):
+            attributed = sum(c[key] for name, c in components.items() if name != "other")
+            components["other"][key] = max(0, total - attributed)
+        report["components"] = components
+        return report
+
+    @staticmethod
+    def print_report(report):
+        stages = " | ".join(f"{stage} {t:.1f}s" for stage, t in report["stages"].items())
+        print(f"\n\033[1mBuild: {report['patch']} ({report['board']}) in {report['total']:.1f}s\033[0m")
+        print(f"  \033[2m{stages}\033[0m")
+
+        firmware = report["firmware"]
+        if not firmware:
+            return
+        print(f"\033[1mFirmware: {firmware['elf']} ({firmware['chip']})\033[0m")
+        if firmware["components"]:
+            print(f"  \033[2m{'':<20} {'flash':>11} {'ram':>11}\033[0m")
+            for name, c in firmware["components"].items():
+                if c["flash"] or c["ram"]:
+                    print(f"  \033[2m{name:<20} {c['flash'] / 1024:>8.1f} KB {c['ram'] / 1024:>8.1f} KB\033[0m")
+        for label, used, limit in (("Flash", firmware["flash"], firmware["flash_limit"]),
+                                   ("RAM", firmware["ram"], firmware["ram_limit"])):
+            pct = used / limit
+            color = "\033[91m" if pct > 1.0 else ("\033[33m" if pct > 0.8 else "\033[32m")
+            print(f"  {label:<10} {color}{used / 1024:>8.1f} KB / {limit // 1024} KB ({pct * 100:.0f}%)\033[0m")
+
+
+def build_target(job):
+    """Process pool worker: sync, render, configure and compile one patch/board project."""
+    gen = PicoUF2Generator(job["pd_path"], job["project_root"], job["src_dir"], hvcc_dir=job["hvcc_dir"])
+    gen.quiet = True
+    gen.jobs = job["jobs"]
+    gen.use_cache = job["use_cache"]
+    gen.ignore_budget = job["ignore_budget"]
+    os.makedirs(gen.project_root, exist_ok=True)
+
+    log_path = os.path.join(gen.project_root, "build.log")
+    start_time = time.time()
+    status = "ok"
+    with open(log_path, "w") as log, contextlib.redirect_stdout(log):
+        try:
+            gen.load_cache()
+            gen.run_stages(job["board_config"], manifest=job["manifest"])
+        except SystemExit:
+            status = "failed"
+        except Exception:
+            # a bad board config or template fails this target, not the batch
+            traceback.print_exc(file=log)
+            status = "failed"
+        if gen.settings is not None:
+            gen.write_build_report(gen.settings, job["board_config"], status)
+
+    uf2 = gen.find_uf2() if status == "ok" else None
+    if status == "ok" and not uf2:
+        status = "no uf2"
+    if uf2:
+        shutil.copy2(uf2, job["uf2_out"])
+
+    return {
+        "patch": job["patch"],
+        "board": job["board"],
+        "status": status,
+        "duration": time.time() - start_time,
+        "uf2": job["uf2_out"] if uf2 else None,
+        "log": log_path,
+    }
+
+
+class PicoBatchBuilder:
+    """Builds a patch x board matrix: hvcc once per patch, CMake/make jobs on a process pool."""
+
+    def __init__(self, pd_paths, out_root, board_configs, src_dir=None, jobs=None, use_cache=True,
+                 ignore_budget=False):
+        self.pd_paths = [os.path.abspath(p) for p in pd_paths]
+        self.out_root = os.path.abspath(out_root)
+        self.board_configs = board_configs or ["board.json"]
+        self.src_dir = src_dir
+        self.jobs = jobs or os.cpu_count() or 4
+        self.use_cache = use_cache
+        self.ignore_budget = ignore_budget
+        self.uf2_dir = os.path.join(self.out_root, "uf2")
+
+    def patch_generator(self, pd_path):
+        name = os.path.splitext(os.path.basename(pd_path))[0]
+        gen = PicoUF2Generator(pd_path, os.path.join(self.out_root, name), self.src_dir)
+        gen.quiet = True
+        gen.use_cache = self.use_cache
+        return gen
+
+    def run_hvcc(self, gen):
+        gen.load_cache()
+        try:
+            gen.run_hvcc()
+        except SystemExit:
+            return None
+        return gen.collect_and_save_manifest()
+
+    def run(self):
+        start_time = time.time()
+        boards = [os.path.splitext(os.path.basename(b))[0] for b in self.board_configs]
+        if len(set(boards)) != len(boards):
+            print("\033[91m❌ Board config file names must be unique in batch mode\033[0m")
+            sys.exit(1)
+
+        os.makedirs(self.uf2_dir, exist_ok=True)
+        print(f"\033[1mBatch: {len(self.pd_paths)} patch(es) x {len(boards)} board(s), {self.jobs} jobs\033[0m")
+
+        # 1. hvcc once per patch, shared by every board of that patch
+        gens = [self.patch_generator(p) for p in self.pd_paths]
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            manifests = list(pool.map(self.run_hvcc, gens))
+
+        results = []
+        targets = []
+        for gen, manifest in zip(gens, manifests):
+            for board, config in zip(boards, self.board_configs):
+                if manifest is None:
+                    results.append({"patch": gen.patch_name, "board": board, "status": "hvcc failed",
+                                    "duration": 0.0, "uf2": None, "log": None})
+                    continue
+                targets.append({
+                    "patch": gen.patch_name,
+                    "board": board,
+                    "pd_path": gen.pd_path,
+                    "project_root": os.path.join(gen.project_root, board),
+                    "hvcc_dir": gen.hvcc_dir,
+                    "src_dir": self.src_dir,
+                    "board_config": config,
+                    "manifest": manifest,
+                    "use_cache": self.use_cache,
+                    "ignore_budget": self.ignore_budget,
+                    "uf2_out": os.path.join(self.uf2_dir, f"{gen.patch_name}_{board}.uf2"),
+                })
+
+        # 2. CMake/make on a process pool, splitting the cores between concurrent builds
+        if targets:
+            workers = min(self.jobs, len(targets))
+            for job in targets:
+                job["jobs"] = max(1, self.jobs // workers)
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(build_target, job) for job in targets]
+                for future in as_completed(futures):
+                    res = future.result()
+                    results.append(res)
+                    ok = res["status"] == "ok"
+                    color = "\033[32m" if ok else "\033[91m"
+                    print(f"{color}  {'✔' if ok else '❌'} {res['patch']} / {res['board']}: "
+                          f"{res['status']} ({res['duration']:.1f}s)\033[0m")
+
+        self.print_report(results, time.time() - start_time)
+        return all(r["status"] == "ok" for r in results)
+
+    def print_report(self, results, duration):
+        results.sort(key=lambda r: (r["patch"], r["board"]))
+        print("\n" + "-" * 50)
+        for r in results:
+            detail = os.path.relpath(r["uf2"]) if r["uf2"] else (r["log"] or "")
+            print(f"{r['patch']:<24} {r['board']:<12} {r['status']:<12} {detail}")
+        print("-" * 50)
+        failed = sum(1 for r in results if r["status"] != "ok")
+        color = "\033[91m" if failed else "\033[32m"
+        print(f"{color}{len(results) - failed}/{len(results)} targets built in {duration:.1f}s -> {self.uf2_dir}\033[0m")
+
+
+class PicoWatcher:
+    """--watch: stays resident, rebuilds on every saved change and flashes when a board shows up in BOOTSEL.
+
+    Builds go through the normal stage caches, so an edit only re-runs what it
+    affects: a patch edit runs hvcc and make, a board.json edit re-renders
+    main.cpp and reconfigures CMake only when the flags changed. The Jinja
+    environment and the cache stay in memory between builds, and a newer edit
+    cancels the build in flight.
+    """
+
+    POLL_SECONDS = 0.25
+    SETTLE_SECONDS = 0.3      # editors and Pd save in more than one write
+    BOOTSEL_POLL_SECONDS = 1.0
+
+    def __init__(self, gen, board_config="board.json", flash=False, midi_host=None):
+        self.gen = gen
+        self.board_config = board_config
+        self.flash = flash
+        self.midi_host = midi_host
+        self.files = []
+        self.thread = None
+        self.result = None
+        self.pending_flash = False
+
+    def watched_files(self):
+        """Patch, abstractions, board config, src/, templates and sample WAVs."""
+        gen = self.gen
+        config = os.path.join(gen.script_dir, self.board_config)
+        files = set(gen.collect_pd_dependencies())
+        files.add(config)
+        for base in (gen.src_dir, gen.templates):
+            for root, _, names in os.walk(base):
+                files.update(os.path.join(root, name) for name in names)
+
+        try:
+            with open(config) as f:
+                samples = json.load(f).get("samples", [])
+        except (OSError, ValueError):
+            samples = []
+        for entry in samples:
+            for name in entry.get("files") or [entry.get("file")]:
+                if name:
+                    files.update(os.path.join(base, name) for base in (os.path.dirname(gen.pd_path), gen.script_dir))
+        return sorted(files)
+
+    def snapshot(self):
+        stamps = {}
+        for path in self.files:
+            try:
+                stamps[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                stamps[path] = None
+        return stamps
+
+    def build(self):
+        gen = self.gen
+        gen.timings = {}
+        start_time = time.time()
+        try:
+            settings = gen.run_stages(self.board_config, self.midi_host)
+        except BuildCancelled:
+            self.result = "cancelled"
+            return
+        except (SystemExit, Exception) as e:
+            if not isinstance(e, SystemExit):
+                # a half-saved board.json or a template syntax error: report it and keep watching
+                print(f"\n\033[91m❌ {type(e).__name__}: {e}\033[0m")
+            if gen.settings is not None:
+                gen.write_build_report(gen.settings, self.board_config, status="failed")
+            self.result = "failed"
+            return
+        gen.print_progress(1.0, f"Built in {time.time() - start_time:.1f}s")
+        sys.stdout.write("\n")
+        PicoFirmwareReport.print_report(gen.write_build_report(settings, self.board_config))
+        self.result = "ok"
+
+    def start_build(self):
+        self.gen.cancel = threading.Event()
+        self.result = None
+        self.pending_flash = False
+        self.thread = threading.Thread(target=self.build, daemon=True)
+        self.thread.start()
+
+    def cancel_build(self):
+        if not self.thread or not self.thread.is_alive():
+            return
+        self.gen.cancel.set()
+        # the command may start between two checks, keep terminating until the thread is out
+        while self.thread.is_alive():
+            self.gen.terminate()
+            self.thread.join(0.1)
+        print("\n\033[33m  -> build cancelled by a newer edit\033[0m")
+
+    def build_finished(self):
+        result, self.result = self.result, None
+        if result == "ok":
+            if self.flash:
+                self.pending_flash = True
+                print("\033[32m  -> waiting for a Pico in BOOTSEL mode to flash\033[0m")
+        elif result == "failed":
+            print("\033[91m  -> build failed, waiting for the next change\033[0m")
+
+    def flash_now(self):
+        self.pending_flash = False
+        uf2 = self.gen.find_uf2()
+        try:
+            self.gen.run_cmd(["picotool", "load", "-f", "-x", uf2], step_name="Flash")
+        except SystemExit:
+            return
+        print(f"\033[32m  -> flashed {os.path.basename(uf2)}\033[0m")
+
+    def run(self):
+        gen = self.gen
+        if not os.path.exists(gen.hv_lib_path):
+            print(f"❌ Heavy library path not found: {gen.hv_lib_path}")
+            sys.exit(1)
+        gen.load_cache()
+        self.files = self.watched_files()
+        stamps = self.snapshot()
+        print(f"\033[1mWatching {gen.patch_name}: {len(self.files)} files, Ctrl+C to stop\033[0m")
+        self.start_build()
+        last_bootsel = 0.0
+
+        try:
+            while True:
+                time.sleep(self.POLL_SECONDS)
+                current = self.snapshot()
+                if current != stamps:
+                    while True:
+                        time.sleep(self.SETTLE_SECONDS)
+                        settled = self.snapshot()
+                        if settled == current:
+                            break
+                        current = settled
+                    changed = [os.path.basename(p) for p in current if current[p] != stamps.get(p)]
+                    print(f"\n\033[36m  -> changed: {', '.join(changed[:3])}{' ...' if len(changed) > 3 else ''}\033[0m")
+                    self.cancel_build()
+                    # abstractions or sample files may have been added or removed
+                    self.files = self.watched_files()
+                    stamps = self.snapshot()
+                    self.start_build()
+                    continue
+
+                if self.result is not None and not self.thread.is_alive():
+                    self.build_finished()
+
+                if self.pending_flash and time.time() - last_bootsel >= self.BOOTSEL_POLL_SECONDS:
+                    last_bootsel = time.time()
+                    if gen.check_pico_bootsel():
+                        self.flash_now()
+        except KeyboardInterrupt:
+            self.cancel_build()
+            print("\n\033[1mStopped watching\033[0m")
+
+
+class PicoBenchmark:
+    """Renders patches offline on the host and times audioFunc + MasterFX per block."""
+
+    SAMPLE_RATES = [44100, 48000]
+    BUFFER_SIZES = [32, 64, 128, 256]
+
+    def __init__(self, pd_paths, out_root, board_config=None, src_dir=None, seconds=10.0,
+                 sample_rates=None, buffer_sizes=None, use_cache=True):
+        self.pd_paths = [os.path.abspath(p) for p in pd_paths]
+        self.out_root = os.path.abspath(out_root)
+        self.board_config = board_config
+        self.src_dir = src_dir
+        self.seconds = seconds
+        self.sample_rates = sample_rates
+        self.buffer_sizes = buffer_sizes
+        self.use_cache = use_cache
+        self.report_path = os.path.join(self.out_root, "bench.json")
+        self.failures = 0
+
+    def masterfx_configs(self, settings):
+        """Sweep MasterFX off, as configured in board.json, and fully on."""
+        board_fx = settings.get("masterfx", {})
+        configs = [
+            {"delay": False, "reverb": False, "limiter": False},
+            {k: bool(board_fx.get(k, False)) for k in ("delay", "reverb", "limiter")},
+            {"delay": True, "reverb": True, "limiter": True},
+        ]
+        unique = {}
+        for fx in configs:
+            label = "+".join(k for k in ("delay", "reverb", "limiter") if fx[k]) or "none"
+            unique[label] = fx
+        return unique
+
+    def compile_bench(self, gen, manifest, label, fx, fx_defines):
+        """Build one host binary per MasterFX config; sample rate and block size are runtime args."""
+        bench_dir = os.path.join(gen.project_root, "bench")
+        os.makedirs(bench_dir, exist_ok=True)
+
+        env = jinja2.Environment(loader=jinja2.FileSystemLoader(gen.templates))
+        bench_cpp = os.path.join(bench_dir, "bench.cpp")
+        gen.write_if_changed(bench_cpp, env.get_template("bench.cpp").render(name=gen.patch_name, hv_manifest=manifest))
+
+        c_files = sorted(glob.glob(os.path.join(gen.hvcc_dir, "*.c")))
+        cpp_files = sorted(glob.glob(os.path.join(gen.hvcc_dir, "*.cpp")))
+        masterfx_dir = os.path.join(gen.src_dir, "masterfx")
+        headers = sorted(glob.glob(os.path.join(gen.hvcc_dir, "*.h*")) + glob.glob(os.path.join(masterfx_dir, "*.h")))
+        binary = os.path.join(bench_dir, f"bench_{label}")
+
+        # Same optimisation flags as the firmware; HV_SIMD_NONE keeps Heavy on its scalar path like the Pico
+        cmd = [os.environ.get("CXX", "c++"), "-O3", "-ffast-math", "-DHV_SIMD_NONE",
+               "-I", gen.hvcc_dir, "-I", gen.src_dir]
+        cmd += [f"-DUSE_{k.upper()}" for k in ("delay", "reverb", "limiter") if fx[k]]
+        cmd += [f"-D{name}={value}" for name, value in fx_defines.items()]
+        cmd += ["-x", "c", *c_files, "-x", "c++", "-std=c++17", *cpp_files, bench_cpp, "-o", binary, "-lm"]
+
+        key = gen.hash_inputs(c_files + cpp_files + headers + [bench_cpp], [cmd])
+        if gen.is_cached(f"bench_{label}", key) and os.path.exists(binary):
+            return binary
+        gen.run_cmd(cmd, step_name=f"Bench compile ({label})")
+        gen.mark_cached(f"bench_{label}", key)
+        return binary
+
+    def run_binary(self, binary, sample_rate, buffer_size):
+        res = subprocess.run([binary, str(sample_rate), str(buffer_size), str(self.seconds)],
+                             capture_output=True, text=True)
+        if res.returncode != 0:
+            return None
+        return json.loads(res.stdout.strip().splitlines()[-1])
+
+    def run_patch(self, pd_path, settings):
+        gen = PicoUF2Generator(pd_path, os.path.join(self.out_root, os.path.splitext(os.path.basename(pd_path))[0]), self.src_dir)
+        gen.quiet = True
+        gen.use_cache = self.use_cache
+        gen.load_cache()
+
+        results = []
+        try:
+            gen.run_hvcc()
+            manifest = gen.collect_and_save_manifest()
+            binaries = {label: self.compile_bench(gen, manifest, label, fx, masterfx_defines(settings))
+                        for label, fx in self.masterfx_configs(settings).items()}
+        except SystemExit:
+            print(f"\033[91m  ❌ {gen.patch_name}: build failed\033[0m")
+            self.failures += 1
+            return results
+
+        for label, binary in binaries.items():
+            for sr in self.sample_rates:
+                for bs in self.buffer_sizes:
+                    stats = self.run_binary(binary, sr, bs)
+                    if stats is None:
+                        print(f"\033[91m  ❌ {gen.patch_name} [{label}] {sr} Hz / {bs}: bench crashed\033[0m")
+                        self.failures += 1
+                        continue
+                    results.append({
+                        "patch": gen.patch_name,
+                        "masterfx": label,
+                        "sample_rate": sr,
+                        "buffer_size": bs,
+                        "blocks": stats["blocks"],
+                        "budget_ns": stats["budget_ns"],
+                        "ns_per_block": {k: stats[f"{k}_ns"] for k in ("mean", "median", "p99", "max")},
+                        "rtf": stats["rtf"],
+                    })
+        return results
+
+    def run(self, baseline=None, threshold=10.0):
+        start_time = time.time()
+        baseline = self.load_baseline(baseline)  # read first: it may be the bench.json about to be rewritten
+        gen = PicoUF2Generator(self.pd_paths[0], self.out_root, self.src_dir)
+        settings = gen.load_settings(self.board_config)
+        self.sample_rates = sorted(set(self.sample_rates or self.SAMPLE_RATES + [settings.get("sample_rate", 48000)]))
+        self.buffer_sizes = sorted(set(self.buffer_sizes or self.BUFFER_SIZES + [settings.get("buffer_size", 64)]))
+
+        print(f"\033[1mBenchmark: {len(self.pd_paths)} patch(es), {self.seconds:g}s per run, "
+              f"rates {self.sample_rates}, buffers {self.buffer_sizes}\033[0m")
+
+        results = []
+        for pd_path in self.pd_paths:
+            results.extend(self.run_patch(pd_path, settings))
+        results.sort(key=lambda r: (r["patch"], r["masterfx"], r["sample_rate"], r["buffer_size"]))
+
+        os.makedirs(self.out_root, exist_ok=True)
+        with open(self.report_path, "w") as f:
+            json.dump({"version": 1, "seconds": self.seconds, "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+        regressions = self.print_report(results, baseline, threshold)
+        color = "\033[91m" if regressions or self.failures else "\033[32m"
+        print(f"{color}{len(results)} runs in {time.time() - start_time:.1f}s, {self.failures} failure(s), "
+              f"{regressions} regression(s) -> {self.report_path}\033[0m")
+        return regressions == 0 and self.failures == 0
+
+    def load_baseline(self, path):
+        if not path:
+            return {}
+        if not os.path.exists(path):
+            print(f"\033[91m❌ Baseline not found: {path}\033[0m")
+            sys.exit(1)
+        with open(path) as f:
+            data = json.load(f)
+        return {(r["patch"], r["masterfx"], r["sample_rate"], r["buffer_size"]): r
+                for r in data.get("results", [])}
+
+    def print_report(self, results, baseline, threshold):
+        """Print one row per run; a median slower than the baseline by more than threshold % is a regression."""
+        regressions = 0
+        print("\n" + "-" * 86)
+        print(f"{'patch':<20} {'masterfx':<22} {'rate':>6} {'block':>5} {'median us':>10} {'p99 us':>8} {'rtf':>7}  delta")
+        print("-" * 86)
+        for r in results:
+            ns = r["ns_per_block"]
+            delta = ""
+            color = ""
+            base = baseline.get((r["patch"], r["masterfx"], r["sample_rate"], r["buffer_size"]))
+            if base:
+                change = (ns["median"] / base["ns_per_block"]["median"] - 1.0) * 100.0
+                delta = f"{change:+.1f}%"
+                if change > threshold:
+                    regressions += 1
+                    color = "\033[91m"
+                    delta += " REGRESSION"
+            print(f"{color}{r['patch']:<20} {r['masterfx']:<22} {r['sample_rate']:>6} {r['buffer_size']:>5} "
+                  f"{ns['median'] / 1000:>10.2f} {ns['p99'] / 1000:>8.2f} {r['rtf']:>7.4f}  {delta}\033[0m")
+        print("-" * 86)
+        return regressions
+
+
+class PicoSimulator:
+    """Runs the generated firmware on the host (test/sim) and measures event-to-audio latency per buffer size."""
+
+    BUFFER_SIZES = [32, 64, 128, 256]
+    LEAD_MS = 250  # firmware settles before the first event
+
+    def __init__(self, pd_path, project_root, board_config=None, src_dir=None, seconds=10.0,
+                 buffer_sizes=None, replay=None, use_cache=True):
+        self.pd_path = os.path.abspath(pd_path)
+        self.project_root = os.path.abspath(project_root)
+        self.board_config = board_config
+        self.src_dir = src_dir
+        self.seconds = seconds
+        self.buffer_sizes = buffer_sizes
+        self.replay = replay
+        self.use_cache = use_cache
+        self.sim_src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test", "sim")
+        self.out_dir = os.path.join(self.project_root, "sim")
+        self.report_path = os.path.join(self.out_dir, "sim_report.json")
+        self.failures = 0
+
+    def sim_settings(self, settings, buffer_size):
+        """The board as far as the host can run it: I2S out, USB MIDI, no web, display, console or I2C/PIO sensors."""
+        sim = json.loads(json.dumps(settings))
+        sim.update({"buffer_size": buffer_size, "audio_mode": "I2S", "pico_board": "pico",
+                    "console": False, "profile": False})
+        if sim.get("midi_mode") == "host":
+            sim["midi_mode"] = "usb"
+        sim["web"] = dict(sim.get("web", {}), enabled=False)
+        sim["display"] = dict(sim.get("display", {}), enabled=False)
+        sensors = sim.setdefault("inputs", {}).setdefault("sensors", {})
+        for name in ("mpr121", "hc-sr04"):
+            sensors.pop(name, None)
+        return sim
+
+    def compile_sim(self, gen, manifest, settings, buffer_size):
+        """Render main.cpp for one buffer size and link it with the patch, the SDK stubs and the replay harness."""
+        out_dir = os.path.join(self.out_dir, f"b{buffer_size}")
+        os.makedirs(out_dir, exist_ok=True)
+
+        sim = self.sim_settings(settings, buffer_size)
+        params = gen.build_params(sim, manifest)
+        env = jinja2.Environment(loader=jinja2.FileSystemLoader(gen.templates))
+        main_cpp = os.path.join(out_dir, "main.cpp")
+        gen.write_if_changed(main_cpp, env.get_template("main.cpp").render(
+            name=gen.patch_name, hv_manifest=manifest, board=sim, params=params,
+            routes=gen.build_routes(manifest, params), samples=gen.sample_banks
+        ))
+
+        stubs = os.path.join(self.sim_src, "stubs")
+        c_files = sorted(glob.glob(os.path.join(gen.hvcc_dir, "*.c")))
+        cpp_files = sorted(glob.glob(os.path.join(gen.hvcc_dir, "*.cpp")))
+        if gen.sample_banks:
+            cpp_files.append(os.path.join(gen.c_dir, "samples_data.cpp"))
+        harness = [os.path.join(self.sim_src, "sim_sdk.cpp"), os.path.join(self.sim_src, "sim_main.cpp")]
+        headers = sorted(glob.glob(os.path.join(gen.hvcc_dir, "*.h*")) + glob.glob(os.path.join(gen.src_dir, "**", "*.h"), recursive=True)
+                         + glob.glob(os.path.join(stubs, "**", "*.h"), recursive=True))
+        binary = os.path.join(out_dir, "sim")
+
+        # The firmware's compile definitions for a board without web; its main() becomes core 0's thread
+        masterfx = sim.get("masterfx", {})
+        steal = sim.get("voice_steal", "oldest")
+        cmd = [os.environ.get("CXX", "c++"), "-O3", "-ffast-math", "-pthread", "-DHV_SIMD_NONE",
+               "-DWEB=0", "-DWEB_ENABLED=0", "-DOSC_ENABLED=0", "-DENABLE_DEBUG=0", "-DAUDIO_PROFILE=0",
+               f"-DMAX_VOICES={sim.get('voice_count', 1)}", f"-DVOICE_STEAL={VOICE_STEAL_POLICIES.get(steal, 0)}",
+               f"-DVOICE_RETRIGGER={1 if sim.get('voice_retrigger', True) else 0}",
+               "-Dmain=pikopd_firmware_main", "-I", stubs, "-I", gen.hvcc_dir, "-I", gen.src_dir]
+        cmd += [f"-DUSE_{k.upper()}" for k in ("delay", "reverb", "limiter") if masterfx.get(k, False)]
+        cmd += [f"-D{name}={value}" for name, value in masterfx_defines(sim).items()]
+        cmd += ["-x", "c", *c_files, "-x", "c++", "-std=c++17", *cpp_files, main_cpp, *harness, "-o", binary, "-lm"]
+
+        key = gen.hash_inputs(c_files + cpp_files + headers + harness + [main_cpp], [cmd])
+        if gen.is_cached(f"sim_b{buffer_size}", key) and os.path.exists(binary):
+            return binary
+        gen.run_cmd(cmd, step_name=f"Simulator compile ({buffer_size})")
+        gen.mark_cached(f"sim_b{buffer_size}", key)
+        return binary
+
+    @staticmethod
+    def midi_kind(data):
+        kinds = {0x80: "note_off", 0x90: "note_on", 0xA0: "aftertouch", 0xB0: "cc", 0xC0: "program",
+                 0xD0: "pressure", 0xE0: "bend"}
+        if data and data[0] >= 0xF8:
+            return "realtime"
+        if data and data[0] & 0xF0 == 0x90 and len(data) > 2 and data[2] == 0:
+            return "note_off"
+        return kinds.get(data[0] & 0xF0, "midi") if data else "midi"
+
+    @staticmethod
+    def read_varlen(data, pos):
+        value = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            value = (value << 7) | (b & 0x7F)
+            if not b & 0x80:
+                return value, pos
+
+    def read_midi_file(self, path):
+        """Channel messages of a Standard MIDI File as (time_ms, bytes), tracks merged, tempo changes applied."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:4] != b"MThd":
+            print(f"\033[91m❌ Not a MIDI file: {path}\033[0m")
+            sys.exit(1)
+        header_len = struct.unpack(">I", data[4:8])[0]
+        _, tracks, division = struct.unpack(">HHH", data[8:14])
+        if division & 0x8000:
+            print(f"\033[91m❌ SMPTE time division is not supported: {path}\033[0m")
+            sys.exit(1)
+
+        events = []  # (tick, order, tempo or None, bytes)
+        pos = 8 + header_len
+        for _ in range(tracks):
+            if data[pos:pos + 4] != b"MTrk":
+                break
+            end = pos + 8 + struct.unpack(">I", data[pos + 4:pos + 8])[0]
+            pos += 8
+            tick, running = 0, 0
+            while pos < end:
+                delta, pos = self.read_varlen(data, pos)
+                tick += delta
+                status = data[pos]
+                if status == 0xFF:
+                    kind = data[pos + 1]
+                    length, pos = self.read_varlen(data, pos + 2)
+                    if kind == 0x51:
+                        events.append((tick, len(events), int.from_bytes(data[pos:pos + 3], "big"), None))
+                    pos += length
+                    continue
+                if status in (0xF0, 0xF7):
+                    length, pos = self.read_varlen(data, pos + 1)
+                    pos += length
+                    continue
+                if status & 0x80:
+                    running = status
+                    pos += 1
+                else:
+                    status = running
+                size = 1 if status & 0xF0 in (0xC0, 0xD0) else 2
+                events.append((tick, len(events), None, bytes([status]) + data[pos:pos + size]))
+                pos += size
+            pos = end
+
+        out, tempo, last_tick, ms = [], 500000, 0, 0.0
+        for tick, _, new_tempo, message in sorted(events):
+            ms += (tick - last_tick) * tempo / division / 1000.0
+            last_tick = tick
+            if new_tempo is not None:
+                tempo = new_tempo
+            else:
+                out.append((ms, message))
+        return out
+
+    def load_replay(self, path):
+        """A .mid file or a text replay; returns (time_ms, kind, harness line) sorted by time."""
+        if not os.path.exists(path):
+            print(f"\033[91m❌ Replay not found: {path}\033[0m")
+            sys.exit(1)
+        if path.lower().endswith((".mid", ".midi")):
+            return [(t, self.midi_kind(m), "midi " + m.hex(" ")) for t, m in self.read_midi_file(path)]
+
+        events = []
+        with open(path) as f:
+            for number, line in enumerate(f, 1):
+                parts = line.split("#")[0].split()
+                if not parts:
+                    continue
+                try:
+                    t, kind, args = float(parts[0]), parts[1], parts[2:]
+                    if kind == "midi":
+                        message = bytes(int(a, 16) for a in args)
+                        events.append((t, self.midi_kind(message), "midi " + message.hex(" ")))
+                    elif kind in ("note_on", "note_off", "cc"):
+                        values = [int(a) for a in args]
+                        arity = 1 if kind == "note_off" else 2
+                        channel = values[arity] - 1 if len(values) > arity else 0
+                        status = {"note_on": 0x90, "note_off": 0x80, "cc": 0xB0}[kind] | (channel & 0x0F)
+                        message = bytes([status, values[0], values[1] if arity == 2 else 0])
+                        events.append((t, kind, "midi " + message.hex(" ")))
+                    elif kind in ("adc", "gpio"):
+                        events.append((t, kind, f"{kind} {int(args[0])} {float(args[1]):g}"))
+                    else:
+                        raise ValueError(kind)
+                except (IndexError, ValueError):
+                    print(f"\033[91m❌ {path}:{number}: cannot read '{line.strip()}'\033[0m")
+                    sys.exit(1)
+        return sorted(events, key=lambda e: e[0])
+
+    def default_replay(self, settings, manifest):
+        """Notes at random gaps so events land at every point of a block; a knob move during every fourth note."""
+        rng = random.Random(1)
+        receives = {r["name"] for r in manifest.get("receives", [])}
+        knob = next((k for k in settings.get("inputs", {}).get("adc_pins", []) if k["name"] in receives), None)
+
+        events, t, i = [], 0.0, 0
+        end = self.seconds * 1000.0 - self.LEAD_MS - 300.0
+        while True:
+            t += rng.uniform(180.0, 260.0)
+            if t > end:
+                return events
+            note = 48 + (i * 7) % 24
+            events.append((t, "note_on", f"midi 90 {note:02x} 64"))
+            if knob and i % 4 == 3:
+                events.append((t + 40.0, "adc", f"adc {knob['pin'] - 26} {0.8 if i % 8 == 3 else 0.2:g}"))
+            events.append((t + rng.uniform(80.0, 120.0), "note_off", f"midi 80 {note:02x} 00"))
+            i += 1
+
+    def run_binary(self, binary, replay_path, wav_path):
+        try:
+            res = subprocess.run([binary, replay_path, str(self.seconds), wav_path],
+                                 capture_output=True, text=True, timeout=self.seconds + 30)
+        except subprocess.TimeoutExpired:
+            return None
+        if res.returncode != 0 or not res.stdout.strip():
+            return None
+        return json.loads(res.stdout.strip().splitlines()[-1])
+
+    @staticmethod
+    def stats(values):
+        """Latency distribution in ms; jitter is the standard deviation."""
+        if not values:
+            return None
+        values = sorted(values)
+        mean = sum(values) / len(values)
+
+        def pct(p):
+            return values[min(len(values) - 1, int(p / 100.0 * len(values)))]
+
+        return {"count": len(values), "min": values[0], "mean": mean, "p50": pct(50), "p95": pct(95),
+                "p99": pct(99), "max": values[-1],
+                "jitter": (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5}
+
+    def summarize(self, out, events, buffer_size):
+        latencies = out["latency_ms"]
+        per_event = [{"t_ms": t, "kind": kind, "latency_ms": lat} for (t, kind, _), lat in zip(events, latencies)]
+        seen = [e["latency_ms"] for e in per_event if e["latency_ms"] is not None]
+        kinds = {}
+        for e in per_event:
+            kinds.setdefault(e["kind"], []).append(e["latency_ms"])
+        return {
+            "buffer_size": buffer_size,
+            "sample_rate": out["sample_rate"],
+            "block_ms": 1000.0 * buffer_size / out["sample_rate"],
+            "events": len(per_event),
+            "detected": len(seen),
+            "blocks": out["blocks"],
+            "underruns": out["underruns"],
+            "latency_ms": self.stats(seen),
+            "by_kind": {k: dict(self.stats([v for v in vals if v is not None]) or {"count": 0}, events=len(vals))
+                        for k, vals in sorted(kinds.items())},
+            "per_event": per_event,
+        }
+
+    def run(self):
+        start_time = time.time()
+        gen = PicoUF2Generator(self.pd_path, self.project_root, self.src_dir)
+        gen.quiet = True
+        gen.use_cache = self.use_cache
+        gen.load_cache()
+        settings = gen.load_settings(self.board_config)
+        self.buffer_sizes = sorted(set(self.buffer_sizes or self.BUFFER_SIZES + [settings.get("buffer_size", 64)]))
+
+        print(f"\033[1mSimulation: {gen.patch_name}, {self.seconds:g}s per run, buffers {self.buffer_sizes}\033[0m")
+
+        try:
+            gen.run_hvcc()
+            manifest = gen.collect_and_save_manifest()
+            os.makedirs(gen.c_dir, exist_ok=True)
+            gen.build_samples(settings, manifest)
+            events = self.load_replay(self.replay) if self.replay else self.default_replay(settings, manifest)
+            binaries = {bs: self.compile_sim(gen, manifest, settings, bs) for bs in self.buffer_sizes}
+        except SystemExit:
+            print(f"\033[91m  ❌ {gen.patch_name}: simulator build failed\033[0m")
+            return False
+
+        replay_path = os.path.join(self.out_dir, "replay.txt")
+        with open(replay_path, "w") as f:
+            for t, kind, line in events:
+                f.write(f"{t + self.LEAD_MS:.3f} {line}  # {kind}\n")
+
+        results = []
+        for bs, binary in binaries.items():
+            out = self.run_binary(binary, replay_path, os.path.join(self.out_dir, f"b{bs}", "out.wav"))
+            if out is None:
+                print(f"\033[91m  ❌ {gen.patch_name} / {bs}: simulation crashed\033[0m")
+                self.failures += 1
+                continue
+            results.append(self.summarize(out, events, bs))
+
+        with open(self.report_path, "w") as f:
+            json.dump({"version": 1, "patch": gen.patch_name, "seconds": self.seconds,
+                       "replay": self.replay or "default", "results": results}, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+        self.print_report(results)
+        color = "\033[91m" if self.failures else "\033[32m"
+        print(f"{color}{len(results)} runs in {time.time() - start_time:.1f}s, {self.failures} failure(s) "
+              f"-> {self.report_path}\033[0m")
+        return self.failures == 0
+
+    @staticmethod
+    def print_report(results):
+        """One row per buffer size and event kind; latency is injection to first changed sample at the DAC."""
+        print("\n" + "-" * 94)
+        print(f"{'block':>5} {'ms':>5}  {'event':<10} {'seen':>9} {'min':>6} {'p50':>6} {'mean':>6} "
+              f"{'p95':>6} {'p99':>6} {'max':>6} {'jitter':>7} {'xruns':>6}")
+        print("-" * 94)
+        for r in results:
+            rows = [("all", dict(r["latency_ms"] or {"count": 0}, events=r["events"]))] + list(r["by_kind"].items())
+            for label, s in rows:
+                seen = f"{s['count']}/{s['events']}"
+                if s["count"]:
+                    values = " ".join(f"{s[k]:>6.2f}" for k in ("min", "p50", "mean", "p95", "p99", "max"))
+                    values += f" {s['jitter']:>7.2f}"
+                else:
+                    values = f"{'no effect on the audio':>49}"
+                color = "\033[1m" if label == "all" else ""
+                xruns = f"{r['underruns']:>6}" if label == "all" else ""
+                print(f"{color}{r['buffer_size']:>5} {r['block_ms']:>5.2f}  {label:<10} {seen:>9} {values} {xruns}\033[0m")
+        print("-" * 94)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Upload Heavy Pd patch to Pico")
-    parser.add_argument("-b", "--board", help="Path to custom board configuration json file") 
-    parser.add_argument("pd_patch", help="Pure Data patch file (e.g., heavy.pd)")
-    parser.add_argument("project_root", help="Project folder")
+    parser.add_argument(
+        "-b", "--board", action="append",
+        help="Path to custom board configuration json file (repeat for a batch build)"
+    )
+    parser.add_argument("pd_patch", nargs="+", help="Pure Data patch file(s) (e.g., heavy.pd)")
+    parser.add_argument("project_root", help="Project folder (output folder in batch mode)")
     parser.add_argument("-f", "--flash", action="store_true", help="Flash UF2 to Pico")
     parser.add_argument(
         "-s", "--serial", action="store_true", help="Open serial console after reboot"
@@ -394,13 +2320,88 @@ if __name__ == "__main__":
     action="store_true",
     help="Skip running HVCC (useful for manual edits of C/C++ files)"
     )
+    parser.add_argument(
+        "-n", "--no-cache", action="store_true", help="Ignore the build cache and rebuild every stage"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count(), help="Parallel build jobs (default: CPU cores)"
+    )
+    parser.add_argument(
+        "--ignore-budget", action="store_true", help="Build even if the RAM/DSP estimate says the patch won't fit"
+    )
+    parser.add_argument(
+        "-w", "--watch", action="store_true",
+        help="Stay running and rebuild on every change of the patch, abstractions, board.json or src/"
+    )
+    parser.add_argument(
+        "--bench", action="store_true", help="Benchmark the patch DSP + MasterFX on the host instead of building"
+    )
+    parser.add_argument("--bench-seconds", type=float, default=10.0, help="Seconds of audio rendered per run")
+    parser.add_argument("--bench-rates", type=int, nargs="+", help="Sample rates to sweep")
+    parser.add_argument("--bench-buffers", type=int, nargs="+", help="Buffer sizes to sweep")
+    parser.add_argument("--bench-baseline", help="Previous bench.json to compare against")
+    parser.add_argument(
+        "--bench-threshold", type=float, default=10.0, help="Median slowdown in %% flagged as a regression"
+    )
+    parser.add_argument(
+        "--simulate", action="store_true",
+        help="Run the firmware on the host and measure MIDI/control-to-audio latency per buffer size"
+    )
+    parser.add_argument("--sim-seconds", type=float, default=10.0, help="Seconds of real time per simulation run")
+    parser.add_argument("--sim-buffers", type=int, nargs="+", help="Buffer sizes to simulate")
+    parser.add_argument("--sim-replay", help="MIDI file (.mid) or text replay to play into the firmware")
     args = parser.parse_args()
 
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
+    boards = args.board or ["board.json"]
+
+    # A folder argument expands to every patch in it (e.g. patches/)
+    pd_patches = []
+    for path in args.pd_patch:
+        pd_patches.extend(sorted(glob.glob(os.path.join(path, "*.pd"))) if os.path.isdir(path) else [path])
+    args.pd_patch = pd_patches
+    if not args.pd_patch:
+        print("\033[91m❌ No .pd patches found\033[0m")
+        sys.exit(1)
+
+    if args.bench:
+        bench = PicoBenchmark(args.pd_patch, args.project_root, boards[0], src, seconds=args.bench_seconds,
+                              sample_rates=args.bench_rates, buffer_sizes=args.bench_buffers,
+                              use_cache=not args.no_cache)
+        sys.exit(0 if bench.run(args.bench_baseline, args.bench_threshold) else 1)
+
+    if args.simulate:
+        if len(args.pd_patch) > 1:
+            print("\033[91m❌ --simulate runs a single patch\033[0m")
+            sys.exit(1)
+        sim = PicoSimulator(args.pd_patch[0], args.project_root, boards[0], src, seconds=args.sim_seconds,
+                            buffer_sizes=args.sim_buffers, replay=args.sim_replay, use_cache=not args.no_cache)
+        sys.exit(0 if sim.run() else 1)
+
+    if args.watch and (len(args.pd_patch) > 1 or len(boards) > 1):
+        print("\033[91m❌ --watch builds a single patch and board\033[0m")
+        sys.exit(1)
+
+    if len(args.pd_patch) > 1 or len(boards) > 1:
+        if args.flash or args.serial:
+            print("\033[33m⚠️  --flash and --serial are ignored in batch mode\033[0m")
+        batch = PicoBatchBuilder(args.pd_patch, args.project_root, boards, src,
+                                 jobs=args.jobs, use_cache=not args.no_cache, ignore_budget=args.ignore_budget)
+        sys.exit(0 if batch.run() else 1)
+
     cmake_path = os.path.join(args.project_root, "CMakeLists.txt")
     if args.skip_hvcc and not os.path.exists(cmake_path):
         print("\033[33m⚠️  --skip-hvcc (-x) ignored: CMakeLists.txt not found in project root\033[0m")
         args.skip_hvcc = False
 
-    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src")
-    gen = PicoUF2Generator(args.pd_patch, args.project_root, src, verbose=args.verbose)
-    gen.run_all(skip_hvcc=args.skip_hvcc, flash=args.flash, serial=args.serial, board_config=args.board)
+    gen = PicoUF2Generator(args.pd_patch[0], args.project_root, src, verbose=args.verbose)
+    gen.use_cache = not args.no_cache
+    gen.jobs = args.jobs
+    gen.ignore_budget = args.ignore_budget
+
+    if args.watch:
+        gen.print_logo()
+        PicoWatcher(gen, boards[0], flash=args.flash).run()
+        sys.exit(0)
+
+    gen.run_all(skip_hvcc=args.skip_hvcc, flash=args.flash, serial=args.serial, board_config=boards[0])
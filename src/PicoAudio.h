@@ -10,13 +10,8 @@
 #include <cmath>
 #include <algorithm>
 
-#ifdef USE_REVERB
-#include "masterfx/freeverb.h"
-#endif
-
-#ifdef USE_DELAY
-#include "masterfx/delayline.h"
-#endif
+#include "masterfx/masterfx.h"
+#include "PicoProfile.h"
 
 #define USE_PWM_AUDIO
 
@@ -24,184 +19,6 @@
 
 enum AudioMode { I2S, PWM };
 
-#ifdef USE_DELAY
-class StereoDelay {
-private:
-    static constexpr size_t MAX_DELAY = 16000;
-
-    daisysp::DelayLine<float, MAX_DELAY> delayL;
-    daisysp::DelayLine<float, MAX_DELAY> delayR;
-
-    float currentDelay = 12000.0f;
-    float smoothLevel  = 0.0f;
-    float smoothFb     = 0.1f;
-
-public:
-    volatile float targetDelay = 12000.0f;
-    volatile float targetLevel = 0.0f;
-    volatile float targetFb    = 0.1f;
-
-    volatile bool bypass = false;
-
-    void init() {
-        delayL.Init();
-        delayR.Init();
-    }
-
-    void set_time(float t) {
-        float raw = 10.0f + (t * t * 22000.0f);
-        targetDelay = std::min(raw, 23000.0f);
-    }
-
-    inline void process(float inL,
-                        float inR,
-                        float& wetL,
-                        float& wetR)
-    {
-        currentDelay += 0.0025f * (targetDelay - currentDelay);
-        smoothLevel  += 0.0025f * (targetLevel - smoothLevel);
-        smoothFb     += 0.0025f * (targetFb - smoothFb);
-
-        if(bypass || smoothLevel < 0.0001f)
-        {
-            wetL = 0.0f;
-            wetR = 0.0f;
-
-            delayL.Write(inL);
-            delayR.Write(inR);
-            return;
-        }
-
-        delayL.SetDelay(currentDelay);
-        delayR.SetDelay(currentDelay * 1.07f);
-
-        float dl = delayL.Read();
-        float dr = delayR.Read();
-
-        wetL = dl * smoothLevel;
-        wetR = dr * smoothLevel;
-
-        float fbL = inL + dr * smoothFb;
-        float fbR = inR + dl * smoothFb;
-
-        fbL = std::clamp(fbL, -1.0f, 1.0f);
-        fbR = std::clamp(fbR, -1.0f, 1.0f);
-
-        delayL.Write(fbL);
-        delayR.Write(fbR);
-    }
-};
-#endif
-
-class SoftLimiter {
-private:
-    float gain_reducer = 1.0f;
-    const float release_coeff = 0.0005f;
-    const float threshold = 0.98f;
-
-public:
-    volatile bool bypass = false;
-
-    void inline process(float& l, float& r) {
-        if (bypass) return;
-
-        float peak = std::max(std::fabsf(l), std::fabsf(r));
-        
-        if (peak > threshold) {
-            float target = threshold / peak;
-            if (target < gain_reducer) gain_reducer = target;
-        } else {
-            gain_reducer += (1.0f - gain_reducer) * release_coeff;
-        }
-
-        l *= gain_reducer;
-        r *= gain_reducer;
-    }
-};
-
-class MasterFX {
-public:
-    #ifdef USE_DELAY
-        StereoDelay delay;
-    #endif
-    #ifdef USE_REVERB
-        FreeverbStereo reverb;
-    #endif
-    #ifdef USE_LIMITER
-        SoftLimiter limiter;
-    #endif
-
-    volatile float master_volume = 0.8f;
-    volatile float reverb_mix = 0.0f;
-    volatile bool reverb_bypass = false;
-
-    MasterFX() : initialized(false) {}
-
-    void init() {
-        #ifdef USE_DELAY
-            delay.init();
-        #endif
-
-        #ifdef USE_REVERB
-            reverb.init();
-        #endif
-
-        initialized = true;
-        }
-
-    void process_inplace(float* buffer, int frames) {
-        if (!initialized) return;
-
-        for (int i = 0; i < frames; i++) {
-            float& l = buffer[i * 2];
-            float& r = buffer[i * 2 + 1];
-
-            const float originalL = l;
-            const float originalR = r;
-
-            float dWetL = 0, dWetR = 0;
-            
-            #ifdef USE_DELAY
-                delay.process(originalL, originalR, dWetL, dWetR);
-            #endif
-
-            #ifdef USE_REVERB
-                float rWetL = 0, rWetR = 0;
-                float mix = reverb_mix;
-                
-                if (!reverb_bypass && mix > 0.001f) {
-                    reverb.Process(originalL + (dWetL * 0.1f), originalR + (dWetR * 0.1f), rWetL, rWetR);
-                    
-                    float dryGain = 1.0f - mix;
-                    l = (originalL * dryGain) + (rWetL * mix);
-                    r = (originalR * dryGain) + (rWetR * mix);
-                } else {
-                    l = originalL;
-                    r = originalR;
-                }
-            #else
-                l = originalL;
-                r = originalR;
-            #endif
-
-            #ifdef USE_DELAY
-                l += dWetL;
-                r += dWetR;
-            #endif
-
-            l *= master_volume;
-            r *= master_volume;
-            
-            #ifdef USE_LIMITER
-                limiter.process(l, r);
-            #endif
-        }
-    }
-
-private:
-    bool initialized;
-};
-
 extern MasterFX masterFX;
 
 
@@ -259,25 +76,31 @@ namespace Pico {
             audio_i2s_connect(ap);
             audio_i2s_set_enabled(true);
 
+            Profiler::begin(_srate, _bsize);
+            bool waited = false;
+
             while (true) {
                 struct audio_buffer* buffer = take_audio_buffer(ap, false);
                 if (buffer) {
+                    Profiler::mark(PROFILE_WAIT);
                     if (_cb) {
                         int frames = buffer->max_sample_count;
                         _cb(heavy_buffer, frames);
-                        
-                        // Process entire FX chain: Delay -> Reverb -> Limiter
-                        process_master_effects(heavy_buffer, frames);
-                        
-                        int16_t* out = (int16_t*)buffer->buffer->bytes;
-                        for (int i = 0; i < frames * 2; i++) {
-                        float v = std::clamp(heavy_buffer[i], -1.0f, 1.0f);
-                        out[i] = (int16_t)(v * 32767.0f);
-                    }
+                        Profiler::mark(PROFILE_HEAVY);
+
+                        // FX chain (Delay -> Reverb -> Limiter) and int16 conversion in one pass
+                        masterFX.process(heavy_buffer, frames, Int16Sink{(int16_t*)buffer->buffer->bytes});
+                        Profiler::mark(PROFILE_FX);
                     }
                     buffer->sample_count = buffer->max_sample_count;
                     give_audio_buffer(ap, buffer);
-                }       
+
+                    // a buffer that was free on the first try means the output queue ran low
+                    Profiler::end_block(!waited);
+                    waited = false;
+                } else {
+                    waited = true;
+                }
             }
         }
         else {
@@ -299,21 +122,26 @@ namespace Pico {
             channel_config_set_dreq(&cfg, pwm_get_dreq(slice));
             volatile uint16_t* pwm_cc_ptr = ((volatile uint16_t*)&pwm_hw->slice[slice].cc) + channel;
 
+            Profiler::begin(_srate, _bsize);
+
             while (true) {
                 if (_cb) {
                     _cb(heavy_buffer, _bsize);
-                    
-                    process_master_effects(heavy_buffer, _bsize);
+                    Profiler::mark(PROFILE_HEAVY);
 
-                    for (int i = 0; i < _bsize; i++) {
-                        float v = (heavy_buffer[i * 2] + heavy_buffer[i * 2 + 1]) * 0.5f;
-                        v = std::clamp(v, -1.0f, 1.0f);
-                        pwm_buffers[write_idx][i] = (uint16_t)((v * 0.5f + 0.5f) * wrap);
-                    }
+                    // FX chain and mono PWM duty conversion in one pass
+                    masterFX.process(heavy_buffer, _bsize, PwmSink{pwm_buffers[write_idx], (float)wrap});
+                    Profiler::mark(PROFILE_FX);
+
+                    // DMA already idle: the previous buffer ran out and PWM held its last value
+                    bool dry = Profiler::enabled && !dma_channel_is_busy(dma_chan);
 
                     dma_channel_wait_for_finish_blocking(dma_chan);
                     dma_channel_configure(dma_chan, &cfg, pwm_cc_ptr, pwm_buffers[write_idx], _bsize, true);
                     write_idx = 1 - write_idx;
+
+                    Profiler::mark(PROFILE_WAIT);
+                    Profiler::end_block(dry);
                 }
             }
         }
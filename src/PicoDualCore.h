@@ -0,0 +1,139 @@
+#pragma once
+
+#include <stdint.h>
+#include <atomic>
+#include "PicoEvents.h"
+
+// Second Heavy instance on core 0 (board.json "dual_core": true).
+//
+// Both cores run the same patch. Voices alternate between the instances
+// (voice v plays on instance v & 1, receiver NOTE(v / 2 + 1)), so a patch
+// with four [r NOTEn] plays eight voices, each core computing four.
+//
+// Core 1 stays the only reader of the control queue: audioFunc drains it,
+// applies events to its own instance and forwards the ones for core 0 into a
+// second ring. It then raises the block sequence number and renders its half
+// while core 0 renders the other half into its own buffer. Before MasterFX
+// core 1 waits for core 0's sequence number to catch up and adds the buffer.
+// If core 0 is busy for longer than the wait (display refresh, a web
+// request), that block of core 0 voices is left out and counted as missed
+// instead of stalling the audio output.
+//
+// Core 0 renders from its main loop; core 1 signals a new block with SEV so
+// an idle core 0 wakes up right away.
+
+#ifndef MAX_BLOCK_SIZE
+#define MAX_BLOCK_SIZE 1024
+#endif
+
+#ifndef VOICE_CORE_QUEUE_SIZE
+#define VOICE_CORE_QUEUE_SIZE 128  // must be a power of two
+#endif
+
+static_assert((VOICE_CORE_QUEUE_SIZE & (VOICE_CORE_QUEUE_SIZE - 1)) == 0, "VOICE_CORE_QUEUE_SIZE must be a power of two");
+
+#if __has_include("hardware/sync.h")
+#include "hardware/sync.h"
+#include "hardware/timer.h"
+#define VOICE_CORE_NOW_US() time_us_32()
+#define VOICE_CORE_SIGNAL() __sev()
+#define VOICE_CORE_PAUSE()
+#else
+#include <chrono>
+#include <thread>
+#define VOICE_CORE_NOW_US() (uint32_t)std::chrono::duration_cast<std::chrono::microseconds>( \
+    std::chrono::steady_clock::now().time_since_epoch()).count()
+#define VOICE_CORE_SIGNAL()
+#define VOICE_CORE_PAUSE() std::this_thread::yield()  // host tests run both "cores" as threads
+#endif
+
+
+struct VoiceCoreStats {
+    std::atomic<uint32_t> blocks{0};    // blocks rendered by core 0 (core 0)
+    std::atomic<uint32_t> missed{0};    // blocks core 1 mixed without core 0 (core 1)
+    std::atomic<uint32_t> dropped{0};   // forwarded events lost to a full ring (core 1)
+};
+
+
+namespace Pico {
+
+    class VoiceCore {
+    public:
+        // Before the audio core starts: how long core 1 may wait for core 0, in us
+        void begin(uint32_t wait_us) { _wait_us = wait_us; }
+
+        // ---- core 1 ----
+
+        void forward(const ControlEvent& e) {
+            uint32_t h = _queue.head.load(std::memory_order_relaxed);
+            uint32_t t = _queue.tail.load(std::memory_order_acquire);
+            if ((h - t) >= VOICE_CORE_QUEUE_SIZE) {
+                count(stats.dropped);
+                return;
+            }
+            _queue.data[h & (VOICE_CORE_QUEUE_SIZE - 1)] = e;
+            _queue.head.store(h + 1, std::memory_order_release);
+        }
+
+        // Events forwarded so far belong to this block
+        void start(int frames) {
+            _frames = frames;
+            _requested.store(_requested.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+            VOICE_CORE_SIGNAL();
+        }
+
+        // Add core 0's block to `buffer`; false if it did not arrive in time
+        bool finish(float* buffer, int samples) {
+            const uint32_t req = _requested.load(std::memory_order_relaxed);
+            const uint32_t t0 = VOICE_CORE_NOW_US();
+            while (_done.load(std::memory_order_acquire) != req) {
+                if (VOICE_CORE_NOW_US() - t0 > _wait_us) {
+                    count(stats.missed);
+                    return false;
+                }
+                VOICE_CORE_PAUSE();
+            }
+            for (int i = 0; i < samples; i++) buffer[i] += _buffer[i];
+            return true;
+        }
+
+        // ---- core 0 ----
+
+        // Render the pending block, if any. SendEvent: void (const ControlEvent&),
+        // Process: void (float* buffer, int frames)
+        template <typename SendEvent, typename Process>
+        bool poll(SendEvent&& send_event, Process&& process) {
+            const uint32_t req = _requested.load(std::memory_order_acquire);
+            if (req == _done.load(std::memory_order_relaxed)) return false;
+
+            uint32_t t = _queue.tail.load(std::memory_order_relaxed);
+            const uint32_t h = _queue.head.load(std::memory_order_acquire);
+            for (; t != h; t++) {
+                send_event(_queue.data[t & (VOICE_CORE_QUEUE_SIZE - 1)]);
+            }
+            _queue.tail.store(t, std::memory_order_release);
+
+            process(_buffer, _frames);
+            count(stats.blocks);
+            _done.store(req, std::memory_order_release);
+            return true;
+        }
+
+        VoiceCoreStats stats;
+
+    private:
+        struct Queue {
+            ControlEvent data[VOICE_CORE_QUEUE_SIZE];
+            std::atomic<uint32_t> head{0};  // written by core 1
+            std::atomic<uint32_t> tail{0};  // written by core 0
+        };
+
+        Queue _queue;
+        float _buffer[MAX_BLOCK_SIZE * 2] __attribute__((aligned(4))) = {};
+        int _frames = 0;
+        uint32_t _wait_us = 0;
+        std::atomic<uint32_t> _requested{0};  // written by core 1
+        std::atomic<uint32_t> _done{0};       // written by core 0
+    };
+
+}
@@ -0,0 +1,247 @@
+#pragma once
+
+#include <stdint.h>
+#include <atomic>
+
+// Control events from core 0 (controls, MIDI, web, OSC) to the audio core.
+//
+// Heavy is only ever touched from core 1: audioFunc drains everything queued
+// here at the start of each block, so core 0 never takes a lock or disables
+// IRQs to talk to the patch.
+//
+// Two paths:
+//   - discrete events (notes, CC, bend, buttons, gates, encoders, pads) go
+//     through a single-producer/single-consumer ring and are delivered
+//     lossless and in order, unless the ring is full (counted as dropped);
+//   - continuous controls (knobs, joysticks, sensors, web, OSC) write to a
+//     per-receiver slot, last write wins. Values written between two blocks
+//     collapse into one send (counted as coalesced).
+//
+// Only plain loads and stores are used, so this stays lock-free on the M0+,
+// which has no atomic read-modify-write instructions. Every counter has a
+// single writer: the core 0 main loop for post_event/post_param, core 1 for
+// the drain. Interrupt handlers on core 0 must not call either, because they
+// can preempt the main loop between a load and its store. The lwIP callbacks
+// (web, OSC), which run from the cyw43 background IRQ, write to an InboxSlot
+// instead and the main loop posts it with post_inbox().
+//
+// Discrete events carry their arrival time. With board.json
+// "sample_accurate": true, EventClock turns it into a Heavy message delay:
+// an event is played one block period after it arrived, at the same offset
+// into the block it arrived in. Jitter drops from a whole block to a sample,
+// for one block of extra latency.
+
+#ifndef EVENT_QUEUE_SIZE
+#define EVENT_QUEUE_SIZE 128  // must be a power of two
+#endif
+
+static_assert((EVENT_QUEUE_SIZE & (EVENT_QUEUE_SIZE - 1)) == 0, "EVENT_QUEUE_SIZE must be a power of two");
+
+#if __has_include("hardware/timer.h")
+#include "hardware/timer.h"
+#define EVENT_NOW_US() time_us_32()
+#else
+#include <chrono>
+#define EVENT_NOW_US() (uint32_t)std::chrono::duration_cast<std::chrono::microseconds>( \
+    std::chrono::steady_clock::now().time_since_epoch()).count()
+#endif
+
+#define EVENT_TARGET_ALL 0xFFFF  // every Heavy instance (dual_core runs two)
+
+struct ControlEvent {
+    uint32_t hash;
+    uint16_t argc;
+    uint16_t target;  // EVENT_TARGET_ALL or the instance that plays the voice
+    float args[3];
+    uint32_t time_us;  // arrival on core 0, EVENT_UNTIMED: send at the block start
+};
+
+#define EVENT_UNTIMED 0u
+
+
+struct EventQueue {
+    ControlEvent data[EVENT_QUEUE_SIZE];
+    std::atomic<uint32_t> head{0};  // written by core 0
+    std::atomic<uint32_t> tail{0};  // written by core 1
+};
+
+
+struct ParamSlot {
+    uint32_t hash;
+    std::atomic<float> value{0.0f};
+    std::atomic<uint32_t> written{0};  // written by core 0
+    std::atomic<uint32_t> applied{0};  // written by core 1
+};
+
+
+// A continuous value from a core 0 interrupt handler, waiting for the main loop
+struct InboxSlot {
+    std::atomic<float> value{0.0f};
+    std::atomic<uint32_t> written{0};  // written by the interrupt handler
+    uint32_t posted = 0;               // main loop
+};
+
+
+struct EventStats {
+    std::atomic<uint32_t> sent{0};       // events and values accepted (core 0)
+    std::atomic<uint32_t> dropped{0};    // discrete events lost to a full ring (core 0)
+    std::atomic<uint32_t> coalesced{0};  // values overwritten before the audio core read them (core 0)
+    std::atomic<uint32_t> delivered{0};  // sends made into Heavy (core 1)
+};
+
+
+namespace Pico {
+
+    inline EventQueue event_queue;
+    inline EventStats event_stats;
+
+    // Arrival time for the events core 0 posts next (core 0 only)
+    inline uint32_t event_stamp_us = 0;
+    inline bool event_stamped = false;
+
+    // Single-writer increment, no read-modify-write needed
+    inline void count(std::atomic<uint32_t>& c, uint32_t n = 1) {
+        c.store(c.load(std::memory_order_relaxed) + n, std::memory_order_relaxed);
+    }
+
+    // ---- core 0 ----
+
+    // Events posted until unstamp_events() arrived at time_us, e.g. a MIDI
+    // message whose bytes the UART interrupt queued before midi_task parsed
+    // them. Unstamped events arrive when they are posted.
+    inline void stamp_events(uint32_t time_us) {
+        event_stamp_us = time_us;
+        event_stamped = true;
+    }
+
+    inline void unstamp_events() {
+        event_stamped = false;
+    }
+
+    inline bool post_event_to(uint16_t target, uint32_t hash, uint32_t argc, float a = 0.0f, float b = 0.0f, float c = 0.0f) {
+        uint32_t h = event_queue.head.load(std::memory_order_relaxed);
+        uint32_t t = event_queue.tail.load(std::memory_order_acquire);
+        if ((h - t) >= EVENT_QUEUE_SIZE) {
+            count(event_stats.dropped);
+            return false;
+        }
+        ControlEvent& e = event_queue.data[h & (EVENT_QUEUE_SIZE - 1)];
+        e.hash = hash;
+        e.argc = (uint16_t)argc;
+        e.target = target;
+        e.args[0] = a;
+        e.args[1] = b;
+        e.args[2] = c;
+        e.time_us = event_stamped ? event_stamp_us : EVENT_NOW_US();
+        if (e.time_us == EVENT_UNTIMED) e.time_us = 1;
+        event_queue.head.store(h + 1, std::memory_order_release);
+        count(event_stats.sent);
+        return true;
+    }
+
+    inline bool post_event(uint32_t hash, uint32_t argc, float a = 0.0f, float b = 0.0f, float c = 0.0f) {
+        return post_event_to(EVENT_TARGET_ALL, hash, argc, a, b, c);
+    }
+
+    inline void post_param(ParamSlot& slot, float v) {
+        uint32_t w = slot.written.load(std::memory_order_relaxed);
+        if (w != slot.applied.load(std::memory_order_relaxed)) {
+            count(event_stats.coalesced);
+        }
+        slot.value.store(v, std::memory_order_relaxed);
+        slot.written.store(w + 1, std::memory_order_release);
+        count(event_stats.sent);
+    }
+
+    // ---- core 0 interrupt handlers ----
+
+    inline void post_from_irq(InboxSlot& in, float v) {
+        in.value.store(v, std::memory_order_relaxed);
+        in.written.store(in.written.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+    }
+
+    // Main loop: post what the handlers left in inbox[i] to slots[i]. A value
+    // written during the pass is posted again next time, never lost.
+    inline void post_inbox(InboxSlot* inbox, ParamSlot* slots, int num_slots) {
+        for (int i = 0; i < num_slots; i++) {
+            InboxSlot& in = inbox[i];
+            const uint32_t w = in.written.load(std::memory_order_acquire);
+            if (w == in.posted) continue;
+            in.posted = w;
+            post_param(slots[i], in.value.load(std::memory_order_relaxed));
+        }
+    }
+
+    // ---- core 1 ----
+
+    // Continuous values first, so a note queued in the same block already sees
+    // the latest knob positions. Only events queued before the call are
+    // drained; anything pushed meanwhile waits for the next block.
+    template <typename SendFloat, typename SendEvent>
+    inline void drain_events(ParamSlot* slots, int num_slots, SendFloat&& send_float, SendEvent&& send_event) {
+        uint32_t n = 0;
+
+        for (int i = 0; i < num_slots; i++) {
+            ParamSlot& s = slots[i];
+            uint32_t w = s.written.load(std::memory_order_acquire);
+            if (w == s.applied.load(std::memory_order_relaxed)) continue;
+            float v = s.value.load(std::memory_order_relaxed);
+            s.applied.store(w, std::memory_order_relaxed);
+            send_float(s.hash, v);
+            n++;
+        }
+
+        uint32_t t = event_queue.tail.load(std::memory_order_relaxed);
+        const uint32_t h = event_queue.head.load(std::memory_order_acquire);
+        for (; t != h; t++) {
+            send_event(event_queue.data[t & (EVENT_QUEUE_SIZE - 1)]);
+            n++;
+        }
+        event_queue.tail.store(t, std::memory_order_release);
+
+        if (n) count(event_stats.delivered, n);
+    }
+
+    // Maps arrival times onto the block being rendered. Core 1 calls
+    // start_block() before draining; core 0 may read it for the dual_core
+    // instance once voice_core.start() has published the block.
+    class EventClock {
+    public:
+        void begin(uint32_t sample_rate) {
+            _sample_rate = sample_rate;
+        }
+
+        void start_block(uint32_t now_us, int frames) {
+            _block_us = now_us;
+            _frames = (uint32_t)frames;
+            _period_us = (uint32_t)((uint64_t)frames * 1000000u / _sample_rate);
+        }
+
+        // Sample offset into the current block, 0 for untimed events and for
+        // events older than a block period (core 1 was late, or catching up)
+        uint32_t offset(const ControlEvent& e) const {
+            if (e.time_us == EVENT_UNTIMED) return 0;
+            int32_t age_us = (int32_t)(_block_us - e.time_us);
+            if (age_us < 0) age_us = 0;  // posted after the block started, before the drain
+            if ((uint32_t)age_us >= _period_us) return 0;
+            uint32_t n = (uint32_t)((uint64_t)(_period_us - (uint32_t)age_us) * _sample_rate / 1000000u);
+            return n < _frames ? n : _frames - 1;
+        }
+
+        // Heavy message delay for the event. Half a sample is added because
+        // Heavy truncates the delay to whole samples.
+        float delay_ms(const ControlEvent& e) const {
+            const uint32_t n = offset(e);
+            return n ? ((float)n + 0.5f) * 1000.0f / (float)_sample_rate : 0.0f;
+        }
+
+    private:
+        uint32_t _sample_rate = 48000;
+        uint32_t _block_us = 0;
+        uint32_t _frames = 1;
+        uint32_t _period_us = 0;
+    };
+
+    inline EventClock event_clock;
+
+}
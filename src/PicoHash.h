@@ -0,0 +1,51 @@
+#pragma once
+
+#include <stdint.h>
+#include <string.h>
+
+// Name routing tables generated by pikopd.py.
+// Every name has its own slot (hash-and-displace perfect hash searched at build
+// time), so a lookup is one string hash, two table reads and one strcmp to
+// confirm the hit, however many names the patch has.
+
+struct RouteEntry {
+    const char* name;   // nullptr for an empty slot
+    uint32_t value;     // Heavy receiver hash or print id
+};
+
+struct RouteTable {
+    const RouteEntry* slots;
+    const uint16_t* disp;   // per-bucket displacement
+    uint32_t mask;          // slot count - 1, slot count is a power of two
+    uint32_t disp_mask;     // bucket count - 1
+    uint32_t seed;
+};
+
+// Seeded FNV-1a with a final mix; must match pico_name_hash() in pikopd.py
+static inline uint32_t pico_name_hash(const char* s, uint32_t seed) {
+    uint32_t h = 2166136261u ^ seed;
+    while (*s) {
+        h ^= (uint8_t)*s++;
+        h *= 16777619u;
+    }
+    h ^= h >> 15;
+    h *= 0x2c1b3c6du;
+    h ^= h >> 12;
+    return h;
+}
+
+// Must match route_slot() in pikopd.py
+static inline uint32_t route_slot(uint32_t h, uint16_t d) {
+    h ^= d * 0x9e3779b1u;
+    h ^= h >> 16;
+    h *= 0x85ebca6bu;
+    h ^= h >> 13;
+    return h;
+}
+
+static inline const RouteEntry* route_lookup(const RouteTable& table, const char* name) {
+    if (!name) return nullptr;
+    const uint32_t h = pico_name_hash(name, table.seed);
+    const RouteEntry& e = table.slots[route_slot(h, table.disp[(h >> 16) & table.disp_mask]) & table.mask];
+    return (e.name && strcmp(e.name, name) == 0) ? &e : nullptr;
+}
@@ -5,6 +5,9 @@
 #include <atomic>
 #include <cmath>
 
+#include "PicoVoices.h"
+#include "PicoEvents.h"
+
 #if defined(WEB) && (WEB == 1)
 #else
     #ifdef MIDI_HOST
@@ -39,19 +42,11 @@
     
 #define MIDI_IN_BUF 256
 #define MIDI_OUT_BUF 256
-#define PRINT_POOL_SIZE 64
-
-
-struct Voice {
-    uint8_t note;
-    uint8_t velocity;   
-    bool active;
-    uint32_t age;
-};
 
 
 struct MidiInputBuffer {
     uint8_t data[MIDI_IN_BUF];
+    uint32_t time_us[MIDI_IN_BUF];  // arrival of each byte, for Pico::stamp_events
     std::atomic<uint32_t> head{0};
     std::atomic<uint32_t> tail{0};
 
@@ -80,84 +75,8 @@ struct MidiOutputBuffer {
 };
 
 
-struct PrintMsg {
-    std::atomic<bool> busy{false}; 
-    int16_t id;
-    float val;      
-    bool is_float;  
-};
-
-
 void handle_midi_message(uint8_t status, uint8_t data1, uint8_t data2);
-void print_queue(const char** names, int num_names, bool debug);
    
-inline Voice voices[MAX_VOICES];
-inline uint32_t voiceCounter = 0;
-extern PrintMsg print_pool[PRINT_POOL_SIZE];
-
-
-inline int findVoiceByNote(uint8_t note) {
-    for (int i = 0; i < MAX_VOICES; i++) {
-        if (voices[i].active && voices[i].note == note) {
-            return i;
-        }
-    }
-    return -1;
-}
-
-
-inline void sendVoiceNoteOff(int voiceIndex, uint8_t note) {
-    if (voiceIndex < 0 || voiceIndex >= MAX_VOICES) return;
-    voices[voiceIndex].active = false;
-}
-
-
-inline void sendVoiceNoteOn(int voiceIndex, uint8_t note, uint8_t velocity) {
-    if (voiceIndex < 0 || voiceIndex >= MAX_VOICES) return;
-
-    voices[voiceIndex].note = note;
-    voices[voiceIndex].velocity = velocity;
-    voices[voiceIndex].active = true;
-    voices[voiceIndex].age = voiceCounter++;
-}
-
-
-inline int allocateVoice(uint8_t note) {
-
-        int existing = findVoiceByNote(note);
-        if (existing >= 0) {
-            voices[existing].age = voiceCounter++;
-            return existing;
-        }
-
-        int oldestIndex = 0;
-        uint32_t oldestAge = UINT32_MAX;
-
-        for (int i = 0; i < MAX_VOICES; i++) {
-
-            if (!voices[i].active) {
-                voices[i].note = note;
-                voices[i].active = true;
-                voices[i].age = voiceCounter++;
-                return i;
-            }
-
-            if (voices[i].age < oldestAge) {
-                oldestAge = voices[i].age;
-                oldestIndex = i;
-            }
-        }
-
-        int v = oldestIndex;
-
-        sendVoiceNoteOff(v, voices[v].note);
-
-        voices[v].note = note;
-        voices[v].active = true;
-        voices[v].age = voiceCounter++;
-
-        return v;
-    }
 
 
 // ----------- MIDI ------------
@@ -169,16 +88,18 @@ inline int allocateVoice(uint8_t note) {
         uint32_t t = midi_in_rb.tail.load(std::memory_order_acquire);
         if ((h - t) < MIDI_IN_BUF) {
             midi_in_rb.data[h & (MIDI_IN_BUF - 1)] = byte;
+            midi_in_rb.time_us[h & (MIDI_IN_BUF - 1)] = time_us_32();
             midi_in_rb.head.store(h + 1, std::memory_order_release);
         }
     }
 
 
-    bool midi_pop(uint8_t &byte) {
+    bool midi_pop(uint8_t &byte, uint32_t &time_us) {
         uint32_t t = midi_in_rb.tail.load(std::memory_order_relaxed);
         uint32_t h = midi_in_rb.head.load(std::memory_order_acquire);
         if (t == h) return false; 
         byte = midi_in_rb.data[t & (MIDI_IN_BUF - 1)];
+        time_us = midi_in_rb.time_us[t & (MIDI_IN_BUF - 1)];
         midi_in_rb.tail.store(t + 1, std::memory_order_release);
         return true;
     }
@@ -250,11 +171,15 @@ void midi_task() {
     #endif
 
     // 2. Process incoming MIDI (Shared: works for UART, USB, and Web/OSC)
+    // Events are stamped with the arrival of the byte that completed them
     uint8_t b;
+    uint32_t arrived_us;
     uint32_t count = 0;
-    while (count++ < 64 && midi_pop(b)) {
+    while (count++ < 64 && midi_pop(b, arrived_us)) {
+        Pico::stamp_events(arrived_us);
         parse_raw_midi_byte(b, core0_parser, handle_midi_message);
     }
+    Pico::unstamp_events();
 
     // 3. USB Output Logic (Only if Web is OFF)
     #if !defined(WEB) || (WEB == 0)
@@ -318,81 +243,6 @@ void midi_task() {
     }
 
 
-    
-#ifndef MIDI_HOST
-
-void print_queue(const char** names, int num_names, bool debug)
-{
-    constexpr int MAX_PRINTS_PER_CALL = 8;
-
-    for (int i = 0; i < MAX_PRINTS_PER_CALL; ++i)
-    {
-        uint32_t idx;
-
-        // non-blocking FIFO drain (IMPORTANT for stability)
-        if (!multicore_fifo_pop_timeout_us(0, &idx)) {
-            break;
-        }
-
-        if (idx >= PRINT_POOL_SIZE) {
-            continue;
-        }
-
-        PrintMsg* m = &print_pool[idx];
-
-        // ---- SAFE ownership release (no struct copy, no race) ----
-        bool expected = true;
-        if (!m->busy.compare_exchange_strong(
-                expected,
-                false,
-                std::memory_order_acq_rel))
-        {
-            continue;
-        }
-
-#if !defined(WEB_ENABLED) || (WEB_ENABLED == 0)
-#if ENABLE_DEBUG
-
-        if (debug && tud_cdc_connected())
-        {
-            const char* name = "print";
-
-            int id = m->id;
-            if (names && id >= 0 && id < num_names && names[id]) {
-                name = names[id];
-            }
-
-            float val = m->val;
-
-            // ---- SAFE float formatting (avoid libc float instability) ----
-            int v = (int)(val * 1000.0f);
-            int whole = v / 1000;
-            int frac  = (v < 0) ? -(v % 1000) : (v % 1000);
-
-            char buf[96];
-
-            int len = snprintf(buf, sizeof(buf),
-                               "%d.%03d\r\n",      // "[%s] %d.%03d\r\n" - This makes crash on RP2350
-                            //   name,
-                               whole,
-                               frac);
-
-            if (len > 0 && len < (int)sizeof(buf))
-            {
-                fputs(buf, stdout);
-            }
-        }
-
-#endif
-#endif
-    }
-}
-
-#endif
-
-
-
-
 
 #if !defined(WEB) || (WEB == 0)
 
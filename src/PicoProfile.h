@@ -0,0 +1,207 @@
+#pragma once
+
+#include <stdint.h>
+#include <stdio.h>
+#include <atomic>
+
+// Audio engine instrumentation (board.json "profile": true -> AUDIO_PROFILE=1).
+//
+// Core 1 marks the end of each stage of a block with the SysTick counter (the
+// M0+ has no DWT cycle counter, SysTick is per core and runs at clk_sys):
+//   heavy - audioFunc: queued control events + processInlineInterleaved
+//   fx    - MasterFX together with the int16/PWM conversion (one fused pass)
+//   block - heavy + fx, compared against the block period
+//   wait  - waiting for a free I2S buffer or for the PWM DMA to finish
+//
+// Every stage feeds a histogram spanning 0..2x the block period. Once per
+// second of audio core 1 turns it into min/avg/max/p99 and publishes the
+// snapshot under a sequence lock, so core 0 can read it without stalling the
+// audio core. With AUDIO_PROFILE=0 every call below is an empty inline.
+
+#ifndef AUDIO_PROFILE
+#define AUDIO_PROFILE 0
+#endif
+
+#if AUDIO_PROFILE
+#include "hardware/structs/systick.h"
+#include "hardware/clocks.h"
+#endif
+
+namespace Pico {
+
+enum ProfileStage {
+    PROFILE_HEAVY,
+    PROFILE_FX,
+    PROFILE_BLOCK,
+    PROFILE_WAIT,
+    PROFILE_NUM_STAGES
+};
+
+struct ProfileSnapshot {
+    uint32_t window;          // increments with every published snapshot
+    uint32_t blocks;          // blocks in this window
+    uint32_t late;            // I2S buffer already free when asked / PWM DMA ran dry
+    uint32_t over;            // blocks whose processing took longer than the block period
+    uint32_t late_total;
+    uint32_t over_total;
+    float budget_us;          // block period
+    float min_us[PROFILE_NUM_STAGES];
+    float avg_us[PROFILE_NUM_STAGES];
+    float max_us[PROFILE_NUM_STAGES];
+    float p99_us[PROFILE_NUM_STAGES];
+};
+
+
+class Profiler {
+public:
+    static constexpr bool enabled = AUDIO_PROFILE;
+
+#if AUDIO_PROFILE
+    static constexpr int BUCKETS = 64;
+    static constexpr int WARMUP_BLOCKS = 8;   // buffers filling up at start are not late
+    static constexpr uint32_t SYSTICK_MASK = 0x00FFFFFF;
+
+    // Call on core 1 before the audio loop
+    static void begin(uint32_t sample_rate, uint32_t frames) {
+        systick_hw->rvr = SYSTICK_MASK;
+        systick_hw->cvr = 0;
+        systick_hw->csr = 0x5;  // enable, processor clock
+
+        const uint32_t hz = clock_get_hz(clk_sys);
+        _us_per_cycle = 1e6f / (float)hz;
+        _budget = (uint32_t)((uint64_t)hz * frames / sample_rate);
+        _bucket = _budget / (BUCKETS / 2) ? _budget / (BUCKETS / 2) : 1;
+        _window_blocks = sample_rate / frames ? sample_rate / frames : 1;
+        _warmup = WARMUP_BLOCKS;
+        reset_window();
+        _mark = systick_hw->cvr;
+    }
+
+    // Time since the previous mark is charged to `stage`
+    static inline void mark(ProfileStage stage) {
+        const uint32_t t = systick_hw->cvr;
+        const uint32_t dt = (_mark - t) & SYSTICK_MASK;  // SysTick counts down
+        _mark = t;
+        add(stage, dt);
+        if (stage != PROFILE_WAIT) _block += dt;
+    }
+
+    static inline void end_block(bool late) {
+        add(PROFILE_BLOCK, _block);
+        if (_block > _budget) { _over++; _over_total++; }
+        _block = 0;
+
+        if (_warmup) {
+            _warmup--;
+        } else if (late) {
+            _late++;
+            _late_total++;
+        }
+
+        if (++_blocks >= _window_blocks) publish();
+    }
+
+    // Core 0: copy the latest snapshot, true if it is newer than `out`
+    static bool read(ProfileSnapshot& out) {
+        uint32_t s1, s2;
+        ProfileSnapshot copy;
+        do {
+            s1 = _seq.load(std::memory_order_acquire);
+            if (s1 & 1) continue;
+            copy = _snap;
+            std::atomic_thread_fence(std::memory_order_acquire);
+            s2 = _seq.load(std::memory_order_relaxed);
+        } while ((s1 & 1) || s1 != s2);
+
+        if (copy.window == 0 || copy.window == out.window) return false;
+        out = copy;
+        return true;
+    }
+#else
+    static inline void begin(uint32_t, uint32_t) {}
+    static inline void mark(ProfileStage) {}
+    static inline void end_block(bool) {}
+    static inline bool read(ProfileSnapshot&) { return false; }
+#endif
+
+    // One-line summary for the console and the display
+    static int format(const ProfileSnapshot& s, char* buf, int size) {
+        const float pct = s.budget_us > 0.0f ? 100.0f / s.budget_us : 0.0f;
+        return snprintf(buf, size,
+            "dsp %.0f%% p99 %.0f%% max %.0f%% | heavy %.0f/%.0f/%.0fus fx %.0f/%.0f/%.0fus | late %lu over %lu",
+            s.avg_us[PROFILE_BLOCK] * pct, s.p99_us[PROFILE_BLOCK] * pct, s.max_us[PROFILE_BLOCK] * pct,
+            s.avg_us[PROFILE_HEAVY], s.p99_us[PROFILE_HEAVY], s.max_us[PROFILE_HEAVY],
+            s.avg_us[PROFILE_FX], s.p99_us[PROFILE_FX], s.max_us[PROFILE_FX],
+            (unsigned long)s.late_total, (unsigned long)s.over_total);
+    }
+
+private:
+#if AUDIO_PROFILE
+    static inline void add(int stage, uint32_t cycles) {
+        uint32_t b = cycles / _bucket;
+        _hist[stage][b < BUCKETS ? b : BUCKETS - 1]++;
+        if (cycles < _min[stage]) _min[stage] = cycles;
+        if (cycles > _max[stage]) _max[stage] = cycles;
+        _sum[stage] += cycles;
+    }
+
+    static void reset_window() {
+        for (int s = 0; s < PROFILE_NUM_STAGES; s++) {
+            for (int b = 0; b < BUCKETS; b++) _hist[s][b] = 0;
+            _min[s] = UINT32_MAX;
+            _max[s] = 0;
+            _sum[s] = 0;
+        }
+        _blocks = _late = _over = 0;
+        _block = 0;
+    }
+
+    static void publish() {
+        const uint32_t seq = _seq.load(std::memory_order_relaxed);
+        _seq.store(seq + 1, std::memory_order_relaxed);
+        std::atomic_thread_fence(std::memory_order_release);
+
+        _snap.window++;
+        _snap.blocks = _blocks;
+        _snap.late = _late;
+        _snap.over = _over;
+        _snap.late_total = _late_total;
+        _snap.over_total = _over_total;
+        _snap.budget_us = _budget * _us_per_cycle;
+
+        // p99: upper edge of the bucket where the top 1% of blocks starts
+        const uint32_t tail = _blocks / 100;
+        for (int s = 0; s < PROFILE_NUM_STAGES; s++) {
+            uint32_t seen = 0;
+            int b = BUCKETS - 1;
+            for (; b > 0; b--) {
+                seen += _hist[s][b];
+                if (seen > tail) break;
+            }
+            uint32_t p99 = (uint32_t)(b + 1) * _bucket;
+            if (p99 > _max[s]) p99 = _max[s];
+
+            _snap.min_us[s] = (_min[s] == UINT32_MAX ? 0 : _min[s]) * _us_per_cycle;
+            _snap.max_us[s] = _max[s] * _us_per_cycle;
+            _snap.avg_us[s] = (float)_sum[s] / (float)_blocks * _us_per_cycle;
+            _snap.p99_us[s] = p99 * _us_per_cycle;
+        }
+
+        _seq.store(seq + 2, std::memory_order_release);
+        reset_window();
+    }
+
+    static inline uint32_t _hist[PROFILE_NUM_STAGES][BUCKETS];
+    static inline uint32_t _min[PROFILE_NUM_STAGES];
+    static inline uint32_t _max[PROFILE_NUM_STAGES];
+    static inline uint32_t _sum[PROFILE_NUM_STAGES];   // at most ~1 s of cycles per window
+    static inline uint32_t _mark = 0, _block = 0;
+    static inline uint32_t _budget = 1, _bucket = 1, _window_blocks = 1, _warmup = 0;
+    static inline uint32_t _blocks = 0, _late = 0, _over = 0, _late_total = 0, _over_total = 0;
+    static inline float _us_per_cycle = 0.0f;
+    static inline ProfileSnapshot _snap = {};
+    static inline std::atomic<uint32_t> _seq{0};
+#endif
+};
+
+} // namespace Pico
@@ -73,6 +73,12 @@ public:
         if (id >= 0 && id < 4) _pd_cache[id] = val;
     }
 
+    // Footer line in console mode, e.g. the audio profile
+    static void set_status(const char* text) {
+        strncpy(_status, text, sizeof(_status) - 1);
+        _status[sizeof(_status) - 1] = '\0';
+    }
+
     static void process(uint32_t now, const char** names, int num_names) {
         if (!_disp || (now - _last_draw_time < 40)) return;
         _last_draw_time = now;
@@ -102,6 +108,7 @@ private:
         } else {
             ssd1306_draw_string(_disp, 12, (_height / 2) - 12, 3, "PikoPD");
         }
+        if (_status[0] != '\0') ssd1306_draw_string(_disp, 0, _height - 8, 1, _status);
     }
 
     static void render_pd_grid(const char** names) {
@@ -118,7 +125,7 @@ private:
     static i2c_inst_t* _i2c;
     static ScreenMode _mode;
     static uint16_t _width, _height;
-    static char _display_buf[32], _log_lines[4][22];
+    static char _display_buf[32], _log_lines[4][22], _status[22];
     static int _char_idx, _current_id;
     static float _current_val, _pd_cache[4];
     static uint32_t _interaction_timer, _last_draw_time;
@@ -132,6 +139,7 @@ inline uint16_t Screen::_width = 128;
 inline uint16_t Screen::_height = 64;
 inline char Screen::_display_buf[32] = {0};
 inline char Screen::_log_lines[4][22] = {"", "", "", ""};
+inline char Screen::_status[22] = {0};
 inline int Screen::_char_idx = 0;
 inline float Screen::_current_val = 0.0f;
 inline float Screen::_pd_cache[4] = {0.0f, 0.0f, 0.0f, 0.0f};
@@ -0,0 +1,177 @@
+#pragma once
+
+#include <stdint.h>
+
+// Sample banks generated by pikopd.py from board.json "samples".
+//
+// WAV files are stored in flash as int16 or IMA-ADPCM (4 bits per sample) and
+// decoded into an exposed Heavy table ([table name size @hv_table]). The table
+// is the playback window: a bank can hold many samples, one of them sits in
+// the table at a time. Loading is streamed on core 1, SAMPLE_STREAM_FRAMES per
+// audio block, which is several times faster than playback, so a [tabplay~]
+// started together with the load stays behind the decoder.
+//
+// Only flash gets the saving; the table itself is still a float buffer in RAM.
+
+#ifndef SAMPLE_STREAM_FRAMES
+#define SAMPLE_STREAM_FRAMES 256  // per audio block, multiple of ADPCM_BLOCK_FRAMES
+#endif
+
+#define SAMPLE_INT16 0
+#define SAMPLE_ADPCM 1
+
+// ADPCM block: int16 predictor, uint8 step index, uint8 unused, then one nibble
+// per frame, low nibble first. Must match PicoSampleAssets in pikopd.py
+#define ADPCM_BLOCK_FRAMES 256
+#define ADPCM_BLOCK_BYTES (4 + ADPCM_BLOCK_FRAMES / 2)
+
+static_assert(SAMPLE_STREAM_FRAMES % ADPCM_BLOCK_FRAMES == 0, "SAMPLE_STREAM_FRAMES must be a multiple of ADPCM_BLOCK_FRAMES");
+
+
+struct SampleAsset {
+    const uint8_t* data;
+    uint32_t frames;
+    uint8_t format;
+};
+
+struct SampleBank {
+    const char* table;
+    uint32_t table_hash;
+    const SampleAsset* assets;
+    uint16_t num_assets;
+};
+
+extern const SampleBank sample_banks[];
+extern const int NUM_SAMPLE_BANKS;
+
+
+namespace Pico {
+
+    static const int16_t ADPCM_STEPS[89] = {
+        7, 8, 9, 10, 11, 12, 13, 14, 16, 17, 19, 21, 23, 25, 28, 31, 34, 37, 41, 45,
+        50, 55, 60, 66, 73, 80, 88, 97, 107, 118, 130, 143, 157, 173, 190, 209, 230,
+        253, 279, 307, 337, 371, 408, 449, 494, 544, 598, 658, 724, 796, 876, 963,
+        1060, 1166, 1282, 1411, 1552, 1707, 1878, 2066, 2272, 2499, 2749, 3024, 3327,
+        3660, 4026, 4428, 4871, 5358, 5894, 6484, 7132, 7845, 8630, 9493, 10442, 11487,
+        12635, 13899, 15289, 16818, 18500, 20350, 22385, 24623, 27086, 29794, 32767
+    };
+
+    static const int8_t ADPCM_INDEX[16] = {
+        -1, -1, -1, -1, 2, 4, 6, 8,
+        -1, -1, -1, -1, 2, 4, 6, 8
+    };
+
+    // Decode frames [start, start + count) of an asset; ADPCM starts must be block aligned
+    inline void sample_decode(const SampleAsset& a, uint32_t start, uint32_t count, float* out) {
+        const float scale = 1.0f / 32768.0f;
+
+        if (a.format == SAMPLE_INT16) {
+            const int16_t* pcm = (const int16_t*)a.data + start;
+            for (uint32_t i = 0; i < count; i++) out[i] = pcm[i] * scale;
+            return;
+        }
+
+        const uint8_t* block = a.data + (start / ADPCM_BLOCK_FRAMES) * ADPCM_BLOCK_BYTES;
+        while (count) {
+            int32_t pred = (int16_t)(block[0] | (block[1] << 8));
+            int index = block[2];
+            const uint8_t* nibbles = block + 4;
+            const uint32_t n = count < ADPCM_BLOCK_FRAMES ? count : ADPCM_BLOCK_FRAMES;
+
+            for (uint32_t i = 0; i < n; i++) {
+                const int code = (i & 1) ? (nibbles[i >> 1] >> 4) : (nibbles[i >> 1] & 0x0F);
+                const int step = ADPCM_STEPS[index];
+                int diff = step >> 3;
+                if (code & 4) diff += step;
+                if (code & 2) diff += step >> 1;
+                if (code & 1) diff += step >> 2;
+                pred += (code & 8) ? -diff : diff;
+                if (pred > 32767) pred = 32767;
+                else if (pred < -32768) pred = -32768;
+                index += ADPCM_INDEX[code];
+                if (index < 0) index = 0;
+                else if (index > 88) index = 88;
+                *out++ = pred * scale;
+            }
+            count -= n;
+            block += ADPCM_BLOCK_BYTES;
+        }
+    }
+
+
+    // TableFn: float* (const SampleBank& bank, uint32_t& length), nullptr if the table is not exposed
+    class SampleStreamer {
+    public:
+        static constexpr int MAX_BANKS = 16;
+
+        // Core 1 (send hook): start loading asset `index` of a bank into its table
+        void request(int bank, int index) {
+            if (bank < 0 || bank >= NUM_SAMPLE_BANKS || bank >= MAX_BANKS) return;
+            const SampleBank& b = sample_banks[bank];
+            if (index < 0 || index >= b.num_assets) return;
+            _state[bank] = { (uint16_t)index, 0, true };
+        }
+
+        // Core 1, start of each audio block
+        template <typename TableFn>
+        void service(TableFn&& table, uint32_t budget = SAMPLE_STREAM_FRAMES) {
+            for (int bank = 0; bank < NUM_SAMPLE_BANKS && bank < MAX_BANKS && budget; bank++) {
+                State& s = _state[bank];
+                if (!s.loading) continue;
+
+                uint32_t length = 0;
+                float* buf = table(sample_banks[bank], length);
+                if (!buf) {
+                    s.loading = false;
+                    continue;
+                }
+
+                const SampleAsset& a = sample_banks[bank].assets[s.asset];
+                const uint32_t frames = a.frames < length ? a.frames : length;
+
+                if (s.pos < frames) {
+                    uint32_t n = frames - s.pos;
+                    if (n > budget) {
+                        // keep ADPCM chunks block aligned, the rest waits for the next block
+                        n = (a.format == SAMPLE_ADPCM) ? budget - budget % ADPCM_BLOCK_FRAMES : budget;
+                        if (!n) break;
+                    }
+                    sample_decode(a, s.pos, n, buf + s.pos);
+                    s.pos += n;
+                    budget -= n;
+                }
+
+                // silence whatever a longer previous sample left behind
+                if (s.pos >= frames && budget) {
+                    uint32_t n = length - s.pos;
+                    if (n > budget) n = budget;
+                    for (uint32_t i = 0; i < n; i++) buf[s.pos + i] = 0.0f;
+                    s.pos += n;
+                    budget -= n;
+                }
+
+                if (s.pos >= length) s.loading = false;
+            }
+        }
+
+        // Core 0 before the audio core starts: load the first sample of every bank
+        template <typename TableFn>
+        void load_all(TableFn&& table) {
+            for (int bank = 0; bank < NUM_SAMPLE_BANKS && bank < MAX_BANKS; bank++) {
+                request(bank, 0);
+                while (_state[bank].loading) service(table, UINT32_MAX);
+            }
+        }
+
+    private:
+        struct State {
+            uint16_t asset;
+            uint32_t pos;
+            bool loading;
+        };
+        State _state[MAX_BANKS] = {};
+    };
+
+    inline SampleStreamer samples;
+
+}
@@ -0,0 +1,108 @@
+#pragma once
+
+#include <stdint.h>
+#include <string.h>
+#include <atomic>
+#include "PicoEvents.h"
+
+// [print] telemetry from the audio core (board.json "console": true).
+//
+// hv_print_handler runs inside Heavy's process call on core 1. It writes one
+// 12-byte record (timestamp, print index, value) into a single-producer ring
+// and returns: no rate limit, no slot search, no FIFO timeout. Core 0 drains
+// the ring from its main loop and either prints the values as text or, with
+// board.json "telemetry": true (TELEMETRY_BINARY=1), writes the records
+// unformatted to USB CDC, each behind a two-byte sync marker so they can be
+// told apart from the text lines around them. tools/telemetry.py turns that
+// stream back into named, timestamped events using the build manifest.
+//
+// Every record carries a sequence number that also advances for records lost
+// to a full ring, so the decoder can report how many went missing and where.
+// Only the core 1 instance has the print hook; with "dual_core" the [print]
+// objects of the core 0 instance stay silent.
+
+#ifndef TELEMETRY_RING_SIZE
+#define TELEMETRY_RING_SIZE 512  // records, must be a power of two
+#endif
+
+#ifndef TELEMETRY_BINARY
+#define TELEMETRY_BINARY 0
+#endif
+
+static_assert((TELEMETRY_RING_SIZE & (TELEMETRY_RING_SIZE - 1)) == 0, "TELEMETRY_RING_SIZE must be a power of two");
+
+// Frame on the wire: sync bytes, then the record as stored (little endian).
+// Must match tools/telemetry.py
+#define TELEMETRY_SYNC0 0xA5
+#define TELEMETRY_SYNC1 0x5A
+#define TELEMETRY_NO_ID 0xFFFF  // [print] name missing from the manifest
+
+
+struct TelemetryRecord {
+    uint32_t time_us;  // time_us_32() on core 1
+    uint16_t id;       // index into the manifest's prints
+    uint16_t seq;      // advances for every record, dropped ones included
+    float value;
+};
+
+static_assert(sizeof(TelemetryRecord) == 12, "TelemetryRecord must stay 12 bytes");
+
+#define TELEMETRY_FRAME_BYTES (2 + sizeof(TelemetryRecord))
+
+
+struct TelemetryStats {
+    std::atomic<uint32_t> written{0};  // records stored (core 1)
+    std::atomic<uint32_t> dropped{0};  // records lost to a full ring (core 1)
+};
+
+
+namespace Pico {
+
+    class Telemetry {
+    public:
+        // ---- core 1 ----
+
+        bool push(uint32_t time_us, uint16_t id, float value) {
+            const uint16_t seq = _seq++;
+            const uint32_t h = _head.load(std::memory_order_relaxed);
+            if (h - _tail.load(std::memory_order_acquire) >= TELEMETRY_RING_SIZE) {
+                count(stats.dropped);
+                return false;
+            }
+            _ring[h & (TELEMETRY_RING_SIZE - 1)] = { time_us, id, seq, value };
+            _head.store(h + 1, std::memory_order_release);
+            count(stats.written);
+            return true;
+        }
+
+        // ---- core 0 ----
+
+        // Oldest record, nullptr if empty; it stays in the ring until pop()
+        const TelemetryRecord* peek() const {
+            const uint32_t t = _tail.load(std::memory_order_relaxed);
+            if (t == _head.load(std::memory_order_acquire)) return nullptr;
+            return &_ring[t & (TELEMETRY_RING_SIZE - 1)];
+        }
+
+        void pop() {
+            _tail.store(_tail.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+        }
+
+        static void frame(const TelemetryRecord& r, uint8_t* out) {
+            out[0] = TELEMETRY_SYNC0;
+            out[1] = TELEMETRY_SYNC1;
+            memcpy(out + 2, &r, sizeof(r));
+        }
+
+        TelemetryStats stats;
+
+    private:
+        TelemetryRecord _ring[TELEMETRY_RING_SIZE];
+        std::atomic<uint32_t> _head{0};  // written by core 1
+        std::atomic<uint32_t> _tail{0};  // written by core 0
+        uint16_t _seq = 0;               // core 1 only
+    };
+
+    inline Telemetry telemetry;
+
+}
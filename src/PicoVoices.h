@@ -0,0 +1,191 @@
+#pragma once
+
+#include <stdint.h>
+
+// Voice allocation for the [r NOTE1] .. [r NOTEn] receivers.
+//
+// Voices live on intrusive doubly linked lists: a free list (longest released
+// first, so release tails get to finish), an active list in note-on order, one
+// list per note and, for the quietest policy, one list per velocity. Bitmaps of
+// the non-empty note/velocity lists find the lowest or highest entry with a
+// count-trailing/leading-zeros per 32 keys, so note on, note off and stealing
+// never scan the voices.
+//
+// Policies (board.json "voice_steal", passed as VOICE_STEAL):
+//   oldest   - steal the voice that was triggered first
+//   quietest - steal the lowest velocity voice, oldest first on a tie
+//   lowest   - lowest note priority: keep low notes, steal the highest one
+//   highest  - highest note priority: keep high notes, steal the lowest one
+// VOICE_RETRIGGER (board.json "voice_retrigger", default on) plays a repeated
+// note on the voice that already holds it instead of stacking a new one.
+
+#ifndef MAX_VOICES
+#define MAX_VOICES 1
+#endif
+
+#define VOICE_STEAL_OLDEST   0
+#define VOICE_STEAL_QUIETEST 1
+#define VOICE_STEAL_LOWEST   2
+#define VOICE_STEAL_HIGHEST  3
+
+#ifndef VOICE_STEAL
+#define VOICE_STEAL VOICE_STEAL_OLDEST
+#endif
+
+#ifndef VOICE_RETRIGGER
+#define VOICE_RETRIGGER 1
+#endif
+
+
+template <int KEYS>
+struct VoiceLists {
+    static constexpr int WORDS = (KEYS + 31) / 32;
+
+    int16_t head[KEYS];
+    int16_t tail[KEYS];
+    int16_t prev[MAX_VOICES];
+    int16_t next[MAX_VOICES];
+    uint32_t bits[WORDS];
+
+    void clear() {
+        for (int k = 0; k < KEYS; k++) head[k] = tail[k] = -1;
+        for (int w = 0; w < WORDS; w++) bits[w] = 0;
+    }
+
+    void push(int key, int v) {
+        prev[v] = tail[key];
+        next[v] = -1;
+        if (tail[key] >= 0) next[tail[key]] = v;
+        else head[key] = v;
+        tail[key] = v;
+        bits[key >> 5] |= 1u << (key & 31);
+    }
+
+    void remove(int key, int v) {
+        if (prev[v] >= 0) next[prev[v]] = next[v];
+        else head[key] = next[v];
+        if (next[v] >= 0) prev[next[v]] = prev[v];
+        else tail[key] = prev[v];
+        if (head[key] < 0) bits[key >> 5] &= ~(1u << (key & 31));
+    }
+
+    int lowest_key() const {
+        for (int w = 0; w < WORDS; w++) {
+            if (bits[w]) return (w << 5) + __builtin_ctz(bits[w]);
+        }
+        return -1;
+    }
+
+    int highest_key() const {
+        for (int w = WORDS - 1; w >= 0; w--) {
+            if (bits[w]) return (w << 5) + 31 - __builtin_clz(bits[w]);
+        }
+        return -1;
+    }
+};
+
+
+class VoiceAllocator {
+public:
+    struct Voice {
+        uint8_t note;
+        uint8_t velocity;
+        bool active;
+    };
+
+    VoiceAllocator() { reset(); }
+
+    void reset() {
+        pool_.clear();
+        by_note_.clear();
+        #if VOICE_STEAL == VOICE_STEAL_QUIETEST
+        by_velocity_.clear();
+        #endif
+        for (int v = 0; v < MAX_VOICES; v++) {
+            voices_[v] = { 0, 0, false };
+            pool_.push(FREE, v);
+        }
+        active_ = 0;
+    }
+
+    // Returns the voice to play the note on
+    int note_on(uint8_t note, uint8_t velocity) {
+        note &= 0x7F;
+        velocity &= 0x7F;
+
+        #if VOICE_RETRIGGER
+        int held = by_note_.tail[note];
+        if (held >= 0) {
+            detach(held);
+            attach(held, note, velocity);
+            return held;
+        }
+        #endif
+
+        int v = pool_.head[FREE];
+        if (v >= 0) {
+            pool_.remove(FREE, v);
+        } else {
+            v = victim();
+            detach(v);
+        }
+        attach(v, note, velocity);
+        return v;
+    }
+
+    // Returns the released voice, or -1 if the note is not playing
+    int note_off(uint8_t note) {
+        int v = by_note_.head[note & 0x7F];
+        if (v < 0) return -1;
+        detach(v);
+        pool_.push(FREE, v);
+        return v;
+    }
+
+    const Voice& voice(int v) const { return voices_[v]; }
+    int active() const { return active_; }
+
+private:
+    enum { FREE = 0, ACTIVE = 1 };
+
+    int victim() const {
+        #if VOICE_STEAL == VOICE_STEAL_QUIETEST
+        return by_velocity_.head[by_velocity_.lowest_key()];
+        #elif VOICE_STEAL == VOICE_STEAL_LOWEST
+        return by_note_.head[by_note_.highest_key()];
+        #elif VOICE_STEAL == VOICE_STEAL_HIGHEST
+        return by_note_.head[by_note_.lowest_key()];
+        #else
+        return pool_.head[ACTIVE];
+        #endif
+    }
+
+    void attach(int v, uint8_t note, uint8_t velocity) {
+        voices_[v] = { note, velocity, true };
+        pool_.push(ACTIVE, v);
+        by_note_.push(note, v);
+        #if VOICE_STEAL == VOICE_STEAL_QUIETEST
+        by_velocity_.push(velocity, v);
+        #endif
+        active_++;
+    }
+
+    void detach(int v) {
+        Voice& voice = voices_[v];
+        pool_.remove(ACTIVE, v);
+        by_note_.remove(voice.note, v);
+        #if VOICE_STEAL == VOICE_STEAL_QUIETEST
+        by_velocity_.remove(voice.velocity, v);
+        #endif
+        voice.active = false;
+        active_--;
+    }
+
+    Voice voices_[MAX_VOICES];
+    VoiceLists<2> pool_;
+    VoiceLists<128> by_note_;
+    #if VOICE_STEAL == VOICE_STEAL_QUIETEST
+    VoiceLists<128> by_velocity_;
+    #endif
+    int active_;
+};
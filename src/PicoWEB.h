@@ -10,6 +10,7 @@ extern "C" {
 #include "lwip/apps/mdns.h"
 #include "lwip/netif.h"
 #include "lwip/apps/fs.h"
+#include "lwip/mem.h"
 
 // AP mode
 #if (ACTIVE_MODE == 0)
@@ -23,6 +24,7 @@ extern "C" {
 #include <stddef.h> 
 #include "web/ssi.h"
 #include "web/picoOSC.h"
+#include "web/picoParams.h"
 #include "pico/cyw43_arch.h"
 
 #ifndef WIFI_SSID
@@ -48,28 +50,95 @@ static uint16_t computer_port = 9000;
 static bool computer_discovered = false;
 static struct udp_pcb* osc_out_pcb = nullptr;
 
+#ifndef WEB_NUM_VALUES
+#define WEB_NUM_VALUES 1
+#endif
+
 typedef void (*web_float_handler_t)(const char *param, float value);
 
 extern web_float_handler_t web_float_handler;
 
+// Defined in main.cpp from the manifest
+extern const picoparams::Manifest web_manifest;
+
+// [s web…] values in manifest order, written by the audio core's sendHook
+static picoparams::WebValues<WEB_NUM_VALUES> web_values;
+
 // --- CGI HANDLER ---
+// /update_pd.cgi?<name>=<value>: one receiver per parameter, looked up by name
 const char * cgi_pd_handler(int iIndex, int iNumParams, char *pcParam[], char *pcValue[]) {
     for (int i = 0; i < iNumParams; i++) {
 
         float raw_val = atof(pcValue[i]);
 
-        if (strcmp(pcParam[i], "v") == 0) {
-            if (web_float_handler) {
-                web_float_handler(pcParam[i], raw_val);
-            }
+        if (web_float_handler) {
+            web_float_handler(pcParam[i], raw_val);
         }
     }
     return NULL; 
 }
+
+// s= of the /params.cgi request being answered; lwIP opens the response
+// file right after the CGI, in the same poll
+static uint32_t params_since = 0;
+
+// /params.cgi?s=<seq>&<index>=<value>...: a batch of updates, answered with
+// the changed values, see web/picoParams.h
+const char * cgi_params_handler(int iIndex, int iNumParams, char *pcParam[], char *pcValue[]) {
+    params_since = 0;
+    picoparams::apply_query(iNumParams, pcParam, pcValue, web_manifest.num_params, params_since,
+                            [](int index, float value) { web_manifest.apply(index, value); });
+    return "/params.bin";
+}
+
 static const tCGI cgi_handlers[] = {
     { "/update_pd.cgi", cgi_pd_handler },
+    { "/params.cgi", cgi_params_handler },
 };
 
+// --- CUSTOM FILES ---
+// /params.bin is built per request, /params.json once
+#ifndef WEB_MANIFEST_JSON_SIZE
+#define WEB_MANIFEST_JSON_SIZE 1024
+#endif
+
+static char web_manifest_json[WEB_MANIFEST_JSON_SIZE];
+static size_t web_manifest_json_len = 0;
+
+int fs_open_custom(struct fs_file *file, const char *name) {
+    const char* data;
+    size_t len;
+    if (strcmp(name, "/params.bin") == 0) {
+        uint8_t* delta = (uint8_t*)mem_malloc(web_values.MAX_BYTES);
+        if (!delta) return 0;
+        len = web_values.delta(params_since, delta);
+        params_since = 0;
+        data = (const char*)delta;
+    } else if (strcmp(name, "/params.json") == 0) {
+        if (web_manifest_json_len == 0) {
+            web_manifest_json_len = picoparams::write_manifest(web_manifest_json, sizeof(web_manifest_json),
+                web_manifest.params, web_manifest.num_params, web_manifest.values, web_manifest.num_values);
+            if (web_manifest_json_len == 0) return 0;
+        }
+        data = web_manifest_json;
+        len = web_manifest_json_len;
+    } else {
+        return 0;
+    }
+    memset(file, 0, sizeof(struct fs_file));
+    file->data = data;
+    file->len = (int)len;
+    file->index = (int)len;
+    file->flags = FS_FILE_FLAGS_HEADER_PERSISTENT;
+    return 1;
+}
+
+void fs_close_custom(struct fs_file *file) {
+    if (file->data && file->data != web_manifest_json) {
+        mem_free((void*)file->data);
+    }
+}
+
 typedef void (*osc_hv_float_handler_t)(const char *address, float value);
 
 extern osc_hv_float_handler_t osc_hv_handler;
@@ -77,6 +146,17 @@ extern osc_hv_float_handler_t osc_hv_handler;
 
 #if OSC_ENABLED
 
+#ifndef OSC_INTERVAL_MS
+#define OSC_INTERVAL_MS 20
+#endif
+
+#ifndef OSC_MAX_ADDRESSES
+#define OSC_MAX_ADDRESSES 32
+#endif
+
+// Latest value per output address, flushed as one bundle every OSC_INTERVAL_MS
+static picoosc::OSCScheduler<OSC_MAX_ADDRESSES> osc_out;
+
 static void osc_internal_callback(void *arg,
                                   struct udp_pcb *pcb,
                                   struct pbuf *p,
@@ -92,72 +172,60 @@ static void osc_internal_callback(void *arg,
         printf(">>> OSC Peer Discovered: %s\n", ipaddr_ntoa(addr));
     }
 
-    char address[64];
-    size_t len = (p->len < 63) ? p->len : 63;
-    std::memcpy(address, p->payload, len);
-    address[len] = '\0';
-
-    if (address[0] != '/') {
-        pbuf_free(p);
-        return;
-    }
-
-    int tag_idx = (int)std::strlen(address) + 1;
-    while (tag_idx % 4 != 0 && tag_idx < p->len) tag_idx++;
-
-    char *tags = (char*)p->payload + tag_idx;
-
-    if (tag_idx < p->len && tags[0] == ',' && tags[1] == 'f') {
-
-        int data_idx = tag_idx + (int)std::strlen(tags) + 1;
-        while (data_idx % 4 != 0 && data_idx < p->len) data_idx++;
-
-        if (data_idx + 4 <= p->len) {
-
-            uint32_t raw;
-            std::memcpy(&raw, (uint8_t*)p->payload + data_idx, 4);
-
-            union { uint32_t i; float f; } u;
-            u.i = __builtin_bswap32(raw);
-
-            float val = u.f;
-
-            if (osc_hv_handler) {
-                osc_hv_handler(address, val);
-            }
-        }
-    }
-
+    // a bundle can arrive in a pbuf chain, parse a flat copy
+    static uint8_t packet[picoosc::MAX_BUNDLE_SIZE];
+    const u16_t len = pbuf_copy_partial(p, packet, sizeof(packet), 0);
     pbuf_free(p);
+
+    const int handled = picoosc::parse_packet(packet, len, [](const char* address, float value) {
+        if (osc_hv_handler) osc_hv_handler(address, value);
+    });
+    osc_out.stats.received.store(osc_out.stats.received.load(std::memory_order_relaxed) + handled,
+                                 std::memory_order_relaxed);
 }
 
 
 // ---------------- SEND ----------------
 
-static inline void osc_send_float(const char *name, float value) {
-    if (!computer_discovered || osc_out_pcb == nullptr) return;
-
-    picoosc::OSCMessage msg;
-
-    char address[64];
+// Core 0 before the audio core starts: patch sends get slots 0, 1, ... in call order
+static inline int osc_register(const char *name) {
+    char address[picoosc::OSCScheduler<1>::ADDRESS_SIZE];
     snprintf(address, sizeof(address), "/%s", name);
+    return osc_out.add(address);
+}
 
-    msg.addAddress(address);
-    msg.add(value);
-
-    struct pbuf* pb = pbuf_alloc(PBUF_TRANSPORT, msg.size(), PBUF_RAM);
-    if (!pb) return;
-
-    std::memcpy(pb->payload, msg.data(), msg.size());
+// Audio core (sendHook): no lwIP here, the value waits in its slot for the flush
+static inline void osc_set(int slot, float value) {
+    osc_out.set(slot, value);  // -1 (not registered) and out of range are ignored
+}
 
-    udp_sendto(osc_out_pcb, pb, &computer_ip, computer_port);
-    pbuf_free(pb);
+// Core 0: status values; an address gets its slot on first use
+static inline void osc_send_float(const char *name, float value) {
+    char address[picoosc::OSCScheduler<1>::ADDRESS_SIZE];
+    snprintf(address, sizeof(address), "/%s", name);
+    int slot = osc_out.find(address);
+    if (slot < 0) slot = osc_out.add(address);
+    osc_set(slot, value);
 }
 
 static inline void osc_send_bang(const char *name) {
     osc_send_float(name, 1.0f);
 }
 
+// Core 0 main loop. Nothing is sent before a peer has talked to us; values
+// keep coalescing in their slots until then.
+static inline void osc_poll() {
+    if (!computer_discovered || osc_out_pcb == nullptr) return;
+    osc_out.poll(to_ms_since_boot(get_absolute_time()), [](const uint8_t* data, size_t size) {
+        struct pbuf* pb = pbuf_alloc(PBUF_TRANSPORT, (u16_t)size, PBUF_RAM);
+        if (!pb) return false;
+        std::memcpy(pb->payload, data, size);
+        const err_t err = udp_sendto(osc_out_pcb, pb, &computer_ip, computer_port);
+        pbuf_free(pb);
+        return err == ERR_OK;
+    });
+}
+
 #endif
 
 
@@ -198,7 +266,7 @@ bool init_wifi() {
     cyw43_wifi_pm(&cyw43_state, cyw43_pm_value(CYW43_NO_POWERSAVE_MODE, 20, 1, 1, 1));
 
     httpd_init();
-    http_set_cgi_handlers(cgi_handlers, 1); 
+    http_set_cgi_handlers(cgi_handlers, LWIP_ARRAYSIZE(cgi_handlers));
     ssi_init();
 
     mdns_resp_init();
@@ -206,8 +274,11 @@ bool init_wifi() {
     mdns_resp_add_service(netif_default, "piko-control", "_http", DNSSD_PROTO_UDP, 80, NULL, NULL);
     mdns_resp_announce(netif_default);
 
+#if OSC_ENABLED
     osc_out_pcb = udp_new();
+    osc_out.begin(OSC_INTERVAL_MS);
     static picoosc::OSCServer osc_receiver(OSC_PORT, osc_internal_callback);
+#endif
 
     printf("\n========================================\n");
     printf("Web Status: ACTIVE\n");
@@ -224,6 +295,9 @@ bool init_wifi() {
 
 static inline void web_poll() {
     cyw43_arch_poll();
+#if OSC_ENABLED
+    osc_poll();
+#endif
 }
 
 #endif // WEB_ENABLED
@@ -20,13 +20,20 @@ Converted to Template December 2019
 
 declaration example: (1 second of floats)
 
-DelayLine<float, SAMPLE_RATE> del;
+DelayLine<float, 65536> del;
 
 By: shensley
+
+pikoPD: max_size must be a power of two, indices wrap with a mask instead of
+a modulo (the Cortex-M0+ has no hardware divider).
 */
 template <typename T, size_t max_size>
 class DelayLine
 {
+    static_assert(max_size > 0 && (max_size & (max_size - 1)) == 0,
+                  "DelayLine max_size must be a power of two");
+    static constexpr size_t mask_ = max_size - 1;
+
   public:
     DelayLine() {}
     ~DelayLine() {}
@@ -70,15 +77,15 @@ class DelayLine
     inline void Write(const T sample)
     {
         line_[write_ptr_] = sample;
-        write_ptr_        = (write_ptr_ - 1 + max_size) % max_size;
+        write_ptr_        = (write_ptr_ - 1) & mask_;
     }
 
     /** returns the next sample of type T in the delay line, interpolated if necessary.
     */
     inline const T Read() const
     {
-        T a = line_[(write_ptr_ + delay_) % max_size];
-        T b = line_[(write_ptr_ + delay_ + 1) % max_size];
+        T a = line_[(write_ptr_ + delay_) & mask_];
+        T b = line_[(write_ptr_ + delay_ + 1) & mask_];
         return a + (b - a) * frac_;
     }
 
@@ -87,8 +94,8 @@ class DelayLine
     {
         int32_t delay_integral   = static_cast<int32_t>(delay);
         float   delay_fractional = delay - static_cast<float>(delay_integral);
-        const T a = line_[(write_ptr_ + delay_integral) % max_size];
-        const T b = line_[(write_ptr_ + delay_integral + 1) % max_size];
+        const T a = line_[(write_ptr_ + delay_integral) & mask_];
+        const T b = line_[(write_ptr_ + delay_integral + 1) & mask_];
         return a + (b - a) * delay_fractional;
     }
 
@@ -98,10 +105,10 @@ class DelayLine
         float   delay_fractional = delay - static_cast<float>(delay_integral);
 
         int32_t     t     = (write_ptr_ + delay_integral + max_size);
-        const T     xm1   = line_[(t - 1) % max_size];
-        const T     x0    = line_[(t) % max_size];
-        const T     x1    = line_[(t + 1) % max_size];
-        const T     x2    = line_[(t + 2) % max_size];
+        const T     xm1   = line_[(t - 1) & mask_];
+        const T     x0    = line_[(t) & mask_];
+        const T     x1    = line_[(t + 1) & mask_];
+        const T     x2    = line_[(t + 2) & mask_];
         const float c     = (x1 - xm1) * 0.5f;
         const float v     = x0 - x1;
         const float w     = c + v;
@@ -113,7 +120,7 @@ class DelayLine
 
     inline const T Allpass(const T sample, size_t delay, const T coefficient)
     {
-        T read  = line_[(write_ptr_ + delay) % max_size];
+        T read  = line_[(write_ptr_ + delay) & mask_];
         T write = sample + coefficient * read;
         Write(write);
         return -write * coefficient + read;
@@ -125,5 +132,51 @@ class DelayLine
     size_t delay_;
     T      line_[max_size];
 };
+
+/** pikoPD: int16 (Q15) storage, half the memory of DelayLine<float>.
+Takes and returns floats in -1..1, converted on Write() and Read(); input
+beyond full scale is clipped. Only the calls StereoDelay needs.
+*/
+template <size_t max_size>
+class DelayLine<int16_t, max_size>
+{
+    static_assert(max_size > 0 && (max_size & (max_size - 1)) == 0,
+                  "DelayLine max_size must be a power of two");
+    static constexpr size_t mask_ = max_size - 1;
+
+  public:
+    void Init() { Reset(); }
+
+    void Reset()
+    {
+        for(size_t i = 0; i < max_size; i++)
+        {
+            line_[i] = 0;
+        }
+        write_ptr_ = 0;
+    }
+
+    inline void Write(const float sample)
+    {
+        float s = sample * 32767.0f;
+        s       = s > 32767.0f ? 32767.0f : (s < -32767.0f ? -32767.0f : s);
+        line_[write_ptr_] = static_cast<int16_t>(s + (s < 0.0f ? -0.5f : 0.5f));
+        write_ptr_        = (write_ptr_ - 1) & mask_;
+    }
+
+    inline float Read(float delay) const
+    {
+        int32_t delay_integral   = static_cast<int32_t>(delay);
+        float   delay_fractional = delay - static_cast<float>(delay_integral);
+        const int32_t a = line_[(write_ptr_ + delay_integral) & mask_];
+        const int32_t b = line_[(write_ptr_ + delay_integral + 1) & mask_];
+        return (static_cast<float>(a) + static_cast<float>(b - a) * delay_fractional)
+               * (1.0f / 32767.0f);
+    }
+
+  private:
+    size_t  write_ptr_;
+    int16_t line_[max_size];
+};
 } // namespace daisysp
 #endif
@@ -12,6 +12,7 @@
  *   5. Softer Allpass Coefficients (feedback gain from 0.5 to 0.45) to break the resonance peaks 
  *   6. Parameter Smoothing (smoothed_predelay)
  *   7. Stereo Width Control
+ *   8. Q15 Pre-Delay Buffer, and buffer sizes set from board.json by pikopd.py
  *
  *
  * Audio Library for Teensy 3.X
@@ -47,16 +48,28 @@
 #pragma once
 #include <stdint.h>
 #include <string.h>
+#include <cmath>
 #include <algorithm>
 
-#define PREDELAY_MAX 4800
+// Longest pre-delay in samples (board.json masterfx "reverb_predelay_ms")
+#ifndef REVERB_PREDELAY_SAMPLES
+#define REVERB_PREDELAY_SAMPLES 4800
+#endif
+
+// Comb and allpass lengths in percent of the Freeverb tuning (masterfx "reverb_size")
+#ifndef REVERB_SIZE_PERCENT
+#define REVERB_SIZE_PERCENT 100
+#endif
+
+static_assert(REVERB_PREDELAY_SAMPLES > 0 && REVERB_PREDELAY_SAMPLES <= 65535, "REVERB_PREDELAY_SAMPLES must fit the uint16_t index");
+static_assert(REVERB_SIZE_PERCENT >= 25 && REVERB_SIZE_PERCENT <= 200, "REVERB_SIZE_PERCENT must be 25..200");
 
 class FreeverbStereo {
 public:
     FreeverbStereo() 
         : reverb_level(0.0f), reverb_width(0.5f), reverb_predelay(0.0f),
           smoothed_predelay(0.0f), hpL_state(0.0f), hpR_state(0.0f),
-          lp_wetL(0.0f), lp_wetR(0.0f), pre_ptr(0),
+          lp_wetL(0.0f), lp_wetR(0.0f), predelay_inc(0.0f), ramp_frames(0), ramp_k(0.0f), pre_ptr(0),
           comb1indexL(0), comb2indexL(0), comb3indexL(0), comb4indexL(0),
           comb5indexL(0), comb6indexL(0), comb7indexL(0), comb8indexL(0),
           comb1indexR(0), comb2indexR(0), comb3indexR(0), comb4indexR(0),
@@ -92,28 +105,38 @@ public:
         combdamp2 = (int16_t)(32768 - x1);
     }
 
+    // Once per block: ramp the predelay linearly to where the per-sample 0.001 smoother would end up
+    void begin_block(int frames) {
+        if (frames != ramp_frames) {
+            ramp_frames = frames;
+            ramp_k = 1.0f - powf(1.0f - 0.001f, (float)frames);
+        }
+        predelay_inc = ramp_k * (reverb_predelay - smoothed_predelay) / (float)frames;
+    }
+
     void Process(float inL, float inR, float& outL, float& outR) {
-        smoothed_predelay += 0.001f * (reverb_predelay - smoothed_predelay);
+        smoothed_predelay += predelay_inc;
         
         hpL_state += 0.05f * (inL - hpL_state);
         float cleanL = inL - hpL_state;
         hpR_state += 0.05f * (inR - hpR_state);
         float cleanR = inR - hpR_state;
 
-        pre_buffer_L[pre_ptr] = cleanL;
-        pre_buffer_R[pre_ptr] = cleanR;
-        int delay_samples = (int)(smoothed_predelay * (PREDELAY_MAX - 1));
-        int read_ptr = (pre_ptr - delay_samples + PREDELAY_MAX) % PREDELAY_MAX;
+        // stored at the combs' input scale, so the read needs no conversion
+        pre_buffer_L[pre_ptr] = sat16((int32_t)(cleanL * 12000.0f), 0);
+        pre_buffer_R[pre_ptr] = sat16((int32_t)(cleanR * 12000.0f), 0);
+        int delay_samples = (int)(smoothed_predelay * (REVERB_PREDELAY_SAMPLES - 1));
+        int read_ptr = pre_ptr - delay_samples;
+        if (read_ptr < 0) read_ptr += REVERB_PREDELAY_SAMPLES;
         
-        float dL = pre_buffer_L[read_ptr];
-        float dR = pre_buffer_R[read_ptr];
-        if (++pre_ptr >= PREDELAY_MAX) pre_ptr = 0;
+        int16_t iL = pre_buffer_L[read_ptr];
+        int16_t iR = pre_buffer_R[read_ptr];
+        if (++pre_ptr >= REVERB_PREDELAY_SAMPLES) pre_ptr = 0;
 
-        int16_t iL = (int16_t)(dL * 12000.0f);
-        int16_t iR = (int16_t)(dR * 12000.0f);
         int32_t sL = 0, sR = 0;
 
-        auto comb = [&](int16_t input, int16_t* buffer, uint16_t& index, int16_t& filter, uint16_t size, int32_t& sum) {
+        auto comb = [&](int16_t input, auto& buffer, uint16_t& index, int16_t& filter, int32_t& sum) {
+            constexpr uint16_t size = (uint16_t)(sizeof(buffer) / sizeof(buffer[0]));
             int16_t output = buffer[index];
             sum += output;
             filter = (int16_t)((output * combdamp2 + filter * combdamp1) >> 15);
@@ -121,28 +144,29 @@ public:
             if (++index >= size) index = 0;
         };
 
-        comb(iL, comb1bufL, comb1indexL, comb1filterL, 1116, sL);
-        comb(iL, comb2bufL, comb2indexL, comb2filterL, 1188, sL);
-        comb(iL, comb3bufL, comb3indexL, comb3filterL, 1277, sL);
-        comb(iL, comb4bufL, comb4indexL, comb4filterL, 1356, sL);
-        comb(iL, comb5bufL, comb5indexL, comb5filterL, 1422, sL);
-        comb(iL, comb6bufL, comb6indexL, comb6filterL, 1491, sL);
-        comb(iL, comb7bufL, comb7indexL, comb7filterL, 1557, sL);
-        comb(iL, comb8bufL, comb8indexL, comb8filterL, 1617, sL);
-
-        comb(iR, comb1bufR, comb1indexR, comb1filterR, 1139, sR);
-        comb(iR, comb2bufR, comb2indexR, comb2filterR, 1211, sR);
-        comb(iR, comb3bufR, comb3indexR, comb3filterR, 1300, sR);
-        comb(iR, comb4bufR, comb4indexR, comb4filterR, 1379, sR);
-        comb(iR, comb5bufR, comb5indexR, comb5filterR, 1445, sR);
-        comb(iR, comb6bufR, comb6indexR, comb6filterR, 1514, sR);
-        comb(iR, comb7bufR, comb7indexR, comb7filterR, 1580, sR);
-        comb(iR, comb8bufR, comb8indexR, comb8filterR, 1640, sR);
+        comb(iL, comb1bufL, comb1indexL, comb1filterL, sL);
+        comb(iL, comb2bufL, comb2indexL, comb2filterL, sL);
+        comb(iL, comb3bufL, comb3indexL, comb3filterL, sL);
+        comb(iL, comb4bufL, comb4indexL, comb4filterL, sL);
+        comb(iL, comb5bufL, comb5indexL, comb5filterL, sL);
+        comb(iL, comb6bufL, comb6indexL, comb6filterL, sL);
+        comb(iL, comb7bufL, comb7indexL, comb7filterL, sL);
+        comb(iL, comb8bufL, comb8indexL, comb8filterL, sL);
+
+        comb(iR, comb1bufR, comb1indexR, comb1filterR, sR);
+        comb(iR, comb2bufR, comb2indexR, comb2filterR, sR);
+        comb(iR, comb3bufR, comb3indexR, comb3filterR, sR);
+        comb(iR, comb4bufR, comb4indexR, comb4filterR, sR);
+        comb(iR, comb5bufR, comb5indexR, comb5filterR, sR);
+        comb(iR, comb6bufR, comb6indexR, comb6filterR, sR);
+        comb(iR, comb7bufR, comb7indexR, comb7filterR, sR);
+        comb(iR, comb8bufR, comb8indexR, comb8filterR, sR);
 
         int16_t rL = sat16(sL, 3);
         int16_t rR = sat16(sR, 3);
 
-        auto allpass = [&](int16_t& v, int16_t* buffer, uint16_t& index, uint16_t size) {
+        auto allpass = [&](int16_t& v, auto& buffer, uint16_t& index) {
+            constexpr uint16_t size = (uint16_t)(sizeof(buffer) / sizeof(buffer[0]));
             int16_t buf_out = buffer[index];
             int16_t ff = (int16_t)((v * 14745) >> 15);
             int16_t fb = (int16_t)((buf_out * 14745) >> 15);
@@ -151,10 +175,10 @@ public:
             if (++index >= size) index = 0;
         };
 
-        allpass(rL, ap1bufL, ap1idxL, 556); allpass(rL, ap2bufL, ap2idxL, 441);
-        allpass(rL, ap3bufL, ap3idxL, 341); allpass(rL, ap4bufL, ap4idxL, 225);
-        allpass(rR, ap1bufR, ap1idxR, 579); allpass(rR, ap2bufR, ap2idxR, 464);
-        allpass(rR, ap3bufR, ap3idxR, 364); allpass(rR, ap4bufR, ap4idxR, 248);
+        allpass(rL, ap1bufL, ap1idxL); allpass(rL, ap2bufL, ap2idxL);
+        allpass(rL, ap3bufL, ap3idxL); allpass(rL, ap4bufL, ap4idxL);
+        allpass(rR, ap1bufR, ap1idxR); allpass(rR, ap2bufR, ap2idxR);
+        allpass(rR, ap3bufR, ap3idxR); allpass(rR, ap4bufR, ap4idxR);
 
         float wetL = (float)rL / 32767.0f;
         float wetR = (float)rR / 32767.0f;
@@ -190,15 +214,39 @@ private:
     }
 
     float smoothed_predelay, hpL_state, hpR_state, lp_wetL, lp_wetR;
-    float pre_buffer_L[PREDELAY_MAX], pre_buffer_R[PREDELAY_MAX];
+    float predelay_inc;
+    int ramp_frames;
+    float ramp_k;
+    int16_t pre_buffer_L[REVERB_PREDELAY_SAMPLES], pre_buffer_R[REVERB_PREDELAY_SAMPLES];
     uint16_t pre_ptr;
-    int16_t comb1bufL[1116], comb2bufL[1188], comb3bufL[1277], comb4bufL[1356], comb5bufL[1422], comb6bufL[1491], comb7bufL[1557], comb8bufL[1617];
-    int16_t comb1bufR[1139], comb2bufR[1211], comb3bufR[1300], comb4bufR[1379], comb5bufR[1445], comb6bufR[1514], comb7bufR[1580], comb8bufR[1640];
+    int16_t comb1bufL[1116 * REVERB_SIZE_PERCENT / 100],
+            comb2bufL[1188 * REVERB_SIZE_PERCENT / 100],
+            comb3bufL[1277 * REVERB_SIZE_PERCENT / 100],
+            comb4bufL[1356 * REVERB_SIZE_PERCENT / 100],
+            comb5bufL[1422 * REVERB_SIZE_PERCENT / 100],
+            comb6bufL[1491 * REVERB_SIZE_PERCENT / 100],
+            comb7bufL[1557 * REVERB_SIZE_PERCENT / 100],
+            comb8bufL[1617 * REVERB_SIZE_PERCENT / 100];
+    int16_t comb1bufR[1139 * REVERB_SIZE_PERCENT / 100],
+            comb2bufR[1211 * REVERB_SIZE_PERCENT / 100],
+            comb3bufR[1300 * REVERB_SIZE_PERCENT / 100],
+            comb4bufR[1379 * REVERB_SIZE_PERCENT / 100],
+            comb5bufR[1445 * REVERB_SIZE_PERCENT / 100],
+            comb6bufR[1514 * REVERB_SIZE_PERCENT / 100],
+            comb7bufR[1580 * REVERB_SIZE_PERCENT / 100],
+            comb8bufR[1640 * REVERB_SIZE_PERCENT / 100];
     uint16_t comb1indexL, comb2indexL, comb3indexL, comb4indexL, comb5indexL, comb6indexL, comb7indexL, comb8indexL;
     uint16_t comb1indexR, comb2indexR, comb3indexR, comb4indexR, comb5indexR, comb6indexR, comb7indexR, comb8indexR;
     int16_t comb1filterL, comb2filterL, comb3filterL, comb4filterL, comb5filterL, comb6filterL, comb7filterL, comb8filterL;
     int16_t comb1filterR, comb2filterR, comb3filterR, comb4filterR, comb5filterR, comb6filterR, comb7filterR, comb8filterR;
-    int16_t ap1bufL[556], ap2bufL[441], ap3bufL[341], ap4bufL[225], ap1bufR[579], ap2bufR[464], ap3bufR[364], ap4bufR[248];
+    int16_t ap1bufL[556 * REVERB_SIZE_PERCENT / 100],
+            ap2bufL[441 * REVERB_SIZE_PERCENT / 100],
+            ap3bufL[341 * REVERB_SIZE_PERCENT / 100],
+            ap4bufL[225 * REVERB_SIZE_PERCENT / 100],
+            ap1bufR[579 * REVERB_SIZE_PERCENT / 100],
+            ap2bufR[464 * REVERB_SIZE_PERCENT / 100],
+            ap3bufR[364 * REVERB_SIZE_PERCENT / 100],
+            ap4bufR[248 * REVERB_SIZE_PERCENT / 100];
     uint16_t ap1idxL, ap2idxL, ap3idxL, ap4idxL, ap1idxR, ap2idxR, ap3idxR, ap4idxR;
     int16_t combdamp1, combdamp2, combfeeback;
 };
\ No newline at end of file
@@ -0,0 +1,293 @@
+#pragma once
+
+#include <stdint.h>
+#include <string.h>
+#include <cmath>
+#include <algorithm>
+
+#ifdef USE_REVERB
+#include "freeverb.h"
+#endif
+
+#ifdef USE_DELAY
+#include "delayline.h"
+#endif
+
+// Per-sample one-pole smoothing (x += c * (target - x)) applied over a whole block:
+// returns the fraction of the distance to the target covered after `frames` samples.
+struct BlockSmoother {
+    float coeff;
+    int frames = 0;
+    float k = 0.0f;
+
+    explicit BlockSmoother(float c) : coeff(c) {}
+
+    inline float fraction(int n) {
+        if (n != frames) {
+            frames = n;
+            k = 1.0f - powf(1.0f - coeff, (float)n);
+        }
+        return k;
+    }
+};
+
+#ifdef USE_DELAY
+// Line length in samples, a power of two; pikopd.py sets it from board.json
+// masterfx "delay_max_ms". The right channel reads 1.07x further back.
+#ifndef DELAY_MAX_SAMPLES
+#define DELAY_MAX_SAMPLES 16384
+#endif
+
+class StereoDelay {
+private:
+    static constexpr float MAX_DELAY_L = (DELAY_MAX_SAMPLES - 2) / 1.07f;
+
+    // Q15 lines: the feedback path is clamped to -1..1 anyway
+    daisysp::DelayLine<int16_t, DELAY_MAX_SAMPLES> delayL;
+    daisysp::DelayLine<int16_t, DELAY_MAX_SAMPLES> delayR;
+
+    BlockSmoother smoother{0.0025f};
+    float currentDelay = std::min(12000.0f, MAX_DELAY_L);
+    float smoothLevel  = 0.0f;
+    float smoothFb     = 0.1f;
+    float incDelay = 0.0f, incLevel = 0.0f, incFb = 0.0f;
+
+public:
+    volatile float targetDelay = 12000.0f;
+    volatile float targetLevel = 0.0f;
+    volatile float targetFb    = 0.1f;
+
+    volatile bool bypass = false;
+
+    void init() {
+        delayL.Init();
+        delayR.Init();
+    }
+
+    // 0..1, squared so the short times get most of the range; 1 is the longest the line holds
+    void set_time(float t) {
+        targetDelay = 10.0f + (t * t * (MAX_DELAY_L - 10.0f));
+    }
+
+    // Sets up this block's linear ramps; returns false when the wet path can be skipped
+    bool begin_block(int frames) {
+        const float k = smoother.fraction(frames);
+        const float inv = 1.0f / (float)frames;
+        const float delay = std::min((float)targetDelay, MAX_DELAY_L);
+
+        incDelay = k * (delay - currentDelay) * inv;
+        incLevel = k * (targetLevel - smoothLevel) * inv;
+        incFb    = k * (targetFb - smoothFb) * inv;
+
+        const bool active = !bypass && (smoothLevel >= 0.0001f || smoothLevel + incLevel * frames >= 0.0001f);
+        if (!active) {
+            // ramps still advance so the wet path fades back in from where it left off
+            currentDelay += incDelay * frames;
+            smoothLevel  += incLevel * frames;
+            smoothFb     += incFb * frames;
+        }
+        return active;
+    }
+
+    // Inactive block: keep the lines filled with the dry input
+    void write_block(const float* buffer, int frames) {
+        for (int i = 0; i < frames; i++) {
+            delayL.Write(buffer[i * 2]);
+            delayR.Write(buffer[i * 2 + 1]);
+        }
+    }
+
+    inline void process(float inL,
+                        float inR,
+                        float& wetL,
+                        float& wetR)
+    {
+        currentDelay += incDelay;
+        smoothLevel  += incLevel;
+        smoothFb     += incFb;
+
+        float dl = delayL.Read(currentDelay);
+        float dr = delayR.Read(currentDelay * 1.07f);
+
+        wetL = dl * smoothLevel;
+        wetR = dr * smoothLevel;
+
+        float fbL = inL + dr * smoothFb;
+        float fbR = inR + dl * smoothFb;
+
+        fbL = std::clamp(fbL, -1.0f, 1.0f);
+        fbR = std::clamp(fbR, -1.0f, 1.0f);
+
+        delayL.Write(fbL);
+        delayR.Write(fbR);
+    }
+};
+#endif
+
+class SoftLimiter {
+private:
+    float gain_reducer = 1.0f;
+    const float release_coeff = 0.0005f;
+    const float threshold = 0.98f;
+
+public:
+    volatile bool bypass = false;
+
+    // bypass is checked once per block by MasterFX
+    void inline process(float& l, float& r) {
+        float peak = std::max(fabsf(l), fabsf(r));
+        
+        if (peak > threshold) {
+            float target = threshold / peak;
+            if (target < gain_reducer) gain_reducer = target;
+        } else {
+            gain_reducer += (1.0f - gain_reducer) * release_coeff;
+        }
+
+        l *= gain_reducer;
+        r *= gain_reducer;
+    }
+};
+
+// Output sinks: the last stage of the FX pass writes straight into the output format
+
+// Interleaved float, written back into the Heavy buffer
+struct FloatSink {
+    float* out;
+    inline void operator()(int i, float l, float r) const {
+        out[i * 2]     = l;
+        out[i * 2 + 1] = r;
+    }
+};
+
+// Interleaved int16 for I2S
+struct Int16Sink {
+    int16_t* out;
+    inline void operator()(int i, float l, float r) const {
+        out[i * 2]     = (int16_t)(std::clamp(l, -1.0f, 1.0f) * 32767.0f);
+        out[i * 2 + 1] = (int16_t)(std::clamp(r, -1.0f, 1.0f) * 32767.0f);
+    }
+};
+
+// Mono PWM duty cycle in 0..wrap
+struct PwmSink {
+    uint16_t* out;
+    float wrap;
+    inline void operator()(int i, float l, float r) const {
+        float v = std::clamp((l + r) * 0.5f, -1.0f, 1.0f);
+        out[i] = (uint16_t)((v * 0.5f + 0.5f) * wrap);
+    }
+};
+
+class MasterFX {
+public:
+    #ifdef USE_DELAY
+        StereoDelay delay;
+    #endif
+    #ifdef USE_REVERB
+        FreeverbStereo reverb;
+    #endif
+    #ifdef USE_LIMITER
+        SoftLimiter limiter;
+    #endif
+
+    volatile float master_volume = 0.8f;
+    volatile float reverb_mix = 0.0f;
+    volatile bool reverb_bypass = false;
+
+    MasterFX() : initialized(false) {}
+
+    void init() {
+        #ifdef USE_DELAY
+            delay.init();
+        #endif
+
+        #ifdef USE_REVERB
+            reverb.init();
+        #endif
+
+        initialized = true;
+        }
+
+    // One pass over the block: Delay -> Reverb -> Volume -> Limiter -> sink.
+    // Parameters are read once per block and inactive stages are compiled out of the loop.
+    template <typename Sink>
+    void process(float* buffer, int frames, const Sink& sink) {
+        bool use_delay = false, use_reverb = false, use_limiter = false;
+
+        if (initialized) {
+            #ifdef USE_DELAY
+                use_delay = delay.begin_block(frames);
+                if (!use_delay) delay.write_block(buffer, frames);
+            #endif
+            #ifdef USE_REVERB
+                use_reverb = !reverb_bypass && reverb_mix > 0.001f;
+                if (use_reverb) reverb.begin_block(frames);
+            #endif
+            #ifdef USE_LIMITER
+                use_limiter = !limiter.bypass;
+            #endif
+        }
+
+        switch ((use_delay << 2) | (use_reverb << 1) | use_limiter) {
+            case 0: run<false, false, false>(buffer, frames, sink); break;
+            case 1: run<false, false, true >(buffer, frames, sink); break;
+            case 2: run<false, true,  false>(buffer, frames, sink); break;
+            case 3: run<false, true,  true >(buffer, frames, sink); break;
+            case 4: run<true,  false, false>(buffer, frames, sink); break;
+            case 5: run<true,  false, true >(buffer, frames, sink); break;
+            case 6: run<true,  true,  false>(buffer, frames, sink); break;
+            default: run<true, true,  true >(buffer, frames, sink); break;
+        }
+    }
+
+    void process_inplace(float* buffer, int frames) {
+        process(buffer, frames, FloatSink{buffer});
+    }
+
+private:
+    bool initialized;
+
+    template <bool DELAY, bool REVERB, bool LIMITER, typename Sink>
+    inline void run(float* buffer, int frames, const Sink& sink) {
+        const float volume = initialized ? (float)master_volume : 1.0f;
+        [[maybe_unused]] const float mix = reverb_mix;
+        [[maybe_unused]] const float dryGain = 1.0f - mix;
+
+        for (int i = 0; i < frames; i++) {
+            const float originalL = buffer[i * 2];
+            const float originalR = buffer[i * 2 + 1];
+            float l = originalL;
+            float r = originalR;
+
+            float dWetL = 0, dWetR = 0;
+
+            #ifdef USE_DELAY
+            if constexpr (DELAY) delay.process(originalL, originalR, dWetL, dWetR);
+            #endif
+
+            #ifdef USE_REVERB
+            if constexpr (REVERB) {
+                float rWetL, rWetR;
+                reverb.Process(originalL + (dWetL * 0.1f), originalR + (dWetR * 0.1f), rWetL, rWetR);
+                l = (originalL * dryGain) + (rWetL * mix);
+                r = (originalR * dryGain) + (rWetR * mix);
+            }
+            #endif
+
+            if constexpr (DELAY) {
+                l += dWetL;
+                r += dWetR;
+            }
+
+            l *= volume;
+            r *= volume;
+
+            #ifdef USE_LIMITER
+            if constexpr (LIMITER) limiter.process(l, r);
+            #endif
+
+            sink(i, l, r);
+        }
+    }
+};
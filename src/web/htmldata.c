@@ -1,401 +1,132 @@
-static const unsigned char data_index_shtml[] = {
-	/* ./index.shtml */
-	0x2f, 0x69, 0x6e, 0x64, 0x65, 0x78, 0x2e, 0x73, 0x68, 0x74, 0x6d, 0x6c, 0,
-	0x48, 0x54, 0x54, 0x50, 0x2f, 0x31, 0x2e, 0x30, 0x20, 0x32, 
-	0x30, 0x30, 0x20, 0x4f, 0x4b, 0x0d, 0x0a, 0x53, 0x65, 0x72, 
-	0x76, 0x65, 0x72, 0x3a, 0x20, 0x6c, 0x77, 0x49, 0x50, 0x2f, 
-	0x70, 0x72, 0x65, 0x2d, 0x30, 0x2e, 0x36, 0x20, 0x28, 0x68, 
-	0x74, 0x74, 0x70, 0x3a, 0x2f, 0x2f, 0x77, 0x77, 0x77, 0x2e, 
-	0x73, 0x69, 0x63, 0x73, 0x2e, 0x73, 0x65, 0x2f, 0x7e, 0x61, 
-	0x64, 0x61, 0x6d, 0x2f, 0x6c, 0x77, 0x69, 0x70, 0x2f, 0x29, 
-	0x0d, 0x0a, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x6e, 0x74, 0x2d, 
-	0x74, 0x79, 0x70, 0x65, 0x3a, 0x20, 0x74, 0x65, 0x78, 0x74, 
-	0x2f, 0x68, 0x74, 0x6d, 0x6c, 0x0d, 0x0a, 0x0d, 0x0a, 
-	0x3c, 0x21, 0x44, 0x4f, 0x43, 0x54, 0x59, 0x50, 0x45, 0x20, 
-	0x68, 0x74, 0x6d, 0x6c, 0x3e, 0x0a, 0x3c, 0x68, 0x74, 0x6d, 
-	0x6c, 0x20, 0x6c, 0x61, 0x6e, 0x67, 0x3d, 0x22, 0x65, 0x6e, 
-	0x22, 0x3e, 0x0a, 0x3c, 0x68, 0x65, 0x61, 0x64, 0x3e, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x3c, 0x6d, 0x65, 0x74, 0x61, 0x20, 
-	0x63, 0x68, 0x61, 0x72, 0x73, 0x65, 0x74, 0x3d, 0x22, 0x55, 
-	0x54, 0x46, 0x2d, 0x38, 0x22, 0x3e, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x3c, 0x74, 0x69, 0x74, 0x6c, 0x65, 0x3e, 0x70, 0x69, 
-	0x6b, 0x6f, 0x50, 0x44, 0x20, 0x57, 0x65, 0x62, 0x20, 0x43, 
-	0x6f, 0x6e, 0x74, 0x72, 0x6f, 0x6c, 0x3c, 0x2f, 0x74, 0x69, 
-	0x74, 0x6c, 0x65, 0x3e, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x3c, 
-	0x73, 0x74, 0x79, 0x6c, 0x65, 0x3e, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x62, 0x6f, 0x64, 0x79, 0x20, 
-	0x7b, 0x20, 0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75, 
-	0x6e, 0x64, 0x3a, 0x20, 0x23, 0x31, 0x32, 0x31, 0x32, 0x31, 
-	0x32, 0x3b, 0x20, 0x63, 0x6f, 0x6c, 0x6f, 0x72, 0x3a, 0x20, 
-	0x23, 0x30, 0x30, 0x66, 0x66, 0x38, 0x38, 0x3b, 0x20, 0x66, 
-	0x6f, 0x6e, 0x74, 0x2d, 0x66, 0x61, 0x6d, 0x69, 0x6c, 0x79, 
-	0x3a, 0x20, 0x27, 0x53, 0x65, 0x67, 0x6f, 0x65, 0x20, 0x55, 
-	0x49, 0x27, 0x2c, 0x20, 0x73, 0x61, 0x6e, 0x73, 0x2d, 0x73, 
-	0x65, 0x72, 0x69, 0x66, 0x3b, 0x20, 0x64, 0x69, 0x73, 0x70, 
-	0x6c, 0x61, 0x79, 0x3a, 0x20, 0x66, 0x6c, 0x65, 0x78, 0x3b, 
-	0x20, 0x66, 0x6c, 0x65, 0x78, 0x2d, 0x64, 0x69, 0x72, 0x65, 
-	0x63, 0x74, 0x69, 0x6f, 0x6e, 0x3a, 0x20, 0x63, 0x6f, 0x6c, 
-	0x75, 0x6d, 0x6e, 0x3b, 0x20, 0x61, 0x6c, 0x69, 0x67, 0x6e, 
-	0x2d, 0x69, 0x74, 0x65, 0x6d, 0x73, 0x3a, 0x20, 0x63, 0x65, 
-	0x6e, 0x74, 0x65, 0x72, 0x3b, 0x20, 0x70, 0x61, 0x64, 0x64, 
-	0x69, 0x6e, 0x67, 0x3a, 0x20, 0x35, 0x30, 0x70, 0x78, 0x3b, 
-	0x20, 0x6d, 0x61, 0x72, 0x67, 0x69, 0x6e, 0x3a, 0x20, 0x30, 
-	0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x2e, 0x63, 0x61, 0x72, 0x64, 0x20, 0x7b, 0x20, 
-	0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75, 0x6e, 0x64, 
-	0x3a, 0x20, 0x23, 0x31, 0x65, 0x31, 0x65, 0x31, 0x65, 0x3b, 
-	0x20, 0x70, 0x61, 0x64, 0x64, 0x69, 0x6e, 0x67, 0x3a, 0x20, 
-	0x32, 0x35, 0x70, 0x78, 0x3b, 0x20, 0x62, 0x6f, 0x72, 0x64, 
-	0x65, 0x72, 0x2d, 0x72, 0x61, 0x64, 0x69, 0x75, 0x73, 0x3a, 
-	0x20, 0x31, 0x32, 0x70, 0x78, 0x3b, 0x20, 0x62, 0x6f, 0x72, 
-	0x64, 0x65, 0x72, 0x3a, 0x20, 0x31, 0x70, 0x78, 0x20, 0x73, 
-	0x6f, 0x6c, 0x69, 0x64, 0x20, 0x23, 0x33, 0x33, 0x33, 0x3b, 
-	0x20, 0x77, 0x69, 0x64, 0x74, 0x68, 0x3a, 0x20, 0x33, 0x32, 
-	0x30, 0x70, 0x78, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x68, 0x32, 0x20, 0x7b, 0x20, 
-	0x6d, 0x61, 0x72, 0x67, 0x69, 0x6e, 0x2d, 0x74, 0x6f, 0x70, 
-	0x3a, 0x20, 0x30, 0x3b, 0x20, 0x66, 0x6f, 0x6e, 0x74, 0x2d, 
-	0x77, 0x65, 0x69, 0x67, 0x68, 0x74, 0x3a, 0x20, 0x34, 0x30, 
-	0x30, 0x3b, 0x20, 0x74, 0x65, 0x78, 0x74, 0x2d, 0x61, 0x6c, 
-	0x69, 0x67, 0x6e, 0x3a, 0x20, 0x63, 0x65, 0x6e, 0x74, 0x65, 
-	0x72, 0x3b, 0x20, 0x62, 0x6f, 0x72, 0x64, 0x65, 0x72, 0x2d, 
-	0x62, 0x6f, 0x74, 0x74, 0x6f, 0x6d, 0x3a, 0x20, 0x31, 0x70, 
-	0x78, 0x20, 0x73, 0x6f, 0x6c, 0x69, 0x64, 0x20, 0x23, 0x33, 
-	0x33, 0x33, 0x3b, 0x20, 0x70, 0x61, 0x64, 0x64, 0x69, 0x6e, 
-	0x67, 0x2d, 0x62, 0x6f, 0x74, 0x74, 0x6f, 0x6d, 0x3a, 0x20, 
-	0x31, 0x35, 0x70, 0x78, 0x3b, 0x20, 0x6d, 0x61, 0x72, 0x67, 
-	0x69, 0x6e, 0x2d, 0x62, 0x6f, 0x74, 0x74, 0x6f, 0x6d, 0x3a, 
-	0x20, 0x32, 0x30, 0x70, 0x78, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x6c, 0x61, 0x62, 
-	0x65, 0x6c, 0x20, 0x7b, 0x20, 0x66, 0x6f, 0x6e, 0x74, 0x2d, 
-	0x73, 0x69, 0x7a, 0x65, 0x3a, 0x20, 0x31, 0x31, 0x70, 0x78, 
-	0x3b, 0x20, 0x74, 0x65, 0x78, 0x74, 0x2d, 0x74, 0x72, 0x61, 
-	0x6e, 0x73, 0x66, 0x6f, 0x72, 0x6d, 0x3a, 0x20, 0x75, 0x70, 
-	0x70, 0x65, 0x72, 0x63, 0x61, 0x73, 0x65, 0x3b, 0x20, 0x63, 
-	0x6f, 0x6c, 0x6f, 0x72, 0x3a, 0x20, 0x23, 0x38, 0x38, 0x38, 
-	0x3b, 0x20, 0x64, 0x69, 0x73, 0x70, 0x6c, 0x61, 0x79, 0x3a, 
-	0x20, 0x62, 0x6c, 0x6f, 0x63, 0x6b, 0x3b, 0x20, 0x6d, 0x61, 
-	0x72, 0x67, 0x69, 0x6e, 0x2d, 0x62, 0x6f, 0x74, 0x74, 0x6f, 
-	0x6d, 0x3a, 0x20, 0x38, 0x70, 0x78, 0x3b, 0x20, 0x7d, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x2e, 0x76, 
-	0x61, 0x6c, 0x2d, 0x6f, 0x75, 0x74, 0x20, 0x7b, 0x20, 0x66, 
-	0x6c, 0x6f, 0x61, 0x74, 0x3a, 0x20, 0x72, 0x69, 0x67, 0x68, 
-	0x74, 0x3b, 0x20, 0x63, 0x6f, 0x6c, 0x6f, 0x72, 0x3a, 0x20, 
-	0x23, 0x30, 0x30, 0x66, 0x66, 0x38, 0x38, 0x3b, 0x20, 0x66, 
-	0x6f, 0x6e, 0x74, 0x2d, 0x66, 0x61, 0x6d, 0x69, 0x6c, 0x79, 
-	0x3a, 0x20, 0x6d, 0x6f, 0x6e, 0x6f, 0x73, 0x70, 0x61, 0x63, 
-	0x65, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x69, 0x6e, 0x70, 0x75, 0x74, 0x5b, 0x74, 
-	0x79, 0x70, 0x65, 0x3d, 0x72, 0x61, 0x6e, 0x67, 0x65, 0x5d, 
-	0x20, 0x7b, 0x20, 0x77, 0x69, 0x64, 0x74, 0x68, 0x3a, 0x20, 
-	0x31, 0x30, 0x30, 0x25, 0x3b, 0x20, 0x61, 0x63, 0x63, 0x65, 
-	0x6e, 0x74, 0x2d, 0x63, 0x6f, 0x6c, 0x6f, 0x72, 0x3a, 0x20, 
-	0x23, 0x30, 0x30, 0x66, 0x66, 0x38, 0x38, 0x3b, 0x20, 0x6d, 
-	0x61, 0x72, 0x67, 0x69, 0x6e, 0x3a, 0x20, 0x31, 0x30, 0x70, 
-	0x78, 0x20, 0x30, 0x20, 0x32, 0x35, 0x70, 0x78, 0x20, 0x30, 
-	0x3b, 0x20, 0x63, 0x75, 0x72, 0x73, 0x6f, 0x72, 0x3a, 0x20, 
-	0x70, 0x6f, 0x69, 0x6e, 0x74, 0x65, 0x72, 0x3b, 0x20, 0x7d, 
-	0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x2e, 
-	0x67, 0x72, 0x69, 0x64, 0x20, 0x7b, 0x20, 0x64, 0x69, 0x73, 
-	0x70, 0x6c, 0x61, 0x79, 0x3a, 0x20, 0x67, 0x72, 0x69, 0x64, 
-	0x3b, 0x20, 0x67, 0x72, 0x69, 0x64, 0x2d, 0x74, 0x65, 0x6d, 
-	0x70, 0x6c, 0x61, 0x74, 0x65, 0x2d, 0x63, 0x6f, 0x6c, 0x75, 
-	0x6d, 0x6e, 0x73, 0x3a, 0x20, 0x31, 0x66, 0x72, 0x20, 0x31, 
-	0x66, 0x72, 0x3b, 0x20, 0x67, 0x61, 0x70, 0x3a, 0x20, 0x31, 
-	0x32, 0x70, 0x78, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x62, 0x75, 0x74, 0x74, 0x6f, 
-	0x6e, 0x20, 0x7b, 0x20, 0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 
-	0x6f, 0x75, 0x6e, 0x64, 0x3a, 0x20, 0x23, 0x30, 0x30, 0x30, 
-	0x3b, 0x20, 0x62, 0x6f, 0x72, 0x64, 0x65, 0x72, 0x3a, 0x20, 
-	0x31, 0x70, 0x78, 0x20, 0x73, 0x6f, 0x6c, 0x69, 0x64, 0x20, 
-	0x23, 0x34, 0x34, 0x34, 0x3b, 0x20, 0x63, 0x6f, 0x6c, 0x6f, 
-	0x72, 0x3a, 0x20, 0x23, 0x30, 0x30, 0x66, 0x66, 0x38, 0x38, 
-	0x3b, 0x20, 0x70, 0x61, 0x64, 0x64, 0x69, 0x6e, 0x67, 0x3a, 
-	0x20, 0x31, 0x32, 0x70, 0x78, 0x3b, 0x20, 0x63, 0x75, 0x72, 
-	0x73, 0x6f, 0x72, 0x3a, 0x20, 0x70, 0x6f, 0x69, 0x6e, 0x74, 
-	0x65, 0x72, 0x3b, 0x20, 0x74, 0x65, 0x78, 0x74, 0x2d, 0x74, 
-	0x72, 0x61, 0x6e, 0x73, 0x66, 0x6f, 0x72, 0x6d, 0x3a, 0x20, 
-	0x75, 0x70, 0x70, 0x65, 0x72, 0x63, 0x61, 0x73, 0x65, 0x3b, 
-	0x20, 0x66, 0x6f, 0x6e, 0x74, 0x2d, 0x73, 0x69, 0x7a, 0x65, 
-	0x3a, 0x20, 0x31, 0x30, 0x70, 0x78, 0x3b, 0x20, 0x66, 0x6f, 
-	0x6e, 0x74, 0x2d, 0x77, 0x65, 0x69, 0x67, 0x68, 0x74, 0x3a, 
-	0x20, 0x62, 0x6f, 0x6c, 0x64, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x62, 0x75, 0x74, 
-	0x74, 0x6f, 0x6e, 0x3a, 0x61, 0x63, 0x74, 0x69, 0x76, 0x65, 
-	0x20, 0x7b, 0x20, 0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 
-	0x75, 0x6e, 0x64, 0x3a, 0x20, 0x23, 0x30, 0x30, 0x66, 0x66, 
-	0x38, 0x38, 0x3b, 0x20, 0x63, 0x6f, 0x6c, 0x6f, 0x72, 0x3a, 
-	0x20, 0x23, 0x30, 0x30, 0x30, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x2e, 0x73, 0x77, 
-	0x69, 0x74, 0x63, 0x68, 0x2d, 0x77, 0x72, 0x61, 0x70, 0x20, 
-	0x7b, 0x20, 0x64, 0x69, 0x73, 0x70, 0x6c, 0x61, 0x79, 0x3a, 
-	0x20, 0x66, 0x6c, 0x65, 0x78, 0x3b, 0x20, 0x61, 0x6c, 0x69, 
-	0x67, 0x6e, 0x2d, 0x69, 0x74, 0x65, 0x6d, 0x73, 0x3a, 0x20, 
-	0x63, 0x65, 0x6e, 0x74, 0x65, 0x72, 0x3b, 0x20, 0x6a, 0x75, 
-	0x73, 0x74, 0x69, 0x66, 0x79, 0x2d, 0x63, 0x6f, 0x6e, 0x74, 
-	0x65, 0x6e, 0x74, 0x3a, 0x20, 0x73, 0x70, 0x61, 0x63, 0x65, 
-	0x2d, 0x62, 0x65, 0x74, 0x77, 0x65, 0x65, 0x6e, 0x3b, 0x20, 
-	0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75, 0x6e, 0x64, 
-	0x3a, 0x20, 0x23, 0x30, 0x30, 0x30, 0x3b, 0x20, 0x62, 0x6f, 
-	0x72, 0x64, 0x65, 0x72, 0x3a, 0x20, 0x31, 0x70, 0x78, 0x20, 
-	0x73, 0x6f, 0x6c, 0x69, 0x64, 0x20, 0x23, 0x34, 0x34, 0x34, 
-	0x3b, 0x20, 0x70, 0x61, 0x64, 0x64, 0x69, 0x6e, 0x67, 0x3a, 
-	0x20, 0x31, 0x30, 0x70, 0x78, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x2e, 0x73, 0x77, 
-	0x69, 0x74, 0x63, 0x68, 0x20, 0x7b, 0x20, 0x70, 0x6f, 0x73, 
-	0x69, 0x74, 0x69, 0x6f, 0x6e, 0x3a, 0x20, 0x72, 0x65, 0x6c, 
-	0x61, 0x74, 0x69, 0x76, 0x65, 0x3b, 0x20, 0x77, 0x69, 0x64, 
-	0x74, 0x68, 0x3a, 0x20, 0x33, 0x34, 0x70, 0x78, 0x3b, 0x20, 
-	0x68, 0x65, 0x69, 0x67, 0x68, 0x74, 0x3a, 0x20, 0x31, 0x38, 
-	0x70, 0x78, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x2e, 0x73, 0x77, 0x69, 0x74, 0x63, 
-	0x68, 0x20, 0x69, 0x6e, 0x70, 0x75, 0x74, 0x20, 0x7b, 0x20, 
-	0x6f, 0x70, 0x61, 0x63, 0x69, 0x74, 0x79, 0x3a, 0x20, 0x30, 
-	0x3b, 0x20, 0x77, 0x69, 0x64, 0x74, 0x68, 0x3a, 0x20, 0x30, 
-	0x3b, 0x20, 0x68, 0x65, 0x69, 0x67, 0x68, 0x74, 0x3a, 0x20, 
-	0x30, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x2e, 0x73, 0x6c, 0x69, 0x64, 0x65, 0x72, 
-	0x2d, 0x62, 0x6f, 0x78, 0x20, 0x7b, 0x20, 0x70, 0x6f, 0x73, 
-	0x69, 0x74, 0x69, 0x6f, 0x6e, 0x3a, 0x20, 0x61, 0x62, 0x73, 
-	0x6f, 0x6c, 0x75, 0x74, 0x65, 0x3b, 0x20, 0x63, 0x75, 0x72, 
-	0x73, 0x6f, 0x72, 0x3a, 0x20, 0x70, 0x6f, 0x69, 0x6e, 0x74, 
-	0x65, 0x72, 0x3b, 0x20, 0x74, 0x6f, 0x70, 0x3a, 0x20, 0x30, 
-	0x3b, 0x20, 0x6c, 0x65, 0x66, 0x74, 0x3a, 0x20, 0x30, 0x3b, 
-	0x20, 0x72, 0x69, 0x67, 0x68, 0x74, 0x3a, 0x20, 0x30, 0x3b, 
-	0x20, 0x62, 0x6f, 0x74, 0x74, 0x6f, 0x6d, 0x3a, 0x20, 0x30, 
-	0x3b, 0x20, 0x62, 0x61, 0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75, 
-	0x6e, 0x64, 0x2d, 0x63, 0x6f, 0x6c, 0x6f, 0x72, 0x3a, 0x20, 
-	0x23, 0x33, 0x33, 0x33, 0x3b, 0x20, 0x74, 0x72, 0x61, 0x6e, 
-	0x73, 0x69, 0x74, 0x69, 0x6f, 0x6e, 0x3a, 0x20, 0x2e, 0x33, 
-	0x73, 0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x2e, 0x73, 0x6c, 0x69, 0x64, 0x65, 0x72, 
-	0x2d, 0x62, 0x6f, 0x78, 0x3a, 0x62, 0x65, 0x66, 0x6f, 0x72, 
-	0x65, 0x20, 0x7b, 0x20, 0x70, 0x6f, 0x73, 0x69, 0x74, 0x69, 
-	0x6f, 0x6e, 0x3a, 0x20, 0x61, 0x62, 0x73, 0x6f, 0x6c, 0x75, 
-	0x74, 0x65, 0x3b, 0x20, 0x63, 0x6f, 0x6e, 0x74, 0x65, 0x6e, 
-	0x74, 0x3a, 0x20, 0x22, 0x22, 0x3b, 0x20, 0x68, 0x65, 0x69, 
-	0x67, 0x68, 0x74, 0x3a, 0x20, 0x31, 0x32, 0x70, 0x78, 0x3b, 
-	0x20, 0x77, 0x69, 0x64, 0x74, 0x68, 0x3a, 0x20, 0x31, 0x32, 
-	0x70, 0x78, 0x3b, 0x20, 0x6c, 0x65, 0x66, 0x74, 0x3a, 0x20, 
-	0x33, 0x70, 0x78, 0x3b, 0x20, 0x62, 0x6f, 0x74, 0x74, 0x6f, 
-	0x6d, 0x3a, 0x20, 0x33, 0x70, 0x78, 0x3b, 0x20, 0x62, 0x61, 
-	0x63, 0x6b, 0x67, 0x72, 0x6f, 0x75, 0x6e, 0x64, 0x2d, 0x63, 
-	0x6f, 0x6c, 0x6f, 0x72, 0x3a, 0x20, 0x23, 0x30, 0x30, 0x66, 
-	0x66, 0x38, 0x38, 0x3b, 0x20, 0x74, 0x72, 0x61, 0x6e, 0x73, 
-	0x69, 0x74, 0x69, 0x6f, 0x6e, 0x3a, 0x20, 0x2e, 0x33, 0x73, 
-	0x3b, 0x20, 0x7d, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x69, 0x6e, 0x70, 0x75, 0x74, 0x3a, 0x63, 0x68, 
-	0x65, 0x63, 0x6b, 0x65, 0x64, 0x20, 0x2b, 0x20, 0x2e, 0x73, 
-	0x6c, 0x69, 0x64, 0x65, 0x72, 0x2d, 0x62, 0x6f, 0x78, 0x3a, 
-	0x62, 0x65, 0x66, 0x6f, 0x72, 0x65, 0x20, 0x7b, 0x20, 0x74, 
-	0x72, 0x61, 0x6e, 0x73, 0x66, 0x6f, 0x72, 0x6d, 0x3a, 0x20, 
-	0x74, 0x72, 0x61, 0x6e, 0x73, 0x6c, 0x61, 0x74, 0x65, 0x58, 
-	0x28, 0x31, 0x36, 0x70, 0x78, 0x29, 0x3b, 0x20, 0x7d, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x68, 0x72, 
-	0x20, 0x7b, 0x20, 0x62, 0x6f, 0x72, 0x64, 0x65, 0x72, 0x3a, 
-	0x20, 0x30, 0x3b, 0x20, 0x62, 0x6f, 0x72, 0x64, 0x65, 0x72, 
-	0x2d, 0x74, 0x6f, 0x70, 0x3a, 0x20, 0x31, 0x70, 0x78, 0x20, 
-	0x73, 0x6f, 0x6c, 0x69, 0x64, 0x20, 0x23, 0x33, 0x33, 0x33, 
-	0x3b, 0x20, 0x6d, 0x61, 0x72, 0x67, 0x69, 0x6e, 0x3a, 0x20, 
-	0x32, 0x35, 0x70, 0x78, 0x20, 0x30, 0x3b, 0x20, 0x7d, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x3c, 0x2f, 0x73, 0x74, 0x79, 0x6c, 
-	0x65, 0x3e, 0x0a, 0x3c, 0x2f, 0x68, 0x65, 0x61, 0x64, 0x3e, 
-	0x0a, 0x3c, 0x62, 0x6f, 0x64, 0x79, 0x3e, 0x0a, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x3c, 0x64, 0x69, 0x76, 0x20, 0x63, 0x6c, 
-	0x61, 0x73, 0x73, 0x3d, 0x22, 0x63, 0x61, 0x72, 0x64, 0x22, 
-	0x3e, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x3c, 0x68, 0x32, 0x3e, 0x70, 0x69, 0x6b, 0x6f, 0x50, 0x44, 
-	0x20, 0x57, 0x65, 0x62, 0x20, 0x43, 0x6f, 0x6e, 0x74, 0x72, 
-	0x6f, 0x6c, 0x3c, 0x2f, 0x68, 0x32, 0x3e, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x6c, 0x61, 0x62, 0x65, 
-	0x6c, 0x3e, 0x4d, 0x61, 0x69, 0x6e, 0x20, 0x53, 0x6c, 0x69, 
-	0x64, 0x65, 0x72, 0x20, 0x3c, 0x73, 0x70, 0x61, 0x6e, 0x20, 
-	0x63, 0x6c, 0x61, 0x73, 0x73, 0x3d, 0x22, 0x76, 0x61, 0x6c, 
-	0x2d, 0x6f, 0x75, 0x74, 0x22, 0x20, 0x69, 0x64, 0x3d, 0x22, 
-	0x76, 0x5f, 0x76, 0x61, 0x6c, 0x22, 0x3e, 0x36, 0x34, 0x3c, 
-	0x2f, 0x73, 0x70, 0x61, 0x6e, 0x3e, 0x3c, 0x2f, 0x6c, 0x61, 
-	0x62, 0x65, 0x6c, 0x3e, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x3c, 0x69, 0x6e, 0x70, 0x75, 0x74, 0x20, 
-	0x74, 0x79, 0x70, 0x65, 0x3d, 0x22, 0x72, 0x61, 0x6e, 0x67, 
-	0x65, 0x22, 0x20, 0x6d, 0x69, 0x6e, 0x3d, 0x22, 0x30, 0x22, 
-	0x20, 0x6d, 0x61, 0x78, 0x3d, 0x22, 0x31, 0x32, 0x37, 0x22, 
-	0x20, 0x76, 0x61, 0x6c, 0x75, 0x65, 0x3d, 0x22, 0x36, 0x34, 
-	0x22, 0x20, 0x69, 0x64, 0x3d, 0x22, 0x6d, 0x61, 0x69, 0x6e, 
-	0x53, 0x6c, 0x69, 0x64, 0x65, 0x72, 0x22, 0x3e, 0x0a, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x68, 
-	0x72, 0x3e, 0x0a, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x3c, 0x6c, 0x61, 0x62, 0x65, 0x6c, 0x3e, 0x53, 
-	0x79, 0x73, 0x74, 0x65, 0x6d, 0x20, 0x53, 0x77, 0x69, 0x74, 
-	0x63, 0x68, 0x3c, 0x2f, 0x6c, 0x61, 0x62, 0x65, 0x6c, 0x3e, 
-	0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 
-	0x64, 0x69, 0x76, 0x20, 0x63, 0x6c, 0x61, 0x73, 0x73, 0x3d, 
-	0x22, 0x73, 0x77, 0x69, 0x74, 0x63, 0x68, 0x2d, 0x77, 0x72, 
-	0x61, 0x70, 0x22, 0x3e, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x73, 0x70, 
-	0x61, 0x6e, 0x20, 0x73, 0x74, 0x79, 0x6c, 0x65, 0x3d, 0x22, 
-	0x66, 0x6f, 0x6e, 0x74, 0x2d, 0x73, 0x69, 0x7a, 0x65, 0x3a, 
-	0x20, 0x31, 0x30, 0x70, 0x78, 0x3b, 0x22, 0x3e, 0x41, 0x43, 
-	0x54, 0x49, 0x56, 0x45, 0x20, 0x53, 0x54, 0x41, 0x54, 0x45, 
-	0x3c, 0x2f, 0x73, 0x70, 0x61, 0x6e, 0x3e, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x3c, 0x6c, 0x61, 0x62, 0x65, 0x6c, 0x20, 0x63, 0x6c, 0x61, 
-	0x73, 0x73, 0x3d, 0x22, 0x73, 0x77, 0x69, 0x74, 0x63, 0x68, 
-	0x22, 0x3e, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 
-	0x69, 0x6e, 0x70, 0x75, 0x74, 0x20, 0x74, 0x79, 0x70, 0x65, 
-	0x3d, 0x22, 0x63, 0x68, 0x65, 0x63, 0x6b, 0x62, 0x6f, 0x78, 
-	0x22, 0x20, 0x69, 0x64, 0x3d, 0x22, 0x6d, 0x61, 0x69, 0x6e, 
-	0x53, 0x77, 0x69, 0x74, 0x63, 0x68, 0x22, 0x3e, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x73, 0x70, 0x61, 0x6e, 
-	0x20, 0x63, 0x6c, 0x61, 0x73, 0x73, 0x3d, 0x22, 0x73, 0x6c, 
-	0x69, 0x64, 0x65, 0x72, 0x2d, 0x62, 0x6f, 0x78, 0x22, 0x3e, 
-	0x3c, 0x2f, 0x73, 0x70, 0x61, 0x6e, 0x3e, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x3c, 0x2f, 0x6c, 0x61, 0x62, 0x65, 0x6c, 0x3e, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x2f, 0x64, 
-	0x69, 0x76, 0x3e, 0x0a, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x3c, 0x68, 0x72, 0x3e, 0x0a, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x6c, 0x61, 
-	0x62, 0x65, 0x6c, 0x3e, 0x4d, 0x6f, 0x6d, 0x65, 0x6e, 0x74, 
-	0x61, 0x72, 0x79, 0x20, 0x54, 0x72, 0x69, 0x67, 0x67, 0x65, 
-	0x72, 0x3c, 0x2f, 0x6c, 0x61, 0x62, 0x65, 0x6c, 0x3e, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x62, 
-	0x75, 0x74, 0x74, 0x6f, 0x6e, 0x20, 0x69, 0x64, 0x3d, 0x22, 
-	0x74, 0x72, 0x69, 0x67, 0x67, 0x65, 0x72, 0x42, 0x74, 0x6e, 
-	0x22, 0x20, 0x73, 0x74, 0x79, 0x6c, 0x65, 0x3d, 0x22, 0x77, 
-	0x69, 0x64, 0x74, 0x68, 0x3a, 0x20, 0x31, 0x30, 0x30, 0x25, 
-	0x3b, 0x22, 0x3e, 0x50, 0x75, 0x6c, 0x73, 0x65, 0x20, 0x53, 
-	0x69, 0x67, 0x6e, 0x61, 0x6c, 0x3c, 0x2f, 0x62, 0x75, 0x74, 
-	0x74, 0x6f, 0x6e, 0x3e, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x3c, 
-	0x2f, 0x64, 0x69, 0x76, 0x3e, 0x0a, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x3c, 0x73, 0x63, 0x72, 0x69, 0x70, 0x74, 0x3e, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x6c, 0x65, 
-	0x74, 0x20, 0x6c, 0x61, 0x73, 0x74, 0x53, 0x65, 0x6e, 0x74, 
-	0x20, 0x3d, 0x20, 0x30, 0x3b, 0x0a, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x63, 0x6f, 0x6e, 0x73, 0x74, 0x20, 
-	0x74, 0x68, 0x72, 0x6f, 0x74, 0x74, 0x6c, 0x65, 0x4d, 0x73, 
-	0x20, 0x3d, 0x20, 0x34, 0x30, 0x3b, 0x20, 0x2f, 0x2f, 0x20, 
-	0x4f, 0x6e, 0x6c, 0x79, 0x20, 0x73, 0x65, 0x6e, 0x64, 0x20, 
-	0x31, 0x20, 0x72, 0x65, 0x71, 0x75, 0x65, 0x73, 0x74, 0x20, 
-	0x65, 0x76, 0x65, 0x72, 0x79, 0x20, 0x34, 0x30, 0x6d, 0x73, 
-	0x0a, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x66, 0x75, 0x6e, 0x63, 0x74, 0x69, 0x6f, 0x6e, 0x20, 0x73, 
-	0x65, 0x6e, 0x64, 0x28, 0x70, 0x61, 0x72, 0x61, 0x6d, 0x2c, 
-	0x20, 0x76, 0x61, 0x6c, 0x29, 0x20, 0x7b, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x63, 0x6f, 0x6e, 0x73, 0x74, 0x20, 0x6e, 0x6f, 0x77, 0x20, 
-	0x3d, 0x20, 0x44, 0x61, 0x74, 0x65, 0x2e, 0x6e, 0x6f, 0x77, 
-	0x28, 0x29, 0x3b, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x69, 0x66, 0x20, 0x28, 
-	0x6e, 0x6f, 0x77, 0x20, 0x2d, 0x20, 0x6c, 0x61, 0x73, 0x74, 
-	0x53, 0x65, 0x6e, 0x74, 0x20, 0x3c, 0x20, 0x74, 0x68, 0x72, 
-	0x6f, 0x74, 0x74, 0x6c, 0x65, 0x4d, 0x73, 0x20, 0x26, 0x26, 
-	0x20, 0x70, 0x61, 0x72, 0x61, 0x6d, 0x20, 0x3d, 0x3d, 0x3d, 
-	0x20, 0x27, 0x76, 0x27, 0x29, 0x20, 0x72, 0x65, 0x74, 0x75, 
-	0x72, 0x6e, 0x3b, 0x20, 0x2f, 0x2f, 0x20, 0x54, 0x68, 0x72, 
-	0x6f, 0x74, 0x74, 0x6c, 0x65, 0x20, 0x73, 0x6c, 0x69, 0x64, 
-	0x65, 0x72, 0x73, 0x2c, 0x20, 0x62, 0x75, 0x74, 0x20, 0x6c, 
-	0x65, 0x74, 0x20, 0x62, 0x75, 0x74, 0x74, 0x6f, 0x6e, 0x73, 
-	0x20, 0x74, 0x68, 0x72, 0x6f, 0x75, 0x67, 0x68, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x6c, 0x61, 0x73, 0x74, 0x53, 0x65, 0x6e, 0x74, 0x20, 
-	0x3d, 0x20, 0x6e, 0x6f, 0x77, 0x3b, 0x0a, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x2f, 0x2f, 0x20, 0x27, 0x6b, 0x65, 0x65, 0x70, 0x61, 0x6c, 
-	0x69, 0x76, 0x65, 0x27, 0x20, 0x68, 0x65, 0x6c, 0x70, 0x73, 
-	0x20, 0x70, 0x72, 0x65, 0x76, 0x65, 0x6e, 0x74, 0x20, 0x6e, 
-	0x65, 0x74, 0x77, 0x6f, 0x72, 0x6b, 0x20, 0x63, 0x6f, 0x6e, 
-	0x67, 0x65, 0x73, 0x74, 0x69, 0x6f, 0x6e, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x66, 0x65, 0x74, 0x63, 0x68, 0x28, 0x60, 0x2f, 0x75, 0x70, 
-	0x64, 0x61, 0x74, 0x65, 0x5f, 0x70, 0x64, 0x2e, 0x63, 0x67, 
-	0x69, 0x3f, 0x24, 0x7b, 0x70, 0x61, 0x72, 0x61, 0x6d, 0x7d, 
-	0x3d, 0x24, 0x7b, 0x76, 0x61, 0x6c, 0x7d, 0x60, 0x2c, 0x20, 
-	0x7b, 0x20, 0x6b, 0x65, 0x65, 0x70, 0x61, 0x6c, 0x69, 0x76, 
-	0x65, 0x3a, 0x20, 0x74, 0x72, 0x75, 0x65, 0x20, 0x7d, 0x29, 
-	0x2e, 0x63, 0x61, 0x74, 0x63, 0x68, 0x28, 0x28, 0x29, 0x20, 
-	0x3d, 0x3e, 0x20, 0x7b, 0x7d, 0x29, 0x3b, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x7d, 0x0a, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x2f, 0x2f, 0x20, 
-	0x53, 0x6c, 0x69, 0x64, 0x65, 0x72, 0x20, 0x4c, 0x69, 0x73, 
-	0x74, 0x65, 0x6e, 0x65, 0x72, 0x0a, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x63, 0x6f, 0x6e, 0x73, 0x74, 0x20, 
-	0x73, 0x6c, 0x69, 0x64, 0x65, 0x72, 0x20, 0x3d, 0x20, 0x64, 
-	0x6f, 0x63, 0x75, 0x6d, 0x65, 0x6e, 0x74, 0x2e, 0x67, 0x65, 
-	0x74, 0x45, 0x6c, 0x65, 0x6d, 0x65, 0x6e, 0x74, 0x42, 0x79, 
-	0x49, 0x64, 0x28, 0x27, 0x6d, 0x61, 0x69, 0x6e, 0x53, 0x6c, 
-	0x69, 0x64, 0x65, 0x72, 0x27, 0x29, 0x3b, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x73, 0x6c, 0x69, 0x64, 
-	0x65, 0x72, 0x2e, 0x6f, 0x6e, 0x69, 0x6e, 0x70, 0x75, 0x74, 
-	0x20, 0x3d, 0x20, 0x28, 0x65, 0x29, 0x20, 0x3d, 0x3e, 0x20, 
-	0x7b, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x64, 0x6f, 0x63, 0x75, 0x6d, 0x65, 
-	0x6e, 0x74, 0x2e, 0x67, 0x65, 0x74, 0x45, 0x6c, 0x65, 0x6d, 
-	0x65, 0x6e, 0x74, 0x42, 0x79, 0x49, 0x64, 0x28, 0x27, 0x76, 
-	0x5f, 0x76, 0x61, 0x6c, 0x27, 0x29, 0x2e, 0x69, 0x6e, 0x6e, 
-	0x65, 0x72, 0x54, 0x65, 0x78, 0x74, 0x20, 0x3d, 0x20, 0x65, 
-	0x2e, 0x74, 0x61, 0x72, 0x67, 0x65, 0x74, 0x2e, 0x76, 0x61, 
-	0x6c, 0x75, 0x65, 0x3b, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x73, 0x65, 0x6e, 
-	0x64, 0x28, 0x27, 0x76, 0x27, 0x2c, 0x20, 0x65, 0x2e, 0x74, 
-	0x61, 0x72, 0x67, 0x65, 0x74, 0x2e, 0x76, 0x61, 0x6c, 0x75, 
-	0x65, 0x29, 0x3b, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x7d, 0x3b, 0x0a, 0x0a, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x2f, 0x2f, 0x20, 0x53, 0x77, 0x69, 
-	0x74, 0x63, 0x68, 0x20, 0x4c, 0x69, 0x73, 0x74, 0x65, 0x6e, 
-	0x65, 0x72, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x64, 0x6f, 0x63, 0x75, 0x6d, 0x65, 0x6e, 0x74, 0x2e, 
-	0x67, 0x65, 0x74, 0x45, 0x6c, 0x65, 0x6d, 0x65, 0x6e, 0x74, 
-	0x42, 0x79, 0x49, 0x64, 0x28, 0x27, 0x6d, 0x61, 0x69, 0x6e, 
-	0x53, 0x77, 0x69, 0x74, 0x63, 0x68, 0x27, 0x29, 0x2e, 0x6f, 
-	0x6e, 0x63, 0x68, 0x61, 0x6e, 0x67, 0x65, 0x20, 0x3d, 0x20, 
-	0x28, 0x65, 0x29, 0x20, 0x3d, 0x3e, 0x20, 0x7b, 0x0a, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x73, 0x65, 0x6e, 0x64, 0x28, 0x27, 0x73, 0x27, 0x2c, 
-	0x20, 0x65, 0x2e, 0x74, 0x61, 0x72, 0x67, 0x65, 0x74, 0x2e, 
-	0x63, 0x68, 0x65, 0x63, 0x6b, 0x65, 0x64, 0x20, 0x3f, 0x20, 
-	0x31, 0x20, 0x3a, 0x20, 0x30, 0x29, 0x3b, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x7d, 0x3b, 0x0a, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x2f, 0x2f, 
-	0x20, 0x54, 0x72, 0x69, 0x67, 0x67, 0x65, 0x72, 0x20, 0x4c, 
-	0x69, 0x73, 0x74, 0x65, 0x6e, 0x65, 0x72, 0x0a, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x63, 0x6f, 0x6e, 0x73, 
-	0x74, 0x20, 0x62, 0x74, 0x6e, 0x20, 0x3d, 0x20, 0x64, 0x6f, 
-	0x63, 0x75, 0x6d, 0x65, 0x6e, 0x74, 0x2e, 0x67, 0x65, 0x74, 
-	0x45, 0x6c, 0x65, 0x6d, 0x65, 0x6e, 0x74, 0x42, 0x79, 0x49, 
-	0x64, 0x28, 0x27, 0x74, 0x72, 0x69, 0x67, 0x67, 0x65, 0x72, 
-	0x42, 0x74, 0x6e, 0x27, 0x29, 0x3b, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x62, 0x74, 0x6e, 0x2e, 0x6f, 
-	0x6e, 0x6d, 0x6f, 0x75, 0x73, 0x65, 0x64, 0x6f, 0x77, 0x6e, 
-	0x20, 0x3d, 0x20, 0x28, 0x29, 0x20, 0x3d, 0x3e, 0x20, 0x73, 
-	0x65, 0x6e, 0x64, 0x28, 0x27, 0x74, 0x27, 0x2c, 0x20, 0x31, 
-	0x29, 0x3b, 0x0a, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 
-	0x20, 0x62, 0x74, 0x6e, 0x2e, 0x6f, 0x6e, 0x6d, 0x6f, 0x75, 
-	0x73, 0x65, 0x75, 0x70, 0x20, 0x3d, 0x20, 0x28, 0x29, 0x20, 
-	0x3d, 0x3e, 0x20, 0x73, 0x65, 0x6e, 0x64, 0x28, 0x27, 0x74, 
-	0x27, 0x2c, 0x20, 0x30, 0x29, 0x3b, 0x0a, 0x20, 0x20, 0x20, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x62, 0x74, 0x6e, 0x2e, 0x6f, 
-	0x6e, 0x74, 0x6f, 0x75, 0x63, 0x68, 0x73, 0x74, 0x61, 0x72, 
-	0x74, 0x20, 0x3d, 0x20, 0x28, 0x65, 0x29, 0x20, 0x3d, 0x3e, 
-	0x20, 0x7b, 0x20, 0x65, 0x2e, 0x70, 0x72, 0x65, 0x76, 0x65, 
-	0x6e, 0x74, 0x44, 0x65, 0x66, 0x61, 0x75, 0x6c, 0x74, 0x28, 
-	0x29, 0x3b, 0x20, 0x73, 0x65, 0x6e, 0x64, 0x28, 0x27, 0x74, 
-	0x27, 0x2c, 0x20, 0x31, 0x29, 0x3b, 0x20, 0x7d, 0x3b, 0x0a, 
-	0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x20, 0x62, 0x74, 
-	0x6e, 0x2e, 0x6f, 0x6e, 0x74, 0x6f, 0x75, 0x63, 0x68, 0x65, 
-	0x6e, 0x64, 0x20, 0x3d, 0x20, 0x28, 0x65, 0x29, 0x20, 0x3d, 
-	0x3e, 0x20, 0x7b, 0x20, 0x65, 0x2e, 0x70, 0x72, 0x65, 0x76, 
-	0x65, 0x6e, 0x74, 0x44, 0x65, 0x66, 0x61, 0x75, 0x6c, 0x74, 
-	0x28, 0x29, 0x3b, 0x20, 0x73, 0x65, 0x6e, 0x64, 0x28, 0x27, 
-	0x74, 0x27, 0x2c, 0x20, 0x30, 0x29, 0x3b, 0x20, 0x7d, 0x3b, 
-	0x0a, 0x20, 0x20, 0x20, 0x20, 0x3c, 0x2f, 0x73, 0x63, 0x72, 
-	0x69, 0x70, 0x74, 0x3e, 0x0a, 0x3c, 0x2f, 0x62, 0x6f, 0x64, 
-	0x79, 0x3e, 0x0a, 0x3c, 0x2f, 0x68, 0x74, 0x6d, 0x6c, 0x3e, 
-	};
+/* makefsdata stamp: b641416b346a7bf0020c1baeafee7fecc387713317c11b7843caef96074f403a */
 
-const struct fsdata_file file_index_shtml[] = {{ NULL, data_index_shtml, data_index_shtml + 13, sizeof(data_index_shtml) - 13, FS_FILE_FLAGS_HEADER_INCLUDED | FS_FILE_FLAGS_HEADER_PERSISTENT}};
+static const unsigned char data_index_html[] = {
+	/* ./index.html */
+	0x2f, 0x69, 0x6e, 0x64, 0x65, 0x78, 0x2e, 0x68, 0x74, 0x6d, 0x6c, 0x00, 
+	0x48, 0x54, 0x54, 0x50, 0x2f, 0x31, 0x2e, 0x30, 0x20, 0x32, 0x30, 0x30, 0x20, 0x4f, 0x4b, 0x0d, 
+	0x0a, 0x53, 0x65, 0x72, 0x76, 0x65, 0x72, 0x3a, 0x20, 0x6c, 0x77, 0x49, 0x50, 0x2f, 0x70, 0x72, 
+	0x65, 0x2d, 0x30, 0x2e, 0x36, 0x20, 0x28, 0x68, 0x74, 0x74, 0x70, 0x3a, 0x2f, 0x2f, 0x77, 0x77, 
+	0x77, 0x2e, 0x73, 0x69, 0x63, 0x73, 0x2e, 0x73, 0x65, 0x2f, 0x7e, 0x61, 0x64, 0x61, 0x6d, 0x2f, 
+	0x6c, 0x77, 0x69, 0x70, 0x2f, 0x29, 0x0d, 0x0a, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x6e, 0x74, 0x2d, 
+	0x74, 0x79, 0x70, 0x65, 0x3a, 0x20, 0x74, 0x65, 0x78, 0x74, 0x2f, 0x68, 0x74, 0x6d, 0x6c, 0x0d, 
+	0x0a, 0x43, 0x6f, 0x6e, 0x74, 0x65, 0x6e, 0x74, 0x2d, 0x45, 0x6e, 0x63, 0x6f, 0x64, 0x69, 0x6e, 
+	0x67, 0x3a, 0x20, 0x67, 0x7a, 0x69, 0x70, 0x0d, 0x0a, 0x0d, 0x0a, 
+	0x1f, 0x8b, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x03, 0x8d, 0x58, 0xff, 0x52, 0xdb, 0x46, 
+	0x10, 0xfe, 0x9f, 0xa7, 0xb8, 0x3a, 0x69, 0x2d, 0x17, 0x4b, 0xb6, 0x31, 0xa1, 0x8c, 0x7f, 0xd0, 
+	0x49, 0x80, 0xb4, 0xcc, 0x94, 0x86, 0x49, 0x48, 0x93, 0x0e, 0xc3, 0xc0, 0x49, 0x5a, 0xd9, 0x17, 
+	0x64, 0x9d, 0x72, 0x3a, 0x19, 0xbb, 0x8c, 0x67, 0xfa, 0x34, 0x7d, 0xb0, 0x3e, 0x49, 0xf7, 0xee, 
+	0x64, 0x4b, 0x96, 0x64, 0xd2, 0x30, 0x80, 0x75, 0xba, 0xdd, 0xfd, 0x6e, 0xf7, 0xdb, 0x6f, 0x8f, 
+	0x8c, 0xbe, 0x3b, 0x7b, 0x77, 0x7a, 0xfd, 0xe7, 0xd5, 0x39, 0x99, 0xca, 0x59, 0x78, 0xb2, 0x37, 
+	0x52, 0xbf, 0x48, 0x48, 0xa3, 0xc9, 0xb8, 0x01, 0x51, 0x43, 0x2d, 0x00, 0xf5, 0x4f, 0xf6, 0x08, 
+	0xfe, 0x1b, 0xcd, 0x40, 0x52, 0xe2, 0x4d, 0xa9, 0x48, 0x40, 0x8e, 0x1b, 0x1f, 0xaf, 0xdf, 0xda, 
+	0xc7, 0x8d, 0xec, 0x95, 0x64, 0x32, 0x84, 0x93, 0x98, 0x3d, 0xf0, 0xab, 0x33, 0xf2, 0x09, 0x5c, 
+	0x72, 0xca, 0x23, 0x29, 0x78, 0x38, 0xea, 0x98, 0x37, 0x66, 0x57, 0x22, 0x97, 0xeb, 0xcf, 0xea, 
+	0x9f, 0xcb, 0xfd, 0x25, 0x79, 0x22, 0x2e, 0xf5, 0x1e, 0x26, 0x82, 0xa7, 0x91, 0x3f, 0x20, 0x2f, 
+	0x7a, 0x07, 0xea, 0x6b, 0x48, 0x3c, 0x1e, 0x72, 0x81, 0xcf, 0xdd, 0x6e, 0x10, 0x1c, 0x1f, 0x0f, 
+	0x49, 0x80, 0xfe, 0xec, 0x80, 0xce, 0x58, 0xb8, 0x1c, 0x90, 0xe6, 0x07, 0x98, 0x70, 0x20, 0x1f, 
+	0x2f, 0x9a, 0x6d, 0x92, 0xd0, 0x28, 0xb1, 0x13, 0x10, 0x2c, 0x18, 0x12, 0x9f, 0x25, 0x71, 0x48, 
+	0x71, 0x43, 0x10, 0xc2, 0x62, 0xa8, 0x7f, 0xda, 0x3e, 0x13, 0xe0, 0x49, 0xc6, 0xa3, 0x81, 0xf2, 
+	0x99, 0xce, 0xa2, 0x21, 0xa1, 0x21, 0x9b, 0x44, 0x36, 0x93, 0x30, 0x4b, 0x70, 0x11, 0x22, 0x09, 
+	0x62, 0x48, 0x62, 0xea, 0xfb, 0x2c, 0x9a, 0x0c, 0xc8, 0xab, 0x6e, 0x8c, 0xb6, 0x33, 0x2a, 0x26, 
+	0x0c, 0x6d, 0xba, 0x43, 0xb2, 0xda, 0x00, 0x76, 0x3c, 0x2a, 0xfc, 0x0a, 0x62, 0x50, 0x5f, 0x05, 
+	0x07, 0x07, 0xaf, 0x94, 0x03, 0x97, 0x0b, 0x1f, 0x84, 0x2d, 0xa8, 0xcf, 0x52, 0x0c, 0xd3, 0x3b, 
+	0xc8, 0x17, 0xf1, 0x29, 0x5e, 0x90, 0x84, 0x87, 0xcc, 0x27, 0x2f, 0xfa, 0xfd, 0xfe, 0x90, 0x3c, 
+	0x32, 0x5f, 0x4e, 0x07, 0xa4, 0x7f, 0xa0, 0x63, 0xe7, 0x01, 0xa7, 0x07, 0x18, 0xcd, 0x40, 0xb1, 
+	0x25, 0x8f, 0x35, 0x1c, 0x9d, 0x89, 0x47, 0x60, 0x93, 0xa9, 0x1c, 0x90, 0xc3, 0x2e, 0xae, 0x48, 
+	0x58, 0x48, 0x5b, 0x1f, 0x2a, 0x3f, 0x4e, 0x16, 0xde, 0xe5, 0x52, 0xf2, 0x59, 0x35, 0x60, 0x06, 
+	0x36, 0x7f, 0xff, 0x2a, 0x3f, 0xf4, 0x66, 0xb1, 0x8c, 0x26, 0xa4, 0x2e, 0x84, 0x08, 0x48, 0x23, 
+	0x48, 0xd8, 0x5f, 0x80, 0x76, 0x3d, 0xb5, 0x45, 0x03, 0x90, 0x02, 0x2b, 0x11, 0x70, 0x81, 0x86, 
+	0x69, 0x1c, 0x83, 0xf0, 0x68, 0x02, 0x79, 0x1d, 0x8f, 0x55, 0x11, 0x37, 0xf5, 0x71, 0x43, 0xee, 
+	0x3d, 0x54, 0xe2, 0x1d, 0x6f, 0x87, 0x73, 0xe6, 0x34, 0xb4, 0x79, 0x2a, 0x55, 0xc4, 0x90, 0x53, 
+	0x3c, 0xad, 0x50, 0x87, 0xfe, 0x06, 0x37, 0x66, 0x3c, 0xe2, 0x49, 0x4c, 0x3d, 0x28, 0xba, 0x62, 
+	0x51, 0x9c, 0xca, 0x1b, 0xb9, 0x8c, 0x61, 0x8c, 0x28, 0x27, 0x70, 0x8b, 0x3e, 0xb3, 0x9c, 0xf7, 
+	0xba, 0xdd, 0xef, 0x91, 0x12, 0x9e, 0x4a, 0x9c, 0x5d, 0xf6, 0xbc, 0x66, 0x41, 0x0f, 0x33, 0x41, 
+	0xba, 0xba, 0xb2, 0xaa, 0x04, 0x5e, 0x2a, 0x12, 0xb5, 0x2f, 0xe6, 0xcc, 0x64, 0xbb, 0x00, 0x7a, 
+	0x22, 0x98, 0xa2, 0xc8, 0xe6, 0xa8, 0xea, 0x79, 0xa8, 0x7f, 0xda, 0x48, 0x38, 0x5c, 0x93, 0x60, 
+	0x1b, 0x22, 0x2a, 0x56, 0x04, 0x42, 0x7d, 0xe3, 0x7b, 0x1a, 0xaf, 0x39, 0x92, 0xfb, 0x72, 0x53, 
+	0xcc, 0x4b, 0x54, 0xe6, 0x5b, 0x57, 0x95, 0xbc, 0x86, 0x48, 0x87, 0x87, 0x87, 0xd5, 0xd4, 0x6c, 
+	0x48, 0x69, 0x7c, 0x57, 0x80, 0x3f, 0x53, 0xb9, 0x62, 0x95, 0x35, 0x11, 0xb6, 0x88, 0xe7, 0xf2, 
+	0xd0, 0xaf, 0x62, 0x1d, 0x50, 0x6c, 0xb5, 0x39, 0x54, 0x21, 0x1b, 0x34, 0x39, 0xba, 0xed, 0xb6, 
+	0x4a, 0x1e, 0x99, 0xf4, 0xa6, 0xf6, 0xa3, 0xa0, 0x71, 0x31, 0x75, 0xa6, 0x8b, 0x6b, 0xbb, 0xf5, 
+	0x4b, 0x9a, 0x48, 0x16, 0x2c, 0x31, 0x93, 0xf8, 0x1c, 0x21, 0x1e, 0x5d, 0x72, 0xdb, 0x05, 0xf9, 
+	0x08, 0x80, 0x2d, 0xfe, 0xff, 0x33, 0x96, 0x67, 0xa8, 0xc4, 0xf6, 0x0c, 0x15, 0x02, 0x8a, 0x79, 
+	0xc2, 0x8c, 0x82, 0x08, 0xc0, 0xfa, 0xe1, 0x01, 0xf3, 0x8e, 0x3d, 0x54, 0x46, 0xd3, 0x2c, 0x29, 
+	0xbd, 0xe3, 0x7a, 0x17, 0x9a, 0x7e, 0xe8, 0x88, 0x23, 0x48, 0x26, 0x97, 0xba, 0x8d, 0x33, 0x07, 
+	0xdd, 0xdc, 0xba, 0x94, 0x13, 0x84, 0xa8, 0x1b, 0x78, 0xb1, 0x85, 0x80, 0xba, 0x08, 0x3e, 0x95, 
+	0x50, 0x57, 0xcb, 0x4c, 0x20, 0x42, 0x08, 0x8c, 0x37, 0xb1, 0xf1, 0xbb, 0xee, 0xb0, 0x6e, 0x31, 
+	0x33, 0x1b, 0xb6, 0x6b, 0x45, 0xd0, 0x24, 0xc8, 0x82, 0x38, 0xfd, 0x64, 0x07, 0x96, 0x81, 0x0b, 
+	0x48, 0x14, 0xd8, 0x05, 0x69, 0x5d, 0x8d, 0x46, 0xa3, 0x90, 0x14, 0xcd, 0xbc, 0x75, 0xb7, 0xe9, 
+	0x07, 0x83, 0xb0, 0x6f, 0x14, 0xd1, 0x20, 0x33, 0x0f, 0x55, 0x6c, 0x6b, 0xea, 0x3c, 0x03, 0x4f, 
+	0x67, 0x77, 0xe0, 0x4d, 0xc1, 0x7b, 0x00, 0x9f, 0xec, 0xd7, 0xc3, 0x2d, 0x70, 0x5c, 0x7f, 0x54, 
+	0x7d, 0xf8, 0xd9, 0xea, 0x1d, 0xc5, 0x8b, 0xd6, 0x96, 0xe0, 0x0a, 0xc5, 0xdd, 0x8c, 0x2a, 0x1b, 
+	0xd6, 0x18, 0xed, 0x2d, 0x6b, 0xe8, 0x5a, 0x1c, 0xd6, 0xaa, 0x60, 0xbc, 0x8c, 0x3a, 0xd9, 0x94, 
+	0x1b, 0x75, 0xcc, 0xe8, 0x1c, 0xa9, 0x31, 0x77, 0xb2, 0x67, 0x5e, 0xfa, 0x6c, 0x4e, 0xbc, 0x90, 
+	0x26, 0xc9, 0xb8, 0xa1, 0x66, 0x49, 0x23, 0x1f, 0x86, 0xa3, 0xe9, 0x41, 0xed, 0xfc, 0xc4, 0xe5, 
+	0x7c, 0x8f, 0x32, 0x67, 0xfe, 0xb8, 0x11, 0x53, 0x41, 0x67, 0x49, 0xe3, 0x64, 0xd4, 0xc1, 0x95, 
+	0xa2, 0x0f, 0x51, 0xb3, 0x19, 0x65, 0x34, 0x85, 0xed, 0xcd, 0xd9, 0xc7, 0x6c, 0x2a, 0x7b, 0x82, 
+	0xc5, 0x32, 0x37, 0xec, 0x74, 0xc8, 0xbb, 0x08, 0x48, 0xc7, 0x04, 0x71, 0xbc, 0x09, 0x43, 0xde, 
+	0x7f, 0x45, 0x17, 0x92, 0xa0, 0x38, 0xa8, 0x6f, 0xc6, 0x7d, 0x82, 0xf0, 0x05, 0x83, 0x84, 0xc0, 
+	0x1c, 0xc4, 0x92, 0x98, 0x94, 0xa3, 0xf8, 0xce, 0xb1, 0x04, 0x09, 0x8b, 0x3c, 0x28, 0xba, 0x93, 
+	0x53, 0xc0, 0xe1, 0x81, 0xf6, 0x1c, 0xfd, 0xd2, 0xc8, 0x27, 0xae, 0xc0, 0x96, 0x4b, 0x74, 0xbd, 
+	0xf5, 0xcb, 0x9b, 0x84, 0x3c, 0x82, 0xfb, 0xef, 0xdf, 0xff, 0xdc, 0x12, 0x83, 0x16, 0x57, 0xa9, 
+	0x54, 0x77, 0x0d, 0x14, 0x6b, 0xdf, 0xd9, 0xf8, 0x42, 0x82, 0x19, 0x14, 0x88, 0xe0, 0x32, 0x21, 
+	0x63, 0x9c, 0x7f, 0xc3, 0xd2, 0xcb, 0x19, 0x5d, 0xbc, 0xa1, 0xaa, 0xe9, 0xc6, 0xa4, 0xdf, 0x1b, 
+	0x16, 0x40, 0xfc, 0xf6, 0xe9, 0xe2, 0xea, 0xee, 0xd7, 0xeb, 0xeb, 0xab, 0xb3, 0xbb, 0xcb, 0xd7, 
+	0x9f, 0xef, 0x4e, 0x7f, 0xb9, 0xb8, 0xbb, 0x7a, 0xfd, 0xfe, 0xf5, 0xe5, 0xf9, 0xf5, 0xf9, 0xfb, 
+	0x0f, 0x6d, 0x32, 0x63, 0x51, 0x9a, 0x90, 0x64, 0x5c, 0x89, 0x15, 0x29, 0x79, 0x40, 0x6f, 0x11, 
+	0x3c, 0x92, 0x4b, 0x1a, 0x5b, 0xc8, 0x17, 0xe5, 0x0e, 0x6f, 0x15, 0x80, 0x4a, 0x20, 0x90, 0x7e, 
+	0x3e, 0x2c, 0x88, 0x7d, 0x62, 0x90, 0xe7, 0xc3, 0x12, 0x24, 0x49, 0xe0, 0x2b, 0x1a, 0x16, 0x20, 
+	0xaa, 0x45, 0x37, 0x4d, 0x96, 0xb8, 0x1a, 0xd0, 0x10, 0x55, 0xb6, 0x14, 0x0d, 0xa7, 0x1d, 0x72, 
+	0x59, 0x1d, 0xec, 0xe6, 0x76, 0xb8, 0xb7, 0x79, 0x19, 0xa4, 0x91, 0xbe, 0xc2, 0x10, 0xc1, 0x1f, 
+	0x2d, 0x2c, 0x0b, 0xf6, 0x58, 0x9b, 0x44, 0x74, 0x06, 0x6d, 0x13, 0xb4, 0x45, 0x9e, 0x36, 0x7b, 
+	0x73, 0x67, 0x66, 0x5c, 0x8f, 0x89, 0xcf, 0xbd, 0x74, 0x86, 0x26, 0x8e, 0x27, 0x00, 0x59, 0x7f, 
+	0x1e, 0x82, 0x7a, 0xb2, 0x9a, 0xfa, 0x7d, 0xb3, 0x35, 0xac, 0x31, 0x55, 0x53, 0x77, 0xb7, 0x21, 
+	0x6a, 0x6d, 0x54, 0xb6, 0x43, 0x0b, 0x47, 0x13, 0xfb, 0x77, 0x84, 0x85, 0xb6, 0xcd, 0x6c, 0x78, 
+	0x37, 0xab, 0xdb, 0x58, 0x14, 0x81, 0xb8, 0xc6, 0xc1, 0x83, 0xdb, 0x34, 0xfc, 0xed, 0x2d, 0x1a, 
+	0x96, 0x43, 0x63, 0x95, 0x79, 0xcb, 0x1c, 0x12, 0xad, 0x4a, 0xe1, 0x4c, 0x12, 0xb2, 0x5d, 0xa7, 
+	0x53, 0x16, 0xfa, 0x96, 0xb6, 0x2b, 0x6d, 0x13, 0x20, 0x53, 0x11, 0x29, 0xfb, 0x7c, 0x7d, 0x55, 
+	0x93, 0x57, 0x37, 0x55, 0x1e, 0x66, 0x34, 0x62, 0x01, 0xd2, 0xbc, 0x3e, 0x9d, 0xa6, 0x1d, 0x8a, 
+	0x69, 0x99, 0x80, 0xcc, 0x72, 0xf2, 0x66, 0x79, 0xe1, 0x5b, 0x4d, 0xb3, 0xa3, 0x9c, 0x99, 0xb5, 
+	0x57, 0x27, 0xeb, 0x27, 0x14, 0xa1, 0x73, 0xea, 0x4d, 0xad, 0xec, 0x6c, 0xac, 0x45, 0xc6, 0x27, 
+	0xa5, 0x80, 0xe5, 0x42, 0x64, 0x65, 0x47, 0xeb, 0x75, 0xd9, 0x8f, 0x0e, 0x4b, 0x51, 0x72, 0x93, 
+	0xac, 0x15, 0x77, 0x97, 0x4f, 0xeb, 0x65, 0xb3, 0xc6, 0xfe, 0x9d, 0xfb, 0x05, 0xaf, 0xca, 0x0e, 
+	0x16, 0x11, 0x27, 0xae, 0x65, 0xfc, 0xb4, 0x95, 0x76, 0xe2, 0xbd, 0x09, 0x2f, 0xdd, 0xfa, 0xe6, 
+	0xd4, 0xd4, 0x9d, 0x82, 0xda, 0xd8, 0x56, 0x9d, 0xa6, 0x04, 0xfd, 0xa7, 0x8c, 0x84, 0x03, 0x04, 
+	0x45, 0x56, 0x35, 0x6e, 0x8d, 0x23, 0x87, 0x47, 0x66, 0x0c, 0x8e, 0x89, 0x05, 0x3b, 0xce, 0x5c, 
+	0xc7, 0x10, 0x70, 0x24, 0xea, 0x2c, 0x48, 0xa7, 0x86, 0x2a, 0x1b, 0x36, 0x98, 0x26, 0x75, 0xf0, 
+	0xef, 0x12, 0x8b, 0xb5, 0x4b, 0x26, 0x35, 0x88, 0x56, 0xd5, 0xa5, 0xac, 0x38, 0x45, 0x42, 0x19, 
+	0xdc, 0x25, 0xf3, 0x55, 0x6d, 0xbf, 0x64, 0xa2, 0xf5, 0x0c, 0x37, 0xcc, 0x8e, 0x9d, 0xdc, 0x30, 
+	0xaf, 0xb7, 0xb9, 0xa1, 0x93, 0x94, 0x29, 0x82, 0x13, 0xa7, 0xc9, 0xd4, 0x52, 0x3c, 0x30, 0x3b, 
+	0xd7, 0x3c, 0x68, 0xda, 0xcd, 0x56, 0xab, 0x55, 0x4b, 0x6e, 0xd4, 0xa8, 0x14, 0x6f, 0x06, 0xfd, 
+	0x03, 0x25, 0x43, 0x6d, 0xfd, 0xb9, 0x77, 0x84, 0x78, 0x53, 0x25, 0x1e, 0xfa, 0x17, 0x51, 0x57, 
+	0x8b, 0x6c, 0x5d, 0xab, 0x58, 0xdb, 0x5c, 0xb4, 0xd1, 0x44, 0x47, 0x21, 0xab, 0x36, 0x09, 0x99, 
+	0xc4, 0xbf, 0xdf, 0x88, 0x4a, 0x30, 0x8d, 0xaa, 0x8d, 0x83, 0xf9, 0x0a, 0x97, 0x96, 0x9b, 0x06, 
+	0x01, 0x66, 0xaa, 0xb6, 0x6d, 0xe6, 0x0c, 0x75, 0xd3, 0xa8, 0xe7, 0x19, 0x95, 0xf4, 0x0f, 0x7c, 
+	0x5c, 0xef, 0xdf, 0xce, 0x85, 0x11, 0x4b, 0xb5, 0x5d, 0x25, 0xef, 0xa3, 0x86, 0x6e, 0x21, 0xcd, 
+	0xa4, 0xa8, 0xd4, 0xd0, 0x78, 0x36, 0x67, 0xd8, 0x36, 0xe9, 0x1d, 0x59, 0x87, 0xb5, 0x26, 0x98, 
+	0x59, 0x62, 0x29, 0xf9, 0x65, 0x5a, 0x91, 0xf1, 0xd7, 0xc8, 0x38, 0xc0, 0x8f, 0xfb, 0xfb, 0xad, 
+	0x9d, 0x0d, 0x68, 0xd4, 0xbd, 0x12, 0xe4, 0x08, 0xef, 0x19, 0x8c, 0xfc, 0x48, 0x8e, 0x6a, 0x83, 
+	0x95, 0x88, 0x51, 0x30, 0x7f, 0x6b, 0xf2, 0x6b, 0x1d, 0x7f, 0xd3, 0x9e, 0x05, 0xc4, 0xca, 0x8a, 
+	0x7f, 0xa3, 0x41, 0xdc, 0xb6, 0xc8, 0xf6, 0x73, 0x55, 0x48, 0x1d, 0xc9, 0xdf, 0xb2, 0x05, 0xf8, 
+	0x56, 0xbf, 0xcc, 0xda, 0x67, 0xd5, 0x2f, 0xe6, 0x61, 0x68, 0x95, 0x53, 0xa0, 0xe2, 0xab, 0x51, 
+	0xd5, 0xca, 0x44, 0x74, 0xdb, 0x61, 0x36, 0xc4, 0x14, 0xf6, 0x92, 0x7a, 0x63, 0x8a, 0xf1, 0xae, 
+	0x20, 0xd4, 0xdb, 0xfb, 0x64, 0xfc, 0xf2, 0x09, 0xcb, 0xba, 0xba, 0xaf, 0xa9, 0x85, 0xc9, 0xcf, 
+	0x0d, 0xb6, 0xeb, 0xfc, 0x96, 0xf0, 0x80, 0xdc, 0x38, 0x8e, 0x93, 0xf5, 0xf1, 0xad, 0xba, 0xc1, 
+	0x79, 0x60, 0x19, 0x8d, 0xd1, 0xd3, 0xbc, 0x55, 0x57, 0x21, 0x13, 0x67, 0x1f, 0x03, 0xfd, 0xf0, 
+	0xf2, 0x89, 0xad, 0x30, 0xd8, 0xbc, 0x1c, 0xaa, 0xa8, 0x0e, 0x3e, 0x20, 0x38, 0xb0, 0xd8, 0xce, 
+	0xdc, 0x68, 0x6c, 0x80, 0xd1, 0xac, 0xfb, 0xc2, 0xe5, 0xe7, 0xe7, 0x97, 0x4f, 0x3a, 0xd0, 0xea, 
+	0x5e, 0x69, 0xa1, 0x87, 0xed, 0xa9, 0xc4, 0x30, 0xe2, 0x76, 0x22, 0xf1, 0x6a, 0xd9, 0x44, 0x45, 
+	0xa8, 0x44, 0x74, 0xf0, 0x4e, 0x13, 0x59, 0x96, 0xd0, 0x1d, 0x2c, 0x1c, 0xbc, 0x29, 0xd1, 0xe5, 
+	0x1b, 0xcd, 0x79, 0xab, 0xb5, 0x6b, 0xb7, 0xee, 0xa4, 0x9a, 0x97, 0x9e, 0x3a, 0xbe, 0x65, 0x19, 
+	0xc5, 0xac, 0x8b, 0x15, 0xb0, 0x88, 0x86, 0xd8, 0x84, 0xd9, 0x96, 0xed, 0xfb, 0xc5, 0x96, 0x5e, 
+	0x15, 0x6b, 0xaf, 0x8f, 0xd9, 0x5c, 0x1f, 0xf3, 0x4b, 0xc2, 0x71, 0xa2, 0xef, 0x3d, 0x73, 0x06, 
+	0xb5, 0xa3, 0x0c, 0x3e, 0xdb, 0x92, 0x8f, 0xcd, 0x5a, 0x51, 0x2f, 0xcd, 0xd6, 0x9a, 0xf9, 0x00, 
+	0xf2, 0x42, 0xfd, 0x05, 0x83, 0x14, 0xb6, 0x14, 0x15, 0xdb, 0x9b, 0x0b, 0xde, 0x0e, 0xed, 0xc5, 
+	0x2b, 0x76, 0x76, 0x65, 0x1d, 0x75, 0xcc, 0xe5, 0x1a, 0xaf, 0xc9, 0xea, 0xbf, 0xaf, 0xfe, 0x03, 
+	0xc5, 0x9b, 0x90, 0x7d, 0xce, 0x12, 0x00, 0x00, 
+};
 
-#define FS_ROOT file_index_shtml
+const struct fsdata_file file_index_html[] = {{ NULL, data_index_html, data_index_html + 12, sizeof(data_index_html) - 12, FS_FILE_FLAGS_HEADER_INCLUDED | FS_FILE_FLAGS_HEADER_PERSISTENT}};
+
+#define FS_ROOT file_index_html
 #define FS_NUMFILES 1
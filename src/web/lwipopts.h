@@ -96,4 +96,6 @@
 #define LWIP_HTTPD_SSI 1
 #define LWIP_HTTPD_CGI 1
 #define LWIP_HTTPD_SSI_INCLUDE_TAG 0
+#define LWIP_HTTPD_CUSTOM_FILES 1           // /params.bin and /params.json, see PicoWEB.h
+#define LWIP_HTTPD_MAX_CGI_PARAMETERS 32    // updates batched into one /params.cgi request
 #define HTTPD_FSDATA_FILE "htmldata.c"
\ No newline at end of file
@@ -35,10 +35,17 @@ SOFTWARE.
 #include <climits>
 #include <cstdint>
 #include <cstring>
+#include <atomic>
 #include <type_traits>
 
+// Bundles and the output scheduler below build without lwIP, for the host tests
+#if __has_include("lwip/udp.h")
+#define PICOOSC_LWIP 1
 #include "lwip/pbuf.h"
 #include "lwip/udp.h"
+#else
+#define PICOOSC_LWIP 0
+#endif
 
 namespace picoosc {
 
@@ -65,6 +72,8 @@ T swap_endian(T u) {
     return dest.u;
 }
 
+#if PICOOSC_LWIP
+
 class OSCServer {
 public:
     OSCServer(uint16_t port, udp_recv_fn callback) {
@@ -116,6 +125,8 @@ private:
     uint16_t mPort;
 };
 
+#endif // PICOOSC_LWIP
+
 class OSCMessage {
 public:
     OSCMessage() : mBufferSize(0) {
@@ -167,5 +178,214 @@ private:
     char mBuffer[MAX_MESSAGE_SIZE];
 };
 
-} 
 
+// ---------------- BUNDLES ----------------
+
+inline size_t pad4(size_t n) { return (n + 3) & ~(size_t)3; }
+
+inline uint32_t read_be32(const uint8_t* p) {
+    return ((uint32_t)p[0] << 24) | ((uint32_t)p[1] << 16) | ((uint32_t)p[2] << 8) | p[3];
+}
+
+inline void write_be32(uint8_t* p, uint32_t v) {
+    p[0] = v >> 24; p[1] = v >> 16; p[2] = v >> 8; p[3] = v;
+}
+
+// "#bundle", time tag 1 (immediately), then [int32 size, message] per element
+class OSCBundle {
+public:
+    static constexpr size_t HEADER_SIZE = 16;
+
+    OSCBundle() { clear(); }
+
+    void clear() {
+        std::memcpy(mBuffer, "#bundle\0", 8);
+        std::memset(mBuffer + 8, 0, 8);
+        mBuffer[15] = 1;
+        mSize = HEADER_SIZE;
+        mCount = 0;
+    }
+
+    // false if the message does not fit; the bundle is unchanged then
+    bool add(const char* address, float value) {
+        const size_t address_size = pad4(std::strlen(address) + 1);
+        const size_t message_size = address_size + 4 + 4;
+        if (address_size > MAX_ADDRESS_SIZE + 1 || mSize + 4 + message_size > MAX_BUNDLE_SIZE) return false;
+
+        uint8_t* p = mBuffer + mSize;
+        write_be32(p, (uint32_t)message_size);
+        p += 4;
+        std::memset(p, 0, address_size);
+        std::memcpy(p, address, std::strlen(address));
+        p += address_size;
+        std::memcpy(p, ",f\0\0", 4);
+        p += 4;
+        uint32_t bits;
+        std::memcpy(&bits, &value, 4);
+        write_be32(p, bits);
+
+        mSize += 4 + message_size;
+        mCount++;
+        return true;
+    }
+
+    const uint8_t* data() const { return mBuffer; }
+    size_t size() const { return mSize; }
+    size_t count() const { return mCount; }
+
+private:
+    uint8_t mBuffer[MAX_BUNDLE_SIZE];
+    size_t mSize;
+    size_t mCount;
+};
+
+
+// Call handler(address, value) for every message whose first argument is a
+// float or an int, descending into (nested) bundles. Malformed elements end
+// the parse of their bundle. Returns the number of messages handled.
+template <typename Handler>
+int parse_packet(const uint8_t* data, size_t len, Handler&& handler, int depth = 0) {
+    if (len >= OSCBundle::HEADER_SIZE && std::memcmp(data, "#bundle\0", 8) == 0) {
+        if (depth >= 4) return 0;
+        int handled = 0;
+        size_t pos = OSCBundle::HEADER_SIZE;
+        while (pos + 4 <= len) {
+            const uint32_t size = read_be32(data + pos);
+            pos += 4;
+            if (size > len - pos || size % 4) break;
+            handled += parse_packet(data + pos, size, handler, depth + 1);
+            pos += size;
+        }
+        return handled;
+    }
+
+    if (len < 4 || data[0] != '/') return 0;
+    const size_t address_len = strnlen((const char*)data, len);
+    const size_t tags = pad4(address_len + 1);
+    if (tags >= len || data[tags] != ',') return 0;
+    const size_t tags_len = strnlen((const char*)data + tags, len - tags);
+    const size_t args = tags + pad4(tags_len + 1);
+    if (tags_len < 2 || args + 4 > len) return 0;
+
+    const uint32_t raw = read_be32(data + args);
+    float value;
+    if (data[tags + 1] == 'f') std::memcpy(&value, &raw, 4);
+    else if (data[tags + 1] == 'i') value = (float)(int32_t)raw;
+    else return 0;
+
+    handler((const char*)data, value);
+    return 1;
+}
+
+
+// ---------------- OUTPUT SCHEDULER ----------------
+
+struct OSCStats {
+    std::atomic<uint32_t> packets{0};    // bundles sent
+    std::atomic<uint32_t> messages{0};   // values sent
+    std::atomic<uint32_t> coalesced{0};  // values replaced by a newer one before the flush
+    std::atomic<uint32_t> dropped{0};    // values lost to a failed send, addresses that got no slot
+    std::atomic<uint32_t> received{0};   // incoming messages handed to the router
+};
+
+// One slot per output address holding the latest value. Each slot has a single
+// writer (the audio core for patch sends, core 0 for its own status values);
+// core 0 flushes every changed slot as one bundle per interval, so a send that
+// changes every block costs one message per interval instead of one packet per
+// value.
+template <int SLOTS>
+class OSCScheduler {
+public:
+    static constexpr size_t ADDRESS_SIZE = 64;
+
+    void begin(uint32_t interval_ms) { mInterval = interval_ms; }
+
+    // Core 0: register an address, returns its slot or -1 (counted as dropped)
+    // when the table is full or the address too long
+    int add(const char* address) {
+        const int n = mCount.load(std::memory_order_relaxed);
+        if (n >= SLOTS || std::strlen(address) >= ADDRESS_SIZE) {
+            count(stats.dropped);
+            return -1;
+        }
+        std::strcpy(mSlots[n].address, address);
+        mCount.store(n + 1, std::memory_order_release);
+        return n;
+    }
+
+    // Core 0
+    int find(const char* address) const {
+        const int n = mCount.load(std::memory_order_acquire);
+        for (int i = 0; i < n; i++) {
+            if (std::strcmp(mSlots[i].address, address) == 0) return i;
+        }
+        return -1;
+    }
+
+    // The slot's writer; a slot that add() did not hand out is ignored
+    void set(int slot, float value) {
+        if (slot < 0 || slot >= mCount.load(std::memory_order_acquire)) return;
+        Slot& s = mSlots[slot];
+        s.value.store(value, std::memory_order_relaxed);
+        s.written.store(s.written.load(std::memory_order_relaxed) + 1, std::memory_order_release);
+    }
+
+    // Core 0: once the interval has passed, send every changed slot.
+    // Send: bool (const uint8_t* data, size_t size). Returns the bundles sent.
+    template <typename Send>
+    int poll(uint32_t now_ms, Send&& send) {
+        if (now_ms - mLast < mInterval) return 0;
+        mLast = now_ms;
+
+        int packets = 0;
+        mBundle.clear();
+        const int n = mCount.load(std::memory_order_acquire);
+        for (int i = 0; i < n; i++) {
+            Slot& s = mSlots[i];
+            const uint32_t written = s.written.load(std::memory_order_acquire);
+            if (written == s.sent) continue;
+            const float value = s.value.load(std::memory_order_relaxed);
+
+            if (!mBundle.add(s.address, value)) {
+                packets += flush(send);
+                mBundle.add(s.address, value);
+            }
+            count(stats.coalesced, written - s.sent - 1);
+            s.sent = written;
+        }
+        return packets + flush(send);
+    }
+
+    OSCStats stats;
+
+private:
+    struct Slot {
+        char address[ADDRESS_SIZE];
+        std::atomic<float> value{0.0f};
+        std::atomic<uint32_t> written{0};
+        uint32_t sent = 0;  // core 0
+    };
+
+    // Single-writer increment
+    static void count(std::atomic<uint32_t>& c, uint32_t n = 1) {
+        c.store(c.load(std::memory_order_relaxed) + n, std::memory_order_relaxed);
+    }
+
+    template <typename Send>
+    int flush(Send&& send) {
+        if (!mBundle.count()) return 0;
+        const bool ok = send(mBundle.data(), mBundle.size());
+        count(ok ? stats.messages : stats.dropped, (uint32_t)mBundle.count());
+        if (ok) count(stats.packets);
+        mBundle.clear();
+        return ok ? 1 : 0;
+    }
+
+    Slot mSlots[SLOTS];
+    std::atomic<int> mCount{0};
+    OSCBundle mBundle;
+    uint32_t mInterval = 0;
+    uint32_t mLast = 0;
+};
+
+}
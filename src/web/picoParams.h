@@ -0,0 +1,144 @@
+#pragma once
+
+// Batched parameter endpoint for the web UI, GET /params.cgi:
+//
+//   /params.cgi?s=<seq>&<index>=<value>&<index>=<value>...
+//
+// applies every <index>=<value> pair to the [r web…] receiver with that index
+// and answers with every [s web…] value that changed after <seq>, so one
+// request carries a whole slider drag and the UI's refresh. Indices are the
+// manifest order, fixed at build time and listed by /params.json.
+//
+// Response body (/params.bin), little endian:
+//
+//   uint32 seq     send with the next request as s=
+//   uint16 count
+//   count x { uint16 index; float value; }
+//
+// s=0 asks for every value the patch has sent so far.
+//
+// The audio core writes values (sendHook) and core 0 reads them (lwIP), each
+// value with the sequence number of its last write; single writer per field,
+// plain loads and stores only, as in PicoEvents.h.
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include <atomic>
+
+namespace picoparams {
+
+static constexpr size_t HEADER_SIZE = 6;
+static constexpr size_t ENTRY_SIZE = 6;
+
+// The [r web…] and [s web…] names behind the indices, generated into main.cpp
+struct Manifest {
+    const char* const* params;
+    int num_params;
+    const char* const* values;
+    int num_values;
+    void (*apply)(int index, float value);  // core 0: queue a value for receiver `index`
+};
+
+template <int N>
+class WebValues {
+public:
+    static constexpr size_t MAX_BYTES = HEADER_SIZE + N * ENTRY_SIZE;
+
+    // Audio core
+    void set(int i, float v) {
+        if (i < 0 || i >= N) return;
+        const uint32_t s = mSeq.load(std::memory_order_relaxed) + 1;
+        mValues[i].store(v, std::memory_order_relaxed);
+        mChanged[i].store(s, std::memory_order_release);
+        mSeq.store(s, std::memory_order_release);
+    }
+
+    // Core 0
+    float get(int i) const {
+        return mValues[i].load(std::memory_order_relaxed);
+    }
+
+    uint32_t seq() const {
+        return mSeq.load(std::memory_order_acquire);
+    }
+
+    // Core 0: encode the values changed after `since` into out (MAX_BYTES
+    // fits all of them). A value written during the scan may be included
+    // and is then sent again next time, never missed.
+    size_t delta(uint32_t since, uint8_t* out) const {
+        const uint32_t now = seq();
+        uint16_t count = 0;
+        size_t pos = HEADER_SIZE;
+        for (int i = 0; i < N; i++) {
+            const uint32_t changed = mChanged[i].load(std::memory_order_acquire);
+            if (changed == 0) continue;                                    // never sent
+            if (since != 0 && (int32_t)(changed - since) <= 0) continue;   // client has it
+            const uint16_t index = (uint16_t)i;
+            const float value = mValues[i].load(std::memory_order_relaxed);
+            memcpy(out + pos, &index, 2);
+            memcpy(out + pos + 2, &value, 4);
+            pos += ENTRY_SIZE;
+            count++;
+        }
+        memcpy(out, &now, 4);
+        memcpy(out + 4, &count, 2);
+        return pos;
+    }
+
+private:
+    std::atomic<float> mValues[N > 0 ? N : 1] = {};
+    std::atomic<uint32_t> mChanged[N > 0 ? N : 1] = {};
+    std::atomic<uint32_t> mSeq{0};
+};
+
+// Core 0: walk the CGI parameters lwIP split out of the query. "s" sets
+// `since`, a numeric key below num_params is applied, anything else is
+// skipped. Apply: void (int index, float value). Returns the values applied.
+template <typename Apply>
+int apply_query(int num, char* const names[], char* const values[], int num_params, uint32_t& since, Apply&& apply) {
+    int applied = 0;
+    for (int i = 0; i < num; i++) {
+        const char* name = names[i];
+        if (!name || !values[i]) continue;
+        if (strcmp(name, "s") == 0) {
+            since = (uint32_t)strtoul(values[i], nullptr, 10);
+            continue;
+        }
+        char* end;
+        const long index = strtol(name, &end, 10);
+        if (end == name || *end != '\0' || index < 0 || index >= num_params) continue;
+        apply((int)index, (float)atof(values[i]));
+        applied++;
+    }
+    return applied;
+}
+
+// Core 0: /params.json, the names behind the indices. Returns the length, or
+// 0 when it does not fit.
+inline size_t write_manifest(char* out, size_t size, const char* const* params, int num_params,
+                             const char* const* values, int num_values) {
+    size_t pos = 0;
+    auto put = [&](const char* s) {
+        const size_t n = strlen(s);
+        if (pos + n >= size) return false;
+        memcpy(out + pos, s, n);
+        pos += n;
+        out[pos] = '\0';
+        return true;
+    };
+    auto list = [&](const char* key, const char* const* names, int n) {
+        if (!put("\"") || !put(key) || !put("\":[")) return false;
+        for (int i = 0; i < n; i++) {
+            if ((i && !put(",")) || !put("\"") || !put(names[i]) || !put("\"")) return false;
+        }
+        return put("]");
+    };
+    if (!put("{") || !list("params", params, num_params) || !put(",") ||
+        !list("values", values, num_values) || !put("}")) {
+        return 0;
+    }
+    return pos;
+}
+
+}
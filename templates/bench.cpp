@@ -0,0 +1,108 @@
+/* pikoPD host benchmark
+
+Generated by pikopd.py --bench. Renders the patch offline on the build
+machine and times audioFunc + the fused MasterFX/int16 pass per block.
+Not part of the firmware.
+
+Usage: bench <sample_rate> <buffer_size> <seconds>
+
+*/
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <chrono>
+#include <vector>
+#include <algorithm>
+
+#include "masterfx/masterfx.h"
+#include "Heavy_{{ name }}.hpp"
+
+#define HV_NOTEIN_HASH 0x67E37CA3
+
+{% set note_receives = [] -%}
+{% for r in hv_manifest.receives if r.name.lower().startswith("note") -%}
+    {% set _ = note_receives.append(r.hash) -%}
+{% endfor -%}
+static const uint32_t NOTE_HASHES[] = {
+    HV_NOTEIN_HASH,
+{%- for hash in note_receives %}
+    {{ hash }},
+{%- endfor %}
+};
+static const int NUM_NOTE_HASHES = sizeof(NOTE_HASHES) / sizeof(NOTE_HASHES[0]);
+
+MasterFX masterFX;
+static Heavy_{{ name }}* pd_prog;
+
+void audioFunc(float* buffer, int frames) {
+    pd_prog->processInlineInterleaved(buffer, buffer, frames);
+}
+
+// Hold a chord on every note receiver, retriggered so envelopes keep running
+static void send_notes(float velocity) {
+    static const float chord[] = { 48.0f, 55.0f, 60.0f, 64.0f };
+    for (int i = 0; i < NUM_NOTE_HASHES; i++) {
+        hv_sendMessageToReceiverV(pd_prog, NOTE_HASHES[i], 0.0f, "fff",
+                                  chord[i % 4], velocity, 1.0f);
+    }
+}
+
+int main(int argc, char** argv) {
+    if (argc < 4) {
+        fprintf(stderr, "usage: %s <sample_rate> <buffer_size> <seconds>\n", argv[0]);
+        return 1;
+    }
+    const int sample_rate = atoi(argv[1]);
+    const int frames = atoi(argv[2]);
+    const double seconds = atof(argv[3]);
+    if (sample_rate <= 0 || frames <= 0 || seconds <= 0.0) return 1;
+
+    pd_prog = new Heavy_{{ name }}(sample_rate);
+    masterFX.init();
+    #ifdef USE_DELAY
+    masterFX.delay.targetLevel = 0.3f;
+    #endif
+    #ifdef USE_REVERB
+    masterFX.reverb_mix = 0.25f;
+    #endif
+
+    std::vector<float> buffer(frames * 2, 0.0f);
+    std::vector<int16_t> out(frames * 2);
+
+    const int blocks = std::max(1, (int)(seconds * sample_rate / frames));
+    const int warmup = std::max(1, sample_rate / 4 / frames);
+    const int retrigger = std::max(1, sample_rate / 2 / frames);
+    std::vector<double> ns(blocks);
+
+    send_notes(100.0f);
+    for (int b = 0; b < warmup; b++) {
+        audioFunc(buffer.data(), frames);
+        masterFX.process(buffer.data(), frames, Int16Sink{out.data()});
+    }
+
+    for (int b = 0; b < blocks; b++) {
+        if (b % retrigger == 0) send_notes(b % (retrigger * 2) ? 0.0f : 100.0f);
+
+        auto t0 = std::chrono::steady_clock::now();
+        audioFunc(buffer.data(), frames);
+        masterFX.process(buffer.data(), frames, Int16Sink{out.data()});
+        auto t1 = std::chrono::steady_clock::now();
+
+        ns[b] = std::chrono::duration<double, std::nano>(t1 - t0).count();
+    }
+
+    double total = 0.0;
+    for (double v : ns) total += v;
+    std::sort(ns.begin(), ns.end());
+
+    const double budget = 1e9 * frames / sample_rate;
+    const double mean = total / blocks;
+    printf("{\"blocks\": %d, \"budget_ns\": %.1f, \"mean_ns\": %.1f, \"median_ns\": %.1f, "
+           "\"p99_ns\": %.1f, \"max_ns\": %.1f, \"rtf\": %.6f}\n",
+           blocks, budget, mean, ns[blocks / 2], ns[(int)(blocks * 0.99)],
+           ns[blocks - 1], mean / budget);
+
+    delete pd_prog;
+    return 0;
+}
@@ -22,9 +22,25 @@ MIT Licence
 #include "PicoAudio.h"
 #include "PicoControl.h"
 #include "PicoMIDI.h"
+#include "PicoHash.h"
+#include "PicoEvents.h"
+#include "PicoProfile.h"
+{%- if board.console %}
+#include "PicoTelemetry.h"
+{%- endif %}
+{%- if samples %}
+#include "PicoSamples.h"
+{%- endif %}
+{%- set dual = board.dual_core and board.voice_count > 1 %}
+{%- if dual %}
+#include "PicoDualCore.h"
+{%- endif %}
 
 {% if board.pico_board == 'pico_w' -%}
 #include "pico/cyw43_arch.h"
+{%- if board.web.enabled %}
+#define WEB_NUM_VALUES {{ [routes.web_values | length, 1] | max }}  // [s web…] sends
+{%- endif %}
 #include "PicoWEB.h"
 {%- endif %}
 
@@ -35,6 +51,16 @@ MIT Licence
 
 #include "Heavy_{{ name }}.hpp"
 
+{% macro route_table(var, table) -%}
+static const RouteEntry {{ var }}_slots[{{ table.slots | length }}] = {
+{%- for slot in table.slots %}
+    {% if slot %}{ "{{ slot.name }}", {{ slot.value }}U }{% else %}{ nullptr, 0 }{% endif %}{{ "," if not loop.last }}
+{%- endfor %}
+};
+static const uint16_t {{ var }}_disp[{{ table.disp | length }}] = { {{ table.disp | join(", ") }} };
+static const RouteTable {{ var }} = { {{ var }}_slots, {{ var }}_disp, {{ table.mask }}U, {{ table.disp_mask }}U, {{ table.seed }}U };
+{%- endmacro %}
+
 #define HV_NOTEIN_HASH       0x67E37CA3
 #define HV_CTLIN_HASH        0x41BE0F9C
 #define HV_POLYTOUCHIN_HASH  0xBC530F59
@@ -62,6 +88,12 @@ MIT Licence
 
 
 Heavy_{{ name }} pd_prog( {{ board.sample_rate }} );
+{%- if dual %}
+
+// Second instance of the patch, rendered on core 0 (see PicoDualCore.h)
+Heavy_{{ name }} pd_core0( {{ board.sample_rate }} );
+static Pico::VoiceCore voice_core;
+{%- endif %}
 
 MasterFX masterFX;
 
@@ -69,6 +101,10 @@ MasterFX masterFX;
 {%- for r in hv_manifest.receives -%}{%- set _ = receives.update({r.name: r.hash}) -%}
 {%- endfor -%}
 
+{%- set param_index = {} -%}
+{%- for p in params -%}{%- set _ = param_index.update({p.name: loop.index0}) -%}
+{%- endfor -%}
+
 {%- set sends = {} -%}
 {%- for s in hv_manifest.sends -%}{%- set _ = sends.update({s.name: s.hash}) -%}
 {%- endfor -%}
@@ -98,7 +134,7 @@ MasterFX masterFX;
 
 {%- set active_knobs = [] -%}
 {%- for k in board.inputs.adc_pins if k.name in receives -%}
-    {%- set _ = active_knobs.append({'hash': receives[k.name], 'pin': k.pin, 'type': k.type}) -%}
+    {%- set _ = active_knobs.append({'hash': receives[k.name], 'slot': param_index[k.name], 'pin': k.pin, 'type': k.type}) -%}
 {%- endfor -%}
 
 {%- set active_leds = [] -%}
@@ -137,8 +173,8 @@ MasterFX masterFX;
             'id': loop.index0,
             'x': j.joy_x,
             'y': j.joy_y,
-            'hash_x': hash_x,
-            'hash_y': hash_y,
+            'slot_x': param_index[j.name + "_x"],
+            'slot_y': param_index[j.name + "_y"],
             'midi_range': j.midi_range if j.midi_range is defined else false
         }) -%}
     {%- endif -%}
@@ -146,7 +182,7 @@ MasterFX masterFX;
 
 {%- set active_cny70 = [] -%}
 {%- for cny in board.inputs.sensors.cny70 if cny.name in receives -%}
-    {%- set _ = active_cny70.append({'adc_pin': cny.adc_pin, 'hash': receives[cny.name]}) -%}
+    {%- set _ = active_cny70.append({'adc_pin': cny.adc_pin, 'slot': param_index[cny.name]}) -%}
 {%- endfor -%}
 
 {%- set active_dist = [] -%}
@@ -155,7 +191,7 @@ MasterFX masterFX;
         {%- set _ = active_dist.append({
             'trig': d.trigger, 
             'echo': d.echo, 
-            'hash': receives[d.name]
+            'slot': param_index[d.name]
         }) -%}
     {%- endfor -%}
 {%- endif -%}
@@ -212,6 +248,9 @@ static uint8_t clock_count = 0;
 static bool clock_running = false; 
 static bool debug_enabled = true;
 static uint32_t last_print_tick = 0;
+{%- if board.profile %}
+static Pico::ProfileSnapshot profile_snap = {};
+{%- endif %}
 
 
 // ---- NOTE receives ----
@@ -224,49 +263,39 @@ static uint32_t last_print_tick = 0;
 {% for r in hv_manifest.receives if r.name.lower().startswith("note") -%}
     {% set _ = note_receives.append(r.hash) -%}
 {% endfor -%}
+{% if dual -%}
+// Voice v plays on instance v & 1 (0: core 1, 1: core 0) through VOICE_HASHES[v >> 1]
+#define VOICE_RECEIVERS ((MAX_VOICES + 1) / 2)
+{% set note_list = note_receives[:(board.voice_count + 1) // 2] -%}
+{% else -%}
+#define VOICE_RECEIVERS MAX_VOICES
 {% set note_list = note_receives[:board.voice_count] -%}
-{% if note_list | length > 1 %}
-constexpr uint32_t VOICE_HASHES[MAX_VOICES] = {
+{% endif -%}
+{% if board.voice_count > 1 %}
+constexpr uint32_t VOICE_HASHES[VOICE_RECEIVERS] = {
 {%- for hash in note_list %}
     {{ hash }}{{ "," if not loop.last }}
 {%- endfor %}
 };
+
+static VoiceAllocator voice_alloc;
 {% endif %}
 
 
 // ---------------------------
 
-// https://github.com/Wasted-Audio/hvcc/issues/175
-
-#define HV_HEAVY_SPINLOCK 5
-
-inline void hv_send_msg1_lock(uint32_t hash, float a) {
-    spin_lock_t *lock = spin_lock_instance(HV_HEAVY_SPINLOCK);
-    uint32_t irq = spin_lock_blocking(lock);
-    hv_sendMessageToReceiverV(&pd_prog, hash, 0.0f, "f", a);
-    spin_unlock(lock, irq);
-}
+// ---- Continuous control slots ----
 
-inline void hv_send_msg2_lock(uint32_t hash, float a, float b) {
-    spin_lock_t *lock = spin_lock_instance(HV_HEAVY_SPINLOCK);
-    uint32_t irq = spin_lock_blocking(lock);
-    hv_sendMessageToReceiverV(&pd_prog, hash, 0.0f, "ff", a, b);
-    spin_unlock(lock, irq);
-}
+// Heavy is only driven from the audio core (https://github.com/Wasted-Audio/hvcc/issues/175):
+// core 0 queues events and parameter values, audioFunc drains them, see PicoEvents.h
 
-inline void hv_send_msg3_lock(uint32_t hash, float a, float b, float c) {
-    spin_lock_t *lock = spin_lock_instance(HV_HEAVY_SPINLOCK);
-    uint32_t irq = spin_lock_blocking(lock);
-    hv_sendMessageToReceiverV(&pd_prog, hash, 0.0f, "fff", a, b, c);
-    spin_unlock(lock, irq);
-}
+#define NUM_PARAM_SLOTS {{ params | length }}
 
-inline void hv_send_float_lock(HeavyContextInterface* ctx, uint32_t hash, float v) {
-    spin_lock_t *lock = spin_lock_instance(HV_HEAVY_SPINLOCK);
-    uint32_t irq = spin_lock_blocking(lock);
-    hv_sendFloatToReceiver(ctx, hash, v);
-    spin_unlock(lock, irq);
-}
+static ParamSlot param_slots[{{ [params | length, 1] | max }}] = {
+{%- for p in params %}
+    { {{ p.hash }}U }{{ "," if not loop.last }}  // {{ p.name }}
+{%- endfor %}
+};
 
 
 void handle_midi_message(uint8_t status, uint8_t data1, uint8_t data2) {
@@ -274,7 +303,7 @@ void handle_midi_message(uint8_t status, uint8_t data1, uint8_t data2) {
     uint32_t now = to_ms_since_boot(get_absolute_time());
 
     if (status >= 0xF8) {
-        hv_send_msg1_lock(HV_MIDIREALTIMEIN_HASH, (float)status);
+        Pico::post_event(HV_MIDIREALTIMEIN_HASH, 1, (float)status);
         switch(status) {
             case MIDI_RT_START:    clock_count = 23; clock_running = true; break;
             case MIDI_RT_CONTINUE: clock_running = true; break;
@@ -300,12 +329,16 @@ void handle_midi_message(uint8_t status, uint8_t data1, uint8_t data2) {
                 current_midi_note = data1;
                 midi_activity_timer = now + FLASH_DURATION_MS;
                 
-                hv_send_msg3_lock(HV_NOTEIN_HASH, (float)data1, (float)data2, f_chan);
+                Pico::post_event(HV_NOTEIN_HASH, 3, (float)data1, (float)data2, f_chan);
 
                 {%- if board.voice_count > 1 %}
                 {
-                    int v_idx = allocateVoice(data1); 
-                    hv_send_msg3_lock(VOICE_HASHES[v_idx], (float)data1, (float)data2, f_chan);
+                    int v_idx = voice_alloc.note_on(data1, data2);
+                    {%- if dual %}
+                    Pico::post_event_to(v_idx & 1, VOICE_HASHES[v_idx >> 1], 3, (float)data1, (float)data2, f_chan);
+                    {%- else %}
+                    Pico::post_event(VOICE_HASHES[v_idx], 3, (float)data1, (float)data2, f_chan);
+                    {%- endif %}
                 }
                 {%- endif %}
                 break; 
@@ -314,14 +347,17 @@ void handle_midi_message(uint8_t status, uint8_t data1, uint8_t data2) {
         }
 
         case 0x80: { 
-             hv_send_msg3_lock(HV_NOTEIN_HASH, (float)data1, 0.0f, f_chan);
+            Pico::post_event(HV_NOTEIN_HASH, 3, (float)data1, 0.0f, f_chan);
 
             {%- if board.voice_count > 1 %}
             {
-                int i = findVoiceByNote(data1);
+                int i = voice_alloc.note_off(data1);
                 if (i >= 0) {
-                    sendVoiceNoteOff(i, data1);
-                    hv_send_msg3_lock(VOICE_HASHES[i], (float)data1, 0.0f, f_chan);
+                    {%- if dual %}
+                    Pico::post_event_to(i & 1, VOICE_HASHES[i >> 1], 3, (float)data1, 0.0f, f_chan);
+                    {%- else %}
+                    Pico::post_event(VOICE_HASHES[i], 3, (float)data1, 0.0f, f_chan);
+                    {%- endif %}
                 }
             }
             {%- endif %}
@@ -352,13 +388,13 @@ void handle_midi_message(uint8_t status, uint8_t data1, uint8_t data2) {
                 case 99: masterFX.reverb_bypass = !is_on; break;
                 {%- endif %}
             }
-            hv_send_msg3_lock(HV_CTLIN_HASH, (float)data2, (float)data1, f_chan);
+            Pico::post_event(HV_CTLIN_HASH, 3, (float)data2, (float)data1, f_chan);
             break;
         }
 
         case 0xE0: { 
             int bend = (data2 << 7) | data1;
-            hv_send_msg2_lock(HV_BENDIN_HASH, (float)bend, f_chan);
+            Pico::post_event(HV_BENDIN_HASH, 2, (float)bend, f_chan);
             break;
         }
     }
@@ -408,6 +444,14 @@ void heavyMidiOutHook(HeavyContextInterface *c, const char *receiverName, hv_uin
 }
 
 
+{% if board.web.enabled -%}
+#if OSC_ENABLED
+// osc_register() slot of each [s osc…] send, -1 when it got none
+static int osc_send_slots[] = {
+    {%- for s in hv_manifest.sends if s.name.startswith('osc') %} -1{{ "," if not loop.last }}{% else %} -1{% endfor %} };
+#endif
+
+{% endif -%}
 void sendHookHandler(HeavyContextInterface *vc, const char *name, uint32_t hash, const HvMessage *m) {
     if (hv_msg_getNumElements(m) < 1) return;
     float val0 = hv_msg_getFloat(m, 0);
@@ -431,23 +475,33 @@ void sendHookHandler(HeavyContextInterface *vc, const char *name, uint32_t hash,
     /* --- Web (SSI Sync) & OSC Routing --- */
     {% if board.web.enabled -%}
     {% set web_count = namespace(index=0) %}
-    {% for s in hv_manifest.sends -%}
+    {% set osc_count = namespace(index=0) %}
+    {% for s in hv_manifest.sends if s.name.startswith(('web', 'osc')) -%}
         case {{ s.hash }}U:
             {% if s.name.startswith('web') -%}
-            web_values[{{ web_count.index }}] = val0;
+            web_values.set({{ web_count.index }}, val0);
             {% set web_count.index = web_count.index + 1 %}
-
-            if (web_float_handler) web_float_handler("{{ s.name }}", val0);
             return;
 
             {%- elif s.name.startswith('osc') -%}
-            osc_send_float("{{ s.name }}", val0);
+            #if OSC_ENABLED
+            osc_set(osc_send_slots[{{ osc_count.index }}], val0);  // flushed as a bundle by core 0
+            #endif
+            {% set osc_count.index = osc_count.index + 1 %}
             return;
             {%- endif %}
             break;
     {% endfor %}
     {%- endif %}
 
+    {%- if samples %}
+
+    /* --- Sample banks: [s <table>_sample] picks the sample to load --- */
+    {%- for bank in samples if bank.send %}
+        case {{ bank.send }}U: Pico::samples.request({{ loop.index0 }}, (int)val0); break;
+    {%- endfor %}
+    {%- endif %}
+
     default:
         heavyMidiOutHook(vc, name, hash, m);
         break;
@@ -459,32 +513,56 @@ void sendHookHandler(HeavyContextInterface *vc, const char *name, uint32_t hash,
 osc_hv_float_handler_t osc_hv_handler = nullptr;
 web_float_handler_t web_float_handler = nullptr;
 
+{{ route_table("web_routes", routes.web) }}
+
+{{ route_table("osc_routes", routes.osc) }}
+
+// The lwIP callbacks below run from the cyw43 background IRQ and may preempt
+// the main loop's post_param, so they leave values here for the main loop
+static InboxSlot param_inbox[{{ [params | length, 1] | max }}];
+
 static void web_router(const char *p, float v) {
-    if (!p) return;
-    {% for r in hv_manifest.receives -%}
-    {% if r.name.startswith('web') -%}
-    if (!strcmp(p, "{{ r.name }}")) {
-        hv_sendFloatToReceiver(&pd_prog, {{ r.hash }}, v);
-        return;
-    }
-    {%- endif %}
-    {% endfor %}
+    const RouteEntry* r = route_lookup(web_routes, p);
+    if (r) Pico::post_from_irq(param_inbox[r->value], v);
 }
 
+// /params.cgi indices: [r web…] receivers and [s web…] sends in manifest order
+static const char* const web_param_names[{{ [routes.web_params | length, 1] | max }}] = {
+{%- for p in routes.web_params %}
+    "{{ p.name }}"{{ "," if not loop.last }}
+{%- else %}
+    nullptr
+{%- endfor %}
+};
+static const uint16_t web_param_slots[{{ [routes.web_params | length, 1] | max }}] = { {{ routes.web_params | map(attribute="slot") | join(", ") or "0" }} };
+
+static const char* const web_value_names[{{ [routes.web_values | length, 1] | max }}] = {
+{%- for name in routes.web_values %}
+    "{{ name }}"{{ "," if not loop.last }}
+{%- else %}
+    nullptr
+{%- endfor %}
+};
+
+static void web_param_router(int index, float v) {
+    Pico::post_from_irq(param_inbox[web_param_slots[index]], v);
+}
+
+const picoparams::Manifest web_manifest = {
+    web_param_names, {{ routes.web_params | length }},
+    web_value_names, {{ routes.web_values | length }},
+    web_param_router
+};
+
 static void hv_osc_router(const char *a, float v) {
-    if (!a) return;
-    {% for r in hv_manifest.receives -%}
-    {% if r.name.startswith('osc') -%}
-    if (!strcmp(a, "/{{ r.name }}")) hv_sendFloatToReceiver(&pd_prog, {{ r.hash }}, v);
-    {%- endif %}
-    {% endfor %}
+    const RouteEntry* r = route_lookup(osc_routes, a);
+    if (r) Pico::post_from_irq(param_inbox[r->value], v);
 }
 {%- endif %}
 
 
 {%- if board.console %}
 #define NUM_PRINT_NAMES {{ hv_manifest.prints|length }}
-PrintMsg print_pool[PRINT_POOL_SIZE];
 
 static const char* printNames[NUM_PRINT_NAMES] = {
 {% for p in hv_manifest.prints -%}
@@ -493,67 +571,182 @@ static const char* printNames[NUM_PRINT_NAMES] = {
 };
 
 
+{{ route_table("print_routes", routes.print) }}
+
 static int16_t get_print_id(const char *name) {
-    if (!name || name[0] == '\0') return -1; 
-    for (uint16_t i = 0; i < NUM_PRINT_NAMES; i++) {
-        if (strcmp(name, printNames[i]) == 0) return (int16_t)i;
-    }
-    return -1;
+    const RouteEntry* r = route_lookup(print_routes, name);
+    return r ? (int16_t)r->value : -1;
 }
 
 
+// Core 1, inside Heavy's process call: store the value, core 0 formats or streams it
 void hv_print_handler(HeavyContextInterface* context,
                       const char* printName,
                       const char* str,
                       const HvMessage* msg)
 {
-    static uint32_t last_print_ms = 0;
-    uint32_t now = to_ms_since_boot(get_absolute_time());
+    (void)context; (void)str;
+    const int16_t id = get_print_id(printName);
+    Pico::telemetry.push(time_us_32(),
+                         id >= 0 ? (uint16_t)id : TELEMETRY_NO_ID,
+                         msg ? hv_msg_getFloat(msg, 0) : 0.0f);
+}
 
-    if (now - last_print_ms < 10) {
-        return;
-    }
 
-    int slot = -1;
+// Core 0: hand [print] records to the USB console and the display
+static void telemetry_task() {
+    constexpr int MAX_RECORDS_PER_CALL = 32;
+
+    for (int i = 0; i < MAX_RECORDS_PER_CALL; i++) {
+        const TelemetryRecord* r = Pico::telemetry.peek();
+        if (!r) break;
+
+        #if !defined(MIDI_HOST) && (!defined(WEB_ENABLED) || (WEB_ENABLED == 0)) && ENABLE_DEBUG
+        if (debug_enabled && tud_cdc_connected()) {
+            #if TELEMETRY_BINARY
+            // whole frames only, the rest stays in the ring until the host reads
+            uint8_t frame[TELEMETRY_FRAME_BYTES];
+            if (tud_cdc_write_available() < sizeof(frame)) break;
+            Pico::Telemetry::frame(*r, frame);
+            tud_cdc_write(frame, sizeof(frame));
+            #else
+            // integer formatting, libc float printf is not safe here
+            int v = (int)(r->value * 1000.0f);
+            const char* sign = (v < 0) ? "-" : "";
+            if (v < 0) v = -v;
+            printf("%s%d.%03d\r\n", sign, v / 1000, v % 1000);
+            #endif
+        }
+        #endif
 
-    for (int i = 0; i < PRINT_POOL_SIZE; i++) {
-        bool expected = false;
+        {%- if board.display.enabled %}
 
-        if (print_pool[i].busy.compare_exchange_strong(
-                expected, true,
-                std::memory_order_acq_rel))
-        {
-            slot = i;
-            break;
+        // Check if this message ID matches one of our 4 quadrant hashes
+        bool is_dashboard_item = false;
+        for (int slot = 0; slot < 4; slot++) {
+            if (r->id == screen_slots[slot]) {
+                Pico::Screen::update_focus(slot, r->value);
+                is_dashboard_item = true;
+                break;
+            }
+        }
+
+        // If it's NOT a quadrant item, treat it as a general console popup
+        if (!is_dashboard_item) {
+            Pico::Screen::update_focus(r->id, r->value);
         }
+        {%- endif %}
+
+        Pico::telemetry.pop();
     }
 
-    if (slot < 0) {
-        return;
+    #if !defined(MIDI_HOST) && (!defined(WEB_ENABLED) || (WEB_ENABLED == 0)) && ENABLE_DEBUG && TELEMETRY_BINARY
+    tud_cdc_write_flush();
+    #endif
+}
+{% endif %}
+
+
+static void deliver(HeavyContextInterface* ctx, const ControlEvent& e) {
+    {%- if board.sample_accurate %}
+    // played one block after arrival, at the same offset into the block
+    const float delay = Pico::event_clock.delay_ms(e);
+    {%- else %}
+    const float delay = 0.0f;
+    {%- endif %}
+    switch (e.argc) {
+        case 1:  hv_sendMessageToReceiverV(ctx, e.hash, delay, "f", e.args[0]); break;
+        case 2:  hv_sendMessageToReceiverV(ctx, e.hash, delay, "ff", e.args[0], e.args[1]); break;
+        default: hv_sendMessageToReceiverV(ctx, e.hash, delay, "fff", e.args[0], e.args[1], e.args[2]); break;
     }
+}
 
-    PrintMsg &m = print_pool[slot];
+static void send_param(uint32_t hash, float v) {
+    hv_sendFloatToReceiver(&pd_prog, hash, v);
+    {%- if dual %}
+    voice_core.forward({ hash, 1, EVENT_TARGET_ALL, { v, 0.0f, 0.0f }, EVENT_UNTIMED });
+    {%- endif %}
+}
 
-    int id = get_print_id(printName);
+static void send_event(const ControlEvent& e) {
+    {%- if dual %}
+    if (e.target != 1) deliver(&pd_prog, e);
+    if (e.target != 0) voice_core.forward(e);
+    {%- else %}
+    deliver(&pd_prog, e);
+    {%- endif %}
+}
 
-    m.id       = id;
-    m.val      = msg ? hv_msg_getFloat(msg, 0) : 0.0f;
-    m.is_float = (msg != nullptr);
+{% if samples -%}
+static float* sample_table(HeavyContextInterface* ctx, const SampleBank& bank, uint32_t& length) {
+    const uint32_t hash = bank.table_hash ? bank.table_hash : hv_stringToHash(bank.table);
+    length = hv_table_getLength(ctx, hash);
+    return length ? hv_table_getBuffer(ctx, hash) : nullptr;
+}
 
-    std::atomic_thread_fence(std::memory_order_release);
+static float* core1_table(const SampleBank& bank, uint32_t& length) {
+    return sample_table(&pd_prog, bank, length);
+}
 
-    if (!multicore_fifo_push_timeout_us(slot, 50)) {
-        m.busy.store(false, std::memory_order_release);
-        return;
+{% if dual -%}
+// Core 0's instance loads its own tables, requested by its own [s <table>_sample]
+static Pico::SampleStreamer core0_samples;
+
+static float* core0_table(const SampleBank& bank, uint32_t& length) {
+    return sample_table(&pd_core0, bank, length);
+}
+
+{% endif -%}
+{% endif -%}
+{% if dual -%}
+// Outputs (LEDs, MIDI out, web, prints) come from the core 1 instance only;
+// core 0's instance runs the same patch, so its sends would be duplicates.
+static void core0SendHook(HeavyContextInterface*, const char*, uint32_t hash, const HvMessage* m) {
+    {%- if samples %}
+    if (hv_msg_getNumElements(m) < 1) return;
+    switch (hash) {
+    {%- for bank in samples if bank.send %}
+        case {{ bank.send }}U: core0_samples.request({{ loop.index0 }}, (int)hv_msg_getFloat(m, 0)); break;
+    {%- endfor %}
+        default: break;
     }
+    {%- else %}
+    (void)hash; (void)m;
+    {%- endif %}
+}
 
-    last_print_ms = now;
+static void core0_render(float* buffer, int frames) {
+    {%- if samples %}
+    core0_samples.service(core0_table);
+    {%- endif %}
+    pd_core0.processInlineInterleaved(buffer, buffer, frames);
+}
+
+static void core0_deliver(const ControlEvent& e) {
+    deliver(&pd_core0, e);
 }
-{% endif %}
 
+// Called between the core 0 tasks, so a slow one delays the voices as little as possible
+static inline void core0_voices() {
+    voice_core.poll(core0_deliver, core0_render);
+}
 
+{% endif -%}
 void audioFunc(float* buffer, int frames) {
+    {%- if board.sample_accurate %}
+    Pico::event_clock.start_block(time_us_32(), frames);
+    {%- endif %}
+    Pico::drain_events(param_slots, NUM_PARAM_SLOTS, send_param, send_event);
+    {%- if dual %}
+    voice_core.start(frames);
+    {%- endif %}
+    {%- if samples %}
+    Pico::samples.service(core1_table);
+    {%- endif %}
     pd_prog.processInlineInterleaved(buffer, buffer, frames);
+    {%- if dual %}
+    voice_core.finish(buffer, frames * pd_prog.getNumOutputChannels());
+    {%- endif %}
 }
 
 
@@ -588,6 +781,11 @@ int main() {
         {% if board.web.enabled %}
     // Web Mode: Initialize full WiFi stack
     init_wifi();
+    #if OSC_ENABLED
+    {%- for s in hv_manifest.sends if s.name.startswith('osc') %}
+    osc_send_slots[{{ loop.index0 }}] = osc_register("{{ s.name }}");
+    {%- endfor %}
+    #endif
         {% else %}
     // Standard Mode: Basic wireless initialization (for LED/system)
     cyw43_arch_init();
@@ -714,6 +912,22 @@ int main() {
     Pico::addDistanceSensor({{ d.trig }}, {{ d.echo }});
     {%- endfor %}
 
+    {%- if samples %}
+    Pico::samples.load_all(core1_table);
+    {%- if dual %}
+    core0_samples.load_all(core0_table);
+    {%- endif %}
+    {%- endif %}
+
+    {%- if dual %}
+    // core 1 waits at most half a block for core 0's voices
+    pd_core0.setSendHook(&core0SendHook);
+    voice_core.begin({{ (board.buffer_size * 500000 // board.sample_rate) | int }});
+    {%- endif %}
+    {%- if board.sample_accurate %}
+    Pico::event_clock.begin({{ board.sample_rate }});
+    {%- endif %}
+
     multicore_launch_core1(Pico::core1_audio_entry);
 
     float val, v; 
@@ -727,47 +941,126 @@ int main() {
     {%- endif %}
 
     while (true) {
+        {%- if dual %}
+        core0_voices();
+        {%- endif %}
 
         {% if board.web.enabled -%}
         web_poll(); 
+        Pico::post_inbox(param_inbox, param_slots, {{ [params | length, 1] | max }});
+        {%- if dual %}
+        core0_voices();
+        {%- endif %}
         {%- endif %}
 
         uint32_t now = to_ms_since_boot(get_absolute_time()); 
 
         midi_task();
+        {%- if dual %}
+        core0_voices();
+        {%- endif %}
         
+        {%- if board.console %}
+        telemetry_task();
+        {%- endif %}
+
         #if !defined(MIDI_HOST) && ENABLE_DEBUG
-            print_queue(printNames, NUM_PRINT_NAMES, debug_enabled);
+            if (debug_enabled && now - last_print_tick >= 5000) {
+                static uint32_t last_sent = 0;
+                uint32_t sent = Pico::event_stats.sent.load(std::memory_order_relaxed);
+                if (sent != last_sent) {
+                    printf("[events] sent %lu | delivered %lu | coalesced %lu | dropped %lu\n",
+                           (unsigned long)sent,
+                           (unsigned long)Pico::event_stats.delivered.load(std::memory_order_relaxed),
+                           (unsigned long)Pico::event_stats.coalesced.load(std::memory_order_relaxed),
+                           (unsigned long)Pico::event_stats.dropped.load(std::memory_order_relaxed));
+                    last_sent = sent;
+                }
+                {%- if board.console %}
+                static uint32_t last_written = 0;
+                uint32_t written = Pico::telemetry.stats.written.load(std::memory_order_relaxed);
+                if (written != last_written) {
+                    printf("[telemetry] records %lu | dropped %lu\n",
+                           (unsigned long)written,
+                           (unsigned long)Pico::telemetry.stats.dropped.load(std::memory_order_relaxed));
+                    last_written = written;
+                }
+                {%- endif %}
+                {%- if board.web.enabled %}
+                #if OSC_ENABLED
+                static uint32_t last_osc = 0;
+                uint32_t osc_total = osc_out.stats.messages.load(std::memory_order_relaxed) +
+                                     osc_out.stats.received.load(std::memory_order_relaxed);
+                if (osc_total != last_osc) {
+                    printf("[osc] bundles %lu | sent %lu | coalesced %lu | dropped %lu | received %lu\n",
+                           (unsigned long)osc_out.stats.packets.load(std::memory_order_relaxed),
+                           (unsigned long)osc_out.stats.messages.load(std::memory_order_relaxed),
+                           (unsigned long)osc_out.stats.coalesced.load(std::memory_order_relaxed),
+                           (unsigned long)osc_out.stats.dropped.load(std::memory_order_relaxed),
+                           (unsigned long)osc_out.stats.received.load(std::memory_order_relaxed));
+                    last_osc = osc_total;
+                }
+                #endif
+                {%- endif %}
+                {%- if dual %}
+                printf("[voices] core 0 blocks %lu | missed %lu | dropped %lu\n",
+                       (unsigned long)voice_core.stats.blocks.load(std::memory_order_relaxed),
+                       (unsigned long)voice_core.stats.missed.load(std::memory_order_relaxed),
+                       (unsigned long)voice_core.stats.dropped.load(std::memory_order_relaxed));
+                {%- endif %}
+                last_print_tick = now;
+            }
         #else
+            {%- if dual %}
+            // core 1 sends an event with every block, which ends the wait early
+            if (!voice_core.poll(core0_deliver, core0_render)) {
+                best_effort_wfe_or_timeout(make_timeout_time_ms(1));
+            }
+            {%- else %}
             best_effort_wfe_or_timeout(make_timeout_time_ms(1));
+            {%- endif %}
         #endif
 
-        {% if board.display.enabled -%}
-            for (int i = 0; i < PRINT_POOL_SIZE; ++i) {
-                if (print_pool[i].busy.load(std::memory_order_acquire)) {
-                    
-                    uint32_t msg_id = print_pool[i].id; 
-                    float msg_val = print_pool[i].val;
-                    bool is_dashboard_item = false;
-
-                    // Check if this message ID matches one of our 4 quadrant hashes
-                    for (int slot = 0; slot < 4; slot++) {
-                        if (msg_id == screen_slots[slot]) {
-                            Pico::Screen::update_focus(slot, msg_val);
-                            is_dashboard_item = true;
-                            break;
-                        }
-                    }
+        {% if board.profile -%}
+        // ---- Audio profile ----
 
-                    // If it's NOT a quadrant item, treat it as a general console popup
-                    if (!is_dashboard_item) {
-                        Pico::Screen::update_focus(msg_id, msg_val); 
-                    }
+        if (Pico::Profiler::read(profile_snap)) {
+            const float pct = 100.0f / profile_snap.budget_us;
+            char line[128];
 
-                    print_pool[i].busy.store(false, std::memory_order_release);
-                }
+            #if ENABLE_DEBUG
+            if (debug_enabled) {
+                Pico::Profiler::format(profile_snap, line, sizeof(line));
+                printf("[audio] %s\n", line);
             }
+            #endif
+
+            {%- if board.web.enabled %}
+            #if OSC_ENABLED
+            osc_send_float("pikopd/profile/load", profile_snap.avg_us[Pico::PROFILE_BLOCK] * pct);
+            osc_send_float("pikopd/profile/p99", profile_snap.p99_us[Pico::PROFILE_BLOCK] * pct);
+            osc_send_float("pikopd/profile/max", profile_snap.max_us[Pico::PROFILE_BLOCK] * pct);
+            osc_send_float("pikopd/profile/late", (float)profile_snap.late_total);
+            osc_send_float("pikopd/profile/over", (float)profile_snap.over_total);
+            #endif
+            {%- endif %}
+
+            {%- if board.display.enabled %}
+            snprintf(line, sizeof(line), "DSP %.0f%% max %.0f%% x%lu",
+                     profile_snap.avg_us[Pico::PROFILE_BLOCK] * pct,
+                     profile_snap.max_us[Pico::PROFILE_BLOCK] * pct,
+                     (unsigned long)(profile_snap.late_total + profile_snap.over_total));
+            Pico::Screen::set_status(line);
+            {%- endif %}
+            (void)pct; (void)line;
+        }
+        {%- endif %}
+
+        {% if board.display.enabled -%}
             Pico::Screen::process(now, printNames, NUM_PRINT_NAMES);
+            {%- if dual %}
+            core0_voices();
+            {%- endif %}
             {%- endif %}
 
         if (now - last_led_tick >= 20) {
@@ -827,25 +1120,25 @@ int main() {
 // ---- Buttons & Gates ----
 
             Pico::processPin({{ loop.index0 }}, val, send); 
-            if (send) hv_send_float_lock(&pd_prog, {{ btn.hash }}, val);
+            if (send) Pico::post_event({{ btn.hash }}, 1, val);
             {%- endfor %}
 
             {%- for gate in active_gates %}
             Pico::processPin({{ active_btns|length + loop.index0 }}, val, send);
-            if (send) hv_send_float_lock(&pd_prog, {{ gate.hash }}, val);
+            if (send) Pico::post_event({{ gate.hash }}, 1, val);
             {%- endfor %}
     
             {%- for knob in active_knobs %}
 
 // ---- Knobs  ----
 
-            if (Pico::processKnob({{ loop.index0 }}, v)) hv_send_float_lock(&pd_prog, {{ knob.hash }}, v);
+            if (Pico::processKnob({{ loop.index0 }}, v)) Pico::post_param(param_slots[{{ knob.slot }}], v);
             {%- endfor %}
             {%- for enc in active_encoders %}
 
 // ---- Encoder ----
 
-            if (Pico::processEnc({{ loop.index0 }}, v)) hv_send_float_lock(&pd_prog, {{ enc.hash }}, v);
+            if (Pico::processEnc({{ loop.index0 }}, v)) Pico::post_event({{ enc.hash }}, 1, v);
             {%- endfor %}
             {%- for joy in active_joystick %}
 
@@ -855,8 +1148,8 @@ int main() {
                 float vx = 0.0f, vy = 0.0f;
                 bool cX = false, cY = false;
                 if (Pico::processJoystick({{ joy.id }}, vx, vy, cX, cY, {{ 'true' if joy.midi_range else 'false' }})) {
-                    if (cX) hv_send_float_lock(&pd_prog, {{ joy.hash_x }}, vx);
-                    if (cY) hv_send_float_lock(&pd_prog, {{ joy.hash_y }}, vy);
+                    if (cX) Pico::post_param(param_slots[{{ joy.slot_x }}], vx);
+                    if (cY) Pico::post_param(param_slots[{{ joy.slot_y }}], vy);
                 }
             }
             {%- endfor %}
@@ -868,7 +1161,7 @@ int main() {
                 float sensor_out = 0.0f; 
                 float raw_val = 0.0f; 
                 if (Pico::processCNY70({{ loop.index0 }}, sensor_out, raw_val)) {
-                    hv_send_float_lock(&pd_prog, {{ cny.hash }}, sensor_out);
+                    Pico::post_param(param_slots[{{ cny.slot }}], sensor_out);
                 //  printf("Sensor %d | Raw: %.1f | Norm: %.3f\n", {{ loop.index0 }}, raw_val, sensor_out);
                 }
             }
@@ -879,7 +1172,7 @@ int main() {
            {%- for d in active_dist %}
             if (Pico::dist_sensor.changed()) {
                 float dist_cm = Pico::dist_sensor.getDistance(); 
-                hv_send_float_lock(&pd_prog, {{ d.hash }}, dist_cm);
+                Pico::post_param(param_slots[{{ d.slot }}], dist_cm);
              // printf("[Distance] %s | Val: %.2f cm\n", "distance", dist_cm);
             }
             {%- endfor %}
@@ -905,7 +1198,7 @@ int main() {
                         bool isTouched = (touched >> pad.pad_idx) & 0x01;
                         bool wasTouched = (last_touched_state[i] >> pad.pad_idx) & 0x01;
                         if (isTouched != wasTouched) {
-                            hv_send_float_lock(&pd_prog, pad.hash, isTouched ? 1.0f : 0.0f);
+                            Pico::post_event(pad.hash, 1, isTouched ? 1.0f : 0.0f);
                         }
                     }
                 }
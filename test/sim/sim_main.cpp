@@ -0,0 +1,187 @@
+/* pikoPD firmware-in-the-loop simulator
+
+Built by pikopd.py --simulate together with the generated main.cpp (its
+main() renamed to pikopd_firmware_main), the patch and the SDK stubs in
+stubs/. Runs the firmware on host threads, replays a control stream into it
+in real time and finds where each event first changes the audio the DAC
+played. Not part of the firmware.
+
+Usage: sim <replay.txt> <seconds> <out.wav>
+
+Replay lines, times in ms after the first played buffer:
+    <time_ms> midi <hex byte> [<hex byte> ...]
+    <time_ms> adc <input 0-4> <value 0..1>
+    <time_ms> gpio <pin> <0|1>
+
+*/
+
+#undef main
+
+#include "pico_sim.h"
+
+#include <math.h>
+#include <unistd.h>
+#include <algorithm>
+#include <chrono>
+#include <string>
+#include <thread>
+#include <vector>
+
+int pikopd_firmware_main();
+
+struct ReplayEvent {
+    double time_ms;
+    std::string kind;
+    std::vector<uint8_t> bytes;
+    unsigned index;
+    float value;
+};
+
+static bool load_replay(const char* path, std::vector<ReplayEvent>& events) {
+    FILE* f = fopen(path, "r");
+    if (!f) return false;
+    char line[512];
+    while (fgets(line, sizeof(line), f)) {
+        ReplayEvent e = {};
+        char kind[16];
+        int used = 0;
+        if (line[0] == '#' || sscanf(line, "%lf %15s%n", &e.time_ms, kind, &used) != 2) continue;
+        e.kind = kind;
+        const char* args = line + used;
+        if (e.kind == "midi") {
+            unsigned byte;
+            int n;
+            while (sscanf(args, "%x%n", &byte, &n) == 1) {
+                e.bytes.push_back((uint8_t)byte);
+                args += n;
+            }
+        } else if (sscanf(args, "%u %f", &e.index, &e.value) != 2) {
+            continue;
+        }
+        events.push_back(e);
+    }
+    fclose(f);
+    return true;
+}
+
+// Smallest mean |x[n] - x[n - lag]| over the window: the signal's period, 0 if silent
+static int find_period(const std::vector<float>& x, size_t from, size_t to) {
+    float energy = 0.0f;
+    for (size_t n = from; n < to; n++) energy += fabsf(x[n]);
+    if (energy == 0.0f) return 0;
+
+    const size_t half = (to - from) / 2;
+    int best = 0;
+    float best_diff = INFINITY;
+    for (size_t lag = 16; lag <= half; lag++) {
+        float diff = 0.0f;
+        for (size_t n = to - half; n < to; n++) diff += fabsf(x[n] - x[n - lag]);
+        if (diff < best_diff) {
+            best_diff = diff;
+            best = (int)lag;
+        }
+    }
+    return best;
+}
+
+// First frame from `start` on that no longer continues the signal before it:
+// a sample that differs from one period earlier by more than the signal did
+// in the window before the event. Silence counts as period 0.
+static long find_onset(const std::vector<float>& x, size_t start, size_t end, size_t window) {
+    constexpr float MIN_THRESHOLD = 32.0f;  // LSB, about -60 dBFS
+    const size_t from = start > window ? start - window : 0;
+    const int period = (start - from > 64) ? find_period(x, from, start) : 0;
+
+    auto residual = [&](size_t n) {
+        return period ? fabsf(x[n] - x[n - period]) : fabsf(x[n]);
+    };
+
+    float baseline = 0.0f;
+    for (size_t n = from + (start - from) / 2; n < start; n++) {
+        if ((size_t)period <= n) baseline = fmaxf(baseline, residual(n));
+    }
+    const float threshold = 2.0f * baseline + MIN_THRESHOLD;
+
+    for (size_t n = start; n < end; n++) {
+        if (residual(n) > threshold) return (long)n;
+    }
+    return -1;
+}
+
+static void write_wav(const char* path, const int16_t* samples, size_t frames, int channels, int rate) {
+    FILE* f = fopen(path, "wb");
+    if (!f) return;
+    const uint32_t data = (uint32_t)(frames * channels * 2);
+    const uint32_t riff = 36 + data, fmt_size = 16, byte_rate = rate * channels * 2;
+    const uint16_t pcm = 1, ch = channels, align = channels * 2, bits = 16;
+    fwrite("RIFF", 1, 4, f); fwrite(&riff, 4, 1, f); fwrite("WAVEfmt ", 1, 8, f);
+    fwrite(&fmt_size, 4, 1, f); fwrite(&pcm, 2, 1, f); fwrite(&ch, 2, 1, f);
+    fwrite(&rate, 4, 1, f); fwrite(&byte_rate, 4, 1, f); fwrite(&align, 2, 1, f); fwrite(&bits, 2, 1, f);
+    fwrite("data", 1, 4, f); fwrite(&data, 4, 1, f);
+    fwrite(samples, 2, frames * channels, f);
+    fclose(f);
+}
+
+int main(int argc, char** argv) {
+    if (argc < 4) {
+        fprintf(stderr, "usage: %s <replay.txt> <seconds> <out.wav>\n", argv[0]);
+        return 1;
+    }
+    std::vector<ReplayEvent> events;
+    if (!load_replay(argv[1], events)) {
+        fprintf(stderr, "cannot read %s\n", argv[1]);
+        return 1;
+    }
+    const double seconds = atof(argv[2]);
+
+    // core 0 runs the firmware's main(), which launches core 1
+    std::thread(pikopd_firmware_main).detach();
+    sim::wait_for_audio();
+
+    const int rate = sim::sample_rate();
+    const auto t0 = std::chrono::steady_clock::now();
+    const double start_frame = sim::play_position();
+    std::vector<double> injected(events.size());
+
+    for (size_t i = 0; i < events.size(); i++) {
+        const ReplayEvent& e = events[i];
+        std::this_thread::sleep_until(t0 + std::chrono::microseconds((int64_t)(e.time_ms * 1000.0)));
+        if (e.kind == "midi") sim::midi_in(e.bytes.data(), e.bytes.size());
+        else if (e.kind == "adc") sim::set_adc(e.index, e.value);
+        else if (e.kind == "gpio") sim::set_gpio(e.index, e.value > 0.5f);
+        injected[i] = sim::play_position();
+    }
+    std::this_thread::sleep_until(t0 + std::chrono::microseconds((int64_t)(seconds * 1e6)));
+
+    size_t frames = 0;
+    const int16_t* out = sim::stop(frames);
+    const int channels = sim::channels();
+
+    std::vector<float> mono(frames);
+    for (size_t n = 0; n < frames; n++) {
+        float sum = 0.0f;
+        for (int c = 0; c < channels; c++) sum += out[n * channels + c];
+        mono[n] = sum / channels;
+    }
+
+    // An event can only be seen before the next one is sent
+    const size_t window = (size_t)rate / 20;
+    const size_t max_search = (size_t)rate / 2;
+    printf("{\"sample_rate\": %d, \"buffer_size\": %d, \"start_frame\": %.1f, \"blocks\": %u, \"underruns\": %u, \"latency_ms\": [",
+           rate, sim::buffer_size(), start_frame, sim::blocks(), sim::underruns());
+    for (size_t i = 0; i < events.size(); i++) {
+        const size_t start = (size_t)ceil(injected[i]);
+        size_t end = i + 1 < events.size() ? (size_t)injected[i + 1] : frames;
+        end = std::min(std::min(end, start + max_search), frames);
+        const long onset = start < end ? find_onset(mono, start, end, window) : -1;
+        if (onset < 0) printf("%snull", i ? ", " : "");
+        else printf("%s%.3f", i ? ", " : "", (onset - injected[i]) * 1000.0 / rate);
+    }
+    printf("]}\n");
+    fflush(stdout);
+
+    write_wav(argv[3], out, frames, channels, rate);
+
+    // core 0, core 1 and the DAC never return
+    _exit(0);
+}
@@ -0,0 +1,408 @@
+// Host implementation of the SDK stubs in stubs/pico_sim.h, see there.
+
+#include "pico_sim.h"
+
+#include <atomic>
+#include <chrono>
+#include <condition_variable>
+#include <deque>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+extern "C" void tud_midi_rx_cb(uint8_t itf);
+
+namespace {
+
+    using Clock = std::chrono::steady_clock;
+    const Clock::time_point boot = Clock::now();
+
+    // ---- core 0 sleep / wake ----
+
+    std::mutex wake_mutex;
+    std::condition_variable wake_cv;
+    bool wake_pending = false;
+
+    // ---- pins ----
+
+    std::atomic<uint32_t> gpio_levels{0};
+    std::atomic<uint16_t> adc_values[5];
+    thread_local uint adc_input = 0;
+
+    // ---- MIDI in ----
+
+    std::mutex midi_mutex;
+    std::deque<uint8_t> uart_rx;
+    std::deque<uint32_t> usb_rx;  // USB-MIDI packets, byte 0 in the low bits
+    irq_handler_t uart_handler = nullptr;
+    uint8_t running_status = 0;
+    uint8_t message[3];
+    int message_len = 0;
+
+    // ---- audio ----
+
+    struct Pool {
+        std::vector<audio_buffer_t> buffers;
+        std::vector<mem_buffer_t> mem;
+        std::vector<std::vector<uint8_t>> bytes;
+        std::deque<audio_buffer_t*> free_list;
+        std::deque<audio_buffer_t*> filled;
+        audio_buffer_format_t format;
+        audio_format_t audio_format;
+    };
+
+    Pool pool;
+    std::mutex audio_mutex;
+    std::condition_variable audio_cv;
+    audio_format_t i2s_format = {};
+    int frames_per_buffer = 0;
+
+    Clock::time_point dac_start;
+    std::atomic<bool> dac_started{false};
+    std::mutex record_mutex;
+    bool recording = true;
+    std::atomic<bool> first_buffer{false};
+    std::atomic<uint32_t> dac_underruns{0};
+    std::atomic<uint32_t> dac_blocks{0};
+    std::vector<int16_t> recorded;
+    bool manual_dac = false;         // sim::step_dac() plays the periods, no DAC thread
+    std::atomic<uint64_t> dac_periods{0};
+    audio_buffer_t* playing = nullptr;
+    std::vector<int16_t> silence;
+
+    // One block period: hand back the buffer that finished, start the next one
+    void dac_period() {
+        const int ch = i2s_format.channel_count;
+        if (silence.size() != (size_t)(frames_per_buffer * ch)) silence.assign(frames_per_buffer * ch, 0);
+        audio_buffer_t* next = nullptr;
+        {
+            std::lock_guard<std::mutex> lock(audio_mutex);
+            // the buffer that just finished playing goes back to the producer
+            if (playing) pool.free_list.push_back(playing);
+            if (!pool.filled.empty()) {
+                next = pool.filled.front();
+                pool.filled.pop_front();
+            }
+        }
+        audio_cv.notify_all();
+        playing = next;
+        dac_periods.fetch_add(1, std::memory_order_relaxed);
+
+        if (next) {
+            first_buffer.store(true, std::memory_order_release);
+            dac_blocks.fetch_add(1, std::memory_order_relaxed);
+        } else if (first_buffer.load(std::memory_order_relaxed)) {
+            dac_underruns.fetch_add(1, std::memory_order_relaxed);
+        }
+
+        std::lock_guard<std::mutex> lock(record_mutex);
+        if (recording) {
+            const int16_t* samples = next ? (const int16_t*)next->buffer->bytes : silence.data();
+            recorded.insert(recorded.end(), samples, samples + frames_per_buffer * ch);
+        }
+    }
+
+    void dac_thread() {
+        const auto period = std::chrono::duration_cast<Clock::duration>(
+            std::chrono::duration<double>((double)frames_per_buffer / i2s_format.sample_freq));
+        for (uint64_t k = 0;; k++) {
+            std::this_thread::sleep_until(dac_start + period * k);
+            dac_period();
+        }
+    }
+
+    void queue_usb_message(const uint8_t* m, int len) {
+        const uint8_t cin = (m[0] >= 0xF8) ? 0x0F : (m[0] >> 4);
+        usb_rx.push_back(cin | (m[0] << 8) | ((len > 1 ? m[1] : 0) << 16) | ((len > 2 ? m[2] : 0) << 24));
+    }
+
+    int message_length(uint8_t status) {
+        const uint8_t type = status & 0xF0;
+        if (type == 0xC0 || type == 0xD0) return 2;
+        return 3;
+    }
+}
+
+// ---- time ----
+
+uint64_t time_us_64() {
+    std::this_thread::yield();
+    return std::chrono::duration_cast<std::chrono::microseconds>(Clock::now() - boot).count();
+}
+
+uint32_t time_us_32() { return (uint32_t)time_us_64(); }
+absolute_time_t get_absolute_time() { return time_us_64(); }
+uint32_t to_ms_since_boot(absolute_time_t t) { return (uint32_t)(t / 1000); }
+absolute_time_t make_timeout_time_ms(uint32_t ms) { return time_us_64() + (uint64_t)ms * 1000; }
+
+bool best_effort_wfe_or_timeout(absolute_time_t timeout) {
+    std::unique_lock<std::mutex> lock(wake_mutex);
+    const auto deadline = boot + std::chrono::microseconds(timeout);
+    const bool woken = wake_cv.wait_until(lock, deadline, [] { return wake_pending; });
+    wake_pending = false;
+    return !woken;
+}
+
+void sleep_ms(uint32_t ms) { std::this_thread::sleep_for(std::chrono::milliseconds(ms)); }
+void sleep_us(uint64_t us) { std::this_thread::sleep_for(std::chrono::microseconds(us)); }
+void busy_wait_us(uint64_t us) { sleep_us(us); }
+void tight_loop_contents() {}
+
+void __sev() {
+    {
+        std::lock_guard<std::mutex> lock(wake_mutex);
+        wake_pending = true;
+    }
+    wake_cv.notify_all();
+}
+
+void __wfe() { best_effort_wfe_or_timeout(time_us_64() + 1000); }
+
+// ---- clocks, stdio ----
+
+bool set_sys_clock_khz(uint32_t, bool) { return true; }
+uint32_t clock_get_hz(enum clock_index) { return 150000000; }
+bool stdio_init_all() { return true; }
+
+// ---- GPIO / ADC ----
+
+void gpio_init(uint) {}
+void gpio_set_dir(uint, bool) {}
+
+void gpio_put(uint pin, bool value) {
+    if (value) gpio_levels.fetch_or(1u << pin);
+    else gpio_levels.fetch_and(~(1u << pin));
+}
+
+bool gpio_get(uint pin) { return (gpio_levels.load() >> pin) & 1u; }
+uint32_t gpio_get_all() { return gpio_levels.load(); }
+void gpio_pull_up(uint pin) { gpio_put(pin, true); }
+void gpio_pull_down(uint pin) { gpio_put(pin, false); }
+void gpio_set_function(uint, enum gpio_function) {}
+
+void adc_init() {}
+void adc_gpio_init(uint) {}
+void adc_select_input(uint input) { adc_input = input; }
+uint16_t adc_read() { return adc_input < 5 ? adc_values[adc_input].load() : 0; }
+
+// ---- PWM / DMA ----
+
+static pwm_hw_t pwm_regs;
+pwm_hw_t* pwm_hw = &pwm_regs;
+
+uint pwm_gpio_to_slice_num(uint pin) { return (pin >> 1) & 7u; }
+uint pwm_gpio_to_channel(uint pin) { return pin & 1u; }
+void pwm_set_wrap(uint, uint16_t) {}
+void pwm_set_enabled(uint, bool) {}
+void pwm_set_chan_level(uint, uint, uint16_t) {}
+uint pwm_get_dreq(uint slice) { return slice; }
+
+dma_channel_config dma_channel_get_default_config(uint) { return { 0 }; }
+void channel_config_set_transfer_data_size(dma_channel_config*, enum dma_channel_transfer_size) {}
+void channel_config_set_read_increment(dma_channel_config*, bool) {}
+void channel_config_set_write_increment(dma_channel_config*, bool) {}
+void channel_config_set_dreq(dma_channel_config*, uint) {}
+void dma_channel_configure(uint, const dma_channel_config*, volatile void*, const volatile void*, uint, bool) {}
+bool dma_channel_is_busy(uint) { return false; }
+void dma_channel_wait_for_finish_blocking(uint) {}
+
+// ---- UART / IRQ / I2C ----
+
+static uart_inst_t uart_insts[2] = { { 0 }, { 1 } };
+uart_inst_t* uart0 = &uart_insts[0];
+uart_inst_t* uart1 = &uart_insts[1];
+static i2c_inst_t i2c_insts[2] = { { 0 }, { 1 } };
+i2c_inst_t* i2c0 = &i2c_insts[0];
+i2c_inst_t* i2c1 = &i2c_insts[1];
+
+uint uart_init(uart_inst_t*, uint baudrate) { return baudrate; }
+void uart_deinit(uart_inst_t*) {}
+void uart_set_format(uart_inst_t*, uint, uint, uart_parity_t) {}
+void uart_set_hw_flow(uart_inst_t*, bool, bool) {}
+void uart_set_fifo_enabled(uart_inst_t*, bool) {}
+void uart_set_irq_enables(uart_inst_t*, bool, bool) {}
+
+// Only called from the handler, which sim::midi_in runs with midi_mutex held
+bool uart_is_readable(uart_inst_t*) { return !uart_rx.empty(); }
+
+char uart_getc(uart_inst_t*) {
+    const char c = (char)uart_rx.front();
+    uart_rx.pop_front();
+    return c;
+}
+
+void uart_write_blocking(uart_inst_t*, const uint8_t*, size_t) {}
+
+void irq_set_exclusive_handler(uint num, irq_handler_t handler) {
+    if (num == UART0_IRQ) uart_handler = handler;
+}
+
+void irq_set_enabled(uint, bool) {}
+uint i2c_init(i2c_inst_t*, uint baudrate) { return baudrate; }
+
+// ---- TinyUSB device ----
+
+bool tusb_init() { return true; }
+
+void tud_task() {
+    bool pending;
+    {
+        std::lock_guard<std::mutex> lock(midi_mutex);
+        pending = !usb_rx.empty();
+    }
+    if (pending) tud_midi_rx_cb(0);
+}
+
+bool tud_midi_mounted() { return false; }
+
+uint32_t tud_midi_available() {
+    std::lock_guard<std::mutex> lock(midi_mutex);
+    return (uint32_t)usb_rx.size() * 4;
+}
+
+bool tud_midi_packet_read(uint8_t packet[4]) {
+    std::lock_guard<std::mutex> lock(midi_mutex);
+    if (usb_rx.empty()) return false;
+    const uint32_t p = usb_rx.front();
+    usb_rx.pop_front();
+    for (int i = 0; i < 4; i++) packet[i] = (uint8_t)(p >> (8 * i));
+    return true;
+}
+
+bool tud_midi_packet_write(const uint8_t[4]) { return true; }
+bool tud_cdc_connected() { return false; }
+uint32_t tud_cdc_write_available() { return 0; }
+uint32_t tud_cdc_write(const void*, uint32_t) { return 0; }
+uint32_t tud_cdc_write_flush() { return 0; }
+
+// ---- multicore ----
+
+void multicore_launch_core1(void (*entry)(void)) {
+    std::thread(entry).detach();
+}
+
+// ---- pico-extras audio ----
+
+audio_buffer_pool_t* audio_new_producer_pool(audio_buffer_format_t* format, int buffer_count, int buffer_sample_count) {
+    std::lock_guard<std::mutex> lock(audio_mutex);
+    pool.audio_format = *format->format;
+    pool.format = { &pool.audio_format, format->sample_stride };
+    pool.buffers.resize(buffer_count);
+    pool.mem.resize(buffer_count);
+    pool.bytes.resize(buffer_count);
+    for (int i = 0; i < buffer_count; i++) {
+        pool.bytes[i].assign((size_t)buffer_sample_count * format->sample_stride, 0);
+        pool.mem[i] = { pool.bytes[i].size(), pool.bytes[i].data() };
+        pool.buffers[i] = { &pool.mem[i], &pool.format, 0, (uint32_t)buffer_sample_count };
+        pool.free_list.push_back(&pool.buffers[i]);
+    }
+    frames_per_buffer = buffer_sample_count;
+    return (audio_buffer_pool_t*)&pool;
+}
+
+const audio_format_t* audio_i2s_setup(const audio_format_t* format, const struct audio_i2s_config*) {
+    i2s_format = *format;
+    return format;
+}
+
+bool audio_i2s_connect(audio_buffer_pool_t*) { return true; }
+
+void audio_i2s_set_enabled(bool enabled) {
+    if (!enabled || dac_started.exchange(true)) return;
+    dac_start = Clock::now();
+    if (!manual_dac) std::thread(dac_thread).detach();
+}
+
+// Non-blocking on the Pico, where core 1 then spins; here the thread sleeps
+// until the DAC frees a buffer or 1 ms passed
+audio_buffer_t* take_audio_buffer(audio_buffer_pool_t*, bool block) {
+    std::unique_lock<std::mutex> lock(audio_mutex);
+    auto ready = [] { return !pool.free_list.empty(); };
+    if (block) audio_cv.wait(lock, ready);
+    else audio_cv.wait_for(lock, std::chrono::milliseconds(1), ready);
+    if (pool.free_list.empty()) return nullptr;
+    audio_buffer_t* b = pool.free_list.front();
+    pool.free_list.pop_front();
+    return b;
+}
+
+void give_audio_buffer(audio_buffer_pool_t*, audio_buffer_t* buffer) {
+    std::lock_guard<std::mutex> lock(audio_mutex);
+    pool.filled.push_back(buffer);
+}
+
+
+// ---- simulation control ----
+
+namespace sim {
+
+    void wait_for_audio() {
+        while (!first_buffer.load(std::memory_order_acquire)) {
+            std::this_thread::sleep_for(std::chrono::milliseconds(1));
+        }
+    }
+
+    int sample_rate() { return (int)i2s_format.sample_freq; }
+    int buffer_size() { return frames_per_buffer; }
+    int channels() { return i2s_format.channel_count; }
+
+    double play_position() {
+        if (manual_dac) return (double)dac_periods.load() * frames_per_buffer;
+        return std::chrono::duration<double>(Clock::now() - dac_start).count() * i2s_format.sample_freq;
+    }
+
+    void midi_in(const uint8_t* bytes, size_t len) {
+        {
+            std::lock_guard<std::mutex> lock(midi_mutex);
+            if (uart_handler) {
+                uart_rx.insert(uart_rx.end(), bytes, bytes + len);
+                uart_handler();  // the RX interrupt, preempting core 0
+            } else {
+                // Cut the byte stream into USB-MIDI packets, like a host driver would
+                for (size_t i = 0; i < len; i++) {
+                    const uint8_t b = bytes[i];
+                    if (b >= 0xF8) {
+                        queue_usb_message(&b, 1);
+                    } else if (b >= 0xF0) {
+                        running_status = 0;  // SysEx and system common are not simulated
+                        message_len = 0;
+                    } else if (b & 0x80) {
+                        running_status = b;
+                        message[0] = b;
+                        message_len = 1;
+                    } else if (running_status) {
+                        if (message_len == 0) message[message_len++] = running_status;
+                        message[message_len++] = b;
+                        if (message_len == message_length(running_status)) {
+                            queue_usb_message(message, message_len);
+                            message_len = 0;
+                        }
+                    }
+                }
+            }
+        }
+        __sev();
+    }
+
+    void set_adc(uint input, float value) {
+        if (input >= 5) return;
+        value = value < 0.0f ? 0.0f : (value > 1.0f ? 1.0f : value);
+        adc_values[input].store((uint16_t)(value * 4095.0f + 0.5f));
+    }
+
+    void set_gpio(uint pin, bool level) { gpio_put(pin, level); }
+
+    const int16_t* stop(size_t& frames) {
+        std::lock_guard<std::mutex> lock(record_mutex);
+        recording = false;
+        frames = recorded.size() / (i2s_format.channel_count ? i2s_format.channel_count : 1);
+        return recorded.data();
+    }
+
+    void manual_clock() { manual_dac = true; }
+
+    void step_dac() { dac_period(); }
+
+    uint32_t underruns() { return dac_underruns.load(); }
+    uint32_t blocks() { return dac_blocks.load(); }
+}
@@ -0,0 +1,4 @@
+#pragma once
+
+// Stub, see pico_sim.h
+#include "pico_sim.h"
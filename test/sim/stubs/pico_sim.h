@@ -0,0 +1,213 @@
+#pragma once
+
+// Host stand-in for the parts of the Pico SDK, pico-extras and TinyUSB that the
+// generated main.cpp uses, so the firmware builds and runs on Linux/macOS for
+// pikopd.py --simulate. Every SDK header under stubs/ includes this one file.
+//
+// The firmware's own code runs unchanged: main() on a "core 0" thread,
+// core1_audio_entry() on a "core 1" thread started by multicore_launch_core1.
+// sim_sdk.cpp adds a DAC thread that plays one audio buffer per block period
+// in real time, like the I2S DMA, and records what it played.
+//
+// Reading the clock yields the host CPU, so firmware loops that spin on the
+// timer (PicoDualCore waiting for core 0) let the other core thread run even
+// when the host has fewer CPUs than the simulation has threads.
+
+#include <stdint.h>
+#include <stddef.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+typedef unsigned int uint;
+typedef uint64_t absolute_time_t;
+
+#define __not_in_flash_func(f) f
+#define __time_critical_func(f) f
+
+// ---- time ----
+
+uint64_t time_us_64();
+uint32_t time_us_32();
+absolute_time_t get_absolute_time();
+uint32_t to_ms_since_boot(absolute_time_t t);
+absolute_time_t make_timeout_time_ms(uint32_t ms);
+bool best_effort_wfe_or_timeout(absolute_time_t timeout);
+void sleep_ms(uint32_t ms);
+void sleep_us(uint64_t us);
+void busy_wait_us(uint64_t us);
+void tight_loop_contents();
+void __sev();
+void __wfe();
+
+// ---- clocks, stdio ----
+
+enum clock_index { clk_gpout0, clk_ref, clk_sys, clk_peri, clk_usb, clk_adc };
+
+bool set_sys_clock_khz(uint32_t khz, bool required);
+uint32_t clock_get_hz(enum clock_index clk);
+bool stdio_init_all();
+
+// ---- GPIO / ADC ----
+
+enum gpio_function {
+    GPIO_FUNC_SPI, GPIO_FUNC_UART, GPIO_FUNC_I2C, GPIO_FUNC_PWM,
+    GPIO_FUNC_SIO, GPIO_FUNC_PIO0, GPIO_FUNC_PIO1, GPIO_FUNC_NULL = 0x1f
+};
+
+#define GPIO_IN  false
+#define GPIO_OUT true
+
+void gpio_init(uint pin);
+void gpio_set_dir(uint pin, bool out);
+void gpio_put(uint pin, bool value);
+bool gpio_get(uint pin);
+uint32_t gpio_get_all();
+void gpio_pull_up(uint pin);
+void gpio_pull_down(uint pin);
+void gpio_set_function(uint pin, enum gpio_function fn);
+
+void adc_init();
+void adc_gpio_init(uint pin);
+void adc_select_input(uint input);
+uint16_t adc_read();
+
+// ---- PWM / DMA / PIO ----
+
+typedef struct { uint32_t csr, div, ctr, cc, top; } pwm_slice_hw_t;
+typedef struct { pwm_slice_hw_t slice[12]; } pwm_hw_t;
+extern pwm_hw_t* pwm_hw;
+
+uint pwm_gpio_to_slice_num(uint pin);
+uint pwm_gpio_to_channel(uint pin);
+void pwm_set_wrap(uint slice, uint16_t wrap);
+void pwm_set_enabled(uint slice, bool enabled);
+void pwm_set_chan_level(uint slice, uint chan, uint16_t level);
+uint pwm_get_dreq(uint slice);
+
+enum dma_channel_transfer_size { DMA_SIZE_8, DMA_SIZE_16, DMA_SIZE_32 };
+typedef struct { uint32_t ctrl; } dma_channel_config;
+
+dma_channel_config dma_channel_get_default_config(uint channel);
+void channel_config_set_transfer_data_size(dma_channel_config* c, enum dma_channel_transfer_size size);
+void channel_config_set_read_increment(dma_channel_config* c, bool incr);
+void channel_config_set_write_increment(dma_channel_config* c, bool incr);
+void channel_config_set_dreq(dma_channel_config* c, uint dreq);
+void dma_channel_configure(uint channel, const dma_channel_config* c, volatile void* write_addr,
+                           const volatile void* read_addr, uint transfer_count, bool trigger);
+bool dma_channel_is_busy(uint channel);
+void dma_channel_wait_for_finish_blocking(uint channel);
+
+typedef struct pio_hw { int unused; } *PIO;
+#define pio0 ((PIO)0)
+#define pio1 ((PIO)0)
+
+// ---- UART / IRQ / I2C ----
+
+typedef struct uart_inst { int index; } uart_inst_t;
+extern uart_inst_t* uart0;
+extern uart_inst_t* uart1;
+
+typedef enum { UART_PARITY_NONE, UART_PARITY_EVEN, UART_PARITY_ODD } uart_parity_t;
+typedef void (*irq_handler_t)(void);
+#define UART0_IRQ 20
+#define UART1_IRQ 21
+
+uint uart_init(uart_inst_t* uart, uint baudrate);
+void uart_deinit(uart_inst_t* uart);
+void uart_set_format(uart_inst_t* uart, uint data_bits, uint stop_bits, uart_parity_t parity);
+void uart_set_hw_flow(uart_inst_t* uart, bool cts, bool rts);
+void uart_set_fifo_enabled(uart_inst_t* uart, bool enabled);
+void uart_set_irq_enables(uart_inst_t* uart, bool rx, bool tx);
+bool uart_is_readable(uart_inst_t* uart);
+char uart_getc(uart_inst_t* uart);
+void uart_write_blocking(uart_inst_t* uart, const uint8_t* src, size_t len);
+void irq_set_exclusive_handler(uint num, irq_handler_t handler);
+void irq_set_enabled(uint num, bool enabled);
+
+typedef struct i2c_inst { int index; } i2c_inst_t;
+extern i2c_inst_t* i2c0;
+extern i2c_inst_t* i2c1;
+uint i2c_init(i2c_inst_t* i2c, uint baudrate);
+
+// ---- multicore ----
+
+void multicore_launch_core1(void (*entry)(void));
+
+// ---- pico-extras audio ----
+
+enum { AUDIO_BUFFER_FORMAT_PCM_S16 = 1, AUDIO_BUFFER_FORMAT_PCM_S8, AUDIO_BUFFER_FORMAT_PCM_U16 };
+
+typedef struct audio_format {
+    uint32_t sample_freq;
+    uint16_t format;
+    uint16_t channel_count;
+} audio_format_t;
+
+typedef struct audio_buffer_format {
+    const audio_format_t* format;
+    uint16_t sample_stride;
+} audio_buffer_format_t;
+
+typedef struct mem_buffer {
+    size_t size;
+    uint8_t* bytes;
+} mem_buffer_t;
+
+typedef struct audio_buffer {
+    mem_buffer_t* buffer;
+    const audio_buffer_format_t* format;
+    uint32_t sample_count;
+    uint32_t max_sample_count;
+} audio_buffer_t;
+
+typedef struct audio_buffer_pool audio_buffer_pool_t;
+
+struct audio_i2s_config {
+    uint8_t data_pin;
+    uint8_t clock_pin_base;
+    uint8_t dma_channel;
+    uint8_t pio_sm;
+};
+
+audio_buffer_pool_t* audio_new_producer_pool(audio_buffer_format_t* format, int buffer_count, int buffer_sample_count);
+const audio_format_t* audio_i2s_setup(const audio_format_t* format, const struct audio_i2s_config* config);
+bool audio_i2s_connect(audio_buffer_pool_t* producer);
+void audio_i2s_set_enabled(bool enabled);
+audio_buffer_t* take_audio_buffer(audio_buffer_pool_t* pool, bool block);
+void give_audio_buffer(audio_buffer_pool_t* pool, audio_buffer_t* buffer);
+
+
+// ---- simulation control, used by sim_main.cpp ----
+
+namespace sim {
+
+    // Block until the DAC has played the first buffer the firmware rendered
+    void wait_for_audio();
+
+    int sample_rate();
+    int buffer_size();
+    int channels();
+
+    // Output position right now, in frames since the DAC started (fractional)
+    double play_position();
+
+    // MIDI bytes as they arrive on the wire: through the UART IRQ handler when
+    // the firmware installed one, otherwise as USB-MIDI packets picked up by
+    // tud_task(). Wakes core 0 like the interrupt would.
+    void midi_in(const uint8_t* bytes, size_t len);
+
+    void set_adc(uint input, float value);  // 0..1 of full scale
+    void set_gpio(uint pin, bool level);
+
+    // Stop recording; returns the interleaved int16 frames the DAC played
+    const int16_t* stop(size_t& frames);
+
+    // Tests: call before audio_i2s_set_enabled to play each block period with
+    // step_dac() instead of on a real-time DAC thread
+    void manual_clock();
+    void step_dac();
+
+    uint32_t underruns();  // DAC found no rendered buffer
+    uint32_t blocks();     // buffers played
+}
@@ -0,0 +1,18 @@
+#pragma once
+
+// Stub, see pico_sim.h. The device side only: sim::midi_in feeds tud_midi_rx_cb,
+// CDC is never connected and MIDI out is dropped.
+#include "pico_sim.h"
+
+bool tusb_init();
+void tud_task();
+
+bool tud_midi_mounted();
+uint32_t tud_midi_available();
+bool tud_midi_packet_read(uint8_t packet[4]);
+bool tud_midi_packet_write(const uint8_t packet[4]);
+
+bool tud_cdc_connected();
+uint32_t tud_cdc_write_available();
+uint32_t tud_cdc_write(const void* buffer, uint32_t size);
+uint32_t tud_cdc_write_flush();
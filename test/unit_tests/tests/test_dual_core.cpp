@@ -0,0 +1,82 @@
+#include "PicoDualCore.h"
+#include <cassert>
+#include <cstdio>
+#include <thread>
+
+static Pico::VoiceCore voice_core;
+static std::atomic<bool> running{true};
+
+// Core 0 stand-in: the last value sent to "receiver" 7 becomes the block output
+static float core0_value = 0.0f;
+static uint32_t core0_events = 0;
+
+static void core0_loop() {
+    while (running.load(std::memory_order_relaxed)) {
+        voice_core.poll(
+            [](const ControlEvent& e) {
+                assert(e.target != 0);
+                if (e.hash == 7) core0_value = e.args[0];
+                core0_events++;
+            },
+            [](float* buffer, int frames) {
+                for (int i = 0; i < frames * 2; i++) buffer[i] = core0_value;
+            });
+        std::this_thread::yield();
+    }
+}
+
+/**
+ * Every block arrives with the events forwarded before it, and is summed in
+ */
+void test_Blocks_SummedWithTheirEvents() {
+    printf("Handing blocks to the second core: ");
+    voice_core.begin(1000000);
+    std::thread core0(core0_loop);
+
+    const int frames = 64;
+    float buffer[frames * 2];
+    for (int block = 1; block <= 5000; block++) {
+        voice_core.forward({ 7, 1, EVENT_TARGET_ALL, { (float)block, 0.0f, 0.0f }, EVENT_UNTIMED });
+        voice_core.forward({ 9, 1, 1, { 0.0f, 0.0f, 0.0f }, EVENT_UNTIMED });
+        voice_core.start(frames);
+        for (int i = 0; i < frames * 2; i++) buffer[i] = 0.5f;
+        assert(voice_core.finish(buffer, frames * 2));
+        for (int i = 0; i < frames * 2; i++) assert(buffer[i] == 0.5f + (float)block);
+    }
+
+    running.store(false);
+    core0.join();
+    assert(core0_events == 10000);
+    assert(voice_core.stats.blocks.load() == 5000);
+    assert(voice_core.stats.missed.load() == 0);
+    puts("Success");
+}
+
+/**
+ * With nobody rendering, core 1 gives up after the wait and keeps its own output
+ */
+void test_StalledCore_CountedAsMissed() {
+    printf("Mixing without a stalled second core: ");
+    Pico::VoiceCore stalled;
+    stalled.begin(100);
+    float buffer[8] = { 1.0f, 1.0f, 1.0f, 1.0f, 1.0f, 1.0f, 1.0f, 1.0f };
+    stalled.start(4);
+    assert(!stalled.finish(buffer, 8));
+    assert(buffer[7] == 1.0f);
+    assert(stalled.stats.missed.load() == 1);
+
+    // the late block is picked up on the next poll, which then renders the newest request
+    stalled.start(4);
+    int renders = 0;
+    assert(stalled.poll([](const ControlEvent&) {}, [&](float*, int) { renders++; }));
+    assert(!stalled.poll([](const ControlEvent&) {}, [&](float*, int) { renders++; }));
+    assert(renders == 1);
+    assert(stalled.finish(buffer, 8));
+    puts("Success");
+}
+
+int main() {
+    test_Blocks_SummedWithTheirEvents();
+    test_StalledCore_CountedAsMissed();
+    return 0;
+}
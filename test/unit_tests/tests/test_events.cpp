@@ -0,0 +1,119 @@
+#include "PicoEvents.h"
+#include <cassert>
+#include <cstdio>
+#include <vector>
+
+static std::vector<ControlEvent> drain() {
+    std::vector<ControlEvent> got;
+    Pico::drain_events(nullptr, 0, [](uint32_t, float) {}, [&](const ControlEvent& e) { got.push_back(e); });
+    return got;
+}
+
+static ControlEvent at(uint32_t time_us) {
+    ControlEvent e = { 0x100, 1, EVENT_TARGET_ALL, { 1.0f, 0.0f, 0.0f }, time_us };
+    return e;
+}
+
+/**
+ * Events keep their offset within the block period they arrived in, one block later
+ */
+void test_Offset_OneBlockAfterArrival() {
+    printf("Mapping arrival times into the next block: ");
+    Pico::EventClock clock;
+    clock.begin(48000);
+    clock.start_block(10000, 64);  // 64 frames = 1333 us
+
+    assert(clock.offset(at(10000)) == 63);         // arrived right at the block start: clamped to the last frame
+    assert(clock.offset(at(10000 - 666)) == 32);   // half a period ago: half a block in
+    assert(clock.offset(at(10000 - 1332)) == 0);   // almost a period ago: block start
+    assert(clock.offset(at(10000 - 1333)) == 0);   // older than a period: as soon as possible
+    assert(clock.offset(at(10000 - 50000)) == 0);
+    assert(clock.offset(at(10000 + 20)) == 63);    // posted between block start and drain
+
+    // untimed events (forwarded params) go out at the block start
+    assert(clock.offset(at(EVENT_UNTIMED)) == 0);
+    assert(clock.delay_ms(at(EVENT_UNTIMED)) == 0.0f);
+
+    // Heavy truncates delay * sample_rate / 1000 to whole samples
+    const uint32_t n = clock.offset(at(10000 - 666));
+    assert((uint32_t)(clock.delay_ms(at(10000 - 666)) * 48000 / 1000.0f) == n);
+    puts("Success");
+}
+
+/**
+ * Offsets are monotonic in arrival order, so Heavy keeps the queue order
+ */
+void test_Offset_MonotonicAcrossTimerWrap() {
+    printf("Keeping event order across the timer wrap: ");
+    Pico::EventClock clock;
+    clock.begin(44100);
+    const uint32_t block_us = 0x00000200u;  // the 32-bit µs timer wrapped during the last period
+    clock.start_block(block_us, 128);
+
+    uint32_t last = 0;
+    for (int32_t age = 3000; age > 0; age -= 7) {
+        const uint32_t n = clock.offset(at(block_us - (uint32_t)age));
+        assert(n >= last && n < 128);
+        last = n;
+    }
+    assert(last == 127);
+    puts("Success");
+}
+
+/**
+ * Posted events carry their arrival: stamped while set, the clock otherwise
+ */
+void test_Post_StampsArrival() {
+    printf("Stamping posted events: ");
+    Pico::stamp_events(1234);
+    assert(Pico::post_event(0x100, 1, 1.0f));
+    Pico::stamp_events(0);  // a real arrival time of 0 must not read as untimed
+    assert(Pico::post_event(0x100, 1, 2.0f));
+    Pico::unstamp_events();
+    const uint32_t before = EVENT_NOW_US();
+    assert(Pico::post_event(0x100, 1, 3.0f));
+    const uint32_t after = EVENT_NOW_US();
+
+    std::vector<ControlEvent> got = drain();
+    assert(got.size() == 3);
+    assert(got[0].time_us == 1234);
+    assert(got[1].time_us != EVENT_UNTIMED);
+    assert(got[2].time_us - before <= after - before);
+    puts("Success");
+}
+
+/**
+ * Values from an interrupt handler reach the slot through the main loop, the
+ * latest one wins and nothing is posted twice
+ */
+void test_Inbox_PostedByMainLoop() {
+    printf("Posting interrupt handler values from the main loop: ");
+    ParamSlot slots[2];
+    slots[0].hash = 0x100;
+    slots[1].hash = 0x101;
+    InboxSlot inbox[2];
+
+    Pico::post_from_irq(inbox[1], 0.25f);
+    Pico::post_from_irq(inbox[1], 0.5f);
+    assert(slots[1].written.load() == 0);  // not posted until the main loop runs
+
+    const uint32_t sent = Pico::event_stats.sent.load();
+    Pico::post_inbox(inbox, slots, 2);
+    Pico::post_inbox(inbox, slots, 2);  // nothing new
+    assert(Pico::event_stats.sent.load() == sent + 1);
+    assert(slots[0].written.load() == 0);
+    assert(slots[1].written.load() == 1 && slots[1].value.load() == 0.5f);
+
+    std::vector<std::pair<uint32_t, float>> got;
+    Pico::drain_events(slots, 2, [&](uint32_t h, float v) { got.push_back({ h, v }); }, [](const ControlEvent&) {});
+    assert(got.size() == 1 && got[0].first == 0x101 && got[0].second == 0.5f);
+    puts("Success");
+}
+
+int main() {
+    test_Offset_OneBlockAfterArrival();
+    test_Offset_MonotonicAcrossTimerWrap();
+    test_Post_StampsArrival();
+    test_Inbox_PostedByMainLoop();
+    return 0;
+}
@@ -0,0 +1,215 @@
+#include "web/picoOSC.h"
+#include <cassert>
+#include <cstdio>
+#include <cstring>
+#include <string>
+#include <thread>
+#include <vector>
+
+struct Received {
+    std::string address;
+    float value;
+};
+
+// Stand-in for the UDP peer: parses whatever the scheduler sends
+struct Peer {
+    std::vector<Received> messages;
+    int packets = 0;
+    bool accept = true;
+
+    bool operator()(const uint8_t* data, size_t size) {
+        if (!accept) return false;
+        packets++;
+        picoosc::parse_packet(data, size, [this](const char* a, float v) { messages.push_back({ a, v }); });
+        return true;
+    }
+};
+
+/**
+ * Values written between two flushes collapse into one message per address
+ */
+void test_Flush_LatestValuePerAddress() {
+    printf("Coalescing OSC sends into one bundle: ");
+    picoosc::OSCScheduler<4> osc;
+    osc.begin(20);
+    assert(osc.add("/osc_lfo") == 0);
+    assert(osc.add("/osc_env") == 1);
+    assert(osc.add("/osc_idle") == 2);
+    assert(osc.find("/osc_env") == 1 && osc.find("/nope") == -1);
+
+    for (int i = 0; i < 100; i++) osc.set(0, (float)i);
+    osc.set(1, 0.25f);
+
+    Peer peer;
+    assert(osc.poll(10, peer) == 0);  // interval not over yet
+    assert(osc.poll(20, peer) == 1);
+    assert(peer.messages.size() == 2);
+    assert(peer.messages[0].address == "/osc_lfo" && peer.messages[0].value == 99.0f);
+    assert(peer.messages[1].address == "/osc_env" && peer.messages[1].value == 0.25f);
+    assert(osc.stats.coalesced.load() == 99);
+    assert(osc.stats.messages.load() == 2);
+
+    // nothing changed, nothing sent
+    assert(osc.poll(40, peer) == 0);
+    assert(peer.packets == 1);
+    puts("Success");
+}
+
+/**
+ * More addresses than fit into MAX_BUNDLE_SIZE go out as several bundles
+ */
+void test_Flush_SplitsLargeBundles() {
+    printf("Splitting a flush across bundles: ");
+    picoosc::OSCScheduler<32> osc;
+    osc.begin(1);
+    char address[64];
+    for (int i = 0; i < 32; i++) {
+        snprintf(address, sizeof(address), "/osc_a_rather_long_address_number_%02d", i);
+        assert(osc.add(address) == i);
+        osc.set(i, (float)i);
+    }
+
+    Peer peer;
+    assert(osc.poll(1, peer) > 1);
+    assert(peer.messages.size() == 32);
+    for (int i = 0; i < 32; i++) assert(peer.messages[i].value == (float)i);
+    puts("Success");
+}
+
+/**
+ * A failed send counts its messages as dropped
+ */
+void test_FailedSend_CountedAsDropped() {
+    printf("Counting dropped OSC bundles: ");
+    picoosc::OSCScheduler<2> osc;
+    osc.begin(5);
+    osc.add("/a");
+    osc.add("/b");
+    osc.set(0, 1.0f);
+    osc.set(1, 2.0f);
+
+    Peer peer;
+    peer.accept = false;
+    assert(osc.poll(5, peer) == 0);
+    assert(osc.stats.dropped.load() == 2);
+    assert(osc.stats.packets.load() == 0);
+    puts("Success");
+}
+
+/**
+ * An address that gets no slot is counted as dropped, and writes to it go nowhere
+ */
+void test_Add_FullOrTooLong() {
+    printf("Rejecting OSC addresses without a slot: ");
+    picoosc::OSCScheduler<2> osc;
+    osc.begin(1);
+    char address[80];
+    memset(address, 'a', sizeof(address));
+    address[0] = '/';
+    address[picoosc::OSCScheduler<2>::ADDRESS_SIZE] = '\0';
+    assert(osc.add(address) == -1);  // too long, takes no slot
+    assert(osc.add("/a") == 0);
+    assert(osc.add("/b") == 1);
+    assert(osc.add("/c") == -1);     // full
+    assert(osc.stats.dropped.load() == 2);
+
+    osc.set(-1, 5.0f);
+    osc.set(2, 5.0f);  // past the table
+    osc.set(1, 1.0f);
+
+    Peer peer;
+    assert(osc.poll(1, peer) == 1);
+    assert(peer.messages.size() == 1);
+    assert(peer.messages[0].address == "/b" && peer.messages[0].value == 1.0f);
+    puts("Success");
+}
+
+/**
+ * Incoming bundles, nested bundles and int arguments each reach the router
+ */
+void test_Parse_BundlesAndInts() {
+    printf("Parsing incoming OSC bundles: ");
+    // /osc_cut ,i 42
+    const uint8_t int_message[] = { '/', 'o', 's', 'c', '_', 'c', 'u', 't', 0, 0, 0, 0, ',', 'i', 0, 0, 0, 0, 0, 42 };
+
+    picoosc::OSCBundle inner;
+    inner.add("/osc_res", 0.5f);
+
+    uint8_t packet[256];
+    size_t size = picoosc::OSCBundle::HEADER_SIZE;
+    memcpy(packet, inner.data(), size);
+    picoosc::write_be32(packet + size, sizeof(int_message));
+    memcpy(packet + size + 4, int_message, sizeof(int_message));
+    size += 4 + sizeof(int_message);
+    picoosc::write_be32(packet + size, (uint32_t)inner.size());
+    memcpy(packet + size + 4, inner.data(), inner.size());
+    size += 4 + inner.size();
+
+    std::vector<Received> got;
+    auto record = [&](const char* a, float v) { got.push_back({ a, v }); };
+    assert(picoosc::parse_packet(packet, size, record) == 2);
+    assert(got[0].address == "/osc_cut" && got[0].value == 42.0f);
+    assert(got[1].address == "/osc_res" && got[1].value == 0.5f);
+
+    // an element claiming more bytes than the packet has is ignored
+    picoosc::write_be32(packet + picoosc::OSCBundle::HEADER_SIZE, 4096);
+    got.clear();
+    assert(picoosc::parse_packet(packet, size, record) == 0);
+
+    // plain message, and one with an unsupported type
+    assert(picoosc::parse_packet(int_message, sizeof(int_message), record) == 1);
+    uint8_t string_message[sizeof(int_message)];
+    memcpy(string_message, int_message, sizeof(int_message));
+    string_message[13] = 's';
+    assert(picoosc::parse_packet(string_message, sizeof(string_message), record) == 0);
+    puts("Success");
+}
+
+/**
+ * Audio core writing while core 0 flushes: every write is either sent or coalesced
+ */
+void test_ConcurrentWrites_Accounted() {
+    printf("Flushing OSC while the audio core writes: ");
+    static picoosc::OSCScheduler<2> osc;
+    osc.begin(1);
+    osc.add("/osc_lfo");
+    const int writes = 100000;
+    std::atomic<bool> done{false};
+
+    std::thread core1([&] {
+        for (int i = 1; i <= writes; i++) {
+            osc.set(0, (float)i);
+            if (i % 16 == 0) std::this_thread::yield();
+        }
+        done.store(true, std::memory_order_release);
+    });
+
+    Peer peer;
+    uint32_t now = 0;
+    float last = 0.0f;
+    while (!done.load(std::memory_order_acquire)) {
+        osc.poll(++now, peer);
+        std::this_thread::yield();
+    }
+    core1.join();
+    osc.poll(++now, peer);
+
+    // a value can be picked up one flush early and repeated, never go back
+    for (const Received& m : peer.messages) {
+        assert(m.value >= last);
+        last = m.value;
+    }
+    assert(last == (float)writes);
+    assert(osc.stats.messages.load() + osc.stats.coalesced.load() == (uint32_t)writes);
+    puts("Success");
+}
+
+int main() {
+    test_Flush_LatestValuePerAddress();
+    test_Flush_SplitsLargeBundles();
+    test_FailedSend_CountedAsDropped();
+    test_Add_FullOrTooLong();
+    test_Parse_BundlesAndInts();
+    test_ConcurrentWrites_Accounted();
+    return 0;
+}
@@ -0,0 +1,140 @@
+#include "PicoSamples.h"
+#include <cassert>
+#include <cmath>
+#include <cstdio>
+#include <cstring>
+
+/**
+ * Minimal IMA-ADPCM encoder with the block layout written by pikopd.py
+ */
+static int encode_adpcm(const int16_t* pcm, int frames, uint8_t* out) {
+    int pred = 0, index = 0, bytes = 0;
+    for (int start = 0; start < frames; start += ADPCM_BLOCK_FRAMES) {
+        uint8_t* block = out + bytes;
+        block[0] = pred & 0xFF;
+        block[1] = (pred >> 8) & 0xFF;
+        block[2] = index;
+        block[3] = 0;
+        memset(block + 4, 0, ADPCM_BLOCK_FRAMES / 2);
+        for (int i = 0; i < ADPCM_BLOCK_FRAMES; i++) {
+            int sample = start + i < frames ? pcm[start + i] : 0;
+            int step = Pico::ADPCM_STEPS[index];
+            int diff = sample - pred;
+            int code = 0;
+            if (diff < 0) { code = 8; diff = -diff; }
+            if (diff >= step) { code |= 4; diff -= step; }
+            if (diff >= step >> 1) { code |= 2; diff -= step >> 1; }
+            if (diff >= step >> 2) { code |= 1; }
+
+            int delta = step >> 3;
+            if (code & 4) delta += step;
+            if (code & 2) delta += step >> 1;
+            if (code & 1) delta += step >> 2;
+            pred += (code & 8) ? -delta : delta;
+            pred = pred > 32767 ? 32767 : (pred < -32768 ? -32768 : pred);
+            index += Pico::ADPCM_INDEX[code];
+            index = index > 88 ? 88 : (index < 0 ? 0 : index);
+            block[4 + i / 2] |= (i & 1) ? code << 4 : code;
+        }
+        bytes += ADPCM_BLOCK_BYTES;
+    }
+    return bytes;
+}
+
+static const int FRAMES = 1000;
+static int16_t pcm[FRAMES];
+alignas(4) static uint8_t adpcm[(FRAMES / ADPCM_BLOCK_FRAMES + 1) * ADPCM_BLOCK_BYTES];
+
+static const SampleAsset assets[] = {
+    { (const uint8_t*)pcm, FRAMES, SAMPLE_INT16 },
+    { adpcm, FRAMES, SAMPLE_ADPCM },
+    { (const uint8_t*)pcm, 300, SAMPLE_INT16 },
+};
+
+const SampleBank sample_banks[] = { { "table", 0x1234, assets, 3 } };
+const int NUM_SAMPLE_BANKS = 1;
+
+static float table[2048];
+
+static float* get_table(const SampleBank& bank, uint32_t& length) {
+    assert(bank.table_hash == 0x1234);
+    length = 2048;
+    return table;
+}
+
+static int stream(Pico::SampleStreamer& s, int index) {
+    s.request(0, index);
+    int blocks = 0;
+    while (table[2047] != 0.0f || blocks == 0) {
+        s.service(get_table);
+        blocks++;
+        assert(blocks < 100);
+    }
+    return blocks;
+}
+
+/**
+ * int16 assets come back exactly, and the rest of the table is cleared
+ */
+void test_Int16_ExactAndZeroFilled() {
+    printf("Streaming an int16 sample: ");
+    Pico::SampleStreamer s;
+    for (float& f : table) f = 1.0f;
+    int blocks = stream(s, 0);
+    assert(blocks == 2048 / SAMPLE_STREAM_FRAMES);
+    for (int i = 0; i < FRAMES; i++) assert(table[i] == pcm[i] / 32768.0f);
+    for (int i = FRAMES; i < 2048; i++) assert(table[i] == 0.0f);
+    puts("Success");
+}
+
+/**
+ * ADPCM decodes block by block close to the source
+ */
+void test_Adpcm_RoundTrip() {
+    printf("Streaming an ADPCM sample: ");
+    Pico::SampleStreamer s;
+    for (float& f : table) f = 1.0f;
+    stream(s, 1);
+    double signal = 0, noise = 0;
+    for (int i = 0; i < FRAMES; i++) {
+        double e = table[i] * 32768.0 - pcm[i];
+        signal += (double)pcm[i] * pcm[i];
+        noise += e * e;
+    }
+    assert(10.0 * log10(signal / noise) > 25.0);
+    for (int i = FRAMES; i < 2048; i++) assert(table[i] == 0.0f);
+    puts("Success");
+}
+
+/**
+ * A shorter sample clears what the previous one left, bad requests are ignored
+ */
+void test_ShorterSample_ClearsTail() {
+    printf("Replacing a sample with a shorter one: ");
+    Pico::SampleStreamer s;
+    s.load_all(get_table);
+    assert(table[FRAMES - 1] == pcm[FRAMES - 1] / 32768.0f);
+    table[2047] = 1.0f;
+    stream(s, 2);
+    assert(table[299] == pcm[299] / 32768.0f);
+    for (int i = 300; i < 2048; i++) assert(table[i] == 0.0f);
+
+    s.request(0, 3);
+    s.request(1, 0);
+    table[2047] = 1.0f;
+    s.service(get_table);
+    assert(table[2047] == 1.0f);
+    puts("Success");
+}
+
+int main() {
+    for (int i = 0; i < FRAMES; i++) {
+        pcm[i] = (int16_t)(12000.0 * sin(i * 0.05) + 3000.0 * sin(i * 0.31));
+    }
+    encode_adpcm(pcm, FRAMES, adpcm);
+
+    test_Int16_ExactAndZeroFilled();
+    test_Adpcm_RoundTrip();
+    test_ShorterSample_ClearsTail();
+    return 0;
+}
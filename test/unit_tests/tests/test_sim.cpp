@@ -0,0 +1,99 @@
+#include "pico_sim.h"
+#include "tusb.h"
+#include <cassert>
+#include <cstdio>
+#include <vector>
+
+static std::vector<uint32_t> packets;
+
+// Stand-in for the firmware's handler in PicoMIDI.h
+extern "C" void tud_midi_rx_cb(uint8_t itf) {
+    (void)itf;
+    uint8_t p[4];
+    while (tud_midi_available()) {
+        if (tud_midi_packet_read(p)) packets.push_back(p[0] | (p[1] << 8) | (p[2] << 16) | ((uint32_t)p[3] << 24));
+    }
+}
+
+static uint32_t packet(uint8_t cin, uint8_t status, uint8_t d1, uint8_t d2) {
+    return cin | (status << 8) | (d1 << 16) | ((uint32_t)d2 << 24);
+}
+
+/**
+ * Raw MIDI bytes reach the firmware as USB-MIDI packets on the next tud_task()
+ */
+void test_MidiIn_RunningStatusToPackets() {
+    printf("Packing replayed MIDI into USB packets: ");
+    const uint8_t bytes[] = { 0x90, 60, 100, 62, 100, 0xF8, 0xB0, 7, 64, 0xC1, 5 };
+    sim::midi_in(bytes, sizeof(bytes));
+    assert(packets.empty());  // only core 0's USB task delivers
+
+    tud_task();
+    assert(packets.size() == 5);
+    assert(packets[0] == packet(0x09, 0x90, 60, 100));
+    assert(packets[1] == packet(0x09, 0x90, 62, 100));  // running status
+    assert(packets[2] == packet(0x0F, 0xF8, 0, 0));     // realtime in between
+    assert(packets[3] == packet(0x0B, 0xB0, 7, 64));
+    assert(packets[4] == packet(0x0C, 0xC1, 5, 0));     // two-byte message
+    puts("Success");
+}
+
+/**
+ * The DAC plays the rendered buffers in order, one per block period, and
+ * counts the blocks it found nothing to play once audio started. The block
+ * periods are stepped by hand, so host scheduling cannot add underruns.
+ */
+void test_Dac_PlaysBuffersInOrder() {
+    printf("Playing audio buffers one per block period: ");
+    const int frames = 64, blocks = 24, idle = 3;
+    audio_format_t format = { 48000, AUDIO_BUFFER_FORMAT_PCM_S16, 2 };
+    audio_buffer_format_t producer = { &format, 4 };
+    audio_buffer_pool_t* pool = audio_new_producer_pool(&producer, 3, frames);
+    audio_i2s_setup(&format, nullptr);
+    audio_i2s_connect(pool);
+    sim::manual_clock();
+    audio_i2s_set_enabled(true);
+
+    // core 1: render into every free buffer
+    int rendered = 0;
+    auto render = [&] {
+        while (rendered < blocks) {
+            audio_buffer_t* buffer = take_audio_buffer(pool, false);
+            if (!buffer) return;
+            rendered++;
+            int16_t* samples = (int16_t*)buffer->buffer->bytes;
+            for (uint32_t i = 0; i < buffer->max_sample_count * 2; i++) samples[i] = (int16_t)rendered;
+            buffer->sample_count = buffer->max_sample_count;
+            give_audio_buffer(pool, buffer);
+        }
+    };
+
+    render();
+    assert(rendered == 3);  // the whole pool, before the first period
+    while (sim::blocks() < (uint32_t)blocks) {
+        sim::step_dac();
+        render();
+    }
+    sim::wait_for_audio();
+    for (int i = 0; i < idle; i++) sim::step_dac();  // periods with nothing to play
+
+    size_t recorded = 0;
+    const int16_t* out = sim::stop(recorded);
+    assert(recorded == (size_t)(blocks + idle) * frames);
+    assert(recorded == sim::play_position());
+
+    // every block exactly once, in order, then silence
+    size_t n = 0;
+    for (int b = 1; b <= blocks; b++) {
+        for (int i = 0; i < frames; i++, n++) assert(out[n * 2] == b && out[n * 2 + 1] == b);
+    }
+    for (; n < recorded; n++) assert(out[n * 2] == 0);
+    assert(sim::underruns() == (uint32_t)idle);
+    puts("Success");
+}
+
+int main() {
+    test_MidiIn_RunningStatusToPackets();
+    test_Dac_PlaysBuffersInOrder();
+    return 0;
+}
@@ -0,0 +1,95 @@
+#include "PicoTelemetry.h"
+#include <cassert>
+#include <cstdio>
+#include <cstring>
+#include <thread>
+
+/**
+ * Audio core writing while core 0 drains: records arrive in order, and every
+ * gap in the sequence matches a record the producer saw dropped
+ */
+void test_ConcurrentDrain_InOrderWithCountedGaps() {
+    printf("Draining telemetry while the audio core writes: ");
+    static Pico::Telemetry ring;
+    const uint32_t total = 200000;
+    std::atomic<bool> done{false};
+
+    std::thread core1([&] {
+        for (uint32_t i = 0; i < total; i++) {
+            ring.push(i, (uint16_t)(i % 7), (float)i);
+            if (i % 64 == 0) std::this_thread::yield();
+        }
+        done.store(true, std::memory_order_release);
+    });
+
+    uint32_t received = 0, lost = 0;
+    int32_t last = -1;
+    while (true) {
+        const bool finished = done.load(std::memory_order_acquire);
+        const TelemetryRecord* r = ring.peek();
+        if (!r) {
+            if (finished) break;
+            std::this_thread::yield();
+            continue;
+        }
+        // time, id, seq and value all derive from the producer's counter
+        assert((int32_t)r->time_us > last);
+        assert(r->id == r->time_us % 7);
+        assert(r->seq == (uint16_t)r->time_us);
+        assert(r->value == (float)r->time_us);
+        lost += r->time_us - (uint32_t)(last + 1);
+        last = (int32_t)r->time_us;
+        received++;
+        ring.pop();
+    }
+    core1.join();
+
+    lost += total - 1 - (uint32_t)last;
+    assert(received + lost == total);
+    assert(lost == ring.stats.dropped.load());
+    assert(received == ring.stats.written.load());
+    puts("Success");
+}
+
+/**
+ * A full ring drops new records and the sequence number shows how many
+ */
+void test_FullRing_DropsNewestAndLeavesGap() {
+    printf("Overflowing the telemetry ring: ");
+    static Pico::Telemetry ring;
+    for (int i = 0; i < TELEMETRY_RING_SIZE; i++) assert(ring.push(i, 1, 0.5f));
+    for (int i = 0; i < 5; i++) assert(!ring.push(0, 1, 0.5f));
+    assert(ring.stats.dropped.load() == 5);
+
+    for (int i = 0; i < TELEMETRY_RING_SIZE; i++) {
+        assert(ring.peek()->seq == i);
+        ring.pop();
+    }
+    assert(ring.peek() == nullptr);
+
+    assert(ring.push(0, 1, 0.5f));
+    assert(ring.peek()->seq == TELEMETRY_RING_SIZE + 5);
+    puts("Success");
+}
+
+/**
+ * Wire format read by tools/telemetry.py
+ */
+void test_Frame_Layout() {
+    printf("Encoding a telemetry frame: ");
+    const TelemetryRecord r = { 0x04030201u, 0x0605, 0x0807, 1.0f };
+    uint8_t frame[TELEMETRY_FRAME_BYTES];
+    Pico::Telemetry::frame(r, frame);
+
+    const uint8_t expected[] = { 0xA5, 0x5A, 0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x08, 0x00, 0x00, 0x80, 0x3F };
+    assert(sizeof(frame) == sizeof(expected));
+    assert(memcmp(frame, expected, sizeof(expected)) == 0);
+    puts("Success");
+}
+
+int main() {
+    test_ConcurrentDrain_InOrderWithCountedGaps();
+    test_FullRing_DropsNewestAndLeavesGap();
+    test_Frame_Layout();
+    return 0;
+}
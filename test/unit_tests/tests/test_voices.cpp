@@ -0,0 +1,160 @@
+#include "PicoVoices.h"
+#include <cassert>
+#include <cstdio>
+#include <cstdlib>
+
+/**
+ * Brute-force model of the allocator: every decision is a linear scan over
+ * timestamps, which is what the linked lists are supposed to reproduce.
+ */
+struct ReferenceVoice {
+    int note;
+    int velocity;
+    bool active;
+    long on_time;
+    long off_time;
+};
+
+static ReferenceVoice ref[MAX_VOICES];
+static long ref_clock = 0;
+
+static void ref_reset() {
+    for (int v = 0; v < MAX_VOICES; v++) {
+        ref[v] = { 0, 0, false, 0, v - MAX_VOICES };
+    }
+}
+
+// Active voice with the given note, oldest (or newest) first
+static int ref_find(int note, bool newest) {
+    int best = -1;
+    for (int v = 0; v < MAX_VOICES; v++) {
+        if (!ref[v].active || ref[v].note != note) continue;
+        if (best < 0 || (newest ? ref[v].on_time > ref[best].on_time : ref[v].on_time < ref[best].on_time)) best = v;
+    }
+    return best;
+}
+
+// Smaller key wins, ties go to the oldest note on
+static bool ref_before(int a, int b) {
+    int ka, kb;
+    #if VOICE_STEAL == VOICE_STEAL_QUIETEST
+    ka = ref[a].velocity; kb = ref[b].velocity;
+    #elif VOICE_STEAL == VOICE_STEAL_LOWEST
+    ka = -ref[a].note; kb = -ref[b].note;
+    #elif VOICE_STEAL == VOICE_STEAL_HIGHEST
+    ka = ref[a].note; kb = ref[b].note;
+    #else
+    ka = kb = 0;
+    #endif
+    return ka != kb ? ka < kb : ref[a].on_time < ref[b].on_time;
+}
+
+static int ref_note_on(int note, int velocity) {
+    int v = -1;
+    #if VOICE_RETRIGGER
+    v = ref_find(note, true);
+    #endif
+    if (v < 0) {
+        for (int i = 0; i < MAX_VOICES; i++) {
+            if (!ref[i].active && (v < 0 || ref[i].off_time < ref[v].off_time)) v = i;
+        }
+    }
+    if (v < 0) {
+        for (int i = 0; i < MAX_VOICES; i++) {
+            if (v < 0 || ref_before(i, v)) v = i;
+        }
+    }
+    ref[v] = { note, velocity, true, ++ref_clock, 0 };
+    return v;
+}
+
+static int ref_note_off(int note) {
+    int v = ref_find(note, false);
+    if (v >= 0) {
+        ref[v].active = false;
+        ref[v].off_time = ++ref_clock;
+    }
+    return v;
+}
+
+static int ref_active() {
+    int n = 0;
+    for (int v = 0; v < MAX_VOICES; v++) n += ref[v].active;
+    return n;
+}
+
+/**
+ * Fill every voice, then release in order: voices come back longest released first
+ */
+void test_FreeVoices_ReusedInReleaseOrder() {
+    printf("Testing that released voices are reused in release order: ");
+    VoiceAllocator alloc;
+    for (int i = 0; i < MAX_VOICES; i++) {
+        assert(alloc.note_on(40 + i, 100) == i);
+    }
+    assert(alloc.active() == MAX_VOICES);
+    assert(alloc.note_off(42) == 2);
+    assert(alloc.note_off(41) == 1);
+    assert(alloc.note_off(42) == -1);
+    assert(alloc.note_on(90, 100) == 2);
+    assert(alloc.note_on(91, 100) == 1);
+    assert(alloc.voice(1).note == 91 && alloc.voice(1).active);
+    puts("Success");
+}
+
+/**
+ * Dense overlapping input, checked step by step against the reference model
+ */
+void test_Stress_MatchesReference() {
+    printf("Driving overlapping notes against the reference model: ");
+    VoiceAllocator alloc;
+    ref_reset();
+    srand(1234);
+
+    const int steps = 200000;
+    for (int step = 0; step < steps; step++) {
+        // narrow ranges so retriggers, stacked notes and steals all happen often
+        int note = 36 + rand() % 24;
+        if (rand() % 3) {
+            int velocity = 1 + rand() % 127;
+            int v = alloc.note_on(note, velocity);
+            assert(v == ref_note_on(note, velocity));
+            assert(alloc.voice(v).note == note && alloc.voice(v).velocity == velocity);
+        } else {
+            assert(alloc.note_off(note) == ref_note_off(note));
+        }
+        assert(alloc.active() == ref_active());
+
+        if (step % 50000 == 0) {
+            alloc.reset();
+            ref_reset();
+        }
+    }
+    puts("Success");
+}
+
+/**
+ * Every held note maps back to a voice that is playing it
+ */
+void test_ReleaseAll_LeavesNoActiveVoices() {
+    printf("Releasing all held notes: ");
+    VoiceAllocator alloc;
+    for (int i = 0; i < 4000; i++) {
+        alloc.note_on(i % 128, 1 + i % 127);
+    }
+    for (int pass = 0; pass < MAX_VOICES; pass++) {
+        for (int n = 0; n < 128; n++) {
+            int v = alloc.note_off(n);
+            assert(v < 0 || !alloc.voice(v).active);
+        }
+    }
+    assert(alloc.active() == 0);
+    puts("Success");
+}
+
+int main() {
+    test_FreeVoices_ReusedInReleaseOrder();
+    test_Stress_MatchesReference();
+    test_ReleaseAll_LeavesNoActiveVoices();
+    return 0;
+}
@@ -0,0 +1,139 @@
+#include "web/picoParams.h"
+#include <cassert>
+#include <cstdio>
+#include <cstring>
+#include <string>
+#include <thread>
+#include <vector>
+
+struct Entry {
+    uint16_t index;
+    float value;
+};
+
+// Decodes a /params.bin body the way the web UI does
+static std::vector<Entry> decode(const uint8_t* data, size_t size, uint32_t& seq) {
+    uint16_t count;
+    assert(size >= picoparams::HEADER_SIZE);
+    memcpy(&seq, data, 4);
+    memcpy(&count, data + 4, 2);
+    assert(size == picoparams::HEADER_SIZE + count * picoparams::ENTRY_SIZE);
+    std::vector<Entry> entries(count);
+    for (int i = 0; i < count; i++) {
+        memcpy(&entries[i].index, data + picoparams::HEADER_SIZE + i * picoparams::ENTRY_SIZE, 2);
+        memcpy(&entries[i].value, data + picoparams::HEADER_SIZE + i * picoparams::ENTRY_SIZE + 2, 4);
+    }
+    return entries;
+}
+
+/**
+ * A client only gets the values that changed after the sequence number it sent
+ */
+void test_Delta_ChangedSinceSeq() {
+    printf("Encoding the values changed since a sequence number: ");
+    picoparams::WebValues<4> values;
+    uint8_t out[picoparams::WebValues<4>::MAX_BYTES];
+    uint32_t seq;
+
+    // nothing sent yet
+    assert(decode(out, values.delta(0, out), seq).empty() && seq == 0);
+
+    values.set(0, 0.5f);
+    values.set(2, 1.0f);
+    values.set(2, 2.0f);
+    values.set(7, 3.0f);  // out of range, ignored
+
+    std::vector<Entry> all = decode(out, values.delta(0, out), seq);
+    assert(seq == 3);
+    assert(all.size() == 2);
+    assert(all[0].index == 0 && all[0].value == 0.5f);
+    assert(all[1].index == 2 && all[1].value == 2.0f);
+
+    // up to date: empty delta, same seq
+    assert(decode(out, values.delta(seq, out), seq).empty() && seq == 3);
+
+    values.set(3, -1.0f);
+    std::vector<Entry> changed = decode(out, values.delta(seq, out), seq);
+    assert(seq == 4);
+    assert(changed.size() == 1 && changed[0].index == 3 && changed[0].value == -1.0f);
+    puts("Success");
+}
+
+/**
+ * "s" and numeric keys come out of the query, everything else is skipped
+ */
+void test_ApplyQuery_IndicesAndSeq() {
+    printf("Applying a batch of index=value pairs: ");
+    char* names[] = { (char*)"s", (char*)"0", (char*)"2", (char*)"v", (char*)"5", (char*)"1x", (char*)"-1", (char*)"1" };
+    char* vals[] = { (char*)"42", (char*)"0.25", (char*)"1e3", (char*)"7", (char*)"1", (char*)"1", (char*)"1", nullptr };
+    std::vector<Entry> applied;
+    uint32_t since = 0;
+    const int n = picoparams::apply_query(8, names, vals, 3, since,
+                                          [&](int i, float v) { applied.push_back({ (uint16_t)i, v }); });
+    assert(n == 2 && since == 42);
+    assert(applied[0].index == 0 && applied[0].value == 0.25f);
+    assert(applied[1].index == 2 && applied[1].value == 1000.0f);
+    puts("Success");
+}
+
+/**
+ * /params.json lists the names behind the indices, or nothing when it does not fit
+ */
+void test_Manifest_Json() {
+    printf("Writing the parameter manifest: ");
+    const char* params[] = { "web_cut", "web_res" };
+    const char* values[] = { "web_out" };
+    char out[64];
+    const size_t len = picoparams::write_manifest(out, sizeof(out), params, 2, values, 1);
+    assert(std::string(out, len) == "{\"params\":[\"web_cut\",\"web_res\"],\"values\":[\"web_out\"]}");
+    assert(picoparams::write_manifest(out, sizeof(out), params, 0, values, 0) == strlen("{\"params\":[],\"values\":[]}"));
+    assert(picoparams::write_manifest(out, 20, params, 2, values, 1) == 0);
+    puts("Success");
+}
+
+/**
+ * Audio core writing while core 0 answers requests: the client ends up with
+ * the last value of every slot and never sees one go back
+ */
+void test_ConcurrentWrites_NeverMissed() {
+    printf("Polling deltas while the audio core writes: ");
+    static picoparams::WebValues<3> values;
+    const int writes = 100000;
+    std::atomic<bool> done{false};
+
+    std::thread core1([&] {
+        for (int i = 1; i <= writes; i++) {
+            values.set(i % 3, (float)i);
+            if (i % 16 == 0) std::this_thread::yield();
+        }
+        done.store(true, std::memory_order_release);
+    });
+
+    uint8_t out[picoparams::WebValues<3>::MAX_BYTES];
+    uint32_t seq = 0;
+    float seen[3] = {};
+    auto poll = [&] {
+        for (const Entry& e : decode(out, values.delta(seq, out), seq)) {
+            assert(e.value >= seen[e.index]);
+            seen[e.index] = e.value;
+        }
+    };
+    while (!done.load(std::memory_order_acquire)) {
+        poll();
+        std::this_thread::yield();
+    }
+    core1.join();
+    poll();
+
+    assert(seq == (uint32_t)writes);
+    assert(seen[0] == (float)(writes - writes % 3) && seen[1] == (float)writes && seen[2] == (float)(writes - 2));
+    puts("Success");
+}
+
+int main() {
+    test_Delta_ChangedSinceSeq();
+    test_ApplyQuery_IndicesAndSeq();
+    test_Manifest_Json();
+    test_ConcurrentWrites_NeverMissed();
+    return 0;
+}
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Decode the binary [print] telemetry stream of a pikoPD build.
+
+With board.json "console": true and "telemetry": true the firmware writes every
+[print] value as a 14-byte frame to the USB serial port instead of formatting
+it on the device: two sync bytes, then a TelemetryRecord (src/PicoTelemetry.h):
+
+    uint32 time_us | uint16 print index | uint16 sequence | float32 value
+
+The print index refers to "prints" in the build manifest
+(project/hvcc/<patch>_manifest.json). Text the firmware prints in between, like
+the [events] counters, is passed through unchanged.
+
+    python3 tools/telemetry.py /dev/ttyACM0 project/hvcc/heavy_manifest.json
+    python3 tools/telemetry.py /dev/tty.usbmodem1101 project --jsonl trace.jsonl
+"""
+
+import os, sys, json, glob, struct, argparse, time
+
+SYNC = b"\xa5\x5a"
+RECORD = struct.Struct("<IHHf")
+NO_ID = 0xFFFF
+
+
+class TelemetryDecoder:
+    """Split a byte stream into telemetry events and text lines; tracks lost records by sequence gaps."""
+
+    def __init__(self, names):
+        self.names = names
+        self.buf = bytearray()
+        self.text = bytearray()
+        self.seq = None
+        self.lost = 0
+        self.events = 0
+        self.t_base = 0
+        self.t_last = None
+
+    def name(self, index):
+        if index < len(self.names):
+            return self.names[index]
+        return "print" if index == NO_ID else f"print#{index}"
+
+    def valid(self, index):
+        return index < len(self.names) or index == NO_ID
+
+    def feed(self, data):
+        """Yield ("event", dict) and ("text", str) in stream order."""
+        self.buf += data
+        frame = len(SYNC) + RECORD.size
+        while self.buf:
+            pos = self.buf.find(SYNC)
+            if pos < 0:
+                # keep a trailing first sync byte, it may be completed by the next read
+                keep = 1 if self.buf[-1:] == SYNC[:1] else 0
+                yield from self.add_text(self.buf[:len(self.buf) - keep])
+                del self.buf[:len(self.buf) - keep]
+                return
+            if pos:
+                yield from self.add_text(self.buf[:pos])
+                del self.buf[:pos]
+            if len(self.buf) < frame:
+                return
+
+            time_us, index, seq, value = RECORD.unpack_from(self.buf, len(SYNC))
+            if not self.valid(index):
+                yield from self.add_text(self.buf[:1])
+                del self.buf[:1]
+                continue
+            del self.buf[:frame]
+            yield "event", self.event(time_us, index, seq, value)
+
+    def add_text(self, data):
+        for b in data:
+            if b == 0x0A:
+                yield "text", self.text.decode(errors="replace").rstrip("\r")
+                self.text.clear()
+            else:
+                self.text.append(b)
+
+    def event(self, time_us, index, seq, value):
+        lost = 0
+        if self.seq is not None:
+            lost = (seq - self.seq - 1) & 0xFFFF
+            self.lost += lost
+        self.seq = seq
+        self.events += 1
+
+        # time_us_32() wraps after ~71 minutes
+        if self.t_last is not None and time_us < self.t_last:
+            self.t_base += 1 << 32
+        self.t_last = time_us
+
+        return {"t": (self.t_base + time_us) / 1e6, "name": self.name(index), "value": value,
+                "seq": seq, "lost": lost}
+
+
+def load_names(path):
+    """Print names from a manifest file, or from the one manifest under <project>/hvcc."""
+    if os.path.isdir(path):
+        found = glob.glob(os.path.join(path, "hvcc", "*_manifest.json")) or glob.glob(os.path.join(path, "*_manifest.json"))
+        if len(found) != 1:
+            sys.exit(f"❌ Expected one *_manifest.json in {path}, found {len(found)}")
+        path = found[0]
+    with open(path) as f:
+        return [p["name"] for p in json.load(f).get("prints", [])]
+
+
+def open_stream(port):
+    if port == "-":
+        return sys.stdin.buffer
+    f = open(port, "rb", buffering=0)
+    if f.isatty():
+        import tty, termios
+        tty.setraw(f.fileno(), termios.TCSANOW)
+    return f
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode pikoPD binary [print] telemetry")
+    parser.add_argument("port", help="Serial device, a captured file, or - for stdin")
+    parser.add_argument("manifest", help="<patch>_manifest.json or the project folder")
+    parser.add_argument("--jsonl", help="Also write every event as one JSON line to this file")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not echo events and text to the terminal")
+    args = parser.parse_args()
+
+    decoder = TelemetryDecoder(load_names(args.manifest))
+    stream = open_stream(args.port)
+    out = open(args.jsonl, "a") if args.jsonl else None
+    start = time.time()
+
+    try:
+        while True:
+            data = stream.read(4096)
+            if not data:
+                break
+            for kind, item in decoder.feed(data):
+                if kind == "text":
+                    if not args.quiet:
+                        print(f"\033[2m{item}\033[0m")
+                    continue
+                if out:
+                    out.write(json.dumps(item) + "\n")
+                if not args.quiet:
+                    gap = f"  \033[91m({item['lost']} lost)\033[0m" if item["lost"] else ""
+                    print(f"{item['t']:12.6f}  {item['name']:<16} {item['value']:.6g}{gap}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if out:
+            out.close()
+
+    elapsed = max(time.time() - start, 1e-9)
+    print(f"\n{decoder.events} events ({decoder.events / elapsed:.0f}/s), {decoder.lost} lost", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()